@@ -6,8 +6,11 @@ api.py - IndieBiz OS Core API Server
 import os
 import sys
 import json
+import time
 from pathlib import Path
 
+_BOOT_T0 = time.perf_counter()   # import 예산 — boot_status.import_report (2026-10-16)
+
 # Windows 인코딩 문제 해결 (한글 등 비-ASCII 문자 처리)
 if sys.platform == 'win32':
     try:
@@ -305,6 +308,17 @@ async def lifespan(app: FastAPI):
 
     # 통합 스케줄러 종료
     calendar_manager.stop()
+
+    # 관측 기록 버퍼(action_health·action_usage_daily) 마저 쓰기 — atexit 도 있지만 리로드 워커는
+    # 여기서 끝난다. 버린 수가 있으면 남긴다.
+    try:
+        import telemetry_sink
+        telemetry_sink.flush(timeout=5.0)
+        _ts = telemetry_sink.stats()
+        if _ts["dropped"]:
+            print(f"[telemetry] 종료 플러시 — 기록 {_ts['written']}건, 버림 {_ts['dropped']}건")
+    except Exception as e:
+        print(f"[telemetry] 종료 플러시 실패: {e}")
     print("👋 IndieBiz OS 서버 종료")
 
 app = FastAPI(
@@ -427,7 +441,12 @@ switch_manager = SwitchManager()
 
 
 # ============ 라우터 임포트 및 매니저 주입 ============
+# ★지연 라우터 (2026-10-16): 매니저 주입·lifespan 훅이 없는 라우터(사진·NAS·포털·엑스레이 …)는
+# 여기서 import 하지 않는다 — lazy_router.mount 가 자리표를 두고 첫 요청 때 올린다. 즉시 올릴
+# 것은 INDIEBIZ_EAGER_ROUTERS="photo,nas" (전부면 "*"). 자가수리 재시작이 UI 를 덜 막게.
 
+boot_status.record_import("api:head", (time.perf_counter() - _BOOT_T0) * 1000)
+_routers_t0 = time.perf_counter()
 from api_projects import router as projects_router, init_managers as init_projects_managers, init_multi_chat_manager as init_projects_multi_chat
 from api_switches import router as switches_router, init_manager as init_switches_manager
 from api_config import router as config_router, init_manager as init_config_manager
@@ -442,28 +461,11 @@ from api_scheduler import router as scheduler_router
 from api_notifications import router as notifications_router
 from api_gmail import router as gmail_router
 from api_business import router as business_router, init_manager as init_business_manager
-from api_health import router as health_router
 from api_multi_chat import router as multi_chat_router, init_manager as init_multi_chat_manager
-from api_pcmanager import router as pcmanager_router
-from api_photo import router as photo_router
-from api_music import router as music_router
-from api_ytrelay import router as ytrelay_router
-from api_nas import router as nas_router
-from api_nas_hls import router as nas_hls_router
-from api_showcase import router as showcase_router
-from api_family_news import router as family_news_router
-from api_portal import router as portal_router
-from api_warehouse_feed import router as warehouse_feed_router
-from api_bulletin import router as bulletin_router
-from api_report import router as report_router
 from api_launcher_web import router as launcher_web_router
 from api_tunnel import router as tunnel_router, auto_start_if_enabled as tunnel_auto_start
 from face_provision import router as face_provision_router
 from api_ibl import router as ibl_router
-from api_nodes import router as nodes_router
-from api_limb import router as limb_router
-from api_xray import router as xray_router
-from api_lecture_workspace import router as lecture_workspace_router
 
 # 매니저 주입
 init_projects_managers(project_manager, switch_manager)
@@ -478,6 +480,9 @@ init_multi_chat_manager()  # AI 설정은 필요시 전달
 # 다중채팅 매니저를 api_projects에도 주입 (휴지통 통합용)
 from api_multi_chat import get_manager as get_multi_chat_manager
 init_projects_multi_chat(get_multi_chat_manager())
+boot_status.record_import("routers:eager", (time.perf_counter() - _routers_t0) * 1000)
+
+import lazy_router  # noqa: E402
 
 
 # ============ 라우터 등록 ============
@@ -499,33 +504,30 @@ app.include_router(scheduler_router, tags=["scheduler"])
 app.include_router(notifications_router, tags=["notifications"])
 app.include_router(gmail_router, tags=["gmail"])
 app.include_router(business_router, tags=["business"])
-app.include_router(health_router, tags=["health-sync"])
+lazy_router.mount(app, "health_sync")
 app.include_router(multi_chat_router, tags=["multi-chat"])
-app.include_router(pcmanager_router, tags=["pcmanager"])
-app.include_router(photo_router, tags=["photo"])
-app.include_router(music_router, tags=["music"])  # 로컬 전용 — is_public_remote_path 등록 금지 (외부=런처 세션)
-app.include_router(ytrelay_router, tags=["yt-relay"])  # 로컬 전용 — is_public_remote_path 등록 금지 (외부=런처 세션)
-app.include_router(nas_router, tags=["nas"])
-app.include_router(nas_hls_router, tags=["nas-hls"])   # /nas/* 는 이미 자체 세션 인증 공개 경로
-app.include_router(showcase_router, tags=["showcase"])
-app.include_router(family_news_router, tags=["family-news"])
-app.include_router(portal_router, tags=["portal"])
-app.include_router(warehouse_feed_router, tags=["warehouse-feed"])
-from warehouse_likes import router as warehouse_likes_router
-app.include_router(warehouse_likes_router, tags=["portal"])  # 창고 파일 좋아요 (/portal/like)
-app.include_router(bulletin_router, tags=["bulletin"])
-app.include_router(report_router, tags=["report"])
+lazy_router.mount(app, "pcmanager")
+lazy_router.mount(app, "photo")
+lazy_router.mount(app, "music")  # 로컬 전용 — is_public_remote_path 등록 금지 (외부=런처 세션)
+lazy_router.mount(app, "ytrelay")  # 로컬 전용 — is_public_remote_path 등록 금지 (외부=런처 세션)
+lazy_router.mount(app, "nas")
+lazy_router.mount(app, "nas_hls")   # /nas/* 는 이미 자체 세션 인증 공개 경로
+lazy_router.mount(app, "showcase")
+lazy_router.mount(app, "family_news")
+lazy_router.mount(app, "portal")
+lazy_router.mount(app, "warehouse_feed")
+lazy_router.mount(app, "warehouse_likes")  # 창고 파일 좋아요 (/portal/like)
+lazy_router.mount(app, "bulletin")
+lazy_router.mount(app, "report")
 app.include_router(launcher_web_router, tags=["launcher-web"])
 app.include_router(tunnel_router, tags=["tunnel"])
 app.include_router(face_provision_router, tags=["tunnel-provision"])  # 로컬 전용 — is_public_remote_path 등록 금지
 app.include_router(ibl_router, tags=["ibl"])
-app.include_router(nodes_router, tags=["nodes"])
-app.include_router(limb_router, tags=["limb"])  # /limb/* 는 자체 limb key 인증 (is_public_remote_path 등록)
-app.include_router(xray_router, tags=["xray"])
-app.include_router(lecture_workspace_router, tags=["lecture-workspace"])
-
-from api_phone import router as phone_router
-app.include_router(phone_router, tags=["phone"])
+lazy_router.mount(app, "nodes")
+lazy_router.mount(app, "limb")  # /limb/* 는 자체 limb key 인증 (is_public_remote_path 등록)
+lazy_router.mount(app, "xray")
+lazy_router.mount(app, "lecture_workspace")
+lazy_router.mount(app, "phone")
 
 # ============ NAS Finder 정적 파일 마운트 ============
 # 주의: 마운트는 반드시 라우터 등록 **후**에 해야 함
@@ -533,6 +535,8 @@ static_path = BACKEND_PATH / "static" / "nas"
 if static_path.exists():
     app.mount("/nas/app", StaticFiles(directory=str(static_path), html=True), name="nas_app")
 
+print(boot_status.import_summary(), flush=True)
+
 
 # ============ 헬스 체크 ============
 
@@ -315,6 +315,13 @@ def record_role_switch(role: str, provider: str, model: str):
         ep.steps.append({"event": "switch", "role": role, "provider": provider, "model": model})
 
 
+def record_recall(timings: dict, dropped=()):
+    """0단계 연상 회상의 원천별 소요(ms)와 예산 초과로 뺀 원천 — 첫 토큰 지연의 분해용(2026-10-16)."""
+    ep = _current_episode.get(None)
+    if ep is not None:
+        ep.steps.append({"event": "recall", "ms": dict(timings), "dropped": list(dropped)})
+
+
 class _TeeWriter:
     """stdout/stderr를 원본 + (현재 컨텍스트의) 에피소드 버퍼 양쪽에 쓰는 래퍼.
 
@@ -619,7 +626,8 @@ def _extract_and_save_summary(episode_id, started_at, agent, user_message, log_t
             steps_json = None
     if round_steps:
         execution_rounds = max(int(s.get("round") or 0) for s in round_steps)
-    elif not steps:
+    elif not any(s.get("event") in ("round", "switch") for s in (steps or [])):
+        # (recall 등 라운드 무관 이벤트만 있는 원장은 '원장 없음'과 같다 — 2026-10-16)
         # 폴백 정규식은 **원장 자체가 없을 때만**(옛 에피소드·미계장 몸). 원장이 있는데
         # 실행 라운드가 0이면 그 자체가 "관측 불가"라는 사실 = NULL 유지.
         # ★4라운드 감사 실측: 원장 분기에서 걷어낸 원샷 사칭이, round_steps 가 빈
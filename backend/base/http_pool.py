@@ -0,0 +1,329 @@
+"""
+http_pool.py — 레지스트리 API 호출용 HTTP 연결 풀 + 응답 캐시 + 호스트별 속도 제한 (2026-10-16)
+
+왜 있는가 — api_engine._do_request 는 호출마다 모듈 수준 `requests.request` 를 불렀다. 그래서
+[sense:*] 팬아웃이 같은 공공 API 몇 곳을 시간당 수백 번 때릴 때마다 TCP·TLS 를 새로 맺었고,
+같은 답을 또 받아 왔고, 429 를 맞으면 그대로 실패했다(재시도 sleep 은 호출 스레드를 막은 채).
+
+세 가지를 한 자리에서:
+  세션 풀   서비스마다 requests.Session 하나(keep-alive, 어댑터 풀). ★쿠키는 받지 않는다 —
+            모듈 수준 requests.request 는 호출 사이에 쿠키를 들고 다니지 않았으므로 그 의미를
+            지킨다(서버가 심은 세션 쿠키가 다음 사람의 호출에 실리지 않게).
+  응답 캐시 도구/서비스의 `cache:` 로 켠다(기본 꺼짐). GET 만. ttl 안이면 네트워크 없이 돌려주고,
+            지나면 ETag/Last-Modified 로 조건부 요청 — 304 면 저장본을 다시 신선하게 쓴다.
+            키는 (메서드, URL, 파라미터, 헤더 해시) — 인증 헤더가 다르면 다른 항목이다.
+  속도 제한 서비스의 `rate_limit:` 로 호스트별 토큰 버킷. 한도를 넘는 호출은 실패하지 않고
+            줄 서서 기다린다(max_wait 까지). 429 의 Retry-After 는 설정이 없어도 그 호스트
+            전체를 그만큼 미룬다 — 같은 호스트로 가는 다른 스레드도 함께 기다린다.
+
+YAML 예시 (api_registry.yaml):
+    services:
+      coingecko:
+        rate_limit: {per_minute: 30, burst: 5, max_wait: 20}
+    tools:
+      crypto_price:
+        cache: {ttl: 60}        # 또는 cache: 60 / ttl 0 = 매번 조건부 재검증만
+
+대기는 lane_scheduler.cancelled() 를 보며 잘게 자른다 — 타임아웃으로 포기된 호출이 재시도
+sleep 을 끝까지 붙들지 않는다.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from lane_scheduler import cancelled as _cancelled
+
+# 서비스 하나가 동시에 쥐는 연결 수 — network 레인 상한(32)과 맞춘다
+_POOL_MAXSIZE = 32
+_CACHE_MAX_ENTRIES = 512
+_CACHE_MAX_BODY = 1 << 20          # 1MB 넘는 본문은 캐시하지 않는다(메모리 상주)
+_DEFAULT_TTL = 60.0                # cache: true
+_DEFAULT_MAX_WAIT = 30.0           # 속도 제한 줄의 최대 대기
+_RETRY_AFTER_CAP = 60.0
+_PAUSE_SLICE = 0.25
+
+
+class RateLimitWait(Exception):
+    """속도 제한 줄에서 max_wait 안에 차례가 오지 않음 — 호출자는 {"error"} 로 바꾼다."""
+
+
+# ── 세션 풀 ──
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def session_for(key: str) -> requests.Session:
+    s = _sessions.get(key)
+    if s is None:
+        with _sessions_lock:
+            s = _sessions.get(key)
+            if s is None:
+                s = requests.Session()
+                s.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _sessions[key] = s
+    return s
+
+
+# ── 취소 가능한 대기 ──
+
+def pause(seconds: float) -> bool:
+    """seconds 만큼 쉰다. 도중에 현재 레인 일이 취소되면 False(더 기다리지 말 것)."""
+    end = time.monotonic() + max(0.0, seconds)
+    while True:
+        if _cancelled():
+            return False
+        left = end - time.monotonic()
+        if left <= 0:
+            return True
+        time.sleep(min(left, _PAUSE_SLICE))
+
+
+# ── 호스트별 토큰 버킷 ──
+
+class _Bucket:
+    """예약형 토큰 버킷 — 잠금 안에서 '내 차례 시각'만 잡고 잠은 밖에서 잔다."""
+
+    def __init__(self):
+        self.rate = 0.0             # 초당 토큰(0 = 제한 없음, 429 미룸만 적용)
+        self.burst = 1.0
+        self.tokens = 1.0
+        self.stamp = time.monotonic()
+        self.blocked_until = 0.0
+
+    def configure(self, rate: float, burst: float) -> None:
+        if rate != self.rate or burst != self.burst:
+            fresh = self.rate <= 0              # 429 미룸으로만 생긴 버킷 — 처음 켜질 때 가득
+            self.rate, self.burst = rate, burst
+            self.tokens = burst if fresh else min(self.tokens, burst)
+            self.stamp = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """토큰 하나를 예약하고 기다릴 초를 돌려준다(음수 토큰 = 앞선 예약분)."""
+        wait = max(0.0, self.blocked_until - now)
+        if self.rate <= 0:
+            return wait
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        self.tokens -= 1.0
+        if self.tokens < 0:
+            wait = max(wait, -self.tokens / self.rate)
+        return wait
+
+    def refund(self) -> None:
+        if self.rate > 0:
+            self.tokens = min(self.burst, self.tokens + 1.0)
+
+
+_buckets: Dict[str, _Bucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _rate_of(cfg: Any) -> Optional[tuple]:
+    """rate_limit 설정 → (초당, burst, max_wait). 숫자 하나면 초당."""
+    if isinstance(cfg, (int, float)) and not isinstance(cfg, bool) and cfg > 0:
+        return float(cfg), max(1.0, float(cfg)), _DEFAULT_MAX_WAIT
+    if not isinstance(cfg, dict):
+        return None
+    try:
+        if cfg.get("per_second"):
+            rate = float(cfg["per_second"])
+        elif cfg.get("per_minute"):
+            rate = float(cfg["per_minute"]) / 60.0
+        else:
+            return None
+        burst = float(cfg.get("burst") or max(1.0, rate))
+        max_wait = float(cfg.get("max_wait", _DEFAULT_MAX_WAIT))
+    except (TypeError, ValueError):
+        return None
+    return (rate, max(1.0, burst), max_wait) if rate > 0 else None
+
+
+def throttle(host: str, rate_cfg: Any = None) -> None:
+    """호스트의 차례를 기다린다. max_wait 를 넘기면 RateLimitWait(예약은 되돌린다)."""
+    spec = _rate_of(rate_cfg)
+    with _buckets_lock:
+        b = _buckets.get(host)
+        if b is None:
+            if spec is None:
+                return                          # 설정도 429 이력도 없는 호스트 — 그냥 간다
+            b = _buckets[host] = _Bucket()
+        if spec:
+            b.configure(spec[0], spec[1])
+        wait = b.reserve(time.monotonic())
+        max_wait = spec[2] if spec else _RETRY_AFTER_CAP
+        if wait > max_wait:
+            b.refund()
+    if wait > max_wait:
+        _count("rate_rejected")
+        raise RateLimitWait(f"{host} 호출 한도 대기 {wait:.1f}초 > {max_wait:.0f}초")
+    if wait > 0:
+        _count("rate_waited")
+        _count("rate_wait_ms", wait * 1000)
+        if not pause(wait):
+            raise RateLimitWait(f"{host} 호출 한도 대기 중 취소됨")
+
+
+def penalize(host: str, seconds: float) -> None:
+    """429 Retry-After — 그 호스트로 가는 모든 호출을 seconds 뒤로 미룬다."""
+    seconds = min(max(0.0, seconds), _RETRY_AFTER_CAP)
+    with _buckets_lock:
+        b = _buckets.setdefault(host, _Bucket())
+        b.blocked_until = max(b.blocked_until, time.monotonic() + seconds)
+
+
+def retry_after(response) -> Optional[float]:
+    """Retry-After 헤더(초) — HTTP 날짜 형식은 무시(공공 API 대부분 초 단위)."""
+    raw = (getattr(response, "headers", None) or {}).get("Retry-After")
+    try:
+        return float(raw) if raw is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+# ── 응답 캐시 ──
+
+class _Cached:
+    """저장된 200 응답 — _do_request 가 쓰는 만큼만 requests.Response 흉내."""
+    status_code = 200
+    from_cache = True
+
+    def __init__(self, text: str, headers: Dict[str, str]):
+        self.text = text
+        self.headers = headers
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class _Entry:
+    __slots__ = ("text", "headers", "etag", "last_modified", "fresh_until")
+
+
+_cache: "OrderedDict[str, _Entry]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _ttl_of(cfg: Any) -> Optional[float]:
+    if cfg is True:
+        return _DEFAULT_TTL
+    if isinstance(cfg, (int, float)) and not isinstance(cfg, bool):
+        return max(0.0, float(cfg))
+    if isinstance(cfg, dict):
+        try:
+            return max(0.0, float(cfg.get("ttl", _DEFAULT_TTL)))
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _cache_key(method: str, url: str, params: Optional[dict], headers: Optional[dict]) -> str:
+    h = hashlib.sha1(json.dumps(sorted((headers or {}).items()), default=str).encode()).hexdigest()
+    p = json.dumps(sorted((params or {}).items()), default=str, ensure_ascii=False)
+    return f"{method} {url}?{p}#{h}"
+
+
+def _store(key: str, resp, ttl: float) -> None:
+    cc = (resp.headers.get("Cache-Control") or "").lower()
+    if "no-store" in cc or len(resp.content or b"") > _CACHE_MAX_BODY:
+        return
+    etag, lm = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    if ttl <= 0 and not (etag or lm):
+        return                                  # 신선 기간도 재검증 수단도 없다 — 쓸모없는 항목
+    e = _Entry()
+    e.text = resp.text
+    e.headers = {k: v for k, v in resp.headers.items() if k.lower() in ("content-type", "etag", "last-modified")}
+    e.etag, e.last_modified = etag, lm
+    e.fresh_until = time.monotonic() + ttl
+    with _cache_lock:
+        _cache[key] = e
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+# ── 진입점 ──
+
+def request(method: str, url: str, *, service: str = "", headers: Optional[dict] = None,
+            params: Optional[dict] = None, json_body: Any = None, form_data: Any = None,
+            timeout: Any = 10, cache: Any = None, rate_limit: Any = None):
+    """풀 세션으로 요청 → Response(또는 캐시 적중 시 _Cached).
+
+    requests 예외(Timeout·ConnectionError)는 그대로 올린다 — 재시도 판단은 호출자 몫.
+    속도 제한 줄에서 밀려나면 RateLimitWait.
+    """
+    method = method.upper()
+    host = urlsplit(url).netloc
+    ttl = _ttl_of(cache) if method == "GET" else None
+    key = entry = None
+    send_headers = dict(headers or {})
+    if ttl is not None:
+        key = _cache_key(method, url, params, headers)
+        with _cache_lock:
+            entry = _cache.get(key)
+            if entry is not None:
+                _cache.move_to_end(key)
+        if entry is not None:
+            if time.monotonic() < entry.fresh_until:
+                _count("cache_hit")
+                return _Cached(entry.text, dict(entry.headers))
+            if entry.etag:
+                send_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                send_headers["If-Modified-Since"] = entry.last_modified
+
+    throttle(host, rate_limit)
+    resp = session_for(service or host).request(
+        method=method, url=url, headers=send_headers, params=params or None,
+        json=json_body, data=form_data, timeout=timeout,
+    )
+    _count("requests")
+    if resp.status_code == 429:
+        ra = retry_after(resp)
+        if ra:
+            penalize(host, ra)
+    if key is None:
+        return resp
+    if resp.status_code == 304 and entry is not None:
+        _count("cache_revalidated")
+        entry.fresh_until = time.monotonic() + ttl
+        return _Cached(entry.text, dict(entry.headers))
+    _count("cache_miss")
+    if resp.status_code == 200:
+        _store(key, resp, ttl)
+    return resp
+
+
+# ── 관측 ──
+
+_stats: Dict[str, float] = {}
+_stats_lock = threading.Lock()
+
+
+def _count(name: str, n: float = 1) -> None:
+    with _stats_lock:
+        _stats[name] = _stats.get(name, 0) + n
+
+
+def stats() -> Dict[str, Any]:
+    with _stats_lock:
+        out = dict(_stats)
+    out.update({"sessions": len(_sessions), "cache_entries": len(_cache),
+                "throttled_hosts": len(_buckets)})
+    return out
@@ -0,0 +1,349 @@
+"""
+lane_scheduler.py — 엔진 전역 실행 스케줄러: 이름 붙은 레인 + 레인별 동시성 상한 (2026-10-16)
+
+왜 있는가 — 실행 스레드를 만드는 자리가 셋으로 갈려 있었다. 병렬(&)은 묶음마다 새
+ThreadPoolExecutor 를, 루프 위 핸들러 오프로드는 따로 8스레드 풀을, 동기 핸들러 타임아웃은
+호출마다 새 스레드를 만들었다. 그래서 워크플로우 안 each 안의 & 같은 중첩은 층마다 곱해져
+스레드가 폭발했고, 타임아웃으로 버린 스레드는 아무도 세지 않은 채 끝까지 돌았다.
+
+레인 (이름 → 동시 실행 상한):
+  network     네트워크 대기형 — & 분기·each 행·동기 핸들러(대부분 HTTP)
+  cpu         계산형 — 코어 수
+  subprocess  외부 프로세스(ffmpeg 등) — 디스크·코어를 통째로 먹으므로 작게
+  async-loop  실행 중인 이벤트 루프 위에서 넘어온 핸들러(asyncio.run/Playwright sync 가 루프 밖에서 돌게)
+
+★자기교착 규칙 — 레인 워커가 같은(또는 다른) 레인에 일을 내고 기다리는 중첩은 흔하다
+(핸들러 → execute_ibl → 핸들러). 고정 풀에서 워커가 전부 "자식 기다림"에 묶이면 영원히 안
+풀린다(ibl_routing D6 가 호출마다 새 스레드를 쓰던 이유). 그래서 **워커가 낸 일은 큐에 줄 세우지
+않는다**: 빈자리가 있으면 바로 시작하고, 없으면 호출 스레드에서 그 자리에서 돌린다(caller-runs).
+async-loop 레인만은 호출 스레드가 루프 위일 수 있어 제자리 실행이 금지라, 전용 넘침 스레드를
+띄운다(세어 둔다). 큐에서 기다리는 일은 바깥(비워커) 호출자의 것뿐이고, 워커가 기다리는 일은
+언제나 이미 시작된 일이라 진행이 보장된다.
+★시간 제한이 걸린 일(timed=True — run(timeout=…)·& 마감·회상/수집 예산)은 제자리 실행하지
+않는다. 제자리 실행은 끝난 Future 를 돌려줘 wait_for 의 timeout 이 설 자리가 없다 — 행 걸린
+핸들러 하나가 워커와 그 호출자를 무제한 붙든다. 그런 일은 넘침 스레드로 보낸다(세어 둔다).
+from_start 대기도 무제한이 아니다: queue_timeout(기본 QUEUE_WAIT_MAX_S) 안에 자리를 못 얻으면
+큐에서 빼 넘침 스레드로 올린다(queue_promoted) — 32칸이 다 찬 동안 최상위 동기 핸들러가 끝없이
+줄 서지 않게.
+
+★취소 — 파이썬 스레드는 죽일 수 없다. 기다리던 쪽이 시간 초과로 포기하면(wait_for) 아직 시작 안
+한 일은 큐에서 빼고, 돌고 있는 일에는 취소 표식을 세운다. execute_pipeline 은 step 경계마다
+`cancelled()` 를 보고 남은 step 을 돌리지 않는다. 버려진 워커는 레인 슬롯을 즉시 반납하고(대체
+워커가 뜬다) 제 일을 마치면 스스로 끝난다 — 그 수는 stats() 의 abandoned_live 로 보인다.
+
+thread_context(threading.local)는 제출 시점에 떠서 워커에 복원한다(매 일마다 깨끗이 교체 —
+앞 일의 task_id 가 다음 일에 새지 않게).
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+import thread_context as _tc
+
+LANE_CAPS: Dict[str, int] = {
+    "network": 32,
+    "cpu": max(2, os.cpu_count() or 2),
+    "subprocess": 4,
+    "async-loop": 8,
+}
+# 워커가 포화 레인에 낸 일을 호출 스레드에서 돌려도 되는가(모듈 독스트링 ★자기교착 규칙)
+_INLINE_OK = {"network": True, "cpu": True, "subprocess": True, "async-loop": False}
+# 타임아웃으로 버려졌는데 아직 도는 스레드 상한 — 넘으면 대체 워커를 더 띄우지 않는다(레인이 준다)
+ABANDONED_MAX = 64
+# 한가한 워커가 스스로 내려가는 시간(초) — 부팅 직후 몰림이 끝나면 스레드를 쥐고 있지 않는다
+_IDLE_EXIT_S = 60.0
+# from_start 대기에서 큐에 줄 설 수 있는 최대 시간(초) — 넘으면 넘침 스레드로 올린다
+QUEUE_WAIT_MAX_S = 10.0
+
+_local = threading.local()
+
+
+class _Job:
+    __slots__ = ("fn", "args", "kwargs", "future", "name", "parent", "snap",
+                 "enqueued_at", "started_at", "abandoned", "slot", "_cancel", "_started")
+
+    def __init__(self, fn, args, kwargs, name, parent, snap):
+        self.fn, self.args, self.kwargs = fn, args, kwargs
+        self.future: Future = Future()
+        self.name = name
+        self.parent = parent
+        self.snap = snap
+        self.enqueued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.abandoned = False
+        self.slot = True            # 레인 슬롯을 쥔 워커가 도는가(넘침 스레드는 False)
+        self._cancel = threading.Event()
+        self._started = threading.Event()
+
+    def mark_started(self) -> None:
+        self.started_at = time.monotonic()
+        self._started.set()
+
+    def is_cancelled(self) -> bool:
+        j = self
+        while j is not None:                # 부모가 취소되면 자식도 — 포기는 아래로 번진다
+            if j._cancel.is_set():
+                return True
+            j = j.parent
+        return False
+
+
+def current_job() -> Optional[_Job]:
+    return getattr(_local, "job", None)
+
+
+def cancelled() -> bool:
+    """지금 스레드가 도는 일이 (또는 그 조상이) 취소됐는가 — 긴 루프의 협조적 확인점."""
+    job = current_job()
+    return job is not None and job.is_cancelled()
+
+
+def in_worker() -> bool:
+    return getattr(_local, "lane", None) is not None
+
+
+class _Lane:
+    def __init__(self, name: str, cap: int, inline_ok: bool):
+        self.name = name
+        self.cap = cap
+        self.inline_ok = inline_ok
+        self._q: deque = deque()
+        self._cv = threading.Condition()
+        self._workers = 0           # 레인 슬롯을 쥔 워커(버려진 것 제외)
+        self._idle = 0
+        self.m = {"submitted": 0, "completed": 0, "failed": 0, "running": 0, "peak_queued": 0,
+                  "inline": 0, "overflow": 0, "timed_out": 0, "cancelled_queued": 0,
+                  "abandoned_live": 0, "queue_promoted": 0, "wait_ms_total": 0.0}
+
+    # ── 제출 ──
+    def submit(self, job: _Job, nowait: bool = False) -> bool:
+        """큐에 넣는다. nowait=True(워커가 낸 일)면 바로 시작할 자리가 없을 때 넣지 않고 False —
+        판정과 적재가 한 잠금 안이라 워커의 일이 줄 서는 틈이 없다."""
+        with self._cv:
+            if nowait and not (self._idle > len(self._q) or self._room_locked()):
+                return False
+            self.m["submitted"] += 1
+            self._q.append(job)
+            self.m["peak_queued"] = max(self.m["peak_queued"], len(self._q))
+            if self._idle >= len(self._q):
+                self._cv.notify()
+            elif self._room_locked():
+                self._spawn_locked()
+            return True
+
+    def _room_locked(self) -> bool:
+        """워커를 더 띄울 자리 — 상한 안이고, 버려진 채 도는 스레드가 ABANDONED_MAX 를 넘긴
+        만큼은 상한에서 깎는다(타임아웃 폭주가 스레드 수를 끝없이 불리지 않게)."""
+        over = max(0, self.m["abandoned_live"] - ABANDONED_MAX)
+        return self._workers < self.cap - over
+
+    def _spawn_locked(self) -> None:
+        self._workers += 1
+        threading.Thread(target=self._loop, daemon=True,
+                         name=f"lane-{self.name}-{self.m['submitted']}").start()
+
+    # ── 워커 ──
+    def _loop(self) -> None:
+        _local.lane = self.name
+        while True:
+            with self._cv:
+                while not self._q:
+                    self._idle += 1
+                    got = self._cv.wait(_IDLE_EXIT_S)
+                    self._idle -= 1
+                    if not got and not self._q:
+                        self._workers -= 1
+                        return
+                job = self._q.popleft()
+                self.m["wait_ms_total"] += (time.monotonic() - job.enqueued_at) * 1000
+            if not job.future.set_running_or_notify_cancel():
+                continue                                    # 시작 전에 포기됨
+            with self._cv:
+                self.m["running"] += 1
+            self._run(job)
+            with self._cv:
+                self.m["running"] -= 1
+                if job.abandoned:                           # 슬롯은 포기 시점에 이미 반납했다
+                    self.m["abandoned_live"] -= 1
+                    return
+
+    def _run(self, job: _Job) -> None:
+        job.mark_started()
+        _local.job = job
+        _tc.restore(job.snap, replace=True)
+        try:
+            result = job.fn(*job.args, **job.kwargs)
+        except BaseException as e:                          # noqa: BLE001 — 호출자에게 원형 전달
+            with self._cv:
+                self.m["failed"] += 1
+            job.future.set_exception(e)
+        else:
+            with self._cv:
+                self.m["completed"] += 1
+            job.future.set_result(result)
+        finally:
+            _local.job = None
+
+    def run_overflow(self, job: _Job) -> None:
+        """포화 + 제자리 실행 금지(또는 시간 제한 걸린 일) — 전용 스레드 하나(상한 밖, 세어 둔다)."""
+        with self._cv:
+            self.m["submitted"] += 1
+            self.m["overflow"] += 1
+            job.slot = False
+        self._start_overflow(job)
+
+    def promote(self, job: _Job) -> bool:
+        """큐에서 너무 오래 기다린 일을 넘침 스레드로 올린다. 이미 워커가 집어 갔으면 False."""
+        with self._cv:
+            try:
+                self._q.remove(job)
+            except ValueError:
+                return False
+            self.m["wait_ms_total"] += (time.monotonic() - job.enqueued_at) * 1000
+            self.m["overflow"] += 1
+            self.m["queue_promoted"] += 1
+            job.slot = False
+        self._start_overflow(job)
+        return True
+
+    def _start_overflow(self, job: _Job) -> None:
+        def _one():
+            _local.lane = self.name
+            if job.future.set_running_or_notify_cancel():
+                self._run(job)
+            with self._cv:
+                if job.abandoned:
+                    self.m["abandoned_live"] -= 1
+        threading.Thread(target=_one, daemon=True, name=f"lane-{self.name}-overflow").start()
+
+    def abandon(self, job: _Job) -> None:
+        """기다리던 쪽의 포기 — 시작 전이면 취소, 돌고 있으면 슬롯 반납 + 대체 워커."""
+        job._cancel.set()
+        with self._cv:
+            self.m["timed_out"] += 1
+            if job.future.cancel():
+                self.m["cancelled_queued"] += 1
+                try:
+                    self._q.remove(job)             # 빈 자리 계산(_idle ≥ 큐)이 죽은 일을 세지 않게
+                except ValueError:
+                    pass
+                return
+            if job.future.done() or job.abandoned:
+                return
+            job.abandoned = True
+            if not job.slot:                        # 넘침 스레드 — 돌려줄 슬롯은 없고 세기만
+                self.m["abandoned_live"] += 1
+                return
+            self._workers -= 1
+            self.m["abandoned_live"] += 1
+            if self._q and self._room_locked():
+                self._spawn_locked()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cv:
+            done = self.m["completed"] + self.m["failed"]
+            out = {k: v for k, v in self.m.items() if k != "wait_ms_total"}
+            out.update({"cap": self.cap, "workers": self._workers, "idle": self._idle,
+                        "queued": len(self._q),
+                        "avg_wait_ms": round(self.m["wait_ms_total"] / done, 2) if done else 0.0})
+            return out
+
+
+_lanes: Dict[str, _Lane] = {}
+_lanes_lock = threading.Lock()
+
+
+def _lane(name: str) -> _Lane:
+    lane = _lanes.get(name)
+    if lane is None:
+        with _lanes_lock:
+            lane = _lanes.get(name)
+            if lane is None:
+                if name not in LANE_CAPS:
+                    raise ValueError(f"모르는 실행 레인: {name} (있는 레인: {', '.join(LANE_CAPS)})")
+                lane = _lanes[name] = _Lane(name, LANE_CAPS[name], _INLINE_OK[name])
+    return lane
+
+
+def submit(lane: str, fn: Callable, *args, name: str = "", timed: bool = False, **kwargs) -> Future:
+    """일을 레인에 낸다 → Future. 워커 안에서 낸 일은 줄 세우지 않는다(모듈 독스트링 ★).
+
+    timed=True — 호출자가 이 Future 를 시간 제한을 두고 기다린다. 워커 안에서 레인이 차 있어도
+    제자리 실행하지 않고 넘침 스레드로 보낸다(제자리 실행은 timeout 을 무력화한다).
+    """
+    ln = _lane(lane)
+    job = _Job(fn, args, kwargs, name, current_job(), _tc.snapshot())
+    job.future._lane_job = (ln, job)
+    if not in_worker():
+        ln.submit(job)
+    elif not ln.submit(job, nowait=True):
+        if timed or not ln.inline_ok:
+            ln.run_overflow(job)
+            return job.future
+        with ln._cv:
+            ln.m["submitted"] += 1
+            ln.m["inline"] += 1
+        job.future.set_running_or_notify_cancel()
+        job.mark_started()
+        prev, _local.job = getattr(_local, "job", None), job    # current_job()/cancelled() 가 이 일을 보게
+        try:
+            job.future.set_result(fn(*args, **kwargs))
+        except BaseException as e:                          # noqa: BLE001
+            job.future.set_exception(e)
+        finally:
+            _local.job = prev
+    return job.future
+
+
+def wait_for(future: Future, timeout: Optional[float], from_start: bool = False,
+             queue_timeout: Optional[float] = QUEUE_WAIT_MAX_S) -> Any:
+    """결과를 기다린다. 시간 초과면 그 일을 포기(취소 표식·슬롯 반납)하고 TimeoutError.
+
+    from_start=True 면 timeout 을 **일이 시작된 때부터** 잰다 — 포화 레인의 큐에서 기다린 시간은
+    실행 시간이 아니다(한 번도 돌지 않은 일을 '실행 시간 초과'로 버리지 않게). 시작 대기는
+    queue_timeout 까지 — 그때도 줄에 있으면 넘침 스레드로 올려 곧바로 시작시킨다(None 이면 무제한).
+    """
+    pair = getattr(future, "_lane_job", None)
+    if from_start and timeout is not None and pair is not None:
+        ln, job = pair
+        promote_at = None if queue_timeout is None else job.enqueued_at + queue_timeout
+        while not job._started.wait(0.5 if promote_at is None
+                                    else min(0.5, max(0.0, promote_at - time.monotonic()))):
+            if future.done():
+                break
+            if promote_at is not None and time.monotonic() >= promote_at:
+                ln.promote(job)
+                promote_at = None
+        if job.started_at is not None:
+            timeout = max(0.0, job.started_at + timeout - time.monotonic())
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        abandon(future)
+        raise
+
+
+def abandon(future: Future) -> None:
+    pair = getattr(future, "_lane_job", None)
+    if pair is not None:
+        pair[0].abandon(pair[1])
+
+
+def run(lane: str, fn: Callable, *args, timeout: Optional[float] = None, name: str = "",
+        from_start: bool = False, queue_timeout: Optional[float] = QUEUE_WAIT_MAX_S,
+        **kwargs) -> Any:
+    """submit + wait_for — 동기 호출자용. timeout 이 있으면 timed 제출. from_start·queue_timeout 은
+    wait_for 참조."""
+    fut = submit(lane, fn, *args, name=name, timed=timeout is not None, **kwargs)
+    return wait_for(fut, timeout, from_start=from_start, queue_timeout=queue_timeout)
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """관측용 — 레인별 상한·워커·큐 깊이·대기 평균·제자리/넘침·큐 승격·타임아웃·버려진 채 도는 수."""
+    with _lanes_lock:
+        lanes = dict(_lanes)
+    return {name: lanes[name].stats() if name in lanes else {"cap": cap, "workers": 0, "queued": 0}
+            for name, cap in LANE_CAPS.items()}
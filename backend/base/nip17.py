@@ -10,11 +10,20 @@ NIP-44 v2(nip44.py) 위에 올라가는 현대 Nostr DM. 3겹 구조:
 
 스펙: NIP-17 (https://github.com/nostr-protocol/nips/blob/master/17.md)
      NIP-59 (https://github.com/nostr-protocol/nips/blob/master/59.md)
+
+밀린 DM 따라잡기 (2026-10-16): unwrap 한 통은 secp256k1 ECDH 두 번이었다. seal 층(나↔발신자)은
+같은 상대와는 늘 같은 키라 conversation_key() 가 LRU 로 들고, gift wrap 서명 검증은 (id, sig) 별로
+한 번만 한다(여러 릴레이가 같은 이벤트를 준다). 수천 통 backlog 는 unwrap_many() 가 cpu 레인에
+나눠 푼다.
 """
+import hashlib
 import json
 import secrets
+import threading
 import time
+from collections import OrderedDict
 
+import lane_scheduler
 import nip44
 from pynostr.event import Event
 from pynostr.key import PrivateKey
@@ -64,7 +73,7 @@ def wrap_dm(sender_priv_hex: str, recipient_pub_hex: str,
     rumor = _make_rumor(sender_pub_hex, recipient_pub_hex, message, extra_tags)
 
     # 2) seal (kind 13): rumor를 발신자→수신자 NIP-44로 암호화, 발신자 서명
-    seal_ck = nip44.get_conversation_key(sender_priv_hex, recipient_pub_hex)
+    seal_ck = conversation_key(sender_priv_hex, recipient_pub_hex)
     seal = Event(content=nip44.encrypt(json.dumps(rumor), seal_ck),
                  pubkey=sender_pub_hex, kind=KIND_SEAL, tags=[],
                  created_at=_random_past_timestamp())
@@ -83,23 +92,108 @@ def wrap_dm(sender_priv_hex: str, recipient_pub_hex: str,
     return wrap.to_dict()
 
 
-def unwrap_dm(recipient_priv_hex: str, giftwrap: dict) -> dict:
+# ---------- 대화키 캐시 · 서명 검증 메모 ----------
+# gift wrap 층 대화키(나↔임시키)는 메시지마다 새 키라 캐시하지 않는다 — 넣으면 일회용 키가
+# 다시 쓸 seal 층 키를 LRU 에서 밀어낸다.
+CONV_KEY_CACHE_MAX = 256        # (내 키, 상대 공개키) 쌍
+VERIFY_MEMO_MAX = 4096          # (id, sig) → 검증 결과
+BATCH_INLINE_MAX = 8            # 이 이하 묶음은 레인에 내지 않고 그 자리에서
+
+_conv_keys: "OrderedDict[tuple, bytes]" = OrderedDict()
+_verified: "OrderedDict[tuple, bool]" = OrderedDict()
+_cache_lock = threading.Lock()
+_counts = {"conv_key_hit": 0, "conv_key_miss": 0, "verify_hit": 0, "verify_miss": 0}
+
+
+def _remember(memo: OrderedDict, key, value, cap: int) -> None:
+    """(락 안에서) LRU 에 넣고 넘치면 가장 오래된 것부터 버린다"""
+    memo[key] = value
+    memo.move_to_end(key)
+    while len(memo) > cap:
+        memo.popitem(last=False)
+
+
+def conversation_key(private_key_hex: str, public_key_hex: str) -> bytes:
+    """seal 층 대화키 — nip44.get_conversation_key 와 같은 값을 (내 키, 상대 공개키) 쌍별 LRU 로.
+    보낼 때(wrap_dm)와 받을 때(unwrap_dm) 같은 상대면 같은 항목을 쓴다."""
+    key = (private_key_hex, public_key_hex.lower())
+    with _cache_lock:
+        ck = _conv_keys.get(key)
+        if ck is not None:
+            _conv_keys.move_to_end(key)
+            _counts["conv_key_hit"] += 1
+            return ck
+    ck = nip44.get_conversation_key(private_key_hex, public_key_hex)
+    with _cache_lock:
+        _counts["conv_key_miss"] += 1
+        _remember(_conv_keys, key, ck, CONV_KEY_CACHE_MAX)
+    return ck
+
+
+def _event_id(event: dict) -> str:
+    data = [0, event["pubkey"], event["created_at"], event["kind"], event["tags"], event["content"]]
+    return hashlib.sha256(json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()).hexdigest()
+
+
+def verify_event(event: dict) -> bool:
+    """NIP-01 서명 검증. id 재계산(싸다)은 매번, schnorr 검증(비싸다)은 (id, sig) 별 한 번.
+    id 를 매번 다시 재므로 검증된 id·sig 에 본문만 바꿔 끼운 이벤트는 메모에 걸리지 않는다."""
+    try:
+        if _event_id(event) != event.get("id"):
+            return False
+        key = (event["id"], event.get("sig") or "")
+    except Exception:
+        return False
+    with _cache_lock:
+        ok = _verified.get(key)
+        if ok is not None:
+            _verified.move_to_end(key)
+            _counts["verify_hit"] += 1
+            return ok
+    try:
+        ok = bool(PublicKey.from_hex(event["pubkey"]).verify(bytes.fromhex(key[1]), bytes.fromhex(key[0])))
+    except Exception:
+        ok = False
+    with _cache_lock:
+        _counts["verify_miss"] += 1
+        _remember(_verified, key, ok, VERIFY_MEMO_MAX)
+    return ok
+
+
+def cache_stats() -> dict:
+    with _cache_lock:
+        return dict(_counts, conv_keys=len(_conv_keys), verified=len(_verified))
+
+
+def clear_caches() -> None:
+    with _cache_lock:
+        _conv_keys.clear()
+        _verified.clear()
+        for k in _counts:
+            _counts[k] = 0
+
+
+def unwrap_dm(recipient_priv_hex: str, giftwrap: dict, verify: bool = True) -> dict:
     """수신한 gift wrap(kind 1059) → {sender, content, created_at, rumor}.
 
     발신자 진위 검증 포함: rumor의 pubkey와 seal의 서명자가 일치해야 한다.
+    verify 면 gift wrap 서명도 본다(verify_event — 같은 이벤트는 한 번만). seal 은 나↔발신자
+    대화키의 MAC 이 이미 발신자 키 보유를 증명하므로 따로 schnorr 검증하지 않는다.
     """
     if giftwrap.get("kind") != KIND_GIFT_WRAP:
         raise ValueError(f"gift wrap(kind 1059)이 아님: kind={giftwrap.get('kind')}")
+    if verify and not verify_event(giftwrap):
+        raise ValueError("gift wrap 서명 검증 실패")
 
-    # 1) gift wrap 복호 (수신자 ↔ 임시키)
+    # 1) gift wrap 복호 (수신자 ↔ 임시키 — 일회용이라 캐시 안 함)
     wrap_ck = nip44.get_conversation_key(recipient_priv_hex, giftwrap["pubkey"])
     seal = json.loads(nip44.decrypt(giftwrap["content"], wrap_ck))
     if seal.get("kind") != KIND_SEAL:
         raise ValueError(f"seal(kind 13)이 아님: kind={seal.get('kind')}")
 
-    # 2) seal 복호 (수신자 ↔ 발신자)
+    # 2) seal 복호 (수신자 ↔ 발신자 — 같은 상대면 캐시 적중)
     seal_pub = seal["pubkey"]
-    seal_ck = nip44.get_conversation_key(recipient_priv_hex, seal_pub)
+    seal_ck = conversation_key(recipient_priv_hex, seal_pub)
     rumor = json.loads(nip44.decrypt(seal["content"], seal_ck))
 
     # 3) 발신자 위조 방지: rumor.pubkey == seal 서명자
@@ -114,6 +208,42 @@ def unwrap_dm(recipient_priv_hex: str, giftwrap: dict) -> dict:
     }
 
 
+def unwrap_many(recipient_priv_hex: str, giftwraps, verify: bool = True) -> list:
+    """gift wrap 여러 통 → 입력 순서대로 unwrap_dm 결과 (우리 대상 아님·복호/검증 실패는 None).
+
+    같은 id 는 한 번만 푼다. BATCH_INLINE_MAX 를 넘으면 cpu 레인 워커 수만큼 연속 구간으로 나눠
+    lane_scheduler 에 낸다(워커 안에서 부르면 레인 규칙대로 빈자리 없을 때 그 자리에서 돈다).
+    """
+    events = list(giftwraps)
+    uniq: "OrderedDict[str, dict]" = OrderedDict()
+    keys = []
+    for i, ev in enumerate(events):
+        k = ev.get("id") or f"#{i}"
+        keys.append(k)
+        uniq.setdefault(k, ev)
+    todo = list(uniq.values())
+
+    def _run(chunk):
+        out = []
+        for ev in chunk:
+            try:
+                out.append(unwrap_dm(recipient_priv_hex, ev, verify=verify))
+            except Exception:
+                out.append(None)
+        return out
+
+    if len(todo) <= BATCH_INLINE_MAX:
+        results = _run(todo)
+    else:
+        n = min(lane_scheduler.LANE_CAPS["cpu"], -(-len(todo) // BATCH_INLINE_MAX))
+        size = -(-len(todo) // n)
+        futures = [lane_scheduler.submit("cpu", _run, todo[i:i + size], name="nip17-unwrap")
+                   for i in range(0, len(todo), size)]
+        results = [r for f in futures for r in f.result()]
+    by_key = dict(zip(uniq, results))
+    return [by_key[k] for k in keys]
+
+
 # === nostr 키 표기 변환 — channel_poller 에서 이동 (2026-08-05 감사 ⑦ 후반부) ===
 # channel_engine(IBL층)의 주소 정규화가 이 변환자 때문에 서비스층(channel_poller)을
 # import 했다 — 키 표기는 nostr 기저(여기)의 어휘. PublicKey 는 이 모듈이 이미
@@ -0,0 +1,558 @@
+"""
+nostr_relay_pool.py — Nostr 릴레이 상주 연결 풀: URL 당 소켓 하나에 REQ 를 겹쳐 보낸다 (2026-10-16)
+
+왜 있는가 — IndieNet._query_relays 는 조회마다 릴레이별로 WebSocketApp + 스레드 둘을 새로 열고
+닫았고, _publish_event 도 발행마다 같은 일을 했으며, ChannelPoller 는 또 제 리스너 소켓을 따로
+들었다. 피드 새로고침·DM 확인 한 번이 릴레이 수만큼 TLS·WebSocket 핸드셰이크를 치렀다.
+
+이제 릴레이 URL 마다 연결 하나가 상주하고, 그 위에 구독 ID 로 REQ 여럿이 겹쳐 흐른다:
+  query(relays, filters, accept, timeout, grace)   한 번짜리 조회. EOSE 를 릴레이별로 모아
+                  (구독 하나가 전 릴레이의 EOSE 를 든다) 기다릴 릴레이가 다 답하거나, 첫 EOSE 뒤
+                  grace 가 지나면 CLOSE 하고 돌려준다. 이벤트는 id 로 한 번만 accept 를 거친다.
+  publish(relays, event, timeout, linger)   EVENT → OK. 첫 OK 를 timeout 까지, 나머지를 linger 더.
+                  → (첫 OK 의 event id | None, OK 수)
+  subscribe(relays, filters, on_event, ...)   상주 구독(persistent=True) — 재연결마다 REQ 를 다시
+                  보낸다. filters 가 callable 이면 보낼 때마다 새로 만든다(since=now 류). → Subscription
+  reconnect(url=None) · stats() · close_all()
+
+재연결   끊기면 1→2→4…60초 backoff 로 다시 붙는다(연속 실패 수 기준, 한 번 열리면 초기화).
+         backoff 중에 구독·발행이 새로 걸리면 기다리지 않고 곧바로 다시 시도한다.
+         구독·발행이 하나도 안 걸린 연결은 IDLE_CLOSE_S 뒤 닫고, 다음 요청이 다시 연다.
+하이버네이션  청소 스레드가 1초 틱 사이 시계가 HIBERNATION_S 넘게 뛰면 열린 연결을 전부 다시 맺는다
+         (ChannelPoller 의 리스너별 감지를 여기로 옮김 — 잠든 사이 죽은 소켓을 붙들지 않게).
+지연 점수  릴레이별 REQ→EOSE · EVENT→OK 왕복의 EWMA + 연속 연결 실패 수. query 는 backoff 중인
+         죽은 릴레이(DEAD_AFTER)와 평소 SLOW_MS 보다 느린 릴레이는 기다리지 않는다 — REQ 는 그대로
+         나가므로 조회가 끝나기 전에 온 이벤트는 담긴다. 기다릴 릴레이가 하나도 없으면 전부 기다린다.
+
+★콜백 스레드 — 한 번짜리 조회의 accept·on_open·on_eose 는 그 릴레이의 소켓 스레드에서 불린다(짧게).
+상주 구독의 on_event 는 구독마다 하나인 전달 스레드로 넘긴다(도착 순 유지). DM 리스너의 처리는
+시스템 AI 실행 → 답장 발행까지 길어, 소켓 스레드에서 돌면 같은 릴레이의 조회·발행·ping 이 멈추고
+그 안에서 낸 발행은 제 OK 를 영영 못 읽는다.
+★끊긴 연결의 한 번짜리 구독은 그 릴레이 몫을 '실패로 끝남'으로 표시하지만 목록엔 남는다 —
+재연결이 조회 안에 끝나면 REQ 가 다시 나가 늦게라도 담긴다.
+★폰 몸은 이 풀을 쓰지 않는다 — 릴레이 연결은 Kotlin RelayClient 브리지가 맡는다.
+"""
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import websocket
+except ImportError:     # websocket-client 없음 — query 는 빈 목록, publish 는 (None, 0)
+    websocket = None
+
+PING_INTERVAL = 20          # 좀비 연결 감지 (옛 ChannelPoller 값)
+PING_TIMEOUT = 10
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+IDLE_CLOSE_S = 300.0        # 아무것도 안 걸린 연결을 닫기까지
+HIBERNATION_S = 30.0        # 청소 틱 사이 시계 점프가 이보다 크면 재연결
+JANITOR_TICK = 1.0
+DEAD_AFTER = 2              # 연속 연결 실패 — 이 이상이면 query 가 기다리지 않는다
+SLOW_MS = 3000.0            # 평소 이보다 느린 릴레이도 기다리지 않는다
+EWMA_ALPHA = 0.3
+_SEEN_MAX = 4096            # 상주 구독의 이벤트 id dedupe 창
+
+
+def _norm(url: str) -> str:
+    return url.strip().rstrip("/")
+
+
+def _unique(relays: Iterable[str]) -> List[str]:
+    return list(OrderedDict.fromkeys(_norm(u) for u in relays if u and u.strip()))
+
+
+class Subscription:
+    """REQ 하나 — 여러 릴레이에 같은 구독 ID 로 나가고, 릴레이별 EOSE 를 한자리에서 든다."""
+
+    def __init__(self, pool: "RelayPool", relays: List[str], filters, on_event: Callable,
+                 on_eose: Optional[Callable] = None, on_open: Optional[Callable] = None,
+                 persistent: bool = False, prefix: str = "q"):
+        self.pool = pool
+        self.sid = f"{prefix}_{uuid.uuid4().hex[:8]}"
+        self.relays = relays
+        self.persistent = persistent
+        self.on_event = on_event
+        self.on_eose = on_eose
+        self.on_open = on_open
+        self.finished: Dict[str, bool] = {}     # url → True(EOSE) / False(끊김·CLOSED)
+        self.first_eose_at: Optional[float] = None
+        self.changed = threading.Event()
+        self.closed = False
+        self._filters = filters
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._inbox: deque = deque()            # 상주 구독 — 전달 스레드가 비울 이벤트
+        self._pumping = False
+        self._lock = threading.Lock()
+
+    def req_frame(self) -> str:
+        f = self._filters() if callable(self._filters) else self._filters
+        return json.dumps(["REQ", self.sid, *(f if isinstance(f, list) else [f])])
+
+    def _deliver(self, url: str, event: dict) -> None:
+        eid = event.get("id")
+        with self._lock:
+            if self.closed:
+                return
+            if eid:
+                if eid in self._seen:
+                    return                      # 다른 릴레이가 먼저 준 같은 이벤트
+                self._seen[eid] = None
+                if len(self._seen) > _SEEN_MAX:
+                    self._seen.popitem(last=False)
+            if self.persistent:
+                self._inbox.append((event, url))
+                if self._pumping:
+                    return
+                self._pumping = True
+        if not self.persistent:
+            self._call(event, url)
+            return
+        threading.Thread(target=self._pump, name=f"nostr-sub:{self.sid}", daemon=True).start()
+
+    def _pump(self) -> None:
+        """상주 구독의 전달 스레드 — 쌓인 이벤트를 도착 순으로, 비면 끝난다(다음 이벤트가 다시 띄운다)."""
+        while True:
+            with self._lock:
+                if not self._inbox or self.closed:
+                    self._inbox.clear()
+                    self._pumping = False
+                    return
+                event, url = self._inbox.popleft()
+            self._call(event, url)
+
+    def _call(self, event: dict, url: str) -> None:
+        try:
+            self.on_event(event, url)
+        except Exception as e:
+            print(f"[NostrPool] {self.sid} 이벤트 처리 실패({url}): {e}")
+
+    def _finish(self, url: str, ok: bool) -> None:
+        with self._lock:
+            if url in self.finished:
+                return
+            self.finished[url] = ok
+            if ok and self.first_eose_at is None:
+                self.first_eose_at = time.monotonic()
+        self.changed.set()
+        if ok and self.on_eose:
+            try:
+                self.on_eose(url)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        self.pool._unsubscribe(self)
+
+
+class _Publish:
+    """EVENT 하나의 릴레이별 OK 대기"""
+
+    def __init__(self, event: dict, relays: List[str]):
+        self.eid = event.get("id") or ""
+        self.frame = json.dumps(["EVENT", event])
+        self.relays = relays
+        self.ok_urls: List[str] = []
+        self.first_ok_id: Optional[str] = None
+        self.first = threading.Event()          # 첫 OK (또는 전 릴레이 실패)
+        self.all = threading.Event()
+        self._done = set()
+        self._lock = threading.Lock()
+
+    def _settle(self, url: str, ok_id: Optional[str] = None) -> None:
+        with self._lock:
+            if url in self._done:
+                return
+            self._done.add(url)
+            if ok_id is not None:
+                self.ok_urls.append(url)
+                if self.first_ok_id is None:
+                    self.first_ok_id = ok_id
+                self.first.set()
+            if len(self._done) >= len(self.relays):
+                self.all.set()
+                self.first.set()
+
+
+class _RelayConn:
+    """릴레이 URL 하나의 상주 연결 — 러너 스레드가 run_forever + backoff 재연결을 돈다."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.state = "idle"                     # idle | connecting | open | backoff
+        self.failures = 0                       # 연속 연결 실패
+        self.latency_ms: Optional[float] = None
+        self.connects = 0
+        self.last_error = ""
+        self.last_used = time.monotonic()
+        self._subs: Dict[str, Subscription] = {}
+        self._publishes: Dict[str, _Publish] = {}
+        self._sent_at: Dict[str, float] = {}    # sid·event id → 보낸 시각 (지연 표본)
+        self._ws = None
+        self._opened = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop = False
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+
+    # ── 점수 ──
+    def waits(self) -> bool:
+        """query 가 이 릴레이의 EOSE 를 기다릴 만한가"""
+        if self.failures >= DEAD_AFTER and self.state != "open":
+            return False
+        return self.latency_ms is None or self.latency_ms <= SLOW_MS
+
+    def _sample(self, key: str) -> None:
+        t0 = self._sent_at.pop(key, None)
+        if t0 is None:
+            return
+        ms = (time.monotonic() - t0) * 1000
+        self.latency_ms = ms if self.latency_ms is None else self.latency_ms + EWMA_ALPHA * (ms - self.latency_ms)
+
+    # ── 요청 걸기·떼기 (아무 스레드) ──
+    def _send(self, frame: str) -> None:
+        try:
+            self._ws.send(frame)
+        except Exception as e:                  # 끊기는 중 — 러너가 재연결 뒤 다시 보낸다
+            self.last_error = str(e)
+
+    def _ensure(self) -> None:
+        """(락 안에서) 러너가 없으면 띄운다"""
+        self._stop = False
+        self.last_used = time.monotonic()
+        if self._thread is None:
+            self.state = "connecting"
+            self._thread = threading.Thread(target=self._run, name=f"nostr-relay:{self.url}", daemon=True)
+            self._thread.start()
+
+    def add_sub(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subs[sub.sid] = sub
+            if self.state == "open":
+                self._sent_at[sub.sid] = time.monotonic()
+                self._send(sub.req_frame())
+            elif self.state == "backoff":
+                self._wake.set()                # 기다리는 요청이 생겼다 — backoff 를 끊고 지금 붙는다
+            self._ensure()
+
+    def remove_sub(self, sid: str) -> None:
+        with self._lock:
+            if self._subs.pop(sid, None) is not None and self.state == "open":
+                self._send(json.dumps(["CLOSE", sid]))
+            self._sent_at.pop(sid, None)
+            self.last_used = time.monotonic()
+
+    def add_publish(self, pub: _Publish) -> None:
+        with self._lock:
+            self._publishes[pub.eid] = pub
+            if self.state == "open":
+                self._sent_at[pub.eid] = time.monotonic()
+                self._send(pub.frame)
+            elif self.state == "backoff":
+                self._wake.set()                # 60초 backoff 중 발행이 OK 0 으로 조용히 끝나지 않게
+            self._ensure()
+
+    def remove_publish(self, eid: str) -> None:
+        with self._lock:
+            self._publishes.pop(eid, None)
+            self._sent_at.pop(eid, None)
+            self.last_used = time.monotonic()
+
+    def drop(self, stop: bool = False) -> None:
+        """지금 소켓을 닫는다 — stop 이면 러너도 끝, 아니면 걸린 게 있는 한 다시 붙는다."""
+        with self._lock:
+            if stop:
+                self._stop = True
+            ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+        if stop:
+            self._wake.set()
+
+    def close_if_idle(self, idle_s: float) -> bool:
+        with self._lock:
+            idle = (self.state == "open" and not self._subs and not self._publishes
+                    and time.monotonic() - self.last_used > idle_s)
+        if idle:
+            self.drop(stop=True)
+        return idle
+
+    # ── 소켓 콜백 (러너 스레드) ──
+    def _on_open(self, ws) -> None:
+        with self._lock:
+            if ws is not self._ws:
+                return
+            self._opened = True
+            self.failures = 0
+            self.state = "open"
+            now = time.monotonic()
+            for sid, sub in self._subs.items():
+                self._sent_at[sid] = now
+                self._send(sub.req_frame())
+            for eid, pub in self._publishes.items():
+                self._sent_at[eid] = now
+                self._send(pub.frame)
+            opened = [s for s in self._subs.values() if s.on_open]
+        for sub in opened:
+            try:
+                sub.on_open(self.url)
+            except Exception:
+                pass
+
+    def _on_message(self, ws, message) -> None:
+        try:
+            data = json.loads(message)
+        except Exception:
+            return
+        if not isinstance(data, list) or len(data) < 2:
+            return
+        kind, key = data[0], data[1]
+        if kind == "EVENT" and len(data) >= 3 and isinstance(data[2], dict):
+            sub = self._subs.get(key)
+            if sub is not None:
+                sub._deliver(self.url, data[2])
+        elif kind == "EOSE":
+            with self._lock:
+                self._sample(key)
+                sub = self._subs.get(key)
+            if sub is not None:
+                sub._finish(self.url, True)
+        elif kind == "CLOSED":                  # 릴레이가 구독을 거절·종료
+            sub = self._subs.get(key)
+            if sub is not None and not sub.persistent:
+                sub._finish(self.url, False)
+        elif kind == "OK" and len(data) >= 3:
+            with self._lock:
+                self._sample(key)
+                pub = self._publishes.get(key)
+            if pub is not None:
+                pub._settle(self.url, key)      # 옛 동작: 거절(false) OK 도 응답으로 센다
+
+    def _on_error(self, ws, error) -> None:
+        self.last_error = str(error)
+
+    def _run(self) -> None:
+        while True:
+            ws = websocket.WebSocketApp(self.url, on_open=self._on_open,
+                                        on_message=self._on_message, on_error=self._on_error)
+            with self._lock:
+                self._ws = ws
+                self._opened = False
+                self.connects += 1
+            try:
+                ws.run_forever(ping_interval=PING_INTERVAL, ping_timeout=PING_TIMEOUT)
+            except Exception as e:
+                self.last_error = str(e)
+            with self._lock:
+                self._ws = None
+                if not self._opened:
+                    self.failures += 1
+                self.state = "backoff"
+                self._sent_at.clear()
+                cut_subs = [s for s in self._subs.values() if not s.persistent]
+                cut_pubs = list(self._publishes.values())
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** max(self.failures - 1, 0))
+            for sub in cut_subs:
+                sub._finish(self.url, False)
+            for pub in cut_pubs:
+                pub._settle(self.url)
+            if self._exit_if_unneeded():
+                return
+            self._wake.wait(delay)
+            self._wake.clear()
+            if self._exit_if_unneeded():
+                return
+            with self._lock:
+                self.state = "connecting"
+
+    def _exit_if_unneeded(self) -> bool:
+        with self._lock:
+            if self._stop or not (self._subs or self._publishes):
+                self._thread = None
+                self.state = "idle"
+                return True
+            return False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "latency_ms": round(self.latency_ms, 1) if self.latency_ms is not None else None,
+            "failures": self.failures,
+            "connects": self.connects,
+            "subs": len(self._subs),
+            "waits": self.waits(),
+            "last_error": self.last_error,
+        }
+
+
+class RelayPool:
+    """릴레이 URL → _RelayConn. 프로세스에 하나 (pool())."""
+
+    def __init__(self):
+        self._conns: Dict[str, _RelayConn] = {}
+        self._lock = threading.Lock()
+        self._janitor: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def available(self) -> bool:
+        return websocket is not None
+
+    def conn(self, url: str) -> _RelayConn:
+        url = _norm(url)
+        with self._lock:
+            c = self._conns.get(url)
+            if c is None:
+                c = self._conns[url] = _RelayConn(url)
+            if self._janitor is None:
+                self._janitor = threading.Thread(target=self._janitor_loop, name="nostr-relay-janitor",
+                                                 daemon=True)
+                self._janitor.start()
+            return c
+
+    # ── 구독 ──
+    def subscribe(self, relays: Iterable[str], filters, on_event: Callable[[dict, str], None], *,
+                  on_eose: Optional[Callable[[str], None]] = None,
+                  on_open: Optional[Callable[[str], None]] = None,
+                  persistent: bool = False, prefix: str = "sub") -> Subscription:
+        urls = _unique(relays)
+        sub = Subscription(self, urls, filters, on_event, on_eose, on_open, persistent, prefix)
+        if self.available:
+            for url in urls:
+                self.conn(url).add_sub(sub)
+        return sub
+
+    def _unsubscribe(self, sub: Subscription) -> None:
+        with sub._lock:
+            sub.closed = True
+        for url in sub.relays:
+            c = self._conns.get(url)
+            if c is not None:
+                c.remove_sub(sub.sid)
+
+    def query(self, relays: Iterable[str], filters, accept: Callable[[dict], Any],
+              timeout: float = 10, grace: float = 1.5) -> List[Any]:
+        """한 번짜리 조회 → accept(event) 가 None 이 아닌 것들 (event id 로 dedupe)"""
+        urls = _unique(relays)
+        if not urls or not self.available:
+            return []
+        collected: Dict[str, Any] = {}
+        lock = threading.Lock()
+
+        def on_event(event, _url):
+            try:
+                item = accept(event)
+            except Exception:
+                return
+            if item is not None:
+                with lock:
+                    collected.setdefault(event.get("id"), item)
+
+        wait_on = [u for u in urls if self.conn(u).waits()] or urls
+        sub = self.subscribe(urls, filters, on_event, prefix="q")
+        start = time.monotonic()
+        try:
+            while not all(u in sub.finished for u in wait_on):
+                now = time.monotonic()
+                if now - start >= timeout:
+                    break
+                fe = sub.first_eose_at
+                if fe is not None and now - fe >= grace:
+                    break
+                sub.changed.wait(0.05)
+                sub.changed.clear()
+        finally:
+            sub.close()
+        with lock:
+            return list(collected.values())
+
+    def publish(self, relays: Iterable[str], event: dict, timeout: float = 5,
+                linger: float = 2) -> Tuple[Optional[str], int]:
+        urls = _unique(relays)
+        if not urls or not self.available:
+            return None, 0
+        pub = _Publish(event, urls)
+        for url in urls:
+            self.conn(url).add_publish(pub)
+        try:
+            pub.first.wait(timeout)
+            pub.all.wait(linger)
+        finally:
+            for url in urls:
+                self.conn(url).remove_publish(pub.eid)
+        return pub.first_ok_id, len(pub.ok_urls)
+
+    # ── 관리 ──
+    def reconnect(self, url: Optional[str] = None) -> None:
+        with self._lock:
+            conns = list(self._conns.values())
+        for c in conns:
+            if url and c.url != _norm(url):
+                continue
+            if c.state == "open":
+                c.drop()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            conns = list(self._conns.values())
+        return {c.url: c.snapshot() for c in conns}
+
+    def close_all(self) -> None:
+        self._closed = True
+        with self._lock:
+            conns = list(self._conns.values())
+            self._conns.clear()
+        for c in conns:
+            c.drop(stop=True)
+
+    def _janitor_loop(self) -> None:
+        last = time.time()
+        while not self._closed:
+            time.sleep(JANITOR_TICK)
+            now = time.time()
+            if now - last > HIBERNATION_S:
+                print(f"[NostrPool] 하이버네이션 감지 ({int(now - last)}초 경과) - 릴레이 재연결")
+                self.reconnect()
+            last = now
+            with self._lock:
+                conns = list(self._conns.values())
+            for c in conns:
+                c.close_if_idle(IDLE_CLOSE_S)
+
+
+_pool: Optional[RelayPool] = None
+_pool_lock = threading.Lock()
+
+
+def pool() -> RelayPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = RelayPool()
+    return _pool
+
+
+def query(relays: Iterable[str], filters, accept: Callable[[dict], Any],
+          timeout: float = 10, grace: float = 1.5) -> List[Any]:
+    return pool().query(relays, filters, accept, timeout=timeout, grace=grace)
+
+
+def publish(relays: Iterable[str], event: dict, timeout: float = 5,
+            linger: float = 2) -> Tuple[Optional[str], int]:
+    return pool().publish(relays, event, timeout=timeout, linger=linger)
+
+
+def subscribe(relays: Iterable[str], filters, on_event: Callable[[dict, str], None],
+              **kw) -> Subscription:
+    return pool().subscribe(relays, filters, on_event, **kw)
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    return pool().stats()
@@ -0,0 +1,122 @@
+"""
+telemetry_sink.py — 관측 기록의 프로세스 전역 배치 쓰기: 링 버퍼 + 백그라운드 플러셔 (2026-10-16)
+
+왜 있는가 — IBL 실행 한 번마다 pulse_db.record_action_health 가 world_pulse.db 에 새 연결을
+열고(스키마 확인 포함) 한 줄 넣고 커밋했고, 이어 ibl_usage_db.bump_action_usage 가 두 번째 연결로
+upsert 하고 커밋했다. 바쁜 [table:each] 루프에선 분당 수천 번의 fsync 가 액션 핫패스 위에 앉아
+있었다 — 관측이 실행을 늦췄다.
+
+쓰는 법:
+  register(kind, writer)   writer(records: list) — 그 종류의 기록들을 **한 트랜잭션**으로 쓴다.
+                           쓰는 쪽(데이터층 모듈)이 import 때 등록한다.
+  emit(kind, record)       핫패스. 링 버퍼에 넣고 바로 돌아온다(락 하나, I/O 0).
+  flush(timeout)           지금까지 쌓인 것을 다 쓰고 돌아온다 — 종료·읽기 직전·시험용.
+  stats()                  {queued, emitted, written, dropped, write_errors, batches}
+
+플러셔: 데몬 스레드 하나(첫 emit 때 기동). FLUSH_INTERVAL 마다, 또는 FLUSH_BATCH 개가 쌓이면
+깨어나 종류별로 writer 를 한 번씩 부른다. ★버퍼가 RING_SIZE 를 넘으면 가장 오래된 기록을 버리고
+dropped 를 센다 — 디스크가 막혀도 관측이 실행을 막거나 메모리를 키우면 안 된다. writer 예외도
+그 배치를 버리고 센다(옛 '기록 실패는 무시' 와 같은 뜻, 다만 이제 숫자가 남는다).
+프로세스 종료 때 atexit 가 한 번 flush 한다.
+"""
+import atexit
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 0.5     # 초 — 이만큼마다 한 번 쓴다
+FLUSH_BATCH = 256        # 이만큼 쌓이면 간격을 기다리지 않고 깨운다
+RING_SIZE = 20000        # 버퍼 상한 — 넘치면 가장 오래된 것부터 버린다
+
+_lock = threading.Lock()
+_write_lock = threading.Lock()          # 쓰기 직렬화 — flush() 가 진행 중인 배치까지 기다리게
+_buf: deque = deque()
+_writers: Dict[str, Callable[[List[Any]], None]] = {}
+_wake = threading.Event()
+_flusher = None
+_stats = {"emitted": 0, "written": 0, "dropped": 0, "write_errors": 0, "batches": 0}
+
+
+def register(kind: str, writer: Callable[[List[Any]], None]) -> None:
+    """kind 기록의 배치 writer 등록(같은 kind 재등록은 교체)."""
+    _writers[kind] = writer
+
+
+def emit(kind: str, record: Any) -> None:
+    """기록 하나를 버퍼에 넣는다 — 실행 경로에서 부르는 유일한 함수. 실패하지 않는다."""
+    global _flusher
+    with _lock:
+        if len(_buf) >= RING_SIZE:
+            _buf.popleft()
+            _stats["dropped"] += 1
+        _buf.append((kind, record))
+        _stats["emitted"] += 1
+        n = len(_buf)
+        if _flusher is None:
+            _flusher = threading.Thread(target=_run, daemon=True, name="telemetry-flusher")
+            _flusher.start()
+    if n >= FLUSH_BATCH:
+        _wake.set()
+
+
+def _run() -> None:
+    while True:
+        _wake.wait(FLUSH_INTERVAL)
+        _wake.clear()
+        try:
+            _drain_locked(None)
+        except Exception as e:               # 플러셔는 죽지 않는다
+            logger.warning(f"[telemetry] 플러시 실패: {e}")
+
+
+def _drain() -> int:
+    """버퍼를 비워 종류별 writer 로 쓴다. _write_lock 을 잡은 채 호출."""
+    with _lock:
+        batch = list(_buf)
+        _buf.clear()
+    if not batch:
+        return 0
+    groups: Dict[str, List[Any]] = {}
+    for kind, rec in batch:
+        groups.setdefault(kind, []).append(rec)
+    for kind, recs in groups.items():
+        writer = _writers.get(kind)
+        try:
+            if writer is None:
+                raise LookupError(f"writer 미등록: {kind}")
+            writer(recs)
+            with _lock:
+                _stats["written"] += len(recs)
+                _stats["batches"] += 1
+        except Exception as e:
+            with _lock:
+                _stats["write_errors"] += 1
+                _stats["dropped"] += len(recs)
+            logger.debug(f"[telemetry] {kind} {len(recs)}건 쓰기 실패(버림): {e}")
+    return len(batch)
+
+
+def _drain_locked(timeout: float) -> bool:
+    if not _write_lock.acquire(timeout=timeout if timeout is not None else -1):
+        return False
+    try:
+        _drain()
+        return True
+    finally:
+        _write_lock.release()
+
+
+def flush(timeout: float = 5.0) -> bool:
+    """쌓인 기록을 지금 쓴다(플러셔가 쓰는 중인 배치가 끝나기까지 포함). 시간 안에 못 잡으면 False."""
+    return _drain_locked(timeout)
+
+
+def stats() -> Dict[str, int]:
+    with _lock:
+        return {"queued": len(_buf), **_stats}
+
+
+atexit.register(flush, 2.0)
@@ -470,8 +470,11 @@ def snapshot() -> dict:
     return dict(_thread_local.__dict__)
 
 
-def restore(snap: dict):
-    """snapshot()으로 떠둔 컨텍스트를 현재 스레드의 thread-local에 복원."""
+def restore(snap: dict, replace: bool = False):
+    """snapshot()으로 떠둔 컨텍스트를 현재 스레드의 thread-local에 복원.
+    replace=True 면 기존 값을 먼저 비운다 — 재사용 워커 스레드에서 앞 일의 컨텍스트가 새지 않게."""
+    if replace:
+        _thread_local.__dict__.clear()
     for k, v in (snap or {}).items():
         setattr(_thread_local, k, v)
 
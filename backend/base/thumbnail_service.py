@@ -0,0 +1,207 @@
+"""
+thumbnail_service.py — 사진 썸네일 렌더 서비스: 레인 오프로드 + 요청 합치기 + LRU 캐시 + 예열 (2026-10-16)
+
+왜 있는가 — api_photo.get_thumbnail 은 async def 안에서 PIL 렌더(generate_image_thumbnail)를 그대로
+불러, 캐시가 빈 사진마다 이벤트 루프가 멈췄다. 캐시 없는 200장 갤러리 한 페이지가 서버의 다른 모든
+엔드포인트를 얼렸고, 같은 경로를 동시에 부르면 같은 썸네일을 두 번 그렸다. 캐시 디렉토리는 끝없이
+자랐다.
+
+쓰는 법:
+  await get(src, size, kind)   캐시 경로(실패면 None). 렌더는 엔진 스케줄러 레인에서 —
+                               사진은 cpu, 동영상(ffmpeg)은 subprocess. 루프는 기다리기만 한다.
+  request(src, size, kind)     같은 일의 동기판 → Future[경로|None] (스레드·스크립트용)
+  prewarm(paths, size)         갤러리 한 페이지 분을 뒤에서 미리 그린다 — 한 번에 PREWARM_WINDOW
+                               장만 레인에 올려 대화형 요청이 줄 뒤에 갇히지 않게.
+  stats()                      {inflight, rendered, failed, coalesced, hits, evicted, prewarm_queued}
+
+합치기: (캐시 경로 = (경로, 크기, 종류)) 당 진행 중인 Future 하나. 같은 키가 또 오면 그 Future 를
+같이 기다린다. ★렌더는 .part 에 쓰고 os.replace — 읽는 쪽이 반쯤 쓴 JPEG 를 받지 않는다.
+
+캐시 키·파일 이름은 예전 api_photo 와 같다(md5("경로:크기") / md5("video:경로:크기")) — 이미 쌓인
+캐시를 그대로 쓴다. 신선도도 같다(캐시 mtime >= 원본 mtime). LRU 는 mtime 순: 적중 때
+TOUCH_AFTER_S 보다 오래된 캐시만 mtime 을 당겨 두고(적중마다 쓰기 syscall 을 내지 않게),
+새 썸네일 SWEEP_EVERY 장마다 총량이 CACHE_CAP_BYTES 를 넘으면 오래된 것부터 80% 까지 지운다.
+"""
+import asyncio
+import hashlib
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Dict, Iterable, Optional
+
+import lane_scheduler
+import thumbnails
+from runtime_utils import get_base_path as _get_base_path
+
+CACHE_DIR = os.path.join(str(_get_base_path()), "data", "thumbnail_cache")
+CACHE_CAP_BYTES = 2 * 1024 * 1024 * 1024   # 2GB — 넘으면 오래 안 본 것부터 버린다
+SWEEP_EVERY = 200                          # 새 썸네일 이만큼마다 총량 점검
+TOUCH_AFTER_S = 3600                       # 적중한 캐시의 mtime 을 당기는 최소 간격
+PREWARM_WINDOW = 4                         # 예열이 한 번에 레인에 올리는 수
+VIDEO_TIMEOUT_S = 10
+
+_LANES = {"photo": "cpu", "video": "subprocess"}
+
+_lock = threading.RLock()                  # RLock — 제자리 실행(caller-runs)이 같은 스레드에서 다시 든다
+_inflight: Dict[str, Future] = {}
+_since_sweep = 0
+_stats = {"rendered": 0, "failed": 0, "coalesced": 0, "hits": 0, "evicted": 0, "prewarm_queued": 0}
+
+
+def cache_path(src: str, size: int, kind: str = "photo") -> str:
+    """썸네일 캐시 파일 경로 (예전 api_photo 의 키 규칙 그대로)"""
+    key = f"video:{src}:{size}" if kind == "video" else f"{src}:{size}"
+    return os.path.join(CACHE_DIR, hashlib.md5(key.encode()).hexdigest() + ".jpg")
+
+
+def _fresh(dst: str, src: str) -> bool:
+    try:
+        cached = os.stat(dst)
+        if cached.st_mtime < os.path.getmtime(src):
+            return False
+    except OSError:
+        return False
+    if time.time() - cached.st_mtime > TOUCH_AFTER_S:
+        try:
+            os.utime(dst)                   # LRU — 최근에 본 것으로
+        except OSError:
+            pass
+    return True
+
+
+def _render(src: str, dst: str, size: int, kind: str) -> Optional[str]:
+    """레인 워커에서 — .part 에 그리고 제자리로 옮긴다. 끝나면 진행 목록에서 뺀다."""
+    global _since_sweep
+    tmp = f"{dst[:-4]}.{uuid.uuid4().hex[:8]}.part.jpg"   # ffmpeg 는 확장자로 형식을 고른다
+    rendered = False
+    try:
+        if kind == "video":
+            ok = thumbnails.generate_video_thumbnail(src, tmp, size, timeout=VIDEO_TIMEOUT_S)
+        else:
+            ok = thumbnails.generate_image_thumbnail(src, tmp, size)
+        if ok:
+            os.replace(tmp, dst)
+            rendered = True
+        return dst if ok else None
+    finally:
+        if os.path.exists(tmp):
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+        sweep = False
+        with _lock:
+            _inflight.pop(dst, None)
+            # 이번 렌더가 제자리에 놓였을 때만 센다 — 디스크에 남은 묵은 캐시는 렌더가 아니다
+            if rendered:
+                _stats["rendered"] += 1
+                _since_sweep += 1
+                if _since_sweep >= SWEEP_EVERY:
+                    _since_sweep, sweep = 0, True
+            else:
+                _stats["failed"] += 1
+        if sweep:
+            _sweep()
+
+
+def _sweep() -> None:
+    """캐시 총량 상한 초과분 정리 — 오래 안 본 것(mtime)부터 80% 까지"""
+    try:
+        entries, total = [], 0
+        for name in os.listdir(CACHE_DIR):
+            if not name.endswith(".jpg") or ".part." in name:
+                continue
+            fp = os.path.join(CACHE_DIR, name)
+            try:
+                st = os.stat(fp)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, fp))
+            total += st.st_size
+        if total <= CACHE_CAP_BYTES:
+            return
+        evicted = 0
+        for _mtime, size, fp in sorted(entries):
+            with _lock:
+                if fp in _inflight:
+                    continue
+            try:
+                os.remove(fp)
+                total -= size
+                evicted += 1
+            except OSError:
+                pass
+            if total <= CACHE_CAP_BYTES * 0.8:
+                break
+        with _lock:
+            _stats["evicted"] += evicted
+    except OSError:
+        pass
+
+
+def _done(value) -> Future:
+    fut = Future()
+    fut.set_result(value)
+    return fut
+
+
+def request(src: str, size: int = 200, kind: str = "photo") -> Future:
+    """썸네일을 보장한다 → Future[캐시 경로|None]. 신선한 캐시면 곧바로 끝난 Future."""
+    dst = cache_path(src, size, kind)
+    if _fresh(dst, src):
+        with _lock:
+            _stats["hits"] += 1
+        return _done(dst)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with _lock:
+        fut = _inflight.get(dst)
+        if fut is not None:
+            _stats["coalesced"] += 1
+            return fut
+        fut = lane_scheduler.submit(_LANES.get(kind, "cpu"), _render, src, dst, size, kind,
+                                    name=f"thumb:{os.path.basename(src)}")
+        if not fut.done():                  # 제자리 실행이면 이미 끝났다 — 목록에 남기지 않는다
+            _inflight[dst] = fut
+        return fut
+
+
+async def get(src: str, size: int = 200, kind: str = "photo") -> Optional[str]:
+    """비동기판 — 렌더는 레인에서, 이 코루틴은 기다리기만. 취소돼도 렌더는 계속(함께 기다리는 쪽)"""
+    return await asyncio.shield(asyncio.wrap_future(request(src, size, kind)))
+
+
+def _prewarm_feed(items) -> None:
+    pending = set()
+    for src, kind, size in items:
+        try:
+            fut = request(src, size, kind)
+        except Exception:
+            continue
+        if not fut.done():
+            pending.add(fut)
+        if len(pending) >= PREWARM_WINDOW:
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+    wait(pending)
+
+
+def prewarm(paths: Iterable[str], size: int = 200) -> int:
+    """여러 장을 뒤에서 미리 그린다 → 새로 그릴 장 수 (신선한 것은 건너뜀). 기다리지 않는다."""
+    items = []
+    for src in paths:
+        kind = thumbnails.classify(src)
+        if kind not in ("photo", "video") or _fresh(cache_path(src, size, kind), src):
+            continue
+        items.append((src, kind, size))
+    if items:
+        with _lock:
+            _stats["prewarm_queued"] += len(items)
+        threading.Thread(target=_prewarm_feed, args=(items,), daemon=True,
+                         name="thumb-prewarm").start()
+    return len(items)
+
+
+def stats() -> Dict[str, int]:
+    with _lock:
+        return {"inflight": len(_inflight), **_stats}
@@ -8,7 +8,17 @@ agent_cognitive.py 에서 분리(2026-07-17, 1500줄 규칙 모듈화). 사용
 _FORAGE_CUES(포식 의도 게이트)는 여기 정의하고 증류 쪽도 self 로 공유한다.
 """
 
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
+
+
+class _Deferred(NamedTuple):
+    """부작용을 '실제로 쓰일 때'로 미룬 회상 블록 (2026-10-16).
+
+    예산 안에서만 쓰이는 원천(_run_recall_sources)이 읽는 김에 상태를 바꾸면(보고 표식·used_at),
+    예산을 넘겨 버려진 블록도 '쓰였다'고 남는다. 그런 원천은 블록과 함께 on_used 를 돌려주고,
+    합성 쪽이 블록을 실제로 넣을 때 한 번 부른다."""
+    block: str
+    on_used: Callable[[], None]
 
 
 class CognitiveRecallMixin:
@@ -35,63 +45,72 @@ class CognitiveRecallMixin:
             - top_code: 해마 최고 점수 항목의 ibl_code (action_hint 적용 시 "[node:action]")
         """
         try:
-            exec_xml, top_score, top_code = ("", 0.0, "")
+            hint_xml = None
             if action_hint:
                 from ibl_usage_rag import build_execution_memory_from_hint
-                exec_xml, top_score, top_code = build_execution_memory_from_hint(action_hint)
-                if not exec_xml:
+                hint_xml = build_execution_memory_from_hint(action_hint)
+                if not hint_xml[0]:
                     print(f"[연상] action_hint='{action_hint}' 유효하지 않음 — 해마 검색으로 폴백")
+                    hint_xml = None
 
-            if not exec_xml:
+            def _hippocampus():
+                if hint_xml:
+                    return hint_xml
                 from ibl_usage_rag import build_execution_memory
                 allowed_nodes = self.config.get("allowed_nodes")
                 allowed_set = None
                 if allowed_nodes:
                     from ibl_access import resolve_allowed_nodes
                     allowed_set = resolve_allowed_nodes(allowed_nodes)
-                exec_xml, top_score, top_code = build_execution_memory(user_message, allowed_set)
-
-            # 심층 메모리에서 관련기억 검색 → 연상기억 합성.
-            #   ★include_related=False(포식 등): 무상태 검색을 개인 사실(심층 메모리)이 하이재킹하지
-            #   않도록 관련기억 주입을 끈다 — 포식은 이미 심층 메모리에 *쓰지 않으며*(무상태), 정당한
-            #   개인화는 포식기억(owner_model 웹 관습)이 담당한다. 넓은 질의가 최근 관심사로 좁혀지는
-            #   필터버블 드리프트 방지. (실행기억[해마]·포식기억·디스크골격은 그대로 유지.)
-            related = self._search_related_memory(user_message) if include_related else ""
+                return build_execution_memory(user_message, allowed_set)
+
+            # 회상 원천 — 아래 순서가 곧 합성 순서다. 원천마다의 뜻은 각 줄 주석 참조.
+            sources = [
+                # 실행기억(해마) — 명령 당 1회. top_score/top_code 는 Reflex·증류 판정이 재사용.
+                ("hippocampus", _hippocampus),
+                # 심층 메모리 관련기억.
+                #   ★include_related=False(포식 등): 무상태 검색을 개인 사실(심층 메모리)이 하이재킹하지
+                #   않도록 관련기억 주입을 끈다 — 포식은 이미 심층 메모리에 *쓰지 않으며*(무상태), 정당한
+                #   개인화는 포식기억(owner_model 웹 관습)이 담당한다. 넓은 질의가 최근 관심사로 좁혀지는
+                #   필터버블 드리프트 방지. (실행기억[해마]·포식기억·디스크골격은 그대로 유지.)
+                ("related", lambda: self._search_related_memory(user_message)) if include_related else None,
+                # 포식 기억(냄새지도) — ★실행기억처럼 *항상-on*. 회상은 싸고(LLM 0, DB+필터), 무관하면
+                #   query 필터가 빈 결과로 자기-억제한다(비용~0). 주인모델(owner)은 query 무관 상시 노출
+                #   =냄새(scent) → 명시 명령 없이도 능동 포식을 촉발. map 은 query 필터(관련 위치만).
+                #   FORAGER_MULTIBODY_DESIGN §주입(THINK-게이트 폐기, 관련성=query 가 자연 게이트).
+                ("forage", lambda: self._search_forage_memory(user_message)),
+                # 연결된 손발(게스트 PC) 프레즌스 — ★강제주입(질의 무관, 라이브일 때만).
+                #   손발 별칭(p0 등)=사용자가 지은 런타임 상태라 어휘·해마가 원리적으로 모른다
+                #   (ep840: "p0 시스템 상태"에 회상이 sense:self_check 로 오도 → others:agents/
+                #   self:limb 탐색 우회 98초). owner 냄새와 같은 상시-노출 원리, 없으면 0토큰.
+                ("limbs", self._limb_presence_scent),
+                # 직전 자기수리의 결말 — ★강제주입(질의 무관, 미보고분이 있을 때만).
+                #   backend 수리는 자기 턴이 죽은 뒤 워치독이 판정한다 → 그 판정을 말할 입이
+                #   없어 성공과 멎음이 구별되지 않았다. 미보고 판정을 주워 다음 턴이 닫는다.
+                #   파일 읽기뿐(LLM 0)·없으면 빈 문자열(0토큰)·한 번만 말한다(보고 표식 —
+                #   예산 초과로 버려지면 안 남도록 블록이 실제로 들어갈 때 _Deferred 로 찍는다).
+                ("repair", self._pending_repair_scent),
+                # 거친 디스크 골격(어디에) — ★포식 의도일 때만(상시-on 폐기, 웹랜드마크와 같은 게이트).
+                #   집중 관심 폴더 아래 거친 디렉토리 트리(맥/윈도우/리눅스 각자 자기 루트). ~5천 자라
+                #   파일·디스크 질의에만 값을 하고 그 외엔 무관 → _FORAGE_CUES 없으면 빈 결과(메서드 내 게이트).
+                #   깊은 상세·큐레이션은 위 forager 냄새가 관련시 페이징. focus_map.py(헌법1조).
+                ("skeleton", lambda: self._build_disk_skeleton(user_message)),
+            ]
+            got = self._run_recall_sources([src for src in sources if src])
+
+            exec_xml, top_score, top_code = got.get("hippocampus") or ("", 0.0, "")
             result = exec_xml
-            if related:
-                result = (result + "\n" + related) if result else related
-
-            # 포식 기억(냄새지도) — ★실행기억처럼 *항상-on*. 회상은 싸고(LLM 0, DB+필터), 무관하면
-            #   query 필터가 빈 결과로 자기-억제한다(비용~0). 주인모델(owner)은 query 무관 상시 노출
-            #   =냄새(scent) → 명시 명령 없이도 능동 포식을 촉발. map 은 query 필터(관련 위치만).
-            #   FORAGER_MULTIBODY_DESIGN §주입(THINK-게이트 폐기, 관련성=query 가 자연 게이트).
-            forage = self._search_forage_memory(user_message)
-            if forage:
-                result = (result + "\n" + forage) if result else forage
-
-            # 연결된 손발(게스트 PC) 프레즌스 — ★강제주입(질의 무관, 라이브일 때만).
-            #   손발 별칭(p0 등)=사용자가 지은 런타임 상태라 어휘·해마가 원리적으로 모른다
-            #   (ep840: "p0 시스템 상태"에 회상이 sense:self_check 로 오도 → others:agents/
-            #   self:limb 탐색 우회 98초). owner 냄새와 같은 상시-노출 원리, 없으면 0토큰.
-            limbs_scent = self._limb_presence_scent()
-            if limbs_scent:
-                result = (result + "\n" + limbs_scent) if result else limbs_scent
-
-            # 직전 자기수리의 결말 — ★강제주입(질의 무관, 미보고분이 있을 때만).
-            #   backend 수리는 자기 턴이 죽은 뒤 워치독이 판정한다 → 그 판정을 말할 입이
-            #   없어 성공과 멎음이 구별되지 않았다. 미보고 판정을 주워 다음 턴이 닫는다.
-            #   파일 읽기뿐(LLM 0)·없으면 빈 문자열(0토큰)·한 번만 말한다(보고 표식).
-            repair = self._pending_repair_scent()
-            if repair:
-                result = (result + "\n" + repair) if result else repair
-
-            # 거친 디스크 골격(어디에) — ★포식 의도일 때만(상시-on 폐기, 웹랜드마크와 같은 게이트).
-            #   집중 관심 폴더 아래 거친 디렉토리 트리(맥/윈도우/리눅스 각자 자기 루트). ~5천 자라
-            #   파일·디스크 질의에만 값을 하고 그 외엔 무관 → _FORAGE_CUES 없으면 빈 결과(메서드 내 게이트).
-            #   깊은 상세·큐레이션은 위 forager 냄새가 관련시 페이징. focus_map.py(헌법1조).
-            skeleton = self._build_disk_skeleton(user_message)
-            if skeleton:
-                result = (result + "\n" + skeleton) if result else skeleton
+            for name in ("related", "forage", "limbs", "repair", "skeleton"):
+                block = got.get(name)
+                if isinstance(block, _Deferred):
+                    block, on_used = block
+                    if block:
+                        try:
+                            on_used()
+                        except Exception as e:
+                            print(f"[연상] {self._RECALL_LABELS.get(name, name)} 사용 표식 실패 (무시): {e}")
+                if block:
+                    result = (result + "\n" + block) if result else block
 
             # ★웹 랜드마크(참고지도)는 여기서 bespoke 주입하던 것을 폐기 —
             #   data/guides/web_search.md(웹 검색 가이드) 안으로 접었다. 일반 에이전트는
@@ -121,6 +140,71 @@ class CognitiveRecallMixin:
             traceback.print_exc()
             return ("", 0.0, "")
 
+    # 회상 원천별 시간 예산(초) — 넘긴 원천은 이번 턴 문맥에서 빠진다(첫 토큰을 기다리게 하지 않는다).
+    #   해마는 Reflex 판정의 근거이고 첫 질의에서 임베딩 모델을 깨울 수 있어 가장 넉넉히 —
+    #   전체 마감(RECALL_DEADLINE_S)과 같다. 나머지는 있으면 좋은 문맥이라 짧게.
+    RECALL_BUDGETS = {"hippocampus": 6.0, "related": 1.5, "forage": 1.0,
+                      "limbs": 0.5, "repair": 0.5, "skeleton": 1.5}
+    RECALL_DEADLINE_S = 6.0
+    _RECALL_LABELS = {"hippocampus": "해마", "related": "관련기억", "forage": "포식기억",
+                      "limbs": "손발", "repair": "자기수리", "skeleton": "디스크골격"}
+
+    def _run_recall_sources(self, sources: list) -> dict:
+        """회상 원천들을 동시에 돌려 {이름: 결과} — 예산을 넘긴 원천은 빠진다 (2026-10-16).
+
+        ★예전엔 여섯 원천이 차례로 돌아 첫 토큰 지연이 그 합이었다(해마 임베딩 + 심층 검색 +
+        건별 read + 포식 DB + ...). network 레인에 한꺼번에 내고 원천별 예산·전체 마감 안에서
+        온 것만 쓴다. 늦은 원천은 lane_scheduler 가 포기 처리하고 결과는 버려진다.
+        ★그래서 원천은 부작용을 직접 내지 않는다 — 늦게 끝난 원천도 끝까지 돌기 때문이다.
+        표식이 필요한 원천은 _Deferred 를 돌려주고, 합성 쪽이 쓴 것만 표식한다.
+        각 원천은 호출 쪽 contextvars 사본 안에서 돈다 — print 가 이 에피소드 로그로 가도록.
+        원천별 소요는 `[연상:타이밍]` 한 줄 + 에피소드 steps(recall) 로 남는다.
+        """
+        import contextvars
+        import time
+        from concurrent.futures import TimeoutError as FuturesTimeoutError
+        import lane_scheduler
+
+        t0 = time.monotonic()
+        took = {}
+
+        def _timed(name, fn):
+            s0 = time.monotonic()
+            try:
+                return fn()
+            finally:
+                took[name] = int((time.monotonic() - s0) * 1000)
+
+        futures = [(name, lane_scheduler.submit("network", contextvars.copy_context().run,
+                                                _timed, name, fn, name=f"recall:{name}",
+                                                timed=True))
+                   for name, fn in sources]
+        got, dropped = {}, []
+        for name, fut in futures:
+            budget = self.RECALL_BUDGETS.get(name, self.RECALL_DEADLINE_S)
+            wait = max(0.0, min(t0 + budget, t0 + self.RECALL_DEADLINE_S) - time.monotonic())
+            try:
+                got[name] = lane_scheduler.wait_for(fut, wait)
+            except FuturesTimeoutError:
+                dropped.append(name)
+                took.setdefault(name, int(wait * 1000))
+            except Exception as e:
+                print(f"[연상] {self._RECALL_LABELS.get(name, name)} 회상 실패 (무시): {e}")
+
+        timings = {name: took.get(name) for name, _ in sources}
+        line = " · ".join(f"{self._RECALL_LABELS.get(n, n)} {ms}ms" for n, ms in timings.items()
+                          if n not in dropped)
+        if dropped:
+            line += " | 예산 초과 제외: " + ", ".join(
+                f"{self._RECALL_LABELS.get(n, n)}(>{timings[n]}ms)" for n in dropped)
+        print(f"[연상:타이밍] {int((time.monotonic() - t0) * 1000)}ms — {line}")
+        try:
+            from episode_logger import record_recall
+            record_recall(timings, dropped)
+        except Exception:
+            pass
+        return got
+
     def _limb_presence_scent(self) -> str:
         """연결된 USB 손발(게스트 PC)의 이름+의미 — ★강제주입 냄새.
 
@@ -155,7 +239,7 @@ class CognitiveRecallMixin:
         except Exception:
             return ""
 
-    def _pending_repair_scent(self) -> str:
+    def _pending_repair_scent(self):
         """아직 보고되지 않은 자기수리 판정 — ★강제주입 냄새.
 
         RED 수리(backend/*.py)는 편집이 부른 리로드가 그 턴을 죽인 **뒤에** 결말이 난다
@@ -163,21 +247,24 @@ class CognitiveRecallMixin:
         말할 입이 없어, 성공한 수리와 그냥 멎어버린 수리가 구별되지 않았다 — 자기수리가
         '멈춘 것처럼' 보이던 증상의 나머지 절반. 여기서 미보고 판정을 주워 다음 턴이
         말로 닫는다. 시스템 AI 만 — 수리의 주체이자 보고 책임자다(프로젝트 에이전트에게는
-        남의 일이라 잡음)."""
+        남의 일이라 잡음).
+        보고 표식은 블록이 실제로 문맥에 들어갈 때 — _Deferred.on_used 로 미룬다."""
         try:
             if not self.config.get("_is_system_ai"):
                 return ""
             from runtime_utils import get_base_path
             import red_report
-            return red_report.pending_scent(str(get_base_path()))
+            block, items = red_report.peek_scent(str(get_base_path()))
+            return _Deferred(block, lambda: red_report.mark_announced(items)) if items else block
         except Exception:
             return ""
 
-    def _search_related_memory(self, user_message: str) -> str:
+    def _search_related_memory(self, user_message: str):
         """심층 메모리에서 관련기억 검색 (top-3)
 
         사용자 메시지를 키워드로 심층 메모리를 검색하여
-        <related_memory> XML 블록으로 반환한다.
+        <related_memory> XML 블록으로 반환한다. 블록에 실린 기억의 used_at 갱신은
+        블록이 실제로 쓰일 때(_Deferred.on_used) — 예산 초과로 버려진 회상은 갱신하지 않는다.
         """
         try:
             import sys
@@ -209,13 +296,14 @@ class CognitiveRecallMixin:
             if not results:
                 return ""
 
-            # 전문 조회 (preview는 100자 잘림이므로)
-            items = []
+            # 전문 조회 (preview는 100자 잘림이므로) — 한 번에(read_many: 연결 1회, 갱신은 쓰일 때)
+            fulls = memory_db.read_many(project_path, agent_id, [r["id"] for r in results], touch=False)
+            items, used = [], []
             for r in results:
-                # last_seen은 read()가 used_at을 now로 갱신하기 전 값(search 결과)에서 취한다.
+                # last_seen은 used_at을 now로 갱신하기 전 값(search 결과)에서 취한다.
                 # 마지막으로 확인된(사용되거나 만들어진) 날짜 — 에이전트가 낡음을 스스로 판단하도록.
                 last_seen = (r.get("used_at") or r.get("created_at") or "")[:10]
-                full = memory_db.read(project_path, agent_id, r["id"])
+                full = fulls.get(r["id"])
                 if full:
                     cat = full.get("category", "")
                     kw = full.get("keywords", "")
@@ -224,6 +312,7 @@ class CognitiveRecallMixin:
                     meta += f' keywords="{kw}"' if kw else ""
                     meta += f' last_seen="{last_seen}"' if last_seen else ""
                     items.append(f"  <memory{meta}>{content}</memory>")
+                    used.append(r["id"])
 
             if not items:
                 return ""
@@ -236,7 +325,7 @@ class CognitiveRecallMixin:
             )
             print(f"[연상:관련기억] {len(items)}건 검색됨: \"{user_message[:40]}\"")
             print(f"[연상:관련기억] 내용:\n{xml}")
-            return xml
+            return _Deferred(xml, lambda: memory_db.touch_many(project_path, agent_id, used))
 
         except Exception as e:
             print(f"[연상:관련기억] 검색 실패 (무시): {e}")
@@ -62,6 +62,7 @@ DECLARATIONS: List[tuple] = [
 
     # 빌드 파생 (derived — 재생성 가능, 직접 편집 금지 부류)
     ("data/ibl_nodes.yaml",         "build_ibl_nodes 산출물",                    "derived"),
+    ("data/ibl_nodes.yaml.snapshot", "어휘 미리-컴파일 스냅샷(vocab_snapshot — yaml 에서 재생성)", "cache"),
     ("data/ibl_fixtures.json",      "build_ibl_nodes 산출물",                    "derived"),
     ("data/ibl_return_shapes.json", "ibl_shape_sweep 실측 반환 열(카탈로그 ⟨열⟩)",  "derived"),
     ("data/ibl_shape_sweep_state.json", "반환 모양 스윕 주간 카덴스 상태",        "state"),
@@ -76,6 +77,8 @@ DECLARATIONS: List[tuple] = [
     ("data/ibl_examples.db",        "해마 예제 DB(ibl_usage_db)",                "state"),
     ("data/ibl_hippo_index.json",   "해마 색인 export(파생)",                    "derived"),
     ("data/ibl_hippo_vecs.f32",     "해마 벡터 export(파생)",                    "derived"),
+    ("data/ibl_hippo_ivf/**",       "렌트 해마 ANN 색인 export(파생, int8)",     "derived"),
+    ("data/ibl_usage_ivf/**",       "해마 ANN 색인(hippo_ann, vec0 파생)",       "cache"),
     ("data/training/**",            "학습 코퍼스(gitignore — 몸)",               "state"),
     ("data/models/**",              "fine-tuned 모델(cloud_training 산출)",      "derived"),
 
@@ -158,7 +161,7 @@ DECLARATIONS: List[tuple] = [
     ("data/auto_response_state.json", "자동응답 on/off(auto_response)",          "state"),
     ("data/claude_code_*.json",     "claude_code 프로바이더 상태",               "state"),
     ("data/ai_desktop_map.json",    "자율주행 데스크탑 배치",                    "state"),
-    ("data/world_pulse_db.json",    "World Pulse 판(world_pulse.PULSE_DB_PATH)", "state"),
+    ("data/world_pulse_db.json*",   "옛 World Pulse 판 — world_snapshots 로 이관 후 .migrated", "state"),
     ("data/phone_agent.json",       "인가 폰 신원(phone_notifications)",         "state"),
     ("data/peer_cards/**",          "이웃 몸 명함 캐시(peer_cards)",             "state"),
     ("data/diagnostic_report.md",   "자가 진단 보고서(world_pulse_health — 재생성)", "derived"),
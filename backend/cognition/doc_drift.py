@@ -47,8 +47,10 @@ def _target_docs() -> List[Path]:
 # ── 실측 (레지스트리) ────────────────────────────────────────────────────────
 
 def _registry_facts() -> Dict:
-    import yaml
-    data = yaml.safe_load((_ROOT / "data" / "ibl_nodes.yaml").read_text(encoding="utf-8"))
+    import vocab_snapshot
+    data = vocab_snapshot.registry(_ROOT / "data" / "ibl_nodes.yaml").data()
+    if data is None:
+        raise FileNotFoundError(_ROOT / "data" / "ibl_nodes.yaml")
     nodes = data.get("nodes") or {}
     per = {n: len(b.get("actions") or {}) for n, b in nodes.items() if isinstance(b, dict)}
     tools_d = _ROOT / "data" / "packages" / "installed" / "tools"
@@ -60,8 +60,8 @@ class _AuditUnreadable(Exception):
 def _live_actions() -> Dict[str, str]:
     """현재 살아있는 액션 → desc."""
     try:
-        import yaml
-        d = yaml.safe_load((DATA_PATH / "ibl_nodes.yaml").read_text(encoding="utf-8"))
+        import vocab_snapshot
+        d = vocab_snapshot.registry(DATA_PATH / "ibl_nodes.yaml").data()
         nodes = d.get("nodes", d)
         return {
             f"{n}:{a}": (av.get("description") or "")
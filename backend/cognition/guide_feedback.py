@@ -65,8 +65,8 @@ _SYS = ("당신은 방금 작업을 끝낸 실행 에이전트다. 방금 쓴 
 
 def _live_actions() -> set:
     try:
-        import yaml
-        d = yaml.safe_load((DATA_PATH / "ibl_nodes.yaml").read_text(encoding="utf-8"))
+        import vocab_snapshot
+        d = vocab_snapshot.registry(DATA_PATH / "ibl_nodes.yaml").data()
         nodes = d.get("nodes", d)
         return {f"{n}:{a}" for n, v in nodes.items() if isinstance(v, dict)
                 for a in (v.get("actions") or {})}
@@ -94,31 +94,16 @@ _SYSTEM_IBL_MAP = {
     "request_user_approval": ("system", "approval"),
 }
 
-# 개별 도구 → (node, action) 역매핑 캐시
-_reverse_node_map: dict = None
-
-
 def _build_reverse_node_map() -> dict:
-    """ibl_nodes.yaml에서 도구 이름 → (node, action) 역매핑 구축"""
-    import yaml
+    """ibl_nodes.yaml에서 도구 이름 → (node, action) 역매핑 구축 (스냅샷 tool_action 색인)"""
+    import vocab_snapshot
     from runtime_utils import get_base_path
 
-    result = {}
-    path = get_base_path() / "data" / "ibl_nodes.yaml"
-    if not path.exists():
-        return result
-
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
-        for node_name, node_config in data.get("nodes", {}).items():
-            for action_name, action_config in node_config.get("actions", {}).items():
-                mapped_tool = action_config.get("tool")
-                if mapped_tool:
-                    result[mapped_tool] = (node_name, action_name)
+        index = vocab_snapshot.registry(get_base_path() / "data" / "ibl_nodes.yaml").index("tool_action")
     except Exception:
-        pass
-
-    return result
+        return {}
+    return index or {}
 
 
 def _tool_to_ibl_notation(tool_name: str, tool_input: dict) -> tuple:
@@ -149,13 +134,10 @@ def _tool_to_ibl_notation(tool_name: str, tool_input: dict) -> tuple:
     if tool_name in _SYSTEM_IBL_MAP:
         return _SYSTEM_IBL_MAP[tool_name]
 
-    # 개별 도구 → ibl_nodes.yaml 역매핑
-    global _reverse_node_map
-    if _reverse_node_map is None:
-        _reverse_node_map = _build_reverse_node_map()
-
-    if tool_name in _reverse_node_map:
-        return _reverse_node_map[tool_name]
+    # 개별 도구 → ibl_nodes.yaml 역매핑 (레지스트리 색인 — 재빌드도 그대로 따라간다)
+    reverse = _build_reverse_node_map()
+    if tool_name in reverse:
+        return reverse[tool_name]
 
     return ("tool", tool_name)
 
@@ -35,7 +35,7 @@ logger = logging.getLogger(__name__)
 
 BASE_PATH = get_base_path()
 DATA_PATH = BASE_PATH / "data"
-PULSE_DB_PATH = DATA_PATH / "world_pulse_db.json"
+PULSE_DB_PATH = DATA_PATH / "world_pulse_db.json"   # 옛 스냅샷 판 — 첫 접근 때 world_snapshots 로 이관(2026-10-16)
 PULSE_CONFIG_PATH = DATA_PATH / "world_pulse_config.json"
 PULSE_GUIDE_PATH = DATA_PATH / "guides" / "world_pulse.md"
 from pulse_db import (  # noqa: E402,F401
@@ -54,25 +54,79 @@ def _exec_tool(tool_name: str, params: dict):
 # DB 관리
 # ============================================================
 
-def _load_db() -> Dict:
-    """world_pulse_db.json 로드"""
+# ★저장소 이동(2026-10-16): world_pulse_db.json(저장마다 전체 재작성·읽을 때마다 전체 파싱)
+#   → world_pulse.db 의 world_snapshots(날짜 키 한 줄). 최근 SNAPSHOT_CACHE_DAYS 일은 메모리에
+#   두고 save_snapshot 이 그 자리를 고쳐 쓴다(write-through). 옛 JSON 은 첫 접근 때 한 번
+#   옮기고 .migrated 로 이름을 바꾼다(지우지 않는다).
+
+SNAPSHOT_CACHE_DAYS = 14
+
+_snap_cache: Optional[Dict[str, Dict]] = None      # 날짜 → 스냅샷 (_snap_cache_since 이후만)
+_snap_cache_since: Optional[str] = None
+_snap_lock = threading.Lock()
+_migrated_paths: set = set()
+
+
+def _migrate_json_db():
+    """옛 world_pulse_db.json 이 있으면 world_snapshots 로 옮긴다(이미 있는 날짜는 DB 우선)."""
     from world_pulse import PULSE_DB_PATH
-    if PULSE_DB_PATH.exists():
-        try:
-            return json.loads(PULSE_DB_PATH.read_text(encoding="utf-8"))
-        except Exception as e:
-            logger.warning(f"[WorldPulse] DB 로드 실패: {e}")
-    return {"snapshots": {}}
+    key = str(PULSE_DB_PATH)
+    if key in _migrated_paths:
+        return
+    _migrated_paths.add(key)
+    if not PULSE_DB_PATH.exists():
+        return
+    try:
+        old = json.loads(PULSE_DB_PATH.read_text(encoding="utf-8"))
+        from pulse_db import put_world_snapshots
+        n = put_world_snapshots(list((old.get("snapshots") or {}).values()), replace=False)
+        PULSE_DB_PATH.rename(PULSE_DB_PATH.with_name(PULSE_DB_PATH.name + ".migrated"))
+        logger.info(f"[WorldPulse] world_pulse_db.json → world_snapshots 이관 {n}건")
+    except Exception as e:
+        _migrated_paths.discard(key)
+        logger.warning(f"[WorldPulse] 스냅샷 JSON 이관 실패(다음에 재시도): {e}")
+
+
+def _recent_snapshots(days: int) -> Dict[str, Dict]:
+    """최근 days 일 스냅샷 {날짜: 스냅샷}. SNAPSHOT_CACHE_DAYS 안이면 캐시에서."""
+    global _snap_cache, _snap_cache_since
+    since = (date.today() - timedelta(days=max(days, 1) - 1)).isoformat()
+    if days > SNAPSHOT_CACHE_DAYS:
+        from pulse_db import load_world_snapshots
+        _migrate_json_db()
+        return {s["date"]: s for s in load_world_snapshots(since)}
+    with _snap_lock:
+        window = (date.today() - timedelta(days=SNAPSHOT_CACHE_DAYS - 1)).isoformat()
+        if _snap_cache is None or _snap_cache_since != window:        # 처음이거나 날이 바뀜
+            from pulse_db import load_world_snapshots
+            _migrate_json_db()
+            _snap_cache = {s["date"]: s for s in load_world_snapshots(window)}
+            _snap_cache_since = window
+        return {d: s for d, s in _snap_cache.items() if d >= since}
+
+
+def _invalidate_snapshot_cache():
+    global _snap_cache
+    with _snap_lock:
+        _snap_cache = None
+
+
+def _load_db() -> Dict:
+    """(호환) 전체 스냅샷을 옛 JSON 모양 {"snapshots": {날짜: ...}} 으로 — 전수 조회라 핫패스 금지."""
+    from pulse_db import load_world_snapshots
+    _migrate_json_db()
+    try:
+        return {"snapshots": {s["date"]: s for s in load_world_snapshots()}}
+    except Exception as e:
+        logger.warning(f"[WorldPulse] DB 로드 실패: {e}")
+        return {"snapshots": {}}
 
 
 def _save_db(db: Dict):
-    """world_pulse_db.json 저장"""
-    from world_pulse import PULSE_DB_PATH
-    PULSE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    PULSE_DB_PATH.write_text(
-        json.dumps(db, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+    """(호환) 옛 JSON 모양을 통째로 쓴다 — 날짜별 upsert."""
+    from pulse_db import put_world_snapshots
+    put_world_snapshots(list((db.get("snapshots") or {}).values()))
+    _invalidate_snapshot_cache()
 
 
 # ============================================================
@@ -254,8 +308,116 @@ def _collect_weather() -> str:
     return ""
 
 
+# ============================================================
+# 병렬 수집기 — 마감·부분 결과·마지막 정상값 (2026-10-16)
+#   ★네 수집기(경제·뉴스·기술·날씨)는 서로 독립인 네트워크 호출인데 차례로 돌아, 수집 지연이
+#   네 상류의 합이었고 그동안 _collecting 이 잡혀 있었다. 이제 network 레인에 한꺼번에 내고
+#   수집기별 제한시간 + 전체 마감 안에서 돌아온 것만 쓴다. 늦거나 죽은(예외) 칸은 마지막 정상값을
+#   그대로 두고 stale 로 표시한다(빈칸보다 어제 값이 낫다 — 다만 그렇다고 밝힌다).
+#   빈 결과는 정상 수집이다 — 상류가 정말 비웠는데 어제 값을 되살리면 없어진 항목이 돌아온다.
+#   제한시간을 넘긴 수집기는 lane_scheduler 가 포기 처리(슬롯 반납)하고, 끝나면 스스로 사라진다.
+# ============================================================
+
+# 칸 → (수집 함수, 설정 섹션). 섹션이 enabled:false 면 그 칸은 돌리지 않는다(stale 아님).
+_SNAPSHOT_COLLECTORS = {
+    "economy": (_collect_economy, "economy"),
+    "news": (_collect_news, "news"),
+    "tech": (_collect_tech_news, "tech"),
+    "weather": (_collect_weather, "weather"),
+}
+_EMPTY = {"economy": dict, "news": list, "tech": list, "weather": str}
+
+COLLECTOR_TIMEOUT_S = 20.0      # 수집기 하나의 제한시간(설정 collect.timeouts.{칸} 로 칸별 덮어쓰기)
+SNAPSHOT_DEADLINE_S = 30.0      # 스냅샷 전체 마감(설정 collect.deadline_s)
+
+# 칸 → {"value", "as_of"} — 프로세스 안의 마지막 정상값. 비어 있으면 저장된 스냅샷에서 채운다.
+_last_good: Dict[str, Dict] = {}
+_last_good_lock = threading.Lock()
+
+
+def _collect_limits(config: Dict) -> tuple:
+    """(칸별 제한시간 dict, 전체 마감) — 설정 collect 섹션이 있으면 그 값."""
+    cc = config.get("collect", {}) or {}
+    default = float(cc.get("timeout_s", COLLECTOR_TIMEOUT_S))
+    per = {name: float((cc.get("timeouts") or {}).get(name, default)) for name in _SNAPSHOT_COLLECTORS}
+    return per, float(cc.get("deadline_s", SNAPSHOT_DEADLINE_S))
+
+
+def _remember_good(name: str, value, as_of: str):
+    with _last_good_lock:
+        _last_good[name] = {"value": value, "as_of": as_of}
+
+
+def _recall_good(name: str) -> Optional[Dict]:
+    """마지막 정상값 — 이 프로세스에서 본 것, 없으면 최근 7일 저장 스냅샷에서 가장 최근 것."""
+    with _last_good_lock:
+        hit = _last_good.get(name)
+    if hit is not None:
+        return hit
+    try:
+        for snap in get_pulse_trend(7):
+            stale = snap.get("stale") or {}
+            if snap.get(name) and name not in stale:
+                hit = {"value": snap[name], "as_of": snap.get("collected_at", snap.get("date", ""))}
+                with _last_good_lock:
+                    _last_good.setdefault(name, hit)
+                return hit
+    except Exception as e:
+        logger.debug(f"[WorldPulse] 마지막 정상값 조회 실패({name}): {e}")
+    return None
+
+
+def _run_collectors(names: List[str], keep_last: bool = True, as_of: str = None) -> tuple:
+    """칸들을 동시에 돌려 (결과 dict, stale dict) 반환. 어떤 실패도 올리지 않는다.
+
+    stale: {칸: {"reason": timeout|error, "as_of": 값의 수집 시각 또는 None}}
+    빈 결과도 새 값이다(stale 아님). 마지막 정상값은 예외·시간 초과일 때만 쓴다.
+    keep_last=False 면 늦은/실패한 칸은 결과에서 빠진다(변화분 수집용 — 묵은 값은 변화가 아니다).
+    as_of: 새 값에 붙일 수집 시각(스냅샷의 collected_at 과 맞춘다, 기본 지금).
+    """
+    import time
+    import lane_scheduler
+    from concurrent.futures import TimeoutError as FuturesTimeoutError
+    from world_pulse import _load_config
+
+    config = _load_config()
+    per, deadline = _collect_limits(config)
+    as_of = as_of or datetime.now().isoformat()
+    t0 = time.monotonic()
+    futures = {}
+    for name in names:
+        fn, section = _SNAPSHOT_COLLECTORS[name]
+        if not (config.get(section, {}) or {}).get("enabled", True):
+            continue
+        futures[name] = lane_scheduler.submit("network", fn, name=f"world_pulse:{name}", timed=True)
+
+    results, stale = {}, {}
+    for name, fut in futures.items():
+        wait = max(0.0, min(t0 + per[name], t0 + deadline) - time.monotonic())
+        try:
+            value, reason = lane_scheduler.wait_for(fut, wait), None
+        except FuturesTimeoutError:
+            value, reason = None, "timeout"
+            logger.warning(f"[WorldPulse] {name} 수집 시간 초과({time.monotonic() - t0:.1f}s) — 마지막 정상값 유지")
+        except Exception as e:
+            value, reason = None, "error"
+            logger.warning(f"[WorldPulse] {name} 수집 실패: {e} — 마지막 정상값 유지")
+        if reason is None:
+            results[name] = value
+            _remember_good(name, value, as_of)
+            continue
+        last = _recall_good(name) if keep_last else None
+        stale[name] = {"reason": reason, "as_of": last["as_of"] if last else None}
+        if keep_last:
+            results[name] = last["value"] if last else _EMPTY[name]()
+
+    logger.info(f"[WorldPulse] 수집 {len(futures)}칸 {time.monotonic() - t0:.1f}s"
+                + (f" (stale: {', '.join(stale)})" if stale else ""))
+    return results, stale
+
+
 def collect_snapshot() -> Dict:
-    """전체 스냅샷 수집
+    """전체 스냅샷 수집 — 네 수집기를 동시에, 마감 안에서 (2026-10-16 병렬화)
 
     Returns:
         {
@@ -264,7 +426,8 @@ def collect_snapshot() -> Dict:
             "economy": {...},
             "news": [...],
             "tech": [...],
-            "weather": "..."
+            "weather": "...",
+            "stale": {"news": {"reason": "timeout", "as_of": "..."}}   # 늦은 칸이 있을 때만
         }
     """
     global _collecting
@@ -275,15 +438,16 @@ def collect_snapshot() -> Dict:
 
     try:
         logger.info("[WorldPulse] 스냅샷 수집 시작")
+        collected_at = datetime.now().isoformat()
+        results, stale = _run_collectors(list(_SNAPSHOT_COLLECTORS), as_of=collected_at)
 
         snapshot = {
             "date": date.today().isoformat(),
-            "collected_at": datetime.now().isoformat(),
-            "economy": _collect_economy(),
-            "news": _collect_news(),
-            "tech": _collect_tech_news(),
-            "weather": _collect_weather(),
+            "collected_at": collected_at,
+            **{name: results.get(name, _EMPTY[name]()) for name in _SNAPSHOT_COLLECTORS},
         }
+        if stale:
+            snapshot["stale"] = stale
 
         logger.info("[WorldPulse] 스냅샷 수집 완료")
         return snapshot
@@ -298,30 +462,33 @@ def collect_snapshot() -> Dict:
 # ============================================================
 
 def save_snapshot(snapshot: Dict):
-    """스냅샷을 DB에 저장"""
-    db = _load_db()
-    date_key = snapshot.get("date", date.today().isoformat())
-    db["snapshots"][date_key] = snapshot
-    _save_db(db)
+    """스냅샷을 DB에 저장 — 그날 한 줄 upsert + 캐시 고쳐 쓰기"""
+    from pulse_db import put_world_snapshots
+    date_key = snapshot.get("date") or date.today().isoformat()
+    snapshot = {**snapshot, "date": date_key}
+    _migrate_json_db()
+    put_world_snapshots([snapshot])
+    with _snap_lock:
+        if _snap_cache is not None and date_key >= (_snap_cache_since or ""):
+            _snap_cache[date_key] = snapshot
     logger.info(f"[WorldPulse] 스냅샷 저장: {date_key}")
 
 
 def get_today_pulse() -> Optional[Dict]:
     """오늘의 스냅샷 반환 (없으면 None)"""
-    db = _load_db()
-    return db["snapshots"].get(date.today().isoformat())
+    snap = _recent_snapshots(1).get(date.today().isoformat())
+    return dict(snap) if snap else None
 
 
 def get_pulse_trend(days: int = 7) -> List[Dict]:
     """최근 N일간 스냅샷 반환 (날짜 내림차순)"""
-    db = _load_db()
-    snapshots = db.get("snapshots", {})
+    snapshots = _recent_snapshots(days)
 
     result = []
     for i in range(days):
         d = (date.today() - timedelta(days=i)).isoformat()
         if d in snapshots:
-            result.append(snapshots[d])
+            result.append(dict(snapshots[d]))
 
     return result
 
@@ -760,15 +927,8 @@ def _collect_world_delta() -> Dict:
 
     delta = {}
 
-    # 경제 지표 (매시간)
-    economy = _collect_economy()
-    if economy:
-        delta["economy"] = economy
-
-    # 날씨 (매시간)
-    weather = _collect_weather()
-    if weather:
-        delta["weather"] = weather
+    # 경제·날씨(매시간) — 동시에, 마감 안에서. 늦은 칸은 빠진다(묵은 값은 변화분이 아니다)
+    names = ["economy", "weather"]
 
     # 뉴스는 설정된 간격으로만 (기본 6시간)
     config = _load_config()
@@ -792,11 +952,11 @@ def _collect_world_delta() -> Dict:
         should_collect_news = True
 
     if should_collect_news:
-        news = _collect_news()
-        if news:
-            delta["news"] = news
-        tech = _collect_tech_news()
-        if tech:
-            delta["tech"] = tech
+        names += ["news", "tech"]
+
+    results, _stale = _run_collectors(names, keep_last=False)
+    for name in names:
+        if results.get(name):
+            delta[name] = results[name]
 
     return delta
@@ -618,19 +618,24 @@ def purge_zombie_health_records() -> Dict:
     (실례: table 분리로 이사간 engines:filter 9종, 은퇴한 others:neighbors).
     __static__/__ibl_health__ 같은 시스템 네임스페이스(__ 접두)는 보존.
     """
-    import yaml
+    import telemetry_sink
+    import vocab_snapshot
     from pulse_db import _get_pulse_db
 
     nodes_path = Path(__file__).parent.parent.parent / "data" / "ibl_nodes.yaml"
     try:
-        with open(nodes_path, encoding="utf-8") as f:
-            nodes = (yaml.safe_load(f) or {}).get("nodes", {})
+        data = vocab_snapshot.registry(nodes_path).data()
+        if data is None:
+            raise FileNotFoundError(nodes_path)
+        nodes = data.get("nodes", {})
     except Exception as e:
         return {"error": f"ibl_nodes.yaml 로드 실패: {e}"}
     valid = {(n, a) for n, nd in nodes.items() for a in ((nd or {}).get("actions") or {})}
     if not valid:
         return {"error": "어휘 레지스트리가 비어 있음 — 청소 중단(안전판)"}
 
+    # 버퍼의 행을 먼저 쓴다 — 아니면 DELETE 뒤에 플러셔가 좀비 행을 되살린다
+    telemetry_sink.flush(timeout=2.0)
     removed = {}
     try:
         conn = _get_pulse_db()
@@ -735,8 +740,11 @@ def analyze_failure_patterns() -> Dict:
         slowdowns: 응답 시간이 증가 추세인 액션
         recovered: 이전에 실패했다가 최근 복구된 액션
     """
+    import telemetry_sink
     from pulse_db import _get_pulse_db
 
+    telemetry_sink.flush(timeout=2.0)   # 버퍼에 남은 최근 실패까지 보고 판정
+
     try:
         conn = _get_pulse_db()
         cutoff_7d = (datetime.now() - timedelta(days=7)).isoformat()
@@ -878,8 +886,11 @@ def get_action_health_summary() -> Dict:
     - failed: 실사용(usage)에서 최근 실패 기록 있고 그 이후 성공 없음
     - assumed: 실사용 기록 없음 (건강 체크 전용 실패는 failed로 올리지 않음)
     """
+    import telemetry_sink
     from pulse_db import _get_pulse_db
 
+    telemetry_sink.flush(timeout=2.0)
+
     try:
         conn = _get_pulse_db()
         cutoff = (datetime.now() - timedelta(days=7)).isoformat()
@@ -967,9 +978,12 @@ def get_recent_action_health(limit: int = 50, source: str = "usage") -> List[Dic
     (V18-2 실측 2026-08-22: 알림은 "만성 실패: self:workflow" 인데 results 500건에 0행,
     훈련자가 결국 DB 직독으로만 근거에 닿았다). 같은 칸 모양으로 내어 한 파이프에서
     대조할 수 있게 한다. source="all" 이면 시험 격리분(source='test')까지 포함.
+    최근 행을 보는 자리라 telemetry_sink 버퍼(아직 안 쓴 행)를 먼저 비운다.
     """
+    import telemetry_sink
     from pulse_db import _get_pulse_db
 
+    telemetry_sink.flush(timeout=2.0)
     try:
         conn = _get_pulse_db()
         if source and source != "all":
@@ -1181,13 +1195,12 @@ DIAGNOSTIC_REPORT_PATH = Path(__file__).parent.parent.parent / "data" / "diagnos
 
 def _count_all_actions() -> int:
     """ibl_nodes.yaml에서 전체 액션 수 카운트"""
-    import yaml as _yaml
+    import vocab_snapshot
     nodes_path = Path(__file__).parent.parent.parent / "data" / "ibl_nodes.yaml"
     if not nodes_path.exists():
         return 0
     try:
-        with open(nodes_path, "r", encoding="utf-8") as f:
-            data = _yaml.safe_load(f) or {}
+        data = vocab_snapshot.registry(nodes_path).data() or {}
         count = 0
         for section_key in ("nodes", "actions"):
             section = data.get(section_key, {})
@@ -1224,8 +1237,11 @@ def _calculate_action_coverage() -> Dict:
 
 def _get_recent_errors(days: int = 7, limit: int = 10) -> List[Dict]:
     """최근 N일간 실패 빈도 높은 액션 top N"""
+    import telemetry_sink
     from pulse_db import _get_pulse_db
 
+    telemetry_sink.flush(timeout=2.0)
+
     try:
         conn = _get_pulse_db()
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
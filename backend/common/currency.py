@@ -165,3 +165,100 @@ def derive_items(result: Any) -> Any:
         return result
 
     return result
+
+
+# ── 파이프 이음매의 구조 통화 (2026-10-16) ─────────────────────────────────────
+# `>>` 이음매는 통화를 JSON 문자열로 날랐다 — 생산자가 dict 를 내면 엔진이 덤프하고, 다음
+# 변환자(data-ops `_parse_prev`)가 같은 문자열을 다시 파싱했다. 50k행 sense>>filter>>sort>>
+# groupby 사슬이 같은 왕복을 네 번 치렀다. PipeCurrency 는 통화를 파이썬 객체로 들고 다니고
+# 문자열은 **경계**(옵트인하지 않은 소비자·원격 포워드·모델에게 가는 최종 봉투)에서만,
+# 그것도 한 번만 만든다. 옵트인 = data-ops 의 PIPE_CURRENCY_TOOLS·[table:each]
+# (ibl_engine._accepts_pipe_currency 가 판정).
+# ★소비자는 객체를 **변형하지 않는다** — 병렬(&) 가지들이 같은 객체를 나눠 받는다.
+
+# size() 추정에 쓰는 표본 행 수 — 스필 판정용이라 정밀할 필요는 없고 과소추정만 피하면 된다
+_SIZE_SAMPLE_ROWS = 16
+
+
+class PipeCurrency:
+    """이음매 통화 — obj(파싱된 통화)와 게으른 JSON 텍스트."""
+
+    __slots__ = ("obj", "_text")
+
+    def __init__(self, obj: Any, text: str = None):
+        self.obj = obj
+        self._text = text          # 생산자 결과를 이미 덤프했으면 그 문자열을 물려받는다
+
+    def text(self) -> str:
+        """경계용 JSON 문자열 — 처음 부를 때 한 번만 만든다."""
+        if self._text is None:
+            self._text = json.dumps(self.obj, ensure_ascii=False)
+        return self._text
+
+    def size(self) -> int:
+        """문자 수. 텍스트가 있으면 정확, 없으면 행 표본으로 추정(덤프하지 않는다)."""
+        if self._text is not None:
+            return len(self._text)
+        obj = self.obj
+        rows = obj.get("items") if isinstance(obj, dict) else obj
+        if not isinstance(rows, list) or len(rows) <= _SIZE_SAMPLE_ROWS:
+            return len(self.text())
+        step = len(rows) // _SIZE_SAMPLE_ROWS
+        sample = rows[::step][:_SIZE_SAMPLE_ROWS]
+        est = sum(len(json.dumps(r, ensure_ascii=False)) + 2 for r in sample) * len(rows) // len(sample)
+        if isinstance(obj, dict):
+            est += len(json.dumps({k: v for k, v in obj.items() if k != "items"}, ensure_ascii=False))
+        return est
+
+    def exceeds(self, limit: int) -> bool:
+        """size() > limit — 추정이 한도의 절반을 넘으면 정확히 잰다(표본 과소추정 방어)."""
+        if self._text is None and self.size() <= limit // 2:
+            return False
+        return len(self.text()) > limit
+
+    __str__ = text
+
+    def __repr__(self) -> str:
+        kind = type(self.obj).__name__
+        n = len(self.obj.get("items") or []) if isinstance(self.obj, dict) else (
+            len(self.obj) if isinstance(self.obj, list) else "-")
+        return f"<PipeCurrency {kind} rows={n} text={'cached' if self._text is not None else 'lazy'}>"
+
+
+def pipe_text(value: Any) -> str:
+    """이음매 값 → 문자열 (PipeCurrency 면 경계 직렬화, None 은 '')."""
+    if isinstance(value, PipeCurrency):
+        return value.text()
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def pipe_obj(value: Any) -> Any:
+    """이음매 값 → 파이썬 객체. PipeCurrency 는 재파싱 없이, JSON 문자열은 파싱(실패=None)."""
+    if isinstance(value, PipeCurrency):
+        return value.obj
+    if isinstance(value, str):
+        s = value.strip()
+        if not s:
+            return None
+        try:
+            return json.loads(s)
+        except Exception:
+            return None
+    return value
+
+
+def pipe_json_default(o: Any) -> Any:
+    """json.dumps(default=...) 훅 — 결과 봉투에 섞여 든 구조 통화(예: 입력을 그대로 되돌린 소비자)를
+    객체로 풀어 직렬화한다. 그 밖의 타입은 json 의 원래 TypeError."""
+    if isinstance(o, PipeCurrency):
+        return o.obj
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def materialize_params(params: Any) -> Any:
+    """params 의 `_prev_result` 가 구조 통화면 문자열로 바꾼 사본 — 원격 포워드·로그 등 경계용."""
+    if isinstance(params, dict) and isinstance(params.get("_prev_result"), PipeCurrency):
+        return {**params, "_prev_result": params["_prev_result"].text()}
+    return params
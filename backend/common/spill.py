@@ -9,15 +9,24 @@
 소비자(변환자 `_get_items`·each 입력·$items 바인딩·write 싱크)는 `resolve_ref` 한 줄로 투명하게
 읽는다. 디렉토리 `data/spill/` 은 소유 선언상 **cache** 계급 — 문장을 다시 돌리면 재생산되는
 파생물이라 기계 삭제가 맞다(2026-08-22 판정): 쓸 때마다 24h 지난 파일을 기회주의적으로 거둔다.
+
+행 형식 (2026-10-16): items/list 통화는 `.jsonl` 로 내린다 — 1행 = 헤더(봉투의 items 밖 키·
+items 를 그대로 비추던 거울 키·키 순서), 2행부터 = 행 하나씩. `resolve_ref` 는 여전히 봉투
+전체를 재조립해 주지만, 스트리밍 소비자(filter·take·each·write)는 `open_rows` 로 헤더만 읽고
+행은 순회 때 한 줄씩 받는다 — 수백 MB 스필을 통째로 메모리에 올리지 않는다. 헤더 없는 옛
+`.json` 스필·`[self:write]{spill:true}` 가 남긴 파일은 open_rows 가 None → 종전 전량 경로.
 """
 import json
 import os
 import time
 import uuid
-from typing import Any, Dict, Optional, Tuple
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 SPILL_TTL_S = 24 * 3600
 AUTO_SPILL_THRESHOLD = 200_000          # 문자 — 이 위는 모델 컨텍스트로 돌려 보낼 크기가 아니다
+_ROWS_MARK = "_spill_rows"              # 행 형식 헤더 표식 (값 = 형식 판)
 
 
 def _root() -> str:
@@ -57,19 +66,44 @@ def make_ref(path: str, kind: str, count: Optional[int], nbytes: int) -> Dict[st
             "expires_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(time.time() + SPILL_TTL_S))}
 
 
-def spill_write(payload: str, tag: str = "step") -> Dict[str, Any]:
-    """통화(문자열)를 스필 파일로 내리고 참조 봉투(dict)를 돌려준다."""
+def _spill_name(tag: str, ext: str) -> str:
+    return os.path.join(spill_dir(), f"{time.strftime('%Y%m%d_%H%M%S')}_{tag}_{uuid.uuid4().hex[:6]}{ext}")
+
+
+def _rows_header(kind: str, env: Optional[Dict[str, Any]] = None,
+                 mirrors: Optional[List[str]] = None, order: Optional[List[str]] = None) -> str:
+    head = {_ROWS_MARK: 1, "kind": kind, "envelope": env or {}, "mirrors": mirrors or [],
+            "order": order or ["items"]}
+    return json.dumps(head, ensure_ascii=False)
+
+
+def _split_envelope(obj: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str], List[str]]:
+    """봉투 → (items 밖 키, items 와 *같은 리스트*를 가리키던 거울 키, 키 순서)."""
+    items = obj["items"]
+    env, mirrors = {}, []
+    for k, v in obj.items():
+        if k == "items":
+            continue
+        # 거울 = 같은 객체, 또는 값이 같은 사본(data-ops _reproject_mirrors 의 판정과 같은 눈)
+        if v is items or (isinstance(v, list) and v and len(v) == len(items) and v == items):
+            mirrors.append(k)
+        else:
+            env[k] = v
+    return env, mirrors, list(obj.keys())
+
+
+def spill_write(payload: str, tag: str = "step", obj: Any = None) -> Dict[str, Any]:
+    """통화(문자열)를 스필 파일로 내리고 참조 봉투(dict)를 돌려준다.
+
+    obj: payload 의 파싱본을 호출자가 이미 쥐고 있으면(파이프 구조 통화) 넘긴다 — 종류·행 수
+    판정을 위해 수백 KB 를 다시 파싱하지 않게. items/list 통화는 행 형식(.jsonl)으로 쓴다."""
     gc()
-    d = spill_dir()
-    name = f"{time.strftime('%Y%m%d_%H%M%S')}_{tag}_{uuid.uuid4().hex[:6]}.json"
-    path = os.path.join(d, name)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(payload)
     kind, count = "text", None
     s = payload.lstrip()
     if s[:1] in "{[":
         try:
-            obj = json.loads(payload)
+            if obj is None:
+                obj = json.loads(payload)
             if isinstance(obj, dict) and isinstance(obj.get("items"), list):
                 kind, count = "items", len(obj["items"])
             elif isinstance(obj, list):
@@ -78,6 +112,23 @@ def spill_write(payload: str, tag: str = "step") -> Dict[str, Any]:
                 kind = "json"
         except Exception:
             pass
+    if kind in ("items", "list"):
+        if kind == "items":
+            env, mirrors, order = _split_envelope(obj)
+            rows, header = obj["items"], _rows_header(kind, env, mirrors, order)
+        else:
+            rows, header = obj, _rows_header(kind)
+        path = _spill_name(tag, ".jsonl")
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            n = f.write(header) + f.write("\n")
+            for r in rows:
+                n += f.write(json.dumps(r, ensure_ascii=False)) + f.write("\n")
+        ref = make_ref(path, kind, count, n)
+        ref["format"] = "rows"
+        return {"items": [], "ref": ref, "_spilled": True}
+    path = _spill_name(tag, ".json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(payload)
     return {"items": [], "ref": make_ref(path, kind, count, len(payload)), "_spilled": True}
 
 
@@ -88,15 +139,18 @@ def is_ref(obj: Any) -> bool:
 
 
 def read_ref(ref: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
-    """(본문, 오류문). 만료·부재는 정직한 오류."""
+    """(본문, 오류문). 만료·부재는 정직한 오류. 행 형식은 봉투 JSON 으로 재조립해 준다."""
     path = ref.get("path")
     if not path or not os.path.isfile(path):
         return None, (f"스필 참조가 가리키는 파일이 없습니다: {path} — 스필은 {SPILL_TTL_S // 3600}h 뒤 "
                       "삭제됩니다(캐시). 문장을 다시 실행하세요.")
     try:
+        rows = _open_path(path, ref)
+        if rows is not None:
+            return json.dumps(rows.load(), ensure_ascii=False), None
         with open(path, encoding="utf-8") as f:
             return f.read(), None
-    except OSError as e:
+    except (OSError, ValueError) as e:
         return None, f"스필 참조 읽기 실패: {e}"
 
 
@@ -104,6 +158,12 @@ def resolve_ref(obj: Any) -> Tuple[Any, Optional[str]]:
     """참조 봉투면 본문(파싱 시도)으로, 아니면 그대로. (값, 오류문)."""
     if not is_ref(obj):
         return obj, None
+    try:
+        rows = _open_path(obj["ref"]["path"], obj["ref"])
+        if rows is not None:
+            return rows.load(), None
+    except (OSError, ValueError) as e:
+        return obj, f"스필 참조 읽기 실패: {e}"
     body, err = read_ref(obj["ref"])
     if err:
         return obj, err
@@ -129,3 +189,140 @@ def resolve_ref_str(raw: Any) -> Tuple[Any, Optional[str]]:
                 return resolve_ref(obj)
         return raw, None
     return resolve_ref(raw)
+
+
+# ── 행 스트리밍 (2026-10-16) ────────────────────────────────────────────────────
+
+class RowStream(list):
+    """SpillRows 를 json 인코더에 *리스트처럼* 건네는 어댑터.
+
+    json 의 순수 파이썬 인코더(indent 지정 시 쓰임)는 list 서브클래스를 `for v in lst` 로
+    돈다 — 그래서 __iter__ 가 파일에서 한 줄씩 읽어 주면 `iterencode` 가 전량 적재 없이
+    json.dumps(indent=…) 와 같은 글자를 낸다. 진위·길이는 행 수로 답한다."""
+
+    def __init__(self, rows: "SpillRows"):
+        super().__init__()
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __bool__(self):
+        return len(self._rows) > 0
+
+
+class SpillRows:
+    """행 형식 스필의 스트리밍 뷰 — 헤더(봉투)만 쥐고, 행은 순회할 때마다 파일에서 한 줄씩.
+
+    `rows[:n]` 은 앞 n행만 읽는 뷰(len = min(n, 행 수)), `len()` 은 참조의 count(없으면 한 번 셈)."""
+
+    def __init__(self, path: str, head: Dict[str, Any], count: Optional[int] = None,
+                 stop: Optional[int] = None, ref: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.kind = head.get("kind") or "items"
+        self.envelope = head.get("envelope") or {}
+        self.mirrors = list(head.get("mirrors") or [])
+        self.order = list(head.get("order") or ["items"])
+        self.ref = ref or {"path": path, "kind": self.kind, "count": count}
+        self._head = head
+        self._count = count
+        self._stop = stop
+
+    def __iter__(self) -> Iterator[Any]:
+        def _gen():
+            with open(self.path, encoding="utf-8", newline="\n") as f:
+                f.readline()                                # 헤더
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        it = _gen()
+        return islice(it, self._stop) if self._stop is not None else it
+
+    def __len__(self) -> int:
+        if self._count is None:
+            with open(self.path, encoding="utf-8", newline="\n") as f:
+                self._count = max(0, sum(1 for ln in f if ln.strip()) - 1)
+        return self._count if self._stop is None else min(self._stop, self._count)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, key):
+        if (isinstance(key, slice) and key.start in (None, 0) and key.step in (None, 1)
+                and key.stop is not None and key.stop >= 0):
+            stop = key.stop if self._stop is None else min(key.stop, self._stop)
+            return SpillRows(self.path, self._head, self._count, stop, self.ref)
+        return list(self)[key]                              # 그 밖의 색인은 정직하게 전량
+
+    def head(self, n: int) -> List[Any]:
+        return list(islice(iter(self), max(0, n)))
+
+    def tail(self, n: int) -> List[Any]:
+        return list(deque(iter(self), maxlen=max(0, n))) if n > 0 else []
+
+    def shell(self, items: Optional[list] = None) -> Any:
+        """봉투를 재조립한다 — items 자리(와 거울 키)에 주어진 리스트(기본 빈 자리표시자)."""
+        ph = [] if items is None else items
+        if self.kind == "list":
+            return {"items": ph}
+        return {k: (ph if k == "items" or k in self.mirrors else self.envelope.get(k))
+                for k in self.order}
+
+    def load(self) -> Any:
+        """전량 재조립 — 옛 resolve_ref 와 같은 값(list 종류면 리스트 그대로)."""
+        rows = list(self)
+        return rows if self.kind == "list" else self.shell(rows)
+
+    def load_lazy(self) -> Any:
+        """load() 의 스트리밍판 — items 자리가 RowStream(직렬화 때 파일에서 한 줄씩)."""
+        return RowStream(self) if self.kind == "list" else self.shell(RowStream(self))
+
+
+def _open_path(path: str, ref: Optional[Dict[str, Any]] = None) -> Optional[SpillRows]:
+    """행 형식 파일이면 SpillRows, 아니면 None(옛 .json·write 산출물)."""
+    if not path.endswith(".jsonl") or not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8", newline="\n") as f:
+        first = f.readline()
+    try:
+        head = json.loads(first)
+    except ValueError:
+        return None
+    if not isinstance(head, dict) or not head.get(_ROWS_MARK):
+        return None
+    count = (ref or {}).get("count")
+    return SpillRows(path, head, count if isinstance(count, int) else None, ref=ref)
+
+
+def open_rows(raw: Any) -> Optional[SpillRows]:
+    """파이프 통화(구조 통화·문자열·dict)가 행 형식 스필 참조면 스트리밍 뷰, 아니면 None.
+
+    None 이면 호출자는 종전 경로(resolve_ref 전량)로 간다 — 파일 부재 같은 오류도 그쪽이
+    정직하게 진단한다."""
+    obj = getattr(raw, "obj", raw)
+    if isinstance(obj, str):
+        s = obj.lstrip()
+        if not (s.startswith("{") and '"ref"' in s[:400]):
+            return None
+        try:
+            obj = json.loads(obj)
+        except ValueError:
+            return None
+    if not is_ref(obj):
+        return None
+    try:
+        return _open_path(obj["ref"]["path"], obj["ref"])
+    except OSError:
+        return None
+
+
+def write_json_stream(fp, obj: Any, indent: int = 2) -> int:
+    """json.dumps(obj, ensure_ascii=False, indent=indent) 와 같은 글자를 조각조각 써 넣는다.
+    obj 안의 RowStream 은 파일에서 한 줄씩 흘러나온다. 쓴 글자 수 반환."""
+    n = 0
+    for chunk in json.JSONEncoder(ensure_ascii=False, indent=indent).iterencode(obj):
+        n += fp.write(chunk)
+    return n
@@ -11,15 +11,24 @@ print(... 실패 (무시): {e})` 로 감싼다. 그 자체는 옳다 — 창고
 ★치명 서브시스템(스케줄러·채널폴러·system_ai_runner)은 lifespan 에서 try 밖 맨몸
 호출이라 실패하면 부팅이 죽는다. 그건 의도된 설계이므로 여기 대상이 아니다 —
 이 원장은 "죽지는 않지만 없이 도는" 것들의 명단이다.
+
+import 예산 (2026-10-16): 같은 원장에 부팅 import 비용도 남는다 — record_import(이름, ms, phase).
+phase 는 boot(부팅 중 즉시) · lazy(첫 요청 때 — lazy_router) · deferred(미뤄 둠, 아직 0ms).
+import_report() 는 boot 합계를 BOOT_IMPORT_BUDGET_MS(env INDIEBIZ_BOOT_BUDGET_MS)와 견주고
+가장 무거운 것들을 보여 준다. 예산 초과도 **보이기만** 한다 — ok 를 바꾸지 않는다.
 """
 from __future__ import annotations
 
+import os
 import threading
 import time
 from typing import Any, Dict, List, Optional
 
 _LOCK = threading.Lock()
 _ENTRIES: Dict[str, Dict[str, Any]] = {}
+_IMPORTS: Dict[str, Dict[str, Any]] = {}
+
+BOOT_IMPORT_BUDGET_MS = float(os.environ.get("INDIEBIZ_BOOT_BUDGET_MS", "2500"))
 
 
 def record(name: str, ok: bool, error: Optional[BaseException | str] = None,
@@ -47,8 +56,48 @@ def snapshot() -> Dict[str, Any]:
         "failed": failed,
         "total": len(entries),
         "entries": entries,
+        "imports": import_report(),
     }
 
 
 def failed_names() -> List[str]:
     return snapshot()["failed"]
+
+
+def record_import(name: str, ms: Optional[float], phase: str = "boot") -> None:
+    """import 한 덩어리의 비용(ms). deferred 는 ms=None — 나중에 lazy 로 덮어쓴다."""
+    with _LOCK:
+        _IMPORTS[name] = {
+            "name": name,
+            "ms": round(ms, 1) if ms is not None else None,
+            "phase": phase,
+            "at": time.time(),
+        }
+
+
+def import_report(budget_ms: Optional[float] = None, top: int = 8) -> Dict[str, Any]:
+    """{budget_ms, boot_ms, over_budget, slowest:[…], lazy:[…], deferred:[이름…]}"""
+    budget = BOOT_IMPORT_BUDGET_MS if budget_ms is None else budget_ms
+    with _LOCK:
+        rows = [dict(v) for v in _IMPORTS.values()]
+    boot = sorted((r for r in rows if r["phase"] == "boot"), key=lambda r: -r["ms"])
+    boot_ms = round(sum(r["ms"] for r in boot), 1)
+    return {
+        "budget_ms": budget,
+        "boot_ms": boot_ms,
+        "over_budget": boot_ms > budget,
+        "slowest": [{"name": r["name"], "ms": r["ms"]} for r in boot[:top]],
+        "lazy": [{"name": r["name"], "ms": r["ms"]}
+                 for r in sorted(rows, key=lambda r: r["at"]) if r["phase"] == "lazy"],
+        "deferred": sorted(r["name"] for r in rows if r["phase"] == "deferred"),
+    }
+
+
+def import_summary() -> str:
+    """부팅 로그 한 줄 — 예산 초과면 가장 무거운 셋을 붙인다."""
+    rep = import_report()
+    line = (f"[boot] import {rep['boot_ms']:.0f}ms / 예산 {rep['budget_ms']:.0f}ms"
+            f" — 지연 라우터 {len(rep['deferred'])}개")
+    if rep["over_budget"]:
+        line += " ⚠ 초과: " + ", ".join(f"{r['name']} {r['ms']:.0f}ms" for r in rep["slowest"][:3])
+    return line
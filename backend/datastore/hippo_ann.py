@@ -0,0 +1,396 @@
+"""
+hippo_ann.py — 해마 벡터의 근사 최근접 이웃(ANN) 색인: NumPy IVF-Flat (2026-10-16)
+
+왜 있는가 — 해마 시맨틱 검색은 질의마다 전수 비교였다. 로컬은 sqlite-vec vec0 KNN(전수 스캔),
+렌트(폰)는 ibl_hippo_vecs.f32 를 통째로 읽어 `vecs @ qv`. 코퍼스가 증류·시딩으로 자라면 질의
+비용이 코퍼스 크기에 정비례하고, 렌트 몸은 파일 전체를 힙에 올려 둔다.
+
+구조 (L2 정규화 벡터, 내적 = 코사인):
+  중심    spherical k-means 로 nlist 개. 질의는 가까운 중심 nprobe 개의 목록만 훑는다.
+  목록    벡터를 목록 순서로 재배열해 연속 저장 — 목록 하나 = 행렬 슬라이스 하나(memmap 뷰).
+  델타    증분 추가(add)는 재학습 없이 델타에 쌓고 질의마다 전수 비교. 델타가 본체의
+          REBUILD_RATIO 를 넘으면 합쳐서 다시 짓는다.
+  묘비    remove·같은 키 덮어쓰기는 본체 행을 묘비로 가린다(재구축 때 정리).
+  평면    FLAT_MAX 이하는 중심 없이 전수 — 그 크기에선 정확 검색이 더 싸고 재현율 손실도 없다.
+  양자화  quantize="f16"|"int8" 이면 본체를 반/¼ 크기로 저장하고(int8 은 차원별 스케일) 거친 점수로
+          k×RERANK_FACTOR 후보를 고른 뒤, full_vectors(keys) 가 있으면 원본 f32 로 다시 채점한다
+          — 결과 점수는 정밀도 그대로, 훑는 바이트는 ¼. (2026-10-16, 폰 콜드스타트·RSS)
+
+디스크 (디렉토리 하나, 원본 벡터 옆):
+  meta.json       {dim, nlist, count, signature, quantize, tombstones}
+  centroids.npy   (nlist, dim) float32
+  vecs.npy        (count, dim) float32|float16|int8 — 목록 순서. np.load(mmap_mode='r') 로 필요한 페이지만
+  scale.npy       (dim,) float32 — int8 일 때만. 원값 ≈ vecs × scale
+  keys.npy        (count,) int64 — vecs 행의 키(용례 id 또는 원본 행 번호)
+  offsets.npy     (nlist+1,) int64 — 목록 c = vecs[offsets[c]:offsets[c+1]]
+  delta_*.npy     증분분(작다 — add 마다 이것과 meta 만 다시 쓴다)
+
+signature 는 호출 측이 정하는 원본 지문이다(file_signature — 내용 기반이라 복사·압축 해제에도
+같다). 열 때 지문이나 양자화가 다르면 None → 호출 측이 다시 짓는다.
+"""
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import zlib
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FLAT_MAX = 2048          # 이하면 평면(전수) 색인
+REBUILD_RATIO = 0.2      # 델타가 본체의 이 비율을 넘으면 재구축
+REBUILD_MIN = 256        # 작은 색인이 add 몇 번에 재구축을 반복하지 않게
+PROBE_RATIO = 0.15       # 기본 nprobe = nlist × 이 비율 (최소 8)
+RERANK_FACTOR = 4        # 양자화 색인: 거친 후보 = k × 이 값 → 원본으로 재채점
+QUANTIZE_MODES = ("f32", "f16", "int8")
+KMEANS_ITERS = 10
+TRAIN_PER_LIST = 64      # k-means 학습 표본 상한 = nlist × 이 값
+_CHUNK = 8192            # 배정 시 한 번에 곱하는 행 수(메모리 상한)
+
+
+def _unit(m: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return (m / norms).astype(np.float32, copy=False)
+
+
+def file_signature(path) -> str:
+    """원본 벡터 파일 지문 — 크기 + 머리·꼬리 64KB crc. mtime 과 달리 번들 전개·복사에도 같다."""
+    path = Path(path)
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        crc = zlib.crc32(f.read(65536))
+        if size > 65536:
+            f.seek(max(65536, size - 65536))
+            crc = zlib.crc32(f.read(), crc)
+    return f"{size}:{crc:08x}"
+
+
+def _quantize(vecs: np.ndarray, mode: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """float32 행렬 → (저장 행렬, int8 스케일). int8 은 차원별 대칭 스케일(최대절댓값/127)."""
+    if mode == "f16":
+        return vecs.astype(np.float16), None
+    if mode == "int8":
+        top = np.abs(vecs).max(axis=0) if len(vecs) else np.ones(vecs.shape[1], np.float32)
+        scale = (np.where(top > 0, top, 1.0) / 127.0).astype(np.float32)
+        return np.clip(np.rint(vecs / scale), -127, 127).astype(np.int8), scale
+    return vecs, None
+
+
+def _assign(vecs: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    out = np.empty(len(vecs), dtype=np.int64)
+    for lo in range(0, len(vecs), _CHUNK):
+        out[lo:lo + _CHUNK] = np.argmax(vecs[lo:lo + _CHUNK] @ centroids.T, axis=1)
+    return out
+
+
+def _kmeans(vecs: np.ndarray, nlist: int, seed: int) -> np.ndarray:
+    """spherical k-means — 표본으로 학습, 빈 목록은 임의 표본으로 다시 심는다."""
+    rng = np.random.default_rng(seed)
+    cap = nlist * TRAIN_PER_LIST
+    sample = vecs if len(vecs) <= cap else vecs[np.sort(rng.choice(len(vecs), cap, replace=False))]
+    sample = np.ascontiguousarray(sample, dtype=np.float32)
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(KMEANS_ITERS):
+        assign = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        empty = np.bincount(assign, minlength=nlist) == 0
+        if empty.any():
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()), replace=False)]
+        centroids = _unit(sums)
+    return centroids
+
+
+class IVFIndex:
+    """IVF-Flat 색인 — build/load 로 만들고 search(배치)/add/remove/save."""
+
+    def __init__(self, dim: int, centroids: Optional[np.ndarray], vecs: np.ndarray,
+                 keys: np.ndarray, offsets: np.ndarray, signature: str = "",
+                 quantize: str = "f32", scale: Optional[np.ndarray] = None):
+        self.dim = dim
+        self.signature = signature
+        self.quantize = quantize
+        self._scale = scale
+        # keys → (len, dim) float32 원본. 양자화 색인의 재채점·재구축용(호출 측이 붙인다)
+        self.full_vectors: Optional[Callable[[np.ndarray], np.ndarray]] = None
+        self._centroids = centroids
+        self._vecs = vecs
+        self._keys = keys
+        self._offsets = offsets
+        self._dead = np.zeros(len(keys), dtype=bool)
+        self._row_of = None                                  # key → 본체 행 (add/remove 때 지연 생성)
+        self._delta_vecs = np.zeros((0, dim), dtype=np.float32)
+        self._delta_keys = np.zeros(0, dtype=np.int64)
+        self._lock = threading.RLock()
+        self._base_dirty = True                              # 본체를 디스크에 다시 써야 하는가
+        self._path: Optional[Path] = None
+        self._meta_mtime = 0
+
+    # ── 만들기 ──────────────────────────────────────────────────────────
+    @classmethod
+    def build(cls, vecs, keys, signature: str = "", nlist: Optional[int] = None,
+              seed: int = 0, quantize: str = "f32") -> "IVFIndex":
+        if quantize not in QUANTIZE_MODES:
+            raise ValueError(f"quantize 는 {QUANTIZE_MODES} 중 하나: {quantize}")
+        vecs = np.ascontiguousarray(vecs, dtype=np.float32)
+        keys = np.asarray(keys, dtype=np.int64)
+        if len(keys):
+            # 같은 키가 여럿이면 마지막 것이 이긴다(INSERT OR REPLACE 와 같은 뜻)
+            _, last = np.unique(keys[::-1], return_index=True)
+            if len(last) != len(keys):
+                pick = np.sort(len(keys) - 1 - last)
+                vecs, keys = vecs[pick], keys[pick]
+        n, dim = len(keys), vecs.shape[1] if vecs.ndim == 2 else 0
+        if nlist is None:
+            nlist = 0 if n <= FLAT_MAX else int(round(math.sqrt(n)))
+        if nlist <= 1 or n < nlist * 4:
+            centroids, offsets = None, np.array([0, n], dtype=np.int64)
+        else:
+            centroids = _kmeans(vecs, nlist, seed)
+            assign = _assign(vecs, centroids)
+            order = np.argsort(assign, kind="stable")
+            offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=nlist))]).astype(np.int64)
+            vecs, keys = vecs[order], keys[order]
+        stored, scale = _quantize(vecs, quantize)
+        return cls(dim, centroids, stored, keys, offsets, signature, quantize, scale)
+
+    @property
+    def nlist(self) -> int:
+        return 0 if self._centroids is None else len(self._centroids)
+
+    def __len__(self) -> int:
+        return int(len(self._keys) - self._dead.sum() + len(self._delta_keys))
+
+    # ── 검색 ────────────────────────────────────────────────────────────
+    def search(self, queries, k: int, nprobe: Optional[int] = None
+               ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """질의 행렬 (m, dim) → 질의마다 (keys, scores) 점수 내림차순 상위 k.
+        양자화 색인은 full_vectors 가 있으면 k×RERANK_FACTOR 후보를 원본 정밀도로 재채점한다."""
+        q = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        m = len(q)
+        with self._lock:
+            vecs, keys, offsets, cents = self._vecs, self._keys, self._offsets, self._centroids
+            dead = self._dead if self._dead.any() else None
+            dvecs, dkeys = self._delta_vecs, self._delta_keys
+            scale, full = self._scale, self.full_vectors
+        qs_base = q if scale is None else q * scale            # int8: 스케일을 질의 쪽에 접는다
+        rerank = full is not None and self.quantize != "f32"
+        fetch = k * RERANK_FACTOR if rerank else k
+        parts: List[list] = [[] for _ in range(m)]
+
+        def _take(lo, hi, qs):
+            if hi <= lo:
+                return
+            sims = vecs[lo:hi] @ qs_base[qs].T                 # (rows, len(qs))
+            rows = keys[lo:hi]
+            live = None if dead is None else ~dead[lo:hi]
+            for col, j in enumerate(qs):
+                s = sims[:, col]
+                parts[j].append((rows, s) if live is None else (rows[live], s[live]))
+
+        if cents is None:
+            _take(0, len(keys), list(range(m)))
+        else:
+            nl = len(cents)
+            probe = min(nl, nprobe or max(8, math.ceil(nl * PROBE_RATIO)))
+            near = q @ cents.T
+            if probe < nl:
+                near = np.argpartition(-near, probe - 1, axis=1)[:, :probe]
+            else:
+                near = np.tile(np.arange(nl), (m, 1))
+            by_list: dict = {}
+            for j, lists in enumerate(near):
+                for c in lists:
+                    by_list.setdefault(int(c), []).append(j)
+            for c, qs in by_list.items():
+                _take(int(offsets[c]), int(offsets[c + 1]), qs)
+        if len(dkeys):
+            dsims = dvecs @ q.T
+            for j in range(m):
+                parts[j].append((dkeys, dsims[:, j]))
+
+        out = []
+        for j in range(m):
+            if not parts[j]:
+                out.append((np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)))
+                continue
+            ks = np.concatenate([p[0] for p in parts[j]])
+            ss = np.concatenate([p[1] for p in parts[j]])
+            if len(ss) > fetch:
+                top = np.argpartition(-ss, fetch - 1)[:fetch]
+                ks, ss = ks[top], ss[top]
+            if rerank and len(ks):
+                ss = np.asarray(full(ks), dtype=np.float32) @ q[j]
+                if len(ss) > k:
+                    top = np.argpartition(-ss, k - 1)[:k]
+                    ks, ss = ks[top], ss[top]
+            order = np.argsort(-ss, kind="stable")
+            out.append((ks[order], ss[order]))
+        return out
+
+    # ── 증분 ────────────────────────────────────────────────────────────
+    def _rows(self) -> dict:
+        if self._row_of is None:
+            self._row_of = {int(key): i for i, key in enumerate(self._keys)}
+        return self._row_of
+
+    def _bury(self, keys) -> None:
+        """본체 행은 묘비로, 델타 행은 삭제."""
+        rows = self._rows()
+        for key in keys:
+            r = rows.get(int(key))
+            if r is not None:
+                self._dead[r] = True
+        if len(self._delta_keys):
+            keep = ~np.isin(self._delta_keys, np.asarray(list(keys), dtype=np.int64))
+            self._delta_vecs, self._delta_keys = self._delta_vecs[keep], self._delta_keys[keep]
+
+    def add(self, vecs, keys) -> None:
+        """벡터 추가(같은 키는 교체). 델타가 커지면 합쳐서 다시 짓는다."""
+        vecs = np.atleast_2d(np.asarray(vecs, dtype=np.float32))
+        keys = np.asarray(keys, dtype=np.int64)
+        if not len(keys):
+            return
+        with self._lock:
+            self._bury(keys.tolist())
+            self._delta_vecs = np.concatenate([self._delta_vecs, vecs])
+            self._delta_keys = np.concatenate([self._delta_keys, keys])
+            if len(self._delta_keys) > max(REBUILD_MIN, REBUILD_RATIO * len(self._keys)):
+                self._rebuild()
+
+    def remove(self, keys) -> None:
+        with self._lock:
+            self._bury(list(keys))
+
+    def _rebuild(self) -> None:
+        live = ~self._dead
+        keys = self._keys[live]
+        if self.full_vectors is not None and self.quantize != "f32":
+            base = np.asarray(self.full_vectors(keys), dtype=np.float32)
+        else:
+            base = np.asarray(self._vecs)[live].astype(np.float32)
+            if self._scale is not None:
+                base = base * self._scale
+        fresh = IVFIndex.build(np.concatenate([base, self._delta_vecs]),
+                               np.concatenate([keys, self._delta_keys]),
+                               self.signature, quantize=self.quantize)
+        self._centroids, self._vecs, self._keys = fresh._centroids, fresh._vecs, fresh._keys
+        self._scale = fresh._scale
+        self._offsets, self._dead = fresh._offsets, fresh._dead
+        self._delta_vecs, self._delta_keys = fresh._delta_vecs, fresh._delta_keys
+        self._row_of, self._base_dirty = None, True
+        logger.info(f"[해마 ANN] 재구축: {len(self._keys)}개, 목록 {self.nlist}")
+
+    # ── 디스크 ──────────────────────────────────────────────────────────
+    def save(self, path) -> None:
+        """디렉토리에 저장. 본체가 그대로면 델타·메타만 다시 쓴다. 파일마다 tmp → replace."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        def _put(name, arr):
+            tmp = path / f".{name}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp, path / name)
+
+        with self._lock:
+            if self._base_dirty or self._path != path:
+                _put("vecs.npy", np.ascontiguousarray(self._vecs))
+                _put("keys.npy", self._keys)
+                _put("offsets.npy", self._offsets)
+                if self._centroids is not None:
+                    _put("centroids.npy", self._centroids)
+                if self._scale is not None:
+                    _put("scale.npy", self._scale)
+            _put("delta_vecs.npy", self._delta_vecs)
+            _put("delta_keys.npy", self._delta_keys)
+            meta = {"dim": self.dim, "nlist": self.nlist, "count": int(len(self._keys)),
+                    "signature": self.signature, "quantize": self.quantize,
+                    "tombstones": self._keys[self._dead].tolist()}
+            tmp = path / ".meta.json.tmp"
+            tmp.write_text(json.dumps(meta), encoding="utf-8")
+            os.replace(tmp, path / "meta.json")
+            self._base_dirty, self._path = False, path
+            self._meta_mtime = (path / "meta.json").stat().st_mtime_ns
+
+    @classmethod
+    def load(cls, path, signature: Optional[str] = None, mmap: bool = True,
+             quantize: Optional[str] = None) -> Optional["IVFIndex"]:
+        """저장본을 연다(본체 벡터는 memmap). 없거나 signature·quantize 가 다르면 None."""
+        path = Path(path)
+        try:
+            meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+            if signature is not None and meta.get("signature") != signature:
+                return None
+            mode = meta.get("quantize", "f32")
+            if quantize is not None and mode != quantize:
+                return None
+            vecs = np.load(path / "vecs.npy", mmap_mode="r" if mmap else None)
+            keys = np.load(path / "keys.npy")
+            offsets = np.load(path / "offsets.npy")
+            cents = np.load(path / "centroids.npy") if meta.get("nlist") else None
+            if len(keys) != meta.get("count") or vecs.shape != (len(keys), meta.get("dim")):
+                return None
+            scale = np.load(path / "scale.npy") if mode == "int8" else None
+            idx = cls(int(meta["dim"]), cents, vecs, keys, offsets, meta.get("signature", ""),
+                      mode, scale)
+            if (path / "delta_keys.npy").exists():
+                idx._delta_vecs = np.load(path / "delta_vecs.npy")
+                idx._delta_keys = np.load(path / "delta_keys.npy")
+            if meta.get("tombstones"):
+                idx._dead = np.isin(keys, np.asarray(meta["tombstones"], dtype=np.int64))
+            idx._base_dirty, idx._path = False, path
+            idx._meta_mtime = (path / "meta.json").stat().st_mtime_ns
+            return idx
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"[해마 ANN] 저장본 열기 실패({path}): {e}")
+            return None
+
+    def disk_changed(self) -> bool:
+        """저장한 뒤 다른 프로세스가 같은 디렉토리를 다시 썼거나 지웠는가."""
+        if self._path is None:
+            return False
+        try:
+            return (self._path / "meta.json").stat().st_mtime_ns != self._meta_mtime
+        except OSError:
+            return True
+
+
+def open_or_build(path, signature: str,
+                  source: Callable[[], Optional[Tuple[np.ndarray, np.ndarray]]],
+                  quantize: str = "f32",
+                  full_vectors: Optional[Callable[[np.ndarray], np.ndarray]] = None
+                  ) -> Optional[IVFIndex]:
+    """저장본이 signature·quantize 와 맞으면 열고, 아니면 source() → (vecs, keys) 로 지어 저장한다.
+    저장 실패(읽기전용 번들 등)는 메모리 색인으로 계속. source 가 None 이면 None.
+    full_vectors 는 양자화 색인의 재채점 원본(keys → f32 행)."""
+    idx = IVFIndex.load(path, signature, quantize=quantize)
+    if idx is not None:
+        idx.full_vectors = full_vectors
+        return idx
+    got = source()
+    if got is None:
+        return None
+    vecs, keys = got
+    idx = IVFIndex.build(_unit(np.atleast_2d(np.asarray(vecs, dtype=np.float32))), keys, signature,
+                         quantize=quantize)
+    idx.full_vectors = full_vectors
+    try:
+        idx.save(path)
+    except OSError as e:
+        logger.warning(f"[해마 ANN] 저장 실패(메모리 색인으로 계속): {e}")
+    logger.info(f"[해마 ANN] 구축: {len(idx)}개, 목록 {idx.nlist} → {path}")
+    return idx
+
+
+def drop(path) -> None:
+    """저장본 삭제 — 원본 벡터를 통째로 다시 만들 때(rebuild_index)."""
+    shutil.rmtree(path, ignore_errors=True)
@@ -3,9 +3,9 @@
 왜 분리: ibl_nodes.yaml 로드·캐시·몸-사전 설치 필터는 엔진(실행)보다 아래의
 '사전' 층이다. capability_card(명함)·ibl_safety·ibl_param_vocab 등 사전만 필요한
 소비자가 엔진 전체를 import 하면서 매듭의 가장 굵은 간선이 됐다(간선 하나에
-매듭 -10 실측). 로드가 곧 설치 — 캐시(_nodes)는 여기가 단일 소유자다.
+매듭 -10 실측). 로드가 곧 설치 — 설치본 캐시는 여기가 단일 소유자다(2026-10-16 부터
+vocab_snapshot 레지스트리의 derive 메모 — 원본 트리·스냅샷·무효화는 그쪽).
 """
-import json
 import os
 import re
 from pathlib import Path
@@ -13,7 +13,8 @@ from typing import Dict, List, Optional
 
 import yaml
 
-_nodes: Optional[Dict] = None
+import vocab_snapshot
+
 _nodes_path: Optional[Path] = None
 
 
@@ -113,52 +114,41 @@ def _merge_api_registry_actions(nodes_config: Dict):
         actions[action_name] = action
 
 
-# 폰 프로파일(#3 runs_on) — runnable 액션 집합 캐시.
-_phone_runnable_cache = {"loaded": False, "set": None}
-
-
 def _phone_runnable(node: str, action: str) -> bool:
-    """폰 프로파일이면 phone_manifest.runnable_actions 막을 적용. PC면 항상 True."""
+    """폰 프로파일이면 phone_manifest.runnable_actions 막을 적용. PC면 항상 True.
+
+    집합은 어휘 스냅샷의 phone_runnable 색인(매니페스트가 바뀌면 함께 갱신 — 2026-10-16).
+    """
     if os.environ.get("INDIEBIZ_PROFILE") != "phone":
         return True
-    if not _phone_runnable_cache["loaded"]:
-        s = None
-        try:
-            base = os.environ.get("INDIEBIZ_BASE_PATH") or os.path.join(os.path.dirname(os.path.dirname(__file__)), "..")
-            with open(os.path.join(base, "data", "phone_manifest.json"), "r", encoding="utf-8") as f:
-                s = set(json.load(f).get("runnable_actions") or [])
-        except Exception:
-            s = None  # 매니페스트 없으면 가드 비활성(안전)
-        _phone_runnable_cache["set"] = s
-        _phone_runnable_cache["loaded"] = True
-    rs = _phone_runnable_cache["set"]
+    rs = vocab_snapshot.registry(_get_nodes_path()).index("phone_runnable")
     return True if rs is None else (f"{node}:{action}" in rs)
 
 
 def _load_nodes_config() -> Dict:
-    """노드 정의 로드 (캐싱)"""
-    global _nodes
-    if _nodes is not None:
-        return _nodes
+    """노드 정의 로드 — 이 몸의 설치본은 사전 세대마다 한 번 (vocab_snapshot.derive)
 
-    path = _get_nodes_path()
-    if not path.exists():
-        _nodes = {"nodes": {}}
-        return _nodes
+    (2026-10-16) 원본 트리는 공유 어휘 레지스트리에서 받는다. 설치본은 병합·삭제를
+    제자리에서 하므로 공유 트리가 아니라 사본(fresh) 위에 만든다.
+    """
+    return vocab_snapshot.registry(_get_nodes_path()).derive("ibl_registry.installed", _install_nodes)
 
-    with open(path, "r", encoding="utf-8") as f:
-        _nodes = yaml.safe_load(f) or {"nodes": {}}
+
+def _install_nodes(reg) -> Dict:
+    nodes = reg.fresh()
+    if nodes is None:
+        return {"nodes": {}}
 
     # api_registry에서 node 바인딩된 액션 자동 병합
-    _merge_api_registry_actions(_nodes.get("nodes", {}))
+    _merge_api_registry_actions(nodes.get("nodes", {}))
 
     # 몸-사전 설치 필터(몸 독립 2단계): 배포물(yaml)=전체 사전집이지만, 이 몸의
     # 런타임에 설치되는 어휘는 자기 것만 — PC는 phone_only 를 모르고, 폰은 runnable
     # 만 안다. 남의 몸 능력은 명함(냄새)으로 알고 [others:ask] 로 부탁한다.
     # 코어(항상-on) 어휘는 양 몸 공통이라 @alias 크로스바디 포워딩이 그대로 산다.
-    _prune_foreign_vocabulary(_nodes)
+    _prune_foreign_vocabulary(nodes)
 
-    return _nodes
+    return nodes
 
 
 _pruned_foreign: Dict[str, str] = {}  # "node:action" → 사유 — 오류문 정직화용 (★F15)
@@ -196,10 +186,9 @@ def pruned_reason(node: str, action: str) -> Optional[str]:
 
 
 def invalidate_nodes() -> None:
-    """사전 캐시 무효화 — 다음 _load_nodes_config() 가 디스크에서 다시 읽는다.
+    """사전 캐시 무효화 — 다음 _load_nodes_config() 가 디스크를 다시 보고 설치본을 새로 만든다.
     (ibl_engine.reload_nodes 의 캐시 리셋 부분이 여기로 위임)"""
-    global _nodes
-    _nodes = None
+    vocab_snapshot.invalidate()
 
 
 # === 사전 소유 판정 — capability_card 에서 이동 (2026-08-05 ⑦) ===
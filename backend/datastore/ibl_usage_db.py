@@ -25,6 +25,8 @@ from dataclasses import dataclass
 from contextlib import contextmanager
 from datetime import datetime
 
+import telemetry_sink
+
 logger = logging.getLogger(__name__)
 
 # DB 경로 — 검색 인덱스(용례+벡터). 프로덕션(INDIEBIZ_BASE_PATH)에선 userData 아래에 둔다:
@@ -102,10 +104,19 @@ class IBLUsageDB:
     # 렌트 해마 (폰-자아 호스팅 §6): 로컬 model/sqlite-vec 가 없는 몸(폰)에서, 정적 인덱스를
     # 인메모리로 로드하고 질의 임베딩은 맥 /ibl/embed 로 렌트해 brute-force 코사인.
     # (인코더=공유 substrate, 인덱스=배포된 합성 코퍼스. export_hippo_index.py 가 정본→파생.)
-    _rented_vecs = None        # np.ndarray (count, dim), L2 정규화
+    _rented_vecs = None        # np.memmap (count, dim), L2 정규화 — 통째로 힙에 올리지 않는다
     _rented_metas = None       # list[dict] — 행 순서가 _rented_vecs 와 1:1
+    _rented_ann = None         # hippo_ann.IVFIndex (키 = _rented_metas 행 번호)
     _rented_load_attempted = False
 
+    # ANN 색인 (2026-10-16): 로컬 시맨틱도 vec0 전수 KNN 대신 hippo_ann(IVF)을 쓴다.
+    # vec0 가 정본이고 색인은 DB 옆(ibl_usage_ivf/)의 파생 — add/삭제는 증분 반영, 낡으면 재구축.
+    _ann = None                # hippo_ann.IVFIndex (키 = 용례 id)
+    _ann_checked = 0.0         # 마지막 신선도 확인 시각
+    _ann_lock = threading.Lock()
+    ANN_RECHECK_SECONDS = 30
+    _local = threading.local()  # 검색용 읽기 연결(스레드마다 하나 — 질의마다 connect 하지 않는다)
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -233,6 +244,26 @@ class IBLUsageDB:
             logger.error(f"[IBL Usage DB] sqlite-vec 연결 실패: {e}")
             return None
 
+    def _read_conn(self, vec: bool = False) -> Optional[sqlite3.Connection]:
+        """검색 경로용 읽기 연결 — 스레드마다 하나를 열어 재사용한다(WAL 이라 쓰기와 경합 없음).
+        vec=True 면 sqlite-vec 가 로드된 연결(불가하면 None). 호출 측은 닫지 않는다."""
+        slot = "vec" if vec else "plain"
+        held = getattr(self._local, slot, None)
+        if held is not None and held[0] == DB_PATH:
+            return held[1]
+        if held is not None:
+            held[1].close()
+        if vec:
+            conn = self._get_vec_connection()
+            if conn is None:
+                return None
+            self._ensure_vec_table(conn)
+        else:
+            conn = sqlite3.connect(DB_PATH)
+            conn.row_factory = sqlite3.Row
+        setattr(self._local, slot, (DB_PATH, conn))
+        return conn
+
     def _ensure_vec_table(self, conn):
         """vec0 가상 테이블 생성 (없으면)"""
         conn.execute(f"""
@@ -586,6 +617,7 @@ class IBLUsageDB:
                     (example_id, emb)
                 )
                 conn.commit()
+                self._ann_update([example_id], [emb])
         except Exception as e:
             logger.error(f"[IBL Usage DB] 인덱싱 실패: {e}")
         finally:
@@ -611,6 +643,7 @@ class IBLUsageDB:
                     (eid, emb)
                 )
             conn.commit()
+            self._ann_update(ids[:len(embeddings)], embeddings)
             logger.info(f"[IBL Usage DB] 배치 인덱싱 완료: {len(embeddings)}개")
         except Exception as e:
             logger.error(f"[IBL Usage DB] 배치 인덱싱 실패: {e}")
@@ -635,8 +668,81 @@ class IBLUsageDB:
                 logger.error(f"[IBL Usage DB] vec 삭제 실패: {e}")
             finally:
                 vconn.close()
+        self._ann_update(ids, None)
         self._search_cache.clear()
 
+    # =========================================================================
+    # ANN 색인 (hippo_ann) — vec0 의 파생. 로컬 시맨틱 질의가 전수 KNN 대신 이걸 본다.
+    # =========================================================================
+
+    @staticmethod
+    def _ann_dir() -> Path:
+        return Path(DB_PATH).with_name("ibl_usage_ivf")
+
+    def _ann_signature(self) -> str:
+        """원본 지문 — 다른 프로세스의 추가/삭제를 알아챈다(AUTOINCREMENT 라 max id 는 줄지 않는다)."""
+        n, top = self._read_conn().execute("SELECT COUNT(*), MAX(id) FROM ibl_examples").fetchone()
+        return f"examples:{n}:{top or 0}"
+
+    def _vec0_matrix(self):
+        """vec0 전체 → (vecs, ids). 색인을 (다시) 지을 때만."""
+        import numpy as np
+        conn = self._read_conn(vec=True)
+        if conn is None:
+            return None
+        rows = conn.execute("SELECT rowid, embedding FROM ibl_examples_vec").fetchall()
+        ids = np.array([int(r[0]) for r in rows], dtype=np.int64)
+        raw = b"".join(bytes(r[1]) for r in rows)
+        return np.frombuffer(raw, dtype=np.float32).reshape(len(rows), self.EMBEDDING_DIM), ids
+
+    def _local_ann(self):
+        """로컬 시맨틱용 ANN 색인 — 없거나 낡았으면 vec0 에서 다시 짓는다. 불가하면 None(→ vec0 KNN).
+        신선도(원본 지문·다른 프로세스의 저장)는 ANN_RECHECK_SECONDS 마다 한 번만 본다."""
+        ann = IBLUsageDB._ann
+        if ann is not None and time.time() - IBLUsageDB._ann_checked < self.ANN_RECHECK_SECONDS:
+            return ann
+        with IBLUsageDB._ann_lock:
+            try:
+                import hippo_ann
+                sig = self._ann_signature()
+                ann = IBLUsageDB._ann
+                if ann is None or ann.signature != sig or ann.disk_changed():
+                    ann = hippo_ann.open_or_build(self._ann_dir(), sig, self._vec0_matrix)
+            except Exception as e:
+                logger.warning(f"[IBL Usage DB] ANN 색인 불가(vec0 KNN 으로): {e}")
+                ann = None
+            IBLUsageDB._ann, IBLUsageDB._ann_checked = ann, time.time()
+            return ann
+
+    def _ann_update(self, ids: List[int], embeddings: Optional[List[bytes]]):
+        """vec0 쓰기를 열린 색인에 증분 반영(embeddings=None 이면 삭제) 후 저장.
+        열린 색인이 없으면 할 일 없음 — 다음 질의가 지문 불일치로 다시 짓는다."""
+        ann = IBLUsageDB._ann
+        if ann is None or not ids:
+            return
+        try:
+            import numpy as np
+            with IBLUsageDB._ann_lock:
+                if embeddings is None:
+                    ann.remove(ids)
+                else:
+                    ann.add(np.frombuffer(b"".join(embeddings), dtype=np.float32)
+                            .reshape(len(embeddings), self.EMBEDDING_DIM), ids)
+                ann.signature = self._ann_signature()
+                ann.save(self._ann_dir())
+        except Exception as e:
+            logger.warning(f"[IBL Usage DB] ANN 증분 반영 실패(다음 질의에 재구축): {e}")
+            IBLUsageDB._ann = None
+
+    def _drop_ann(self):
+        """vec0 를 통째로 다시 만들 때 — 색인도 버린다(다음 질의에 재구축)."""
+        try:
+            import hippo_ann
+            hippo_ann.drop(self._ann_dir())
+        except ImportError:
+            pass
+        IBLUsageDB._ann = None
+
     def consolidate_distilled(self, cap: int = 200,
                               dup_threshold: float = 0.92,
                               min_fails_to_prune: int = 2) -> Dict[str, Any]:
@@ -744,6 +850,7 @@ class IBLUsageDB:
             self._ensure_vec_table(conn)
             conn.execute("DELETE FROM ibl_examples_vec")
             conn.commit()
+            self._drop_ann()
 
             rows = conn.execute(
                 "SELECT id, intent, ibl_code FROM ibl_examples ORDER BY id"
@@ -815,7 +922,8 @@ class IBLUsageDB:
 
     @classmethod
     def _ensure_rented_index(cls) -> bool:
-        """ibl_hippo_index.json + ibl_hippo_vecs.f32 를 인메모리로 1회 로드(numpy 행렬)."""
+        """ibl_hippo_index.json + ibl_hippo_vecs.f32 를 1회 로드. 벡터는 memmap, 질의는 f32 옆
+        ibl_hippo_ivf/ 의 ANN 색인(hippo_ann)으로 — f32 가 바뀌면(지문 불일치) 다시 짓는다."""
         if cls._rented_vecs is not None:
             return True
         if cls._rented_load_attempted:
@@ -827,21 +935,46 @@ class IBLUsageDB:
             data_dir = Path(base) / "data"
             idx = json.loads((data_dir / "ibl_hippo_index.json").read_text(encoding="utf-8"))
             n, dim = idx["count"], idx["dim"]
-            raw = (data_dir / "ibl_hippo_vecs.f32").read_bytes()
-            vecs = np.frombuffer(raw, dtype=np.float32)
-            if vecs.size != n * dim:
-                logger.error(f"[IBL 렌트해마] 벡터 크기 불일치: {vecs.size} != {n}x{dim}")
+            vec_path = data_dir / "ibl_hippo_vecs.f32"
+            st = vec_path.stat()
+            if st.st_size != n * dim * 4:
+                logger.error(f"[IBL 렌트해마] 벡터 크기 불일치: {st.st_size // 4} != {n}x{dim}")
                 return False
-            cls._rented_vecs = vecs.reshape(n, dim)
+            vecs = np.memmap(vec_path, dtype=np.float32, mode="r", shape=(n, dim))
+            ann = cls._open_rented_ann(vec_path, vecs)
+            cls._rented_vecs, cls._rented_ann = vecs, ann
             cls._rented_metas = idx["examples"]
-            logger.info(f"[IBL 렌트해마] 인덱스 로드: {n}개 x {dim}차원 (질의는 맥 /embed 렌트)")
+            logger.info(f"[IBL 렌트해마] 인덱스 로드: {n}개 x {dim}차원, ANN 목록 {ann.nlist}·"
+                        f"{ann.quantize} (질의는 맥 /embed 렌트)")
             return True
         except Exception as e:
             logger.warning(f"[IBL 렌트해마] 인덱스 로드 실패(렌트 검색 비활성): {e}")
             return False
 
-    def _rent_query_vec(self, query: str):
-        """맥 /ibl/embed 로 질의 텍스트→768벡터 렌트. 인증=원격 런처 세션(_forward_to_mac 패턴)."""
+    @classmethod
+    def _open_rented_ann(cls, vec_path: Path, vecs):
+        """f32 옆 ibl_hippo_ivf/ 의 ANN 색인을 열거나 짓는다(export_hippo_index 가 미리 지어 번들에 싣는다).
+        본체는 양자화(기본 int8 — ¼ 크기)로 훑고 상위 후보만 f32 memmap 에서 재채점 — 폰 콜드스타트·RSS
+        에서 이 인덱스가 부팅 최대 단일 할당이었다. (2026-10-16)"""
+        import numpy as np
+        import hippo_ann
+        n, dim = vecs.shape
+        return hippo_ann.open_or_build(
+            Path(vec_path).with_name("ibl_hippo_ivf"),
+            f"f32:{n}x{dim}:{hippo_ann.file_signature(vec_path)}",
+            lambda: (vecs, np.arange(n, dtype=np.int64)),
+            quantize=cls._rented_quantize(),
+            full_vectors=lambda keys: vecs[np.asarray(keys, dtype=np.int64)])
+
+    @staticmethod
+    def _rented_quantize() -> str:
+        """렌트 색인 양자화 — INDIEBIZ_HIPPO_QUANT=f32|f16|int8 (기본 int8, 재채점은 f32)."""
+        mode = (os.environ.get("INDIEBIZ_HIPPO_QUANT") or "int8").strip().lower()
+        return mode if mode in ("f32", "f16", "int8") else "int8"
+
+    def _rent_query_vecs(self, queries: List[str]):
+        """맥 /ibl/embed 로 질의 텍스트들→(m, 768) 행렬 렌트 — 여럿이어도 왕복 1회(texts).
+        인증=원격 런처 세션(_forward_to_mac 패턴)."""
         mac_url = (os.environ.get("INDIEBIZ_MAC_URL") or "").rstrip("/")
         if not mac_url:
             return None
@@ -857,7 +990,7 @@ class IBLUsageDB:
             headers = {"Content-Type": "application/json"}
             if _sess.get("session"):
                 headers["X-Launcher-Session"] = _sess["session"]
-            return requests.post(f"{mac_url}/ibl/embed", json={"text": query},
+            return requests.post(f"{mac_url}/ibl/embed", json={"texts": list(queries)},
                                  headers=headers, timeout=20)
 
         def _login() -> bool:
@@ -882,29 +1015,31 @@ class IBLUsageDB:
             if r.status_code != 200:
                 logger.warning(f"[IBL 렌트해마] /embed 실패 HTTP {r.status_code}")
                 return None
-            vec = (r.json() or {}).get("vector")
-            return np.array(vec, dtype=np.float32) if vec else None
+            vecs = (r.json() or {}).get("vectors")
+            return np.array(vecs, dtype=np.float32) if vecs and len(vecs) == len(queries) else None
         except Exception as e:
             logger.warning(f"[IBL 렌트해마] /embed 호출 실패: {e}")
             return None
 
-    def _search_rented(self, query: str, top_k: int, allowed_nodes: set = None,
-                       category: str = None) -> List["UsageExample"]:
-        """렌트 모드 검색: 맥 /embed 질의벡터 + 인메모리 brute-force 코사인 → UsageExample.
-        벡터·문서 모두 L2 정규화라 dot = 코사인. FTS5 없이 순수 시맨틱(handoff '브루트포스 코사인')."""
-        if not self._ensure_rented_index():
-            return []
-        import numpy as np
-        qv = self._rent_query_vec(query)
-        if qv is None:
-            return []
-        sims = self._rented_vecs @ qv  # (count,)
+    def _search_rented_many(self, queries: List[str], top_k: int, allowed_nodes: set = None,
+                            category: str = None) -> List[List["UsageExample"]]:
+        """렌트 모드 검색: 맥 /embed 질의벡터(배치 1회) + ANN 색인 → 질의마다 UsageExample.
+        벡터·문서 모두 L2 정규화라 dot = 코사인. FTS5 없이 순수 시맨틱(handoff '브루트포스 코사인' 의
+        후속 — 작은 코퍼스는 hippo_ann 이 평면(전수)이라 결과가 같다)."""
+        if not queries or not self._ensure_rented_index():
+            return [[] for _ in queries]
+        qm = self._rent_query_vecs(queries)
+        if qm is None:
+            return [[] for _ in queries]
         # over-fetch 후 필터링(노드/카테고리)
-        over = min(len(sims), max(top_k * 5, top_k))
-        cand = np.argpartition(-sims, over - 1)[:over]
-        cand = cand[np.argsort(-sims[cand])]
+        over = max(top_k * 5, top_k)
+        return [self._materialize_rented(keys, sims, top_k, allowed_nodes, category)
+                for keys, sims in self._rented_ann.search(qm, over)]
+
+    def _materialize_rented(self, keys, sims, top_k: int, allowed_nodes: set = None,
+                            category: str = None) -> List["UsageExample"]:
         results: List[UsageExample] = []
-        for i in cand:
+        for i, sim in zip(keys, sims):
             meta = self._rented_metas[int(i)]
             if allowed_nodes:
                 ex_nodes = set(meta["nodes"].split(",")) if meta.get("nodes") else set()
@@ -918,7 +1053,7 @@ class IBLUsageDB:
                 id=meta["id"], intent=meta["intent"], ibl_code=meta["ibl_code"],
                 nodes=meta.get("nodes", ""), category=meta.get("category", "single"),
                 difficulty=meta.get("difficulty", 1),
-                score=round(float(sims[int(i)]), 4),
+                score=round(float(sim), 4),
                 source=meta.get("source", "synthetic"),
                 success_rate=round(success_rate, 2) if total else -1.0,
             ))
@@ -931,29 +1066,40 @@ class IBLUsageDB:
         emb = self._generate_embedding(query)
         if emb is None:
             return []
-        conn = self._get_vec_connection()
+        return self._semantic_many([emb], top_k)[0]
+
+    def _semantic_many(self, embs: List[bytes], top_k: int) -> List[List[Tuple[int, float]]]:
+        """packed 질의 임베딩들 → 질의마다 (id, similarity). ANN 색인 1회 배치 질의,
+        색인이 없으면 vec0 KNN(읽기 연결 하나로). 둘 다 정규화 벡터라 similarity = dot."""
+        ann = self._local_ann()
+        if ann is not None:
+            import numpy as np
+            qm = np.frombuffer(b"".join(embs), dtype=np.float32).reshape(len(embs), self.EMBEDDING_DIM)
+            return [[(int(i), max(0.0, float(sim))) for i, sim in zip(keys, sims)]
+                    for keys, sims in ann.search(qm, top_k)]
+        conn = self._read_conn(vec=True)
         if conn is None:
-            return []
-        try:
-            self._ensure_vec_table(conn)
-            rows = conn.execute("""
-                SELECT rowid, distance
-                FROM ibl_examples_vec
-                WHERE embedding MATCH ?
-                  AND k = ?
-                ORDER BY distance
-            """, (emb, top_k)).fetchall()
-            results = []
-            for row in rows:
-                dist = float(row['distance'])
-                similarity = max(0.0, 1.0 - (dist * dist / 2.0))
-                results.append((int(row['rowid']), similarity))
-            return results
-        except Exception as e:
-            logger.error(f"[IBL Usage DB] 시맨틱 검색 실패: {e}")
-            return []
-        finally:
-            conn.close()
+            return [[] for _ in embs]
+        out = []
+        for emb in embs:
+            try:
+                rows = conn.execute("""
+                    SELECT rowid, distance
+                    FROM ibl_examples_vec
+                    WHERE embedding MATCH ?
+                      AND k = ?
+                    ORDER BY distance
+                """, (emb, top_k)).fetchall()
+                results = []
+                for row in rows:
+                    dist = float(row['distance'])
+                    similarity = max(0.0, 1.0 - (dist * dist / 2.0))
+                    results.append((int(row['rowid']), similarity))
+                out.append(results)
+            except Exception as e:
+                logger.error(f"[IBL Usage DB] 시맨틱 검색 실패: {e}")
+                out.append([])
+        return out
 
     @staticmethod
     def _strip_korean_particles(text: str) -> str:
@@ -980,26 +1126,25 @@ class IBLUsageDB:
 
     def search_fts5(self, query: str, top_k: int = 10) -> List[Tuple[int, float]]:
         """FTS5 BM25 키워드 검색. (id, bm25_score) 리스트 반환"""
-        with self._get_connection() as conn:
-            try:
-                from korean_utils import tokenize_korean
-                # 한국어 정규화 토큰화: 조사 제거 + 복합어 분리
-                tokens = [t for t in tokenize_korean(query) if len(t) >= 2]
-                if not tokens:
-                    return []
-                fts_query = ' OR '.join(tokens)
-                rows = conn.execute("""
-                    SELECT e.id, bm25(ibl_examples_fts) as score
-                    FROM ibl_examples_fts fts
-                    JOIN ibl_examples e ON e.id = fts.rowid
-                    WHERE ibl_examples_fts MATCH ?
-                    ORDER BY score
-                    LIMIT ?
-                """, (fts_query, top_k)).fetchall()
-                return [(int(row['id']), -float(row['score'])) for row in rows]
-            except Exception as e:
-                logger.error(f"[IBL Usage DB] FTS5 검색 실패: {e}")
+        try:
+            from korean_utils import tokenize_korean
+            # 한국어 정규화 토큰화: 조사 제거 + 복합어 분리
+            tokens = [t for t in tokenize_korean(query) if len(t) >= 2]
+            if not tokens:
                 return []
+            fts_query = ' OR '.join(tokens)
+            rows = self._read_conn().execute("""
+                SELECT e.id, bm25(ibl_examples_fts) as score
+                FROM ibl_examples_fts fts
+                JOIN ibl_examples e ON e.id = fts.rowid
+                WHERE ibl_examples_fts MATCH ?
+                ORDER BY score
+                LIMIT ?
+            """, (fts_query, top_k)).fetchall()
+            return [(int(row['id']), -float(row['score'])) for row in rows]
+        except Exception as e:
+            logger.error(f"[IBL Usage DB] FTS5 검색 실패: {e}")
+            return []
 
     def _combine_scores(
         self,
@@ -1040,67 +1185,101 @@ class IBLUsageDB:
         Returns:
             UsageExample 리스트 (점수 내림차순)
         """
+        return self.search_hybrid_many([query], top_k, alpha, allowed_nodes, category)[0]
+
+    def search_hybrid_many(self, queries: List[str], top_k: int = 5,
+                           alpha: float = None,
+                           allowed_nodes: set = None,
+                           category: str = None) -> List[List[UsageExample]]:
+        """배치 하이브리드 검색 — 한 턴에 의도 여럿을 찾는 호출 측용 (2026-10-16).
+
+        질의마다 search_hybrid 와 같은 결과(같은 캐시 키)를 queries 순서로 돌려준다. 다만 캐시에
+        없는 질의들은 임베딩 1회(배치 encode 또는 /embed texts 1회), ANN 배치 질의 1회, 메타 조회
+        1회로 묶이고 연결은 스레드의 읽기 연결 하나를 쓴다.
+        """
         if alpha is None:
             alpha = self.DEFAULT_ALPHA
+        out: List[List[UsageExample]] = [[] for _ in queries]
 
         # 해마 비활성(폰 기본): 연상검색 자체를 건너뜀 → 맥 /embed 렌트 왕복 0.
-        if self.hippo_disabled():
-            return []
+        if not queries or self.hippo_disabled():
+            return out
 
         # 캐시 확인
-        cache_key = hashlib.md5(
-            f"{query}_{top_k}_{alpha}_{allowed_nodes}_{category}".encode()
-        ).hexdigest()
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached
-
-        # 렌트 모드(폰-자아 §6): 로컬 시맨틱 스택이 없으면 맥 /embed 렌트 + 인메모리 brute-force.
+        keys = [hashlib.md5(f"{q}_{top_k}_{alpha}_{allowed_nodes}_{category}".encode()).hexdigest()
+                for q in queries]
+        todo = []
+        for i, key in enumerate(keys):
+            cached = self._get_cached(key)
+            if cached is not None:
+                out[i] = cached
+            else:
+                todo.append(i)
+        if not todo:
+            return out
+        texts = [queries[i] for i in todo]
+
+        # 렌트 모드(폰-자아 §6): 로컬 시맨틱 스택이 없으면 맥 /embed 렌트 + 인메모리 ANN.
         if self._rented_mode():
-            results = self._search_rented(query, top_k, allowed_nodes, category)
-            self._set_cached(cache_key, results)
-            return results
+            for i, results in zip(todo, self._search_rented_many(texts, top_k, allowed_nodes, category)):
+                out[i] = results
+                self._set_cached(keys[i], results)
+            return out
 
         over_fetch = top_k * 3  # 필터링 후 충분한 결과를 위해 넉넉히
         use_semantic = self.is_semantic_available() and alpha > 0
+        sem_all = [[] for _ in texts]
+        if use_semantic:
+            embs = self._generate_embeddings_batch(texts)
+            if len(embs) == len(texts):
+                sem_all = self._semantic_many(embs, over_fetch)
 
-        semantic_results = self.search_semantic(query, over_fetch) if use_semantic else []
+        scored_all = [self._score_query(text, sem, alpha, over_fetch)
+                      for text, sem in zip(texts, sem_all)]
 
+        # 메타데이터 조회 — 모든 질의의 후보를 한 번에
+        all_ids = sorted({idx for scored in scored_all for idx, _ in scored})
+        if not all_ids:
+            return out
+        placeholders = ','.join('?' * len(all_ids))
+        rows = self._read_conn().execute(
+            f"""SELECT id, intent, ibl_code, nodes, category, difficulty,
+                       source, success_count, fail_count
+                FROM ibl_examples WHERE id IN ({placeholders})""",
+            all_ids
+        ).fetchall()
+        meta_map = {row['id']: dict(row) for row in rows}
+
+        for i, scored in zip(todo, scored_all):
+            if not scored:
+                continue
+            out[i] = self._materialize(scored, meta_map, top_k, allowed_nodes, category)
+            self._set_cached(keys[i], out[i])
+        return out
+
+    def _score_query(self, query: str, semantic_results: List[Tuple[int, float]],
+                     alpha: float, over_fetch: int) -> List[Tuple[int, float]]:
+        """질의 하나의 (id, score) — 시맨틱 100% 면 그대로, 아니면 BM25 폴백/결합."""
         if semantic_results and alpha >= 1.0:
             # 시맨틱 100%: BM25 호출 생략
-            scored = list(semantic_results)
-        else:
-            # 시맨틱 실패 시 BM25 폴백, 또는 하이브리드 모드
-            fts5_results = self.search_fts5(query, over_fetch)
-
-            if not semantic_results and not fts5_results:
-                return []
-
-            if not semantic_results:
-                # FTS5 단독 폴백 — raw BM25 점수를 0~1로 정규화하여 일관성 확보
-                max_fts = max((s for _, s in fts5_results), default=1.0) or 1.0
-                scored = [(idx, s / max_fts) for idx, s in fts5_results]
-            elif not fts5_results:
-                # 시맨틱 단독 — search_semantic이 이미 0~1로 반환
-                scored = list(semantic_results)
-            else:
-                scored = self._combine_scores(semantic_results, fts5_results, alpha)
-
-        # 메타데이터 조회
-        all_ids = [idx for idx, _ in scored]
-        if not all_ids:
+            return list(semantic_results)
+        # 시맨틱 실패 시 BM25 폴백, 또는 하이브리드 모드
+        fts5_results = self.search_fts5(query, over_fetch)
+        if not semantic_results and not fts5_results:
             return []
+        if not semantic_results:
+            # FTS5 단독 폴백 — raw BM25 점수를 0~1로 정규화하여 일관성 확보
+            max_fts = max((s for _, s in fts5_results), default=1.0) or 1.0
+            return [(idx, s / max_fts) for idx, s in fts5_results]
+        if not fts5_results:
+            # 시맨틱 단독 — search_semantic이 이미 0~1로 반환
+            return list(semantic_results)
+        return self._combine_scores(semantic_results, fts5_results, alpha)
 
-        with self._get_connection() as conn:
-            placeholders = ','.join('?' * len(all_ids))
-            rows = conn.execute(
-                f"""SELECT id, intent, ibl_code, nodes, category, difficulty,
-                           source, success_count, fail_count
-                    FROM ibl_examples WHERE id IN ({placeholders})""",
-                all_ids
-            ).fetchall()
-            meta_map = {row['id']: dict(row) for row in rows}
-
+    @staticmethod
+    def _materialize(scored: List[Tuple[int, float]], meta_map: Dict[int, dict], top_k: int,
+                     allowed_nodes: set = None, category: str = None) -> List[UsageExample]:
+        """점수 목록 + 메타 → 필터(노드/카테고리) 통과분 UsageExample 상위 top_k."""
         results = []
         for idx, score in scored:
             meta = meta_map.get(idx)
@@ -1136,8 +1315,6 @@ class IBLUsageDB:
 
             if len(results) >= top_k:
                 break
-
-        self._set_cached(cache_key, results)
         return results
 
     # =========================================================================
@@ -1169,46 +1346,60 @@ class IBLUsageDB:
 # 아니었다(family_news·icon 등 실사용 반례). 이 계수는 _execute_ibl_unified(전 경로
 # 단일 관문, system_tools_ibl.py)에서 매 실행마다 증가한다.
 # 집계형(일×노드×액션×origin)이라 크기 유계 — 원문·파라미터는 저장하지 않는다.
-# 싱글턴(IBLUsageDB)과 무관한 독립 함수: 임베딩 모델 기계를 안 건드리고, 호출마다
-# 짧은 연결(WAL이라 회상 읽기와 경합 없음).
+# 싱글턴(IBLUsageDB)과 무관한 독립 함수: 임베딩 모델 기계를 안 건드린다. 쓰기는
+# telemetry_sink 배치(플러시마다 짧은 연결 하나 — WAL이라 회상 읽기와 경합 없음).
 
 def bump_action_usage(pairs, origin: str):
     """실행된 (node, action) 쌍 목록의 오늘 계수를 각 +1.
 
     origin: app(앱 표면)/manual(조종실)/web(원격 기타)/agent(인지 파이프라인)/internal.
-    관측일 뿐이므로 어떤 실패도 삼킨다 — 실행 경로에 전파 금지."""
+    관측일 뿐이므로 어떤 실패도 삼킨다 — 실행 경로에 전파 금지.
+    ★DB 는 열지 않는다(2026-10-16): telemetry_sink 버퍼에 넣으면 플러셔가 같은 키를 합산해
+    한 트랜잭션으로 upsert 한다(_write_action_usage)."""
     if not pairs:
         return
     try:
         day = datetime.now().strftime("%Y-%m-%d")
-        conn = sqlite3.connect(DB_PATH, timeout=2.0)
-        try:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS action_usage_daily (
-                    day TEXT NOT NULL,
-                    node TEXT NOT NULL,
-                    action TEXT NOT NULL,
-                    origin TEXT NOT NULL,
-                    count INTEGER NOT NULL DEFAULT 0,
-                    PRIMARY KEY (day, node, action, origin)
-                )""")
-            conn.executemany(
-                """INSERT INTO action_usage_daily (day, node, action, origin, count)
-                   VALUES (?, ?, ?, ?, 1)
-                   ON CONFLICT(day, node, action, origin)
-                   DO UPDATE SET count = count + 1""",
-                [(day, str(n), str(a), origin or "internal") for n, a in pairs])
-            conn.commit()
-        finally:
-            conn.close()
+        for n, a in pairs:
+            telemetry_sink.emit("action_usage", (day, str(n), str(a), origin or "internal"))
     except Exception as e:
         logger.debug(f"[IBL Usage] 사용 계수 실패(무해): {e}")
 
 
+def _write_action_usage(rows: list):
+    """action_usage_daily 배치 upsert — 같은 (day, node, action, origin) 은 먼저 합산."""
+    from collections import Counter
+    counts = Counter(rows)
+    conn = sqlite3.connect(DB_PATH, timeout=2.0)
+    try:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS action_usage_daily (
+                day TEXT NOT NULL,
+                node TEXT NOT NULL,
+                action TEXT NOT NULL,
+                origin TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, node, action, origin)
+            )""")
+        conn.executemany(
+            """INSERT INTO action_usage_daily (day, node, action, origin, count)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(day, node, action, origin)
+               DO UPDATE SET count = count + excluded.count""",
+            [(*key, c) for key, c in counts.items()])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+telemetry_sink.register("action_usage", _write_action_usage)
+
+
 def action_usage_summary(days: int = 30) -> List[Dict]:
     """최근 N일 액션별·origin별 사용 합계 (은퇴/압축 감사용 조회)."""
     from datetime import timedelta
     cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    telemetry_sink.flush(timeout=2.0)   # 버퍼에 있는 오늘 계수까지
     try:
         conn = sqlite3.connect(DB_PATH, timeout=2.0)
         conn.row_factory = sqlite3.Row
@@ -28,6 +28,7 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import vocab_snapshot
 
 # === 경로 ===
 
@@ -42,9 +43,13 @@ def _get_nodes_path() -> Path:
     return _get_base_path() / "data" / "ibl_nodes.yaml"
 
 
+def _vocab():
+    """공유 어휘 레지스트리 (2026-10-16) — 파싱·mtime 검증·파생물 메모는 그쪽이 한다."""
+    return vocab_snapshot.registry(_get_nodes_path())
+
+
 # === 캐시 ===
 
-_node_cache: Optional[List[Dict]] = None
 _agent_node_cache: Optional[List[Dict]] = None
 
 
@@ -54,11 +59,10 @@ def invalidate_node_cache():
     ★2026-08-18 공개화: 이 함수는 정의만 있고 호출자가 0이었다 — 이름은 정확한데
     아무도 부르지 않아, /packages/reload 후에도 list_nodes() 소비처가 기동 시점
     스냅샷을 계속 봤다. 무효화의 단일 진입점인 ibl_access.invalidate_nodes_cache()
-    가 이제 여기로 위임한다.
+    가 이제 여기로 위임한다. (2026-10-16) 플랫/타입 디스크립터는 레지스트리 derive 메모 —
+    yaml 이 바뀌면 스스로도 갱신된다.
     """
-    global _node_cache, _typed_node_cache
-    _node_cache = None
-    _typed_node_cache = None
+    _vocab().invalidate()
 
 
 # 하위 호환 별칭 (공개화 전 이름 — 원래 호출자가 0이라 깨질 곳은 없다)
@@ -172,28 +176,10 @@ def _extract_tags(text: str) -> List[str]:
 
 # === 에이전트 노드 디스크립터 생성 (Phase 11) ===
 
-# 도구 → 노드 역매핑 (lazy load)
-_TOOL_NODE_REVERSE_MAP: Optional[Dict] = None
-
-
 def _get_tool_node_map() -> dict:
-    """ibl_nodes.yaml에서 tool->노드 역매핑 테이블 생성 (캐시)"""
-    global _TOOL_NODE_REVERSE_MAP
-    if _TOOL_NODE_REVERSE_MAP is not None:
-        return _TOOL_NODE_REVERSE_MAP
-    path = _get_nodes_path()
-    if not path.exists():
-        return {}
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-    mapping = {}
-    for node_name, node_cfg in data.get("nodes", {}).items():
-        for action_cfg in node_cfg.get("actions", {}).values():
-            tool = action_cfg.get("tool")
-            if tool:
-                mapping[tool] = node_name
-    _TOOL_NODE_REVERSE_MAP = mapping
-    return mapping
+    """ibl_nodes.yaml에서 tool->노드 역매핑 테이블 (스냅샷 tool_action 색인에서)"""
+    return _vocab().derive("node_registry.tool_node", lambda reg: {
+        tool: node for tool, (node, _action) in (reg.index("tool_action") or {}).items()})
 
 
 def _map_tools_to_capabilities(allowed_tools: list) -> List[str]:
@@ -311,23 +297,13 @@ def _build_typed_descriptor(node_type: str, sub_name: str, sub_config: dict) ->
     }
 
 
-_typed_node_cache: Optional[List[Dict]] = None
-
-
 def _load_node_typed_descriptors() -> List[Dict]:
-    """nodes: 섹션에서 타입 노드 디스크립터 생성 (Phase 12)"""
-    global _typed_node_cache
-    if _typed_node_cache is not None:
-        return _typed_node_cache
-
-    path = _get_nodes_path()
-    if not path.exists():
-        return []
+    """nodes: 섹션에서 타입 노드 디스크립터 생성 (Phase 12) — 사전 세대마다 한 번"""
+    return _vocab().derive("node_registry.typed", _build_typed_descriptors)
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
 
-    nodes_config = data.get("nodes", {})
+def _build_typed_descriptors(reg) -> List[Dict]:
+    nodes_config = (reg.data() or {}).get("nodes", {})
     descriptors = []
 
     for node_name, node_config in nodes_config.items():
@@ -367,39 +343,21 @@ def _load_node_typed_descriptors() -> List[Dict]:
                     "tags": _extract_tags(action_cfg.get("description", "")),
                 })
 
-    _typed_node_cache = descriptors
     return descriptors
 
 
 def invalidate_typed_cache():
     """타입 노드 캐시 무효화"""
-    global _typed_node_cache
-    _typed_node_cache = None
+    _vocab().invalidate()
 
 
 # === 공개 API ===
 
 def _load_flat_nodes() -> List[Dict]:
-    """플랫 노드 로딩 (캐시)"""
-    global _node_cache
-    if _node_cache is not None:
-        return _node_cache
-
-    path = _get_nodes_path()
-    if not path.exists():
-        return []
-
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-
-    flat_nodes = data.get("nodes", {})
-    nodes = []
-    for name, config in flat_nodes.items():
-        descriptor = _build_node_descriptor(name, config)
-        nodes.append(descriptor)
-
-    _node_cache = nodes
-    return nodes
+    """플랫 노드 로딩 (사전 세대마다 한 번)"""
+    return _vocab().derive("node_registry.flat", lambda reg: [
+        _build_node_descriptor(name, config)
+        for name, config in ((reg.data() or {}).get("nodes", {})).items()])
 
 
 def list_nodes(include_agents: bool = True) -> List[Dict]:
@@ -5,10 +5,25 @@ IndieBiz OS Core
 
 import json
 import shutil
+import sys
 from pathlib import Path
 from datetime import datetime
 
 
+def _release_db_handles(project_path: Path):
+    """프로젝트 폴더 안 memory_*.db 의 풀 연결을 닫는다 — 옮기기·지우기·이름 바꾸기 전에.
+
+    memory_db(도구 패키지)는 경로별로 연결을 쥐고 있고, 윈도우는 열린 파일이 든 폴더를 옮기거나
+    지울 수 없다. 패키지를 import 하지는 않는다 — 아직 안 실렸으면 열린 연결도 없다.
+    """
+    memory_db = sys.modules.get("memory_db")
+    if memory_db is not None and hasattr(memory_db, "close_pool"):
+        try:
+            memory_db.close_pool(str(project_path))
+        except Exception as e:
+            print(f"[ProjectManager] 메모리 DB 연결 정리 실패 {project_path}: {e}")
+
+
 class ProjectManager:
     """프로젝트 CRUD 관리"""
 
@@ -174,6 +189,7 @@ agents:
 
         project_path = self.projects_path / name
         if project_path.exists():
+            _release_db_handles(project_path)
             if move_to_trash:
                 trash_path = self.projects_path / "trash"
                 trash_path.mkdir(exist_ok=True)
@@ -444,6 +460,7 @@ agents:
                     print(f"[ProjectManager] 휴지통 비우기: 폴더 미발견(이미 없음) id={p.get('id')} name={p.get('name')}")
                     continue
                 try:
+                    _release_db_handles(d)
                     shutil.rmtree(d)
                     deleted += 1
                     print(f"[ProjectManager] 휴지통 폴더 삭제: {d}")
@@ -490,6 +507,7 @@ agents:
                 raise ValueError(f"프로젝트 '{new_name}'이(가) 이미 존재합니다.")
 
             if old_path.exists():
+                _release_db_handles(old_path)
                 old_path.rename(new_path)
 
             original["id"] = new_name
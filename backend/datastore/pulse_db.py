@@ -5,11 +5,13 @@ world_pulse(인지층)에서 이동: DB 경로·스키마 초기화·연결자
 package_manager(제거 후 정리)가 이 *데이터 쓰기* 때문에 인지층을 import 하던 것이
 매듭의 교차층 간선이었다 — 데이터는 데이터층에.
 """
+import json
 import logging
 import sqlite3
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+import telemetry_sink
 from runtime_utils import get_base_path
 
 logger = logging.getLogger(__name__)
@@ -78,6 +80,11 @@ def _init_pulse_db():
             evaluation_result TEXT,
             source TEXT
         );
+        CREATE TABLE IF NOT EXISTS world_snapshots (
+            date TEXT PRIMARY KEY,
+            collected_at TEXT,
+            body TEXT NOT NULL
+        );
     """)
     conn.close()
 
@@ -134,31 +141,40 @@ def _in_test_process() -> bool:
 
 def record_action_health(node: str, action: str, success: bool, response_ms: int = None,
                          source: str = "usage", channel: str = None, error: str = None):
-    """액션 실행 결과를 action_health 테이블에 기록 — 경량, 실패 시 무시"""
+    """액션 실행 결과를 action_health 에 기록 — 경량, 실패 시 무시.
+
+    ★핫패스에서 DB 를 열지 않는다(2026-10-16): 한 줄을 telemetry_sink 버퍼에 넣고 돌아오면
+    플러셔가 모아 한 트랜잭션으로 쓴다(_write_action_health). 시각은 지금 찍는다."""
     if source == "usage" and _in_test_process():
         source = "test"   # 시험의 의도된 실패를 실사용 통계에서 격리 (B18-1)
     try:
-        conn = _get_pulse_db()
-        _ensure_action_health_cols(conn)
         err = (str(error)[:300] if error else None)
+        telemetry_sink.emit("action_health", (node, action, 1 if success else 0, response_ms, source,
+                                              datetime.now().isoformat(), channel, err))
+    except Exception:
+        pass  # 기록 실패가 액션 실행에 영향 주면 안 됨
+
+
+def _write_action_health(rows: list):
+    """action_health 배치 쓰기 — 연결 1개·트랜잭션 1개 (telemetry_sink 플러셔가 부른다)."""
+    conn = _get_pulse_db()
+    try:
+        _ensure_action_health_cols(conn)
         try:
-            conn.execute(
+            conn.executemany(
                 "INSERT INTO action_health (node, action, success, response_ms, source, timestamp, channel, error) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                (node, action, 1 if success else 0, response_ms, source,
-                 datetime.now().isoformat(), channel, err)
-            )
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
         except sqlite3.OperationalError:
             # 구 스키마 폴백 (마이그레이션 실패 시에도 기록 자체는 산다)
-            conn.execute(
+            conn.executemany(
                 "INSERT INTO action_health (node, action, success, response_ms, source, timestamp) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (node, action, 1 if success else 0, response_ms, source, datetime.now().isoformat())
-            )
+                "VALUES (?, ?, ?, ?, ?, ?)", [r[:6] for r in rows])
         conn.commit()
+    finally:
         conn.close()
-    except Exception:
-        pass  # 기록 실패가 액션 실행에 영향 주면 안 됨
+
+
+telemetry_sink.register("action_health", _write_action_health)
 
 
 def purge_action_records(actions: List[str]) -> Dict:
@@ -174,6 +190,8 @@ def purge_action_records(actions: List[str]) -> Dict:
     if not names:
         return result
     ph = ",".join("?" * len(names))
+    # 버퍼의 행을 먼저 쓴다 — 아니면 DELETE 뒤에 플러셔가 지운 액션의 행을 되살린다
+    telemetry_sink.flush(timeout=2.0)
     try:
         conn = _get_pulse_db()
         for table in ("action_health", "self_checks"):
@@ -189,3 +207,63 @@ def purge_action_records(actions: List[str]) -> Dict:
     except Exception as e:
         logger.warning(f"[SelfCheck] 건강기록 정리 실패: {e}")
     return result
+
+
+# ============================================================
+# 세계 스냅샷 (2026-10-16) — 옛 world_pulse_db.json 의 자리
+#   ★날짜 키 한 줄씩. 옛 JSON 은 저장마다 파일 전체를 indent=2 로 다시 썼고 읽을 때마다 전체를
+#   파싱했다(파일은 줄지 않는다). 이제 쓰기는 그날 한 줄 upsert, 읽기는 날짜 범위 질의.
+#   캐시·이관은 인지층(world_pulse_collectors)이 쥔다 — 여기는 저장만.
+# ============================================================
+
+_WS_ENSURED: set = set()
+
+
+def _ensure_world_snapshots(conn):
+    """world_snapshots 테이블 지연 생성 — 이 테이블 이전에 만들어진 DB 용(경로당 1회)."""
+    key = str(CONSCIOUSNESS_DB_PATH)
+    if key in _WS_ENSURED:
+        return
+    conn.execute("""CREATE TABLE IF NOT EXISTS world_snapshots (
+        date TEXT PRIMARY KEY, collected_at TEXT, body TEXT NOT NULL)""")
+    _WS_ENSURED.add(key)
+
+
+def put_world_snapshots(snapshots: List[Dict], replace: bool = True) -> int:
+    """스냅샷들을 날짜 키로 쓴다(한 트랜잭션). replace=False 면 이미 있는 날짜는 건드리지 않는다(이관용).
+    반환: 쓴 줄 수."""
+    rows = [(s["date"], s.get("collected_at"), json.dumps(s, ensure_ascii=False))
+            for s in snapshots if isinstance(s, dict) and s.get("date")]
+    if not rows:
+        return 0
+    verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+    conn = _get_pulse_db()
+    try:
+        _ensure_world_snapshots(conn)
+        cur = conn.executemany(
+            f"{verb} INTO world_snapshots (date, collected_at, body) VALUES (?, ?, ?)", rows)
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+def load_world_snapshots(since: Optional[str] = None) -> List[Dict]:
+    """since(YYYY-MM-DD) 이후 스냅샷 — 날짜 내림차순. since=None 이면 전부."""
+    conn = _get_pulse_db()
+    try:
+        _ensure_world_snapshots(conn)
+        if since:
+            rows = conn.execute("SELECT body FROM world_snapshots WHERE date >= ? ORDER BY date DESC",
+                                (since,)).fetchall()
+        else:
+            rows = conn.execute("SELECT body FROM world_snapshots ORDER BY date DESC").fetchall()
+    finally:
+        conn.close()
+    out = []
+    for (body,) in rows:
+        try:
+            out.append(json.loads(body))
+        except (json.JSONDecodeError, ValueError):
+            continue
+    return out
@@ -140,12 +140,24 @@ def pending_scent(repo: str) -> str:
     스테이징 쪽은 표식을 남기지 않는다 — 그건 지나간 사건이 아니라 *지금도 참인 상태*라,
     해소(apply/discard)될 때까지 계속 보여야 한다.
     """
+    block, items = peek_scent(repo)
+    mark_announced(items)
+    return block
+
+
+def peek_scent(repo: str) -> tuple:
+    """pending_scent 의 부작용 없는 절반 → (블록, 판정 목록) (2026-10-16).
+
+    ★블록이 실제로 문맥에 들어갈지 모르는 호출(시간 예산 안에서만 쓰이는 연상 회상)용.
+    예산을 넘겨 버려진 블록이 판정을 '보고됨'으로 만들면 그 결말은 영영 말해지지 않는다 —
+    호출 쪽이 블록을 쓴 뒤에 mark_announced(판정 목록)을 부른다.
+    """
     items = collect_pending(repo)
     staged = collect_unapplied(repo)
     if not items and not staged:
-        return ""
+        return "", []
     if not items:
-        return _staged_block(staged)
+        return _staged_block(staged), []
     rows = []
     for d in items:
         outcome = d.get("outcome") or "unknown"
@@ -161,9 +173,8 @@ def pending_scent(repo: str) -> str:
             "않았다). 사용자에게 결과를 한 문장으로 먼저 알리고, 실패·롤백이면 무엇이 "
             "원상 복구됐는지 말한 뒤 다음 행동을 제안하라. 이미 지난 일이니 다시 수리하지 "
             "말고, 사용자가 새로 요청한 일이 있으면 그것을 이어서 하라.")
-    mark_announced(items)
     return (f"<repair_outcome note=\"{note}\">\n" + "\n".join(rows) + "\n</repair_outcome>"
-            + _staged_block(staged))
+            + _staged_block(staged)), items
 
 
 def _staged_block(staged: list) -> str:
@@ -0,0 +1,296 @@
+"""
+vocab_snapshot.py — ibl_nodes.yaml 미리-컴파일 스냅샷 + 프로세스 단일 어휘 레지스트리 (2026-10-16)
+
+왜 있는가 — ibl_nodes.yaml(363KB)은 순수 파이썬 yaml.safe_load 로 한 번 읽는 데 0.7s 남짓이다.
+그런데 ibl_registry·ibl_access·node_registry·tool_loader·tool_selector·system_tools·
+api_launcher_web … 가 저마다 따로 파싱하고 따로 캐시했다(영구·TTL·mtime·수동 — 무효화 규칙도
+제각각). 부팅마다 같은 파일을 여러 번 파싱했고, 폰에서는 같은 트리가 여러 벌 RSS 에 떠 있었다.
+
+쓰는 법:
+  registry(path=None)    경로당 레지스트리 하나 (기본 data/ibl_nodes.yaml). 없는 파일이면 data()=None
+  reg.data()             공유 트리 — ★읽기 전용. 제자리에서 고치는 소비자는 fresh()
+  reg.fresh()            내 것 사본 (ibl_registry 설치 필터처럼 병합·삭제하는 쪽)
+  reg.index(name)        빌드 때 함께 구운 파생 색인:
+                           node_actions   {노드: (액션, ...)}
+                           action_router  {"노드:액션": router}
+                           tool_action    {tool: (노드, 액션)}        — 나중 것이 이긴다(옛 역매핑과 같음)
+                           params         {"노드:액션": frozenset(선언 키)} — target_key·aliases·op
+                           phone_runnable frozenset("노드:액션") | None — phone_manifest.json 이 없으면 None
+  reg.derive(key, fn)    소비자 파생물 메모 — 사전 세대(generation)가 바뀌거나 invalidate() 면 다시 만든다
+  invalidate()           모든 레지스트리 — 다음 조회 때 디스크 재검사 + 파생물 비움 (/packages/reload)
+  write_snapshot(path)   빌드(scripts/build_ibl_nodes.py)가 yaml 옆에 스냅샷을 쓴다
+
+스냅샷 <yaml>.snapshot = MAGIC + 머리(json 한 줄) + marshal. 머리는 포맷 판, 구운 인터프리터
+(python 주·부 버전, marshal.version), 원본(yaml·phone_manifest.json)마다 (크기, mtime_ns, sha256).
+크기·mtime 이 같으면 그대로 믿고, mtime 만 다르면(git checkout·
+번들 복사) sha256 으로 확인한다. 어긋나거나 없으면 yaml 을 파싱(CSafeLoader 가 있으면 그것)하고
+스냅샷을 다시 쓴다 — 읽기 전용 설치면 쓰기만 조용히 건너뛴다. marshal 은 트리 안의 공유 참조
+(yaml 앵커)를 보존하고, 사본(fresh)도 같은 바이트에서 풀어 수 ms 다. 스냅샷은 빌드 산출물(.gitignore),
+data_ownership 에는 cache 로 선언돼 있다.
+
+★pickle 이 아니라 marshal 인 이유 (2026-10-16): 스냅샷은 쓰기 가능한 data/ 에 산다. pickle.load 는
+그 파일에 든 임의 객체를 *생성*(= 코드 실행)할 수 있어, data/ 에 쓸 수 있는 누구나 백엔드 안에서
+코드를 돌릴 수 있게 된다. marshal 은 기본 값(dict·list·str·수·frozenset …)만 풀고 임의 객체를
+만들지 않는다 — safe_load 트리와 색인이 쓰는 타입이 딱 그것이다. 풀기 전에 머리(원본 서명)부터 맞춘다.
+대가는 marshal 포맷이 파이썬 버전 사이에 보장되지 않는다는 것 — 그래서 머리에 굽은 인터프리터를
+적고, 다른 인터프리터가 구운 스냅샷(개발 PC 의 build_ibl_nodes 산출물이 폰에 실려 간 경우 등)은
+marshal.loads 가 터지기를 기대하지 않고 낡은 것으로 보고 다시 굽는다.
+
+★색인은 배포물(yaml) 기준이다 — api_registry 병합·몸 필터는 ibl_registry 의 설치본(derive)에서.
+디스크 stat 은 CHECK_INTERVAL_S 에 한 번 — 매 조회마다 syscall 을 내지 않는다.
+"""
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import yaml
+
+MAGIC = b"IBLVOCAB\n"
+FORMAT = 2                  # 1 = pickle 판 — 머리에서 걸러져 다시 굽는다
+SNAPSHOT_SUFFIX = ".snapshot"
+CHECK_INTERVAL_S = 1.0
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_MISSING = object()
+
+
+def default_path() -> Path:
+    """data/ibl_nodes.yaml (INDIEBIZ_BASE_PATH 우선 — ibl_access·node_registry 와 같은 규칙)"""
+    env_path = os.environ.get("INDIEBIZ_BASE_PATH")
+    base = Path(env_path) if env_path else Path(__file__).parent.parent.parent
+    return base / "data" / "ibl_nodes.yaml"
+
+
+def _sources(yaml_path: Path) -> Dict[str, Path]:
+    return {"yaml": yaml_path, "manifest": yaml_path.parent / "phone_manifest.json"}
+
+
+def _stat(p: Path) -> Optional[tuple]:
+    try:
+        st = os.stat(p)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def build_indexes(data: Dict, runnable: Optional[frozenset]) -> Dict[str, Any]:
+    """트리 → 파생 색인 (모듈 docstring 의 표)"""
+    node_actions, action_router, tool_action, params = {}, {}, {}, {}
+    for node, node_cfg in ((data or {}).get("nodes") or {}).items():
+        actions = (node_cfg.get("actions") or {}) if isinstance(node_cfg, dict) else {}
+        node_actions[node] = tuple(actions)
+        for action, cfg in actions.items():
+            if not isinstance(cfg, dict):
+                continue
+            qualified = f"{node}:{action}"
+            action_router[qualified] = cfg.get("router")
+            if cfg.get("tool"):
+                tool_action[cfg["tool"]] = (node, action)
+            keys = set()
+            if cfg.get("target_key"):
+                keys.add(str(cfg["target_key"]))
+            if isinstance(cfg.get("aliases"), dict):
+                for canonical, alts in cfg["aliases"].items():
+                    keys.add(str(canonical))
+                    keys.update(str(a) for a in (alts or []))
+            if cfg.get("ops"):
+                keys.add("op")
+            params[qualified] = frozenset(keys)
+    return {"node_actions": node_actions, "action_router": action_router,
+            "tool_action": tool_action, "params": params, "phone_runnable": runnable}
+
+
+def _python_tag() -> list:
+    """스냅샷을 구운 인터프리터 (json 왕복 뒤에도 같게 list)"""
+    return list(sys.version_info[:2])
+
+
+def _compile(yaml_path: Path) -> tuple:
+    """원본을 읽어 (머리, data marshal 바이트, 색인). 파싱 실패는 그대로 올린다."""
+    srcs = _sources(yaml_path)
+    header = {"format": FORMAT, "python": _python_tag(), "marshal": marshal.version}
+    stamps = {name: _stat(p) for name, p in srcs.items()}   # 읽기 전에 — 읽는 사이 바뀌면 다음 검사가 잡는다
+    raw = srcs["yaml"].read_bytes()
+    data = yaml.load(raw, Loader=_Loader) or {}
+    header["yaml"] = [*stamps["yaml"], hashlib.sha256(raw).hexdigest()] if stamps["yaml"] else None
+    runnable = None
+    if stamps["manifest"]:
+        try:
+            mraw = srcs["manifest"].read_bytes()
+            runnable = frozenset(json.loads(mraw).get("runnable_actions") or [])
+            header["manifest"] = [*stamps["manifest"], hashlib.sha256(mraw).hexdigest()]
+        except (OSError, ValueError):
+            runnable = None
+    header.setdefault("manifest", None)
+    return header, marshal.dumps(data), build_indexes(data, runnable)
+
+
+def _header_matches(header: Dict, yaml_path: Path, stamps: Dict[str, Optional[tuple]]) -> bool:
+    if header.get("format") != FORMAT:
+        return False
+    if header.get("python") != _python_tag() or header.get("marshal") != marshal.version:
+        return False                        # 다른 인터프리터가 구운 marshal — 믿지 않고 다시 굽는다
+    for name, p in _sources(yaml_path).items():
+        rec, cur = header.get(name), stamps[name]
+        if rec is None or cur is None:
+            if rec is not cur:
+                return False
+            continue
+        if rec[0] != cur[0]:
+            return False
+        if rec[1] != cur[1]:
+            try:
+                if hashlib.sha256(p.read_bytes()).hexdigest() != rec[2]:
+                    return False
+            except OSError:
+                return False
+    return True
+
+
+def _read_snapshot(snap_path: Path, yaml_path: Path, stamps) -> Optional[tuple]:
+    try:
+        with open(snap_path, "rb") as f:
+            if f.readline() != MAGIC:
+                return None
+            header = json.loads(f.readline())
+            if not _header_matches(header, yaml_path, stamps):
+                return None
+            payload = marshal.load(f)
+        if not isinstance(payload.get("data"), bytes) or not isinstance(payload.get("index"), dict):
+            return None
+        return header, payload["data"], payload["index"]
+    except (OSError, ValueError, EOFError, TypeError, AttributeError):
+        return None
+
+
+def _write(snap_path: Path, header: Dict, blob: bytes, index: Dict) -> bool:
+    """tmp + os.replace (라이브 프로세스가 반쯤 쓴 스냅샷을 읽지 않게). 쓸 수 없으면 False."""
+    try:
+        fd, tmp = tempfile.mkstemp(dir=str(snap_path.parent), prefix=f".{snap_path.name}.", suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(json.dumps(header).encode() + b"\n")
+            marshal.dump({"data": blob, "index": index}, f)
+        os.chmod(tmp, 0o644)                # mkstemp 는 0600 — 다른 사용자로 도는 백엔드도 읽게
+        os.replace(tmp, snap_path)
+        return True
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+
+
+class VocabRegistry:
+    """yaml 하나의 공유 사전. 디스크 검사·적재는 이 객체가 단독으로 한다."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.snapshot_path = Path(str(self.path) + SNAPSHOT_SUFFIX)
+        self.generation = 0
+        self.source = None          # "snapshot" | "yaml" | "absent"
+        self._lock = threading.RLock()
+        self._stamps = _MISSING
+        self._checked = 0.0
+        self._blob: Optional[bytes] = None
+        self._data = None
+        self._index: Dict[str, Any] = {}
+        self._derived: Dict[str, Any] = {}
+
+    def _current(self) -> None:
+        if self._stamps is not _MISSING and time.monotonic() - self._checked < CHECK_INTERVAL_S:
+            return
+        with self._lock:
+            stamps = {name: _stat(p) for name, p in _sources(self.path).items()}
+            if stamps != self._stamps:
+                self._load(stamps)
+            self._checked = time.monotonic()
+
+    def _load(self, stamps) -> None:
+        if stamps["yaml"] is None:
+            blob, index, source = None, {}, "absent"
+        else:
+            hit = _read_snapshot(self.snapshot_path, self.path, stamps)
+            if hit is not None:
+                _header, blob, index = hit
+                source = "snapshot"
+            else:
+                header, blob, index = _compile(self.path)
+                _write(self.snapshot_path, header, blob, index)
+                source = "yaml"
+        self._blob, self._index, self.source = blob, index, source
+        self._data = None
+        self._stamps = stamps
+        self._derived.clear()
+        self.generation += 1
+
+    def data(self) -> Optional[Dict]:
+        """공유 트리 (읽기 전용). 파일이 없으면 None."""
+        self._current()
+        with self._lock:
+            if self._data is None and self._blob is not None:
+                self._data = marshal.loads(self._blob)
+            return self._data
+
+    def fresh(self) -> Optional[Dict]:
+        """고쳐 써도 되는 사본. 파일이 없으면 None."""
+        self._current()
+        blob = self._blob
+        return marshal.loads(blob) if blob is not None else None
+
+    def index(self, name: str) -> Any:
+        self._current()
+        return self._index.get(name)
+
+    def derive(self, key: str, fn: Callable[["VocabRegistry"], Any]) -> Any:
+        """fn(self) 의 결과를 이 세대 동안 기억한다. 같은 키 동시 호출은 한 번만 만든다."""
+        self._current()
+        with self._lock:
+            hit = self._derived.get(key, _MISSING)
+            if hit is _MISSING:
+                hit = self._derived[key] = fn(self)
+            return hit
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._checked = float("-inf")
+            self._derived.clear()
+
+
+_registries: Dict[str, VocabRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def registry(path=None) -> VocabRegistry:
+    key = os.path.abspath(str(path or default_path()))
+    reg = _registries.get(key)
+    if reg is None:
+        with _registries_lock:
+            reg = _registries.setdefault(key, VocabRegistry(Path(key)))
+    return reg
+
+
+def invalidate() -> None:
+    for reg in list(_registries.values()):
+        reg.invalidate()
+
+
+def write_snapshot(yaml_path=None) -> Path:
+    """빌드용 — 원본에서 스냅샷을 새로 굽는다 (파싱 실패·쓰기 실패는 올린다)."""
+    reg = registry(yaml_path)
+    header, blob, index = _compile(reg.path)
+    if not _write(reg.snapshot_path, header, blob, index):
+        raise OSError(f"스냅샷을 쓸 수 없습니다: {reg.snapshot_path}")
+    reg.invalidate()
+    return reg.snapshot_path
@@ -142,7 +142,7 @@ def execute_tool(tool_name: str, tool_input: dict, project_path: str) -> Any:
 
     raw_result = _do_request(method, url, headers, params, timeout, response_type,
                              json_body=json_body, form_data=form_data,
-                             retry_config=retry_config)
+                             retry_config=retry_config, **_http_options(service_name, tool_config, service_config))
 
     # 7. 에러 확인
     if isinstance(raw_result, dict) and "error" in raw_result:
@@ -317,7 +317,7 @@ def _execute_single_tool(tool_config: dict, tool_input: dict, reg: dict) -> Any:
 
     raw_result = _do_request(method, url, headers, params, timeout, response_type,
                              json_body=json_body, form_data=form_data,
-                             retry_config=retry_config)
+                             retry_config=retry_config, **_http_options(service_name, tool_config, service_config))
 
     if isinstance(raw_result, dict) and "error" in raw_result:
         return raw_result
@@ -603,10 +603,18 @@ def _build_headers(auth_config: dict) -> dict:
     return headers
 
 
+def _http_options(service_name: str, tool_config: dict, service_config: dict) -> dict:
+    """세션 풀 키 + 캐시/속도 제한 설정 (도구가 서비스를 덮는다) → _do_request kwargs."""
+    cache = tool_config.get("cache", service_config.get("cache"))
+    rate_limit = tool_config.get("rate_limit") or service_config.get("rate_limit")
+    return {"service": service_name or "", "cache": cache, "rate_limit": rate_limit}
+
+
 def _do_request(method: str, url: str, headers: dict, params: dict,
                 timeout: int, response_type: str,
                 json_body: Any = None, form_data: Any = None,
-                retry_config: dict = None) -> Any:
+                retry_config: dict = None, service: str = "",
+                cache: Any = None, rate_limit: Any = None) -> Any:
     """HTTP 요청 실행 (query params + JSON body + form data + retry 지원)
 
     Args:
@@ -615,6 +623,9 @@ def _do_request(method: str, url: str, headers: dict, params: dict,
             backoff: 대기 전략 - "fixed" | "exponential" (기본 "exponential")
             delay: 기본 대기 시간 초 (기본 1.0)
             retry_on: 재시도할 HTTP 상태 코드 (기본 [429, 500, 502, 503, 504])
+        service: 세션 풀 키 (서비스 이름 — keep-alive 연결을 서비스끼리 나눠 쓴다)
+        cache: 응답 캐시 설정 (도구 > 서비스, 기본 꺼짐) — http_pool 독스트링
+        rate_limit: 호스트별 토큰 버킷 설정 (도구 > 서비스) — 넘는 호출은 줄 서서 기다린다
 
     YAML 예시:
         retry:
@@ -622,8 +633,12 @@ def _do_request(method: str, url: str, headers: dict, params: dict,
           backoff: exponential
           delay: 1.0
           retry_on: [429, 500, 502, 503]
+
+    ★(2026-10-16) 모듈 수준 requests.request → http_pool.request. 연결 재사용·조건부 요청·
+    속도 제한 줄은 거기서, 재시도 대기는 http_pool.pause(취소되면 멈춘다). 429 는 Retry-After 가
+    backoff 보다 길면 그만큼 기다린다(같은 호스트의 다른 호출도 http_pool 이 함께 미룬다).
     """
-    import time as _time
+    import http_pool
 
     max_attempts = 1
     backoff = "exponential"
@@ -641,20 +656,19 @@ def _do_request(method: str, url: str, headers: dict, params: dict,
 
     for attempt in range(max_attempts):
         try:
-            response = requests.request(
-                method=method.upper(),
-                url=url,
-                headers=headers,
-                params=params if params else None,
-                json=json_body,
-                data=form_data,
-                timeout=timeout,
+            response = http_pool.request(
+                method, url, service=service, headers=headers, params=params,
+                json_body=json_body, form_data=form_data, timeout=timeout,
+                cache=cache, rate_limit=rate_limit,
             )
 
             # 재시도 가능한 에러인지 확인
             if response.status_code in retry_on and attempt < max_attempts - 1:
                 wait = delay * (2 ** attempt) if backoff == "exponential" else delay
-                _time.sleep(wait)
+                if response.status_code == 429:
+                    wait = max(wait, http_pool.retry_after(response) or 0)
+                if not http_pool.pause(wait):
+                    return {"error": f"재시도 대기 중 취소됨 (HTTP {response.status_code})"}
                 continue
 
             # HTTP 에러 처리 (재시도 불가 또는 마지막 시도)
@@ -692,19 +706,21 @@ def _do_request(method: str, url: str, headers: dict, params: dict,
                         return response.text
                 return data
 
+        except http_pool.RateLimitWait as e:
+            return {"error": f"API 요청 한도 대기 초과: {e}"}
         except requests.exceptions.Timeout:
             last_error = f"API 요청 시간 초과 ({timeout}초)"
             if attempt < max_attempts - 1:
                 wait = delay * (2 ** attempt) if backoff == "exponential" else delay
-                _time.sleep(wait)
-                continue
+                if http_pool.pause(wait):
+                    continue
             return {"error": last_error}
         except requests.exceptions.ConnectionError:
             last_error = "네트워크 연결 실패"
             if attempt < max_attempts - 1:
                 wait = delay * (2 ** attempt) if backoff == "exponential" else delay
-                _time.sleep(wait)
-                continue
+                if http_pool.pause(wait):
+                    continue
             return {"error": last_error}
         except Exception as e:
             return {"error": f"API 호출 실패: {str(e)}"}
@@ -194,7 +194,7 @@ def _execute_step(
     from api_engine import (
         _build_params, _build_headers, _build_json_body,
         _build_form_data, _do_request, _resolve_dynamic_endpoint,
-        _check_auth,
+        _check_auth, _http_options,
     )
 
     service_name = step.get("service")
@@ -257,7 +257,7 @@ def _execute_step(
     raw_result = _do_request(
         method, url, headers, params, timeout, response_type,
         json_body=json_body, form_data=form_data,
-        retry_config=retry_config
+        retry_config=retry_config, **_http_options(service_name, step, service_config)
     )
 
     # 에러 확인
@@ -23,6 +23,8 @@ import logging
 from pathlib import Path
 from typing import List, Optional, Set, Dict
 
+import vocab_snapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -438,7 +440,6 @@ def build_environment(
 # ============ 내부 함수 ============
 
 _node_groups_cache = None
-_nodes_data_cache = None
 _package_meta_cache = None
 
 
@@ -448,10 +449,11 @@ def invalidate_nodes_cache():
     액션 추가·제거·op 변경(build_ibl_nodes.py 결과)을 backend 재시작 없이 반영하기 위해
     /packages/reload 경로에서 호출된다.
     """
-    global _nodes_data_cache, _node_groups_cache, _package_meta_cache
-    _nodes_data_cache = None
+    global _node_groups_cache, _package_meta_cache
     _node_groups_cache = None
     _package_meta_cache = None
+    # 원본 트리·스냅샷·소비자 파생물(ibl_registry 설치본 등)은 공유 어휘 레지스트리 몫 (2026-10-16)
+    vocab_snapshot.invalidate()
 
     # node_registry 도 같은 ibl_nodes.yaml 을 자기 캐시(_node_cache·_typed_node_cache)에
     # 물고 있다. 그쪽 무효화 함수는 정의만 있고 호출자가 0이었다(2026-08-18 발견) —
@@ -568,18 +570,14 @@ def _get_nodes_path() -> Path:
 
 
 def _load_nodes_data() -> dict:
-    """ibl_nodes.yaml 전체 로드 (캐시)"""
-    global _nodes_data_cache
-    if _nodes_data_cache is not None:
-        return _nodes_data_cache
+    """ibl_nodes.yaml 전체 — 공유 어휘 레지스트리(vocab_snapshot)의 트리. ★읽기 전용.
 
+    (2026-10-16) 모듈별 파싱·캐시 대신 프로세스에 한 벌: 스냅샷이 맞으면 파싱 없이 풀고,
+    yaml 이 바뀌면(mtime) 레지스트리가 알아서 다시 읽는다.
+    """
     path = _get_nodes_path()
-    if not path.exists():
-        return {}
-
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = vocab_snapshot.registry(path).data()
     except Exception as e:
         # ★깨진 어휘 파일을 {} 로 눙치면 낱말 전부가 "없는 낱말"이 되고,
         # 환경 프롬프트가 빈 문자열이 되어 에이전트가 몸 없이 조용히 돈다
@@ -589,8 +587,7 @@ def _load_nodes_data() -> dict:
             f"→ 빌드 중이었다면 잠시 후 재시도, 아니면 "
             f"`python3 scripts/build_ibl_nodes.py` 로 재생성하세요."
         ) from e
-    _nodes_data_cache = data
-    return data
+    return data if data is not None else {}
 
 
 def _load_node_groups() -> dict:
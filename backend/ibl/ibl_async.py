@@ -0,0 +1,247 @@
+"""
+ibl_async.py — IBL 엔진의 비동기 실행 경로: execute_ibl_async / execute_pipeline_async (2026-10-16)
+
+왜 있는가 — execute_ibl 은 처음부터 끝까지 동기다. 실행 중인 이벤트 루프 위(MCP·웹소켓)에서
+부르면 _run_router_safely 가 핸들러를 스레드로 넘기고, async 핸들러는 persistent 루프에 코루틴을
+넘긴 뒤 호출 스레드가 결과를 막고 기다린다. 그래서 진행 중인 step 하나가 OS 스레드 하나를
+붙잡았고, 앞단이 동시에 여러 에이전트 파이프를 돌리면 그만큼 스레드가 쌓였다.
+
+경로:
+  leaf — async 핸들러      handler.execute 가 async def 면 스레드 없이 await 한다. 코루틴은
+                           persistent 루프(ibl_engine._get_persistent_loop — Playwright 객체가 사는
+                           루프) 위에서 돌고, 호출 쪽은 wrap_future 로 기다린다. 호출 루프가 바로
+                           그 루프면 직접 await.
+  leaf — 그 밖            동기 핸들러·system·블록(if/case/try/repeat/goal)·원격 포워드는 동기
+                           execute_ibl 을 엔진 스케줄러의 network 레인에 태우고 await 한다.
+  파이프                  workflow_engine 의 같은 코어(_pipeline_core)를 같은 구동 루프(_drive_core)로
+                           await — 봉투·실패 처리·바인딩이 동기 경로와 한 벌이다.
+  & 분기                  분기마다 태스크, 묶음 마감(PARALLEL_BRANCH_TIMEOUT) 하나. 마감을 넘기거나
+                           바깥이 취소되면 분기 태스크를 진짜로 취소한다 — async 핸들러는
+                           CancelledError 를 받고, 레인의 동기 일은 포기(취소 표식)된다.
+  ?? 폴백                 체인이 순차라 동기 실행기를 레인에 태운다.
+
+★준비(사전 조회·파라미터 정규화·경고)와 기록(도구 로그·X-Ray·action_health)은 ibl_engine 의
+_prepare_leaf·_record_action 을 그대로 쓴다. 후처리(compress)는 AI 호출이라 레인에서 돈다.
+
+★호출자 컨텍스트 — 한 루프 스레드 위에서 여러 파이프가 겹쳐 돌면 threading.local 하나를 같이
+쓴다: 앞 코루틴이 await 하는 사이 뒤 코루틴의 세터가 task_id·tool_calls 를 덮어, 도구 호출 로그가
+남의 작업에 붙었다. 그래서 진입점(execute_ibl_async·execute_pipeline_async)이 thread_context 를
+떠서 contextvar 에 싣고(코루틴·그 자식 태스크마다 따로), thread_context 를 읽고 쓰는 동기 구간
+(준비·기록·레인 제출)은 그 스냅샷을 스레드에 얹은 채 돈다(_as_caller — await 없는 구간이라
+다른 코루틴이 끼어들 수 없다). tool_calls 리스트는 스냅샷이 같은 객체를 쥐어 호출자에게 쌓인다.
+"""
+import asyncio
+import contextvars
+import inspect
+import time
+from contextlib import contextmanager
+from typing import Any, Optional
+
+import lane_scheduler
+import thread_context
+from workflow_engine import _drive_core
+
+# 블록 메타 키 — 이 키를 단 tool_input 은 몸통 문장을 동기 재귀로 도는 실행기라 레인으로 보낸다
+_BLOCK_KEYS = ("_goal", "_condition", "_case", "_try", "_repeat", "_assign")
+
+# 진입점이 뜬 호출자의 thread_context 스냅샷 — 코루틴(태스크)마다 따로 (모듈 독스트링 ★호출자 컨텍스트)
+_caller_ctx: contextvars.ContextVar = contextvars.ContextVar("ibl_async_caller_ctx", default=None)
+
+
+@contextmanager
+def _caller_scope():
+    """바깥 진입점이면 지금 스레드의 컨텍스트를 떠서 싣는다. 안쪽 호출은 바깥 것을 그대로 쓴다."""
+    if _caller_ctx.get() is not None:
+        yield
+        return
+    token = _caller_ctx.set(thread_context.snapshot())
+    try:
+        yield
+    finally:
+        _caller_ctx.reset(token)
+
+
+@contextmanager
+def _as_caller():
+    """동기 구간 동안 이 코루틴의 호출자 컨텍스트를 스레드에 얹고, 끝나면 원래 것으로 되돌린다."""
+    snap = _caller_ctx.get()
+    if snap is None:
+        yield
+        return
+    own = thread_context.snapshot()
+    thread_context.restore(snap, replace=True)
+    try:
+        yield
+    finally:
+        thread_context.restore(own, replace=True)
+
+
+async def _in_lane(lane: str, fn, *args, name: str = "", **kwargs) -> Any:
+    """동기 함수를 레인 워커에서 돌리고 await. 바깥이 취소되면 그 일을 포기한다."""
+    with _as_caller():      # 제출 시점 스냅샷이 호출자의 것이 되게
+        fut = lane_scheduler.submit(lane, fn, *args, name=name, **kwargs)
+    try:
+        return await asyncio.wrap_future(fut)
+    except asyncio.CancelledError:
+        lane_scheduler.abandon(fut)
+        raise
+
+
+def _native_handler(tool_input: dict):
+    """스레드 없이 await 할 수 있는 leaf 인가 → action_config 또는 None.
+
+    로컬 handler 라우터 + async def execute 일 때만. @주소·phone_only·폰 프로파일은 원격 포워드
+    판정이 네트워크를 탈 수 있어 동기 경로로 보낸다."""
+    from ibl_engine import _load_nodes_config
+    node, action = tool_input.get("_node"), tool_input.get("action")
+    if not node or not action or tool_input.get("target_node"):
+        return None
+    try:
+        cfg = _load_nodes_config().get("nodes", {}).get(node, {}).get("actions", {}).get(action)
+    except Exception:
+        return None
+    if not cfg or cfg.get("router") != "handler" or not cfg.get("tool"):
+        return None
+    if cfg.get("runs_on") == "phone_only":
+        return None
+    try:
+        from runtime_utils import detect_body
+        phone = detect_body().get("profile") == "phone"
+    except Exception:
+        phone = True            # 몸을 모르면 포워드 판정이 있는 동기 경로로 — 포크-가드: env 직접 참조 금지
+    if phone:
+        return None
+    try:
+        from tool_loader import load_tool_handler
+        handler = load_tool_handler(cfg["tool"])
+    except Exception:
+        return None
+    return cfg if inspect.iscoroutinefunction(getattr(handler, "execute", None)) else None
+
+
+async def _await_handler(mapped_tool: str, params: dict, project_path: str, scope: str) -> Any:
+    """async 핸들러를 persistent 루프에서 await — 동기 _route_handler 의 async 분기와 같은 봉투."""
+    from ibl_engine import _get_persistent_loop
+    from ibl_routing import (TOOL_EXECUTION_TIMEOUT, _async_handler_failure,
+                             _dependency_error, _handler_call)
+    with _as_caller():
+        call = _handler_call(mapped_tool, params, project_path, scope)
+        if isinstance(call, dict):
+            return call
+        handler, merged_params, context = call
+        try:
+            coro = handler.execute(merged_params, context)
+        except (ModuleNotFoundError, ImportError) as e:
+            return _dependency_error(mapped_tool, e)
+        except Exception as e:
+            print(f"[IBL] 도구 실행 실패 ({mapped_tool}): {e}")
+            return {"error": f"도구 실행 실패 ({mapped_tool}): {e}"}
+    timed = asyncio.wait_for(coro, timeout=TOOL_EXECUTION_TIMEOUT)
+    loop = _get_persistent_loop()
+    try:
+        if asyncio.get_running_loop() is loop:
+            return await timed
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(timed, loop))
+    except asyncio.TimeoutError:
+        return _async_handler_failure(mapped_tool, None)
+    except Exception as e:
+        return _async_handler_failure(mapped_tool, e)
+
+
+async def execute_ibl_async(tool_input: dict, project_path: str, agent_id: str = None) -> Any:
+    """execute_ibl 의 비동기판 — 같은 입력, 같은 결과 봉투."""
+    with _caller_scope():
+        return await _execute_leaf_async(tool_input, project_path, agent_id)
+
+
+async def _execute_leaf_async(tool_input: dict, project_path: str, agent_id: Optional[str]) -> Any:
+    from ibl_engine import (MAX_NEST_DEPTH, _attach_param_warning, _finish_leaf, _judge_result,
+                            _needs_postprocess, _pipe_currency_boundary, _prepare_leaf,
+                            _record_action, execute_ibl)
+    label = f"{tool_input.get('_node', '?')}:{tool_input.get('action', '?')}"
+    if (tool_input.get("_depth") or 0) > MAX_NEST_DEPTH or any(tool_input.get(k) for k in _BLOCK_KEYS):
+        return await _in_lane("network", execute_ibl, tool_input, project_path, agent_id, name=label)
+    if _native_handler(tool_input) is None:
+        return await _in_lane("network", execute_ibl, tool_input, project_path, agent_id, name=label)
+
+    _pipe_currency_boundary(tool_input)
+    with _as_caller():
+        prep = _prepare_leaf(tool_input, agent_id)
+    if not isinstance(prep, tuple):
+        return prep
+    node, action, action_config, _router, params, param_warning = prep
+    start = time.time()
+    ok, err, result = True, None, None
+    try:
+        result = await _await_handler(action_config.get("tool"), params, project_path,
+                                      action_config.get("scope", "project"))
+        ok, err = _judge_result(result)
+    except asyncio.CancelledError:
+        ok, err = False, "cancelled"
+        raise
+    except Exception as e:
+        ok, err = False, f"exception: {str(e)[:260]}"
+        raise
+    finally:
+        with _as_caller():
+            _record_action(node, action, params, agent_id, ok, err, round((time.time() - start) * 1000))
+    if _needs_postprocess(result, tool_input, action_config, agent_id):
+        return await _in_lane("network", _finish_leaf, result, tool_input, action, action_config,
+                              agent_id, param_warning, name=f"{label}:postprocess")
+    return _attach_param_warning(result, param_warning)
+
+
+async def _execute_parallel_async(branches: list, project_path: str, prev_result,
+                                  raw: bool = False) -> list:
+    """& 묶음 — 분기마다 태스크, 마감은 묶음 전체에 한 번(동기 _execute_parallel 과 같은 뜻).
+    동시에 도는 분기는 wp.PARALLEL_MAX_BRANCHES 개까지."""
+    import workflow_parallel as wp
+    gate = asyncio.Semaphore(wp.PARALLEL_MAX_BRANCHES)
+
+    async def _run(branch):
+        async with gate:
+            return await _drive_core(wp._branch_core(branch, prev_result, raw),
+                                     lambda ti: execute_ibl_async(ti, project_path))
+
+    tasks = [asyncio.ensure_future(_run(b)) for b in branches]
+    try:
+        _done, pending = await asyncio.wait(tasks, timeout=wp.PARALLEL_BRANCH_TIMEOUT)
+    except asyncio.CancelledError:
+        for t in tasks:
+            t.cancel()
+        raise
+    for t in pending:
+        t.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    out = []
+    for branch, t in zip(branches, tasks):
+        if t in pending or t.cancelled():
+            print(f"[IBL] 병렬 브랜치 타임아웃: [{branch.get('node', branch.get('_node', '?'))}:"
+                  f"{branch.get('action', '?')}] ({wp.PARALLEL_BRANCH_TIMEOUT}초)")
+            out.append(wp.branch_timeout_error(branch))
+        elif t.exception() is not None:
+            out.append({"error": str(t.exception())})
+        else:
+            r = t.result()
+            out.append(r if r is not None else wp.branch_timeout_error(branch))
+    return out
+
+
+async def execute_pipeline_async(steps: list, project_path: str = ".",
+                                 context: dict = None, agent_id: str = None) -> dict:
+    """execute_pipeline 의 비동기판 — 같은 코어, 같은 봉투. 태스크 취소는 진행 중인 step 까지 번진다."""
+    import workflow_engine as we
+
+    async def _run(effect):
+        kind = effect[0]
+        if kind == "ibl":
+            return await execute_ibl_async(effect[1], project_path, agent_id)
+        if kind == "parallel":
+            return await _execute_parallel_async(effect[1], project_path, effect[2], raw=effect[3])
+        return await _in_lane("network", we._execute_fallback, effect[1], project_path, effect[2],
+                              agent_id=agent_id, name="??")
+
+    with _caller_scope():
+        return await _drive_core(we._pipeline_core(steps, project_path, context, agent_id), _run)
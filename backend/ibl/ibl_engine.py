@@ -29,6 +29,8 @@ import yaml
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from common.currency import PipeCurrency, materialize_params
+
 
 # === Persistent 이벤트 루프 (async 핸들러용) ===
 # browser-action 등 async 도구가 파이프라인에서 연속 호출될 때,
@@ -160,7 +162,7 @@ def _forward_to_phone(phone_url: str, node: str, action: str, params: dict,
     """
     code = f"[{node}:{action}]"
     if params:
-        code += json.dumps(params, ensure_ascii=False)
+        code += json.dumps(materialize_params(params), ensure_ascii=False)  # 전선 = 구조 통화 경계
     payload = {"code": code}
     if agent_id:
         payload["agent_id"] = agent_id
@@ -248,7 +250,7 @@ def _forward_to_mac(node: str, action: str, params: dict, agent_id: str = None,
                 "mac_unreachable": True}
     code = f"[{node}:{action}]"
     if params:
-        code += json.dumps(params, ensure_ascii=False)
+        code += json.dumps(materialize_params(params), ensure_ascii=False)  # 전선 = 구조 통화 경계
     payload = {"code": code, "project_id": "앱모드"}
     if agent_id:
         payload["agent_id"] = agent_id  # 호출자 신원 전파 — 맥서 폰-자아로 기록(미동봉 시만 system_ai 폴백)
@@ -461,18 +463,12 @@ def _resolve_and_maybe_forward(node, action, action_config, params,
 def reload_nodes():
     """노드 정의 강제 리로드 (실행기 측 캐시 전부).
 
-    ibl_registry 사전 캐시 + ibl_executors._nodes_cache(파생 캐시)를 함께 무효화한다.
-    /packages/reload 가 ibl_access(카탈로그) 캐시만 비우던 누락을 메운다 — src/nodes 변경이
-    backend 재시작 없이 실행 경로에도 반영되도록.
+    ibl_registry 사전 캐시를 무효화한다. /packages/reload 가 ibl_access(카탈로그) 캐시만
+    비우던 누락을 메운다 — src/nodes 변경이 backend 재시작 없이 실행 경로에도 반영되도록.
+    (2026-10-16) ibl_executors 의 별도 nodes 캐시는 은퇴 — 설치본 메모 하나를 같이 본다.
     """
     _invalidate_nodes()
     _load_nodes_config()
-    # ibl_executors 가 _load_nodes_config 결과의 nodes 섹션을 별도 캐싱하므로 함께 비운다.
-    try:
-        import ibl_executors
-        ibl_executors._nodes_cache = None
-    except Exception:
-        pass
 
 
 def get_node_actions(node_name: str) -> set:
@@ -546,20 +542,6 @@ def list_actions(node: str) -> List[Dict]:
 #  - 루프가 없으면(동기 프로바이더 등) 오프로드 안 함 → 기존과 100% 동일.
 #  - thread_context(threading.local)는 스냅샷→워커 복원해 allowed_nodes 등 보존.
 #  - delegate(system 라우터)/channel/workflow 등은 손대지 않음 → AI·위임 경로 무영향.
-_offload_pool = None
-
-
-def _get_offload_pool():
-    """핸들러 오프로드용 스레드풀 (지연 생성)."""
-    global _offload_pool
-    if _offload_pool is None:
-        import concurrent.futures
-        _offload_pool = concurrent.futures.ThreadPoolExecutor(
-            max_workers=8, thread_name_prefix="ibl_offload"
-        )
-    return _offload_pool
-
-
 def _run_router_safely(fn, *args, **kwargs):
     """실행 중인 이벤트 루프 위라면 루프 없는 워커 스레드에서 fn을 실행한다.
 
@@ -571,15 +553,10 @@ def _run_router_safely(fn, *args, **kwargs):
     except RuntimeError:
         return fn(*args, **kwargs)  # 루프 없음 → 인라인 (변화 없음)
 
-    # 실행 중인 루프 위 → 워커 스레드로 오프로드 (+ thread_context 전파)
-    import thread_context as _tc
-    snap = _tc.snapshot()
-
-    def _worker():
-        _tc.restore(snap)
-        return fn(*args, **kwargs)
-
-    return _get_offload_pool().submit(_worker).result()
+    # 실행 중인 루프 위 → 엔진 스케줄러의 async-loop 레인 워커로 오프로드
+    # (thread_context 전파는 스케줄러가 한다 — 옛 전용 8스레드 풀을 흡수, 2026-10-16)
+    import lane_scheduler
+    return lane_scheduler.run("async-loop", fn, *args, name=getattr(fn, "__name__", ""), **kwargs)
 
 
 def _attach_param_warning(result: Any, warning: Optional[dict]) -> Any:
@@ -619,60 +596,56 @@ def _attach_param_warning(result: Any, warning: Optional[dict]) -> Any:
 MAX_NEST_DEPTH = 3
 
 
-def execute_ibl(tool_input: dict, project_path: str, agent_id: str = None) -> Any:
-    """
-    IBL 노드 도구 실행
+# 구조 통화(PipeCurrency)를 객체째 받는 system 함수 — 나머지 system 소비자는 문자열을 받는다
+_PIPE_CURRENCY_FUNCS = frozenset({"table_each"})
 
-    Args:
-        tool_input: {
-            "action": "search",      # 필수: 액션 이름
-            "params": {...},         # 파라미터
-            "_depth": 0,             # 중첩 실행 깊이 (문장을 값으로 받는 자리가 +1 해서 전달)
-            ...기타 노드별 파라미터
-        }
-        project_path: 프로젝트 경로 (필수, 호출자가 명시 전달)
-        agent_id: 에이전트 ID
 
-    Returns:
-        실행 결과
-    """
-    # 중첩 깊이 초과 — 조용히 멈추지 않고 명시 오류로 반환한다(침묵 금지 계약).
-    _depth = tool_input.get("_depth") or 0
-    if _depth > MAX_NEST_DEPTH:
-        return {
-            "success": False,
-            "_nest_depth_exceeded": True,
-            "error": f"중첩 실행 깊이 상한({MAX_NEST_DEPTH})을 넘었습니다 (현재 {_depth}). "
-                     f"문장 안에 문장을 넣는 깊이를 줄이거나, 긴 절차는 "
-                     f"[self:workflow]에 저장해 id 로 참조하세요.",
-        }
+def _accepts_pipe_currency(node: str, action: str) -> bool:
+    """이 액션의 소비자가 구조 통화를 객체째 받겠다고 옵트인했는가.
 
-    # Phase 26: Goal Block 실행
-    if tool_input.get("_goal"):
-        return _execute_goal_block(tool_input, project_path, agent_id)
+    handler 는 모듈의 `PIPE_CURRENCY_TOOLS`(도구 이름 집합)로, system 은 _PIPE_CURRENCY_FUNCS 로.
+    옵트인은 "재파싱 없이 읽고 **변형하지 않는다**"는 약속이다(병렬 가지가 객체를 공유)."""
+    try:
+        cfg = _load_nodes_config().get("nodes", {}).get(node, {}).get("actions", {}).get(action) or {}
+    except Exception:
+        return False
+    router = cfg.get("router")
+    if router == "system":
+        return cfg.get("func") in _PIPE_CURRENCY_FUNCS
+    if router == "handler" and cfg.get("tool"):
+        from tool_loader import load_tool_handler
+        try:
+            h = load_tool_handler(cfg["tool"])
+        except Exception:
+            return False
+        return cfg["tool"] in (getattr(h, "PIPE_CURRENCY_TOOLS", None) or ())
+    return False
 
-    # Phase 26: 조건문 (if/else) 실행
-    if tool_input.get("_condition"):
-        return _execute_condition(tool_input, project_path, agent_id)
 
-    # Phase 26: Case문 실행
-    if tool_input.get("_case"):
-        return _execute_case(tool_input, project_path, agent_id)
+def _pipe_currency_boundary(tool_input: dict) -> None:
+    """옵트인하지 않은 소비자 앞에서 구조 통화를 문자열로 바꾼다(2026-10-16).
 
-    # 프로그램급 IBL M3·M4: try/catch/finally · repeat (2026-08-22)
-    if tool_input.get("_try"):
-        from ibl_control_blocks import _execute_try
-        return _execute_try(tool_input, project_path, agent_id)
-    if tool_input.get("_repeat"):
-        from ibl_control_blocks import _execute_repeat
-        return _execute_repeat(tool_input, project_path, agent_id)
-    if tool_input.get("_assign"):
-        from ibl_control_blocks import _execute_assign
-        return _execute_assign(tool_input, project_path, agent_id)
+    파이프 이음매(workflow_binding._auto_inject_prev)가 주입 직후 부르고, execute_ibl 입구가
+    한 번 더 부른다(이음매 밖에서 params 를 손으로 꾸린 호출자 방어). 대다수 핸들러·블록·
+    원격 포워드는 문자열 계약이라 여기서 한 번 직렬화하고, data-ops 변환자·each 만 객체를
+    그대로 받는다. @주소 지정은 전선을 건너므로 항상 문자열."""
+    params = tool_input.get("params")
+    if not isinstance(params, dict) or not isinstance(params.get("_prev_result"), PipeCurrency):
+        return
+    if not tool_input.get("target_node") and _accepts_pipe_currency(tool_input.get("_node"),
+                                                                      tool_input.get("action")):
+        return
+    tool_input["params"] = materialize_params(params)
 
-    # (2026-08-05 감사 D11) 옛 노드타입 모드(_node_type: info/store/exec/output) 디스패치 삭제 —
-    # 그 노드들은 레지스트리에 없어 정상 경로의 "알 수 없는 노드" 오류로 수렴한다.
 
+def _prepare_leaf(tool_input: dict, agent_id: str = None):
+    """leaf 액션 실행 준비 — 사전 조회·파라미터 정규화·미인식 경고·default_input.
+
+    반환: 준비가 끝나면 (node, action, action_config, router, params, param_warning) 튜플,
+    조회 실패면 그대로 돌려줄 오류 dict. 동기 execute_ibl 과 비동기 execute_ibl_async(ibl_async)
+    가 같은 준비를 쓰도록 떼어 냈다(2026-10-16).
+    """
+    _depth = tool_input.get("_depth") or 0
     action = tool_input.get("action")
     if not action:
         node = tool_input.get("_node")
@@ -755,6 +728,70 @@ def execute_ibl(tool_input: dict, project_path: str, agent_id: str = None) -> An
             if k not in params:
                 params[k] = v
 
+    return node, action, action_config, router, params, _param_warning
+
+
+def execute_ibl(tool_input: dict, project_path: str, agent_id: str = None) -> Any:
+    """
+    IBL 노드 도구 실행
+
+    Args:
+        tool_input: {
+            "action": "search",      # 필수: 액션 이름
+            "params": {...},         # 파라미터
+            "_depth": 0,             # 중첩 실행 깊이 (문장을 값으로 받는 자리가 +1 해서 전달)
+            ...기타 노드별 파라미터
+        }
+        project_path: 프로젝트 경로 (필수, 호출자가 명시 전달)
+        agent_id: 에이전트 ID
+
+    Returns:
+        실행 결과
+    """
+    # 중첩 깊이 초과 — 조용히 멈추지 않고 명시 오류로 반환한다(침묵 금지 계약).
+    _depth = tool_input.get("_depth") or 0
+    if _depth > MAX_NEST_DEPTH:
+        return {
+            "success": False,
+            "_nest_depth_exceeded": True,
+            "error": f"중첩 실행 깊이 상한({MAX_NEST_DEPTH})을 넘었습니다 (현재 {_depth}). "
+                     f"문장 안에 문장을 넣는 깊이를 줄이거나, 긴 절차는 "
+                     f"[self:workflow]에 저장해 id 로 참조하세요.",
+        }
+
+    _pipe_currency_boundary(tool_input)
+
+    # Phase 26: Goal Block 실행
+    if tool_input.get("_goal"):
+        return _execute_goal_block(tool_input, project_path, agent_id)
+
+    # Phase 26: 조건문 (if/else) 실행
+    if tool_input.get("_condition"):
+        return _execute_condition(tool_input, project_path, agent_id)
+
+    # Phase 26: Case문 실행
+    if tool_input.get("_case"):
+        return _execute_case(tool_input, project_path, agent_id)
+
+    # 프로그램급 IBL M3·M4: try/catch/finally · repeat (2026-08-22)
+    if tool_input.get("_try"):
+        from ibl_control_blocks import _execute_try
+        return _execute_try(tool_input, project_path, agent_id)
+    if tool_input.get("_repeat"):
+        from ibl_control_blocks import _execute_repeat
+        return _execute_repeat(tool_input, project_path, agent_id)
+    if tool_input.get("_assign"):
+        from ibl_control_blocks import _execute_assign
+        return _execute_assign(tool_input, project_path, agent_id)
+
+    # (2026-08-05 감사 D11) 옛 노드타입 모드(_node_type: info/store/exec/output) 디스패치 삭제 —
+    # 그 노드들은 레지스트리에 없어 정상 경로의 "알 수 없는 노드" 오류로 수렴한다.
+
+    prep = _prepare_leaf(tool_input, agent_id)
+    if not isinstance(prep, tuple):
+        return prep
+    node, action, action_config, router, params, _param_warning = prep
+
     # === 다중 노드 분산 라우팅 ===
     # 능력(runs_on)으로 로컬/원격을 판정하고, 원격이면 "지금 연결된" 노드 중 대상을 고른다
     # (명시 @주소 > 자기-가능 > 후보1대 > 주(主)기기 > 모호하면 되물음). 폰 수를 고정하지 않음 —
@@ -807,58 +844,80 @@ def execute_ibl(tool_input: dict, project_path: str, agent_id: str = None) -> An
         else:
             return {"error": f"알 수 없는 라우터: {router}"}
 
-        # 결과에서 성공/실패 판단
-        if isinstance(result, dict):
-            if result.get("success") is False:
-                _action_success = False
-            elif result.get("error"):  # error 키가 있고 값이 비어있지 않은 경우
-                _action_success = False
-            if not _action_success:
-                _action_err = result.get("error") or result.get("message")
+        _action_success, _action_err = _judge_result(result)
     except Exception as _exc:
         _action_success = False
         _action_err = f"exception: {str(_exc)[:260]}"
         raise
     finally:
-        _action_ms = round((_time.time() - _action_start) * 1000)
-        try:
-            from thread_context import append_tool_call
-            append_tool_call(f"ibl:{node}:{action}", {"node": node, "action": action, "params": params},
-                             _action_success, node=node, action=action, duration_ms=_action_ms)
-        except Exception:
-            pass
-        try:
-            from xray_stream import push_xray_event
-            push_xray_event("tool", {
-                "node": node, "action": action,
-                "success": _action_success, "ms": _action_ms,
-                "agent": agent_id or "",
-            })
-        except Exception:
-            pass
-        # action_health 기록 (실사용 및 self_check 모두). channel(호출 통로)·error(실패
-        # 오류문 절단본)는 2026-08-21 ③ 조사 — §1D 를 추정이 아니라 기록으로 읽기 위함.
-        try:
-            from pulse_db import record_action_health
-            from thread_context import is_health_check_mode, get_call_channel
-            _src = "self_check" if agent_id == "__self_check__" or is_health_check_mode() else "usage"
-            record_action_health(node, action, _action_success, _action_ms, source=_src,
-                                 channel=get_call_channel(),
-                                 error=(None if _action_success else _action_err))
-        except Exception:
-            pass
+        _record_action(node, action, params, agent_id, _action_success, _action_err,
+                       round((_time.time() - _action_start) * 1000))
+
+    return _finish_leaf(result, tool_input, action, action_config, agent_id, _param_warning)
+
+
+def _judge_result(result: Any) -> tuple:
+    """라우터 결과의 성공/실패 판단 → (성공 여부, 실패 사유)."""
+    if isinstance(result, dict):
+        # error 키가 있고 값이 비어있지 않으면 실패
+        if result.get("success") is False or result.get("error"):
+            return False, result.get("error") or result.get("message")
+    return True, None
 
-    # 후처리 (postprocess): 액션 YAML에 정의된 전처리(예: compress=AI 노이즈 제거) 수행
-    # 건너뛰는 경우:
-    #  - 자가점검(__self_check__): AI 호출 비용 절감
-    #  - params._raw=true: 앱·GUI 등 구조화 원본이 필요한 호출 (요약은 에이전트 소비용)
+
+def _record_action(node: str, action: str, params: Any, agent_id: Optional[str],
+                   success: bool, err: Optional[str], ms: int) -> None:
+    """개별 액션 기록 — 도구 호출 로그 · X-Ray · action_health. 기록 실패는 실행에 영향 없음."""
+    try:
+        from thread_context import append_tool_call
+        append_tool_call(f"ibl:{node}:{action}", {"node": node, "action": action,
+                                                   "params": materialize_params(params)},
+                         success, node=node, action=action, duration_ms=ms)
+    except Exception:
+        pass
+    try:
+        from xray_stream import push_xray_event
+        push_xray_event("tool", {
+            "node": node, "action": action,
+            "success": success, "ms": ms,
+            "agent": agent_id or "",
+        })
+    except Exception:
+        pass
+    # action_health 기록 (실사용 및 self_check 모두). channel(호출 통로)·error(실패
+    # 오류문 절단본)는 2026-08-21 ③ 조사 — §1D 를 추정이 아니라 기록으로 읽기 위함.
+    try:
+        from pulse_db import record_action_health
+        from thread_context import is_health_check_mode, get_call_channel
+        _src = "self_check" if agent_id == "__self_check__" or is_health_check_mode() else "usage"
+        record_action_health(node, action, success, ms, source=_src,
+                             channel=get_call_channel(),
+                             error=(None if success else err))
+    except Exception:
+        pass
+
+
+def _needs_postprocess(result: Any, tool_input: dict, action_config: dict, agent_id: Optional[str]):
+    """후처리 (postprocess): 액션 YAML에 정의된 전처리(예: compress=AI 노이즈 제거) 설정 또는 None.
+
+    건너뛰는 경우:
+     - 자가점검(__self_check__): AI 호출 비용 절감
+     - params._raw=true: 앱·GUI 등 구조화 원본이 필요한 호출 (요약은 에이전트 소비용)
+    """
     postprocess = action_config.get("postprocess")
     _raw = bool((tool_input.get("params") or {}).get("_raw"))
     if postprocess and result is not None and agent_id != "__self_check__" and not _raw:
-        result = _postprocess(result, action, postprocess)
+        return postprocess
+    return None
 
+
+def _finish_leaf(result: Any, tool_input: dict, action: str, action_config: dict,
+                 agent_id: Optional[str], param_warning: Optional[dict]) -> Any:
+    postprocess = _needs_postprocess(result, tool_input, action_config, agent_id)
+    if postprocess:
+        result = _postprocess(result, action, postprocess)
     # 인자 경고 부착 — postprocess 이후 (압축이 경고를 지우지 않게)
-    return _attach_param_warning(result, _param_warning)
+    return _attach_param_warning(result, param_warning)
 
 
 # === 후처리 시스템 (Postprocessing) ===
@@ -1,5 +1,5 @@
 """
-ibl_exec_each.py — [table:each] 실행기(행마다 $it 치환 → 파이프 실행) + 입력 통화 추출.
+ibl_exec_each.py — [table:each] 실행기(행마다 $it 결속 → 파이프 실행) + 입력 통화 추출.
 
 2026-08-23 ibl_executors.py 에서 이사(1500줄 규칙). 재수출 = ibl_executors.
 """
@@ -7,7 +7,7 @@ import os
 import re
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from common.currency import currency_shape_note
 
 
@@ -25,6 +25,9 @@ _EACH_DEFAULT_LIMIT = 20
 #   필드를 보여주면서 없다고 말하는 자기모순이 난다(2026-08-17 실측 버그).
 _EACH_SCALAR_FIELD = "value"
 _EACH_MAX_SUBSTEPS = 200
+# parallel: N — 행을 동시에 돌리는 폭 (2026-10-16). true 는 기본 폭, 상한은 병렬(&) 분기와 같은 8.
+_EACH_DEFAULT_PARALLEL = 4
+_EACH_MAX_PARALLEL = 8
 
 
 def _each_escape(value: Any) -> str:
@@ -76,6 +79,29 @@ def _each_substitute(sentence: str, row: Any, var: str) -> Tuple[str, list]:
     return pattern.sub(_sub, sentence), missing
 
 
+def _each_slot_values(fields: tuple, row: Any) -> Tuple[list, list]:
+    """슬롯 계획(ibl_plan.SlotPlan)의 필드들을 행에서 꺼낸다. 반환: (슬롯 값 목록, 없는 필드 목록).
+
+    필드 해석 규칙은 _each_substitute 와 **같다** — 빈 필드=행 전체, 스칼라 행은
+    `_EACH_SCALAR_FIELD` 만 있음. 두 경로가 갈리면 같은 행이 경로에 따라 성공/실패가 바뀐다.
+    """
+    values: list = []
+    missing: list = []
+    for field in fields:
+        if not field:
+            values.append(row)
+        elif isinstance(row, dict):
+            if field not in row:
+                missing.append(field)
+            values.append(row.get(field))
+        elif field == _EACH_SCALAR_FIELD:
+            values.append(row)
+        else:
+            missing.append(field)
+            values.append(None)
+    return values, missing
+
+
 def _each_foreign_vars(do: str, var: str) -> list:
     """do 문장 안에서 **해석되지 않을** `$변수` 이름 목록 (F14-1, 2026-08-20 14회차).
 
@@ -116,8 +142,9 @@ def _stamp_depth(steps: Any, depth: int) -> None:
             _stamp_depth(v if isinstance(v, list) else ([v] if isinstance(v, dict) else None), depth)
 
 
-def _each_input_rows(params: dict) -> Tuple[Optional[list], Any]:
+def _each_input_rows(params: dict) -> Tuple[Optional[Sequence], Any]:
     """입력 통화(items)를 꺼낸다. 반환: (행 목록 또는 None, 파싱된 봉투).
+    행 형식 스필이면 행 목록 자리에 common.spill.SpillRows(슬라이스·len·순회만 되는 뷰)가 온다.
 
     규약은 data-ops 변환자와 **같다**(2026-08-15 대칭 수리): 파이프 입력(`_prev_result`)이
     먼저이고, 그게 없을 때만 params 에서 통화를 직접 받는다 — 단독 호출·자가점검·
@@ -126,8 +153,16 @@ def _each_input_rows(params: dict) -> Tuple[Optional[list], Any]:
     유일한 고차 변환자가 항상 앞에 생산자를 요구하던 셈이다.
     """
     prev = params.get("_prev_result")
+    # 파이프 구조 통화면 앞 step 의 객체를 그대로 (재파싱 없음 — 행은 아래에서 dict() 사본으로만 쓴다)
+    from common.currency import PipeCurrency
+    if isinstance(prev, PipeCurrency):
+        prev = prev.obj
+    # 행 형식 스필이면 스트리밍 뷰 — 행은 순회 때 한 줄씩, limit 까지만 읽는다(len = 참조의 count)
+    from common.spill import open_rows, resolve_ref_str
+    spilled = open_rows(prev)
+    if spilled is not None:
+        return spilled, spilled.shell()
     # 스필 참조 봉투면 본문으로 (M5 자동 스필 — 소비자는 투명하게 읽는다)
-    from common.spill import resolve_ref_str
     prev, _ref_err = resolve_ref_str(prev)
     if _ref_err:
         return None, {"error": _ref_err}
@@ -165,13 +200,80 @@ def _each_input_rows(params: dict) -> Tuple[Optional[list], Any]:
     return None, obj
 
 
+def _each_parallel_width(raw: Any) -> int:
+    """parallel 파라미터 → 동시 실행 폭. 없음·1 이하·해석 불가 = 1(순차, 옛 동작).
+    상한은 _EACH_MAX_PARALLEL — 병렬(&) 분기와 같은 8."""
+    if raw is True:
+        return _EACH_DEFAULT_PARALLEL
+    try:
+        n = int(raw)
+    except (TypeError, ValueError):
+        return 1
+    return max(1, min(n, _EACH_MAX_PARALLEL))
+
+
+def _each_run_parallel(target: Sequence, prepare, run, workers: int,
+                       on_error: str) -> Tuple[list, int, Optional[str]]:
+    """each 의 parallel 모드 — 행 실행만 워커 풀에 태운다. 반환: (출력 행, 하위 스텝 수, 중단 사유).
+
+    결속·파싱·예산 계산은 호출 스레드에서 행 순서대로 하고(예산은 순차와 같은 행에서 끊긴다),
+    execute_pipeline 만 동시에 돈다. 제출 창은 workers 개 — 그래서 on_error=stop 이 실패를 본
+    뒤에는 새 행을 내지 않는다. 이미 떠난 행은 취소할 수 없으니(부수효과가 났다) 결과에
+    그대로 싣는다. 출력은 완료 순이 아니라 **입력 순**이다.
+    행 실행은 엔진 스케줄러(lane_scheduler)의 network 레인에 낸다 — thread_context 승계는 스케줄러가
+    하고, each 가 이미 레인 워커 안(워크플로우·& 분기 속)이면 빈자리가 없을 때 행이 제자리에서 돈다
+    (중첩이 스레드를 곱하지 않는다).
+    """
+    import lane_scheduler
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    slots: list = []            # 입력 순 — 완성된 출력 행(dict) 또는 Future
+    pending: set = set()
+    substeps = 0
+    halted: Optional[str] = None
+    failed = False
+
+    def _reap(done) -> None:
+        nonlocal failed
+        for f in done:
+            pending.discard(f)
+            if not f.result()["_ok"]:
+                failed = True
+
+    for row in target:
+        if failed and on_error == "stop":
+            halted = "on_error"
+            break
+        base, steps, prep_err = prepare(row)
+        if prep_err is not None:
+            slots.append({**base, "_ok": False, "_error": prep_err})
+            if on_error == "stop":
+                halted = "on_error"
+                break
+            continue
+        substeps += len(steps)
+        if substeps > _EACH_MAX_SUBSTEPS:
+            halted = "budget"
+            break
+        fut = lane_scheduler.submit("network", run, base, steps, name="each")
+        slots.append(fut)
+        pending.add(fut)
+        if len(pending) >= workers:
+            _reap(wait(pending, return_when=FIRST_COMPLETED).done)
+    _reap(wait(pending).done)
+    if failed and on_error == "stop" and halted is None:
+        halted = "on_error"
+    return [s if isinstance(s, dict) else s.result() for s in slots], substeps, halted
+
+
 def _execute_table_each(params: dict, project_path: str, agent_id: str = None) -> Any:
-    """[table:each]{do, as, limit, on_error} — items 의 각 행에 IBL 문장을 적용.
+    """[table:each]{do, as, limit, on_error, parallel} — items 의 각 행에 IBL 문장을 적용.
 
     통화 계약: items → items. 각 출력 행 = 원 행 + `_ok` + (`_error` | `_result`).
     원 행을 보존하므로 `>> [table:filter]{where: {_ok: false}}` 로 실패만 추릴 수 있다.
     """
-    from ibl_parser import parse as ibl_parse, IBLSyntaxError
+    from ibl_parser import IBLSyntaxError
+    from ibl_plan import compile_slot_plan, parse_cached
     from workflow_engine import execute_pipeline
 
     do = params.get("do")
@@ -213,18 +315,26 @@ def _execute_table_each(params: dict, project_path: str, agent_id: str = None) -
     on_error = str(params.get("on_error") or "continue").strip().lower()
     depth = int(params.get("_depth") or 0)
 
+    # do 는 한 번만 컴파일한다 — 문자열 리터럴 안의 `$it.필드` 는 슬롯으로 바뀌어 행마다 값만
+    # 결속된다(재파싱 0회). 결속이 옛 치환과 같은 뜻을 보장 못 하는 문장(맨몸 참조 등)은
+    # None → 아래에서 옛 치환 경로(파싱은 계획 캐시 경유)로 간다.
+    slot_plan = compile_slot_plan(do, var)
+
     target = rows[:limit]
     skipped = max(0, len(rows) - len(target))
     out_items: list = []
-    ok_n = err_n = substeps = 0
+    substeps = 0
     halted: Optional[str] = None
+    _wf_stack = params.get("_wf_stack")
 
-    for idx, row in enumerate(target):
+    def _prepare(row: Any) -> Tuple[dict, Optional[list], Optional[str]]:
+        """행 → (출력 바탕 행, 실행할 step, 실행 전 오류문). 결속·파싱은 호출 스레드에서만."""
         base = dict(row) if isinstance(row, dict) else {_EACH_SCALAR_FIELD: row}
-
-        sentence, missing = _each_substitute(do, row, var)
+        if slot_plan is not None:
+            values, missing = _each_slot_values(slot_plan.fields, row)
+        else:
+            sentence, missing = _each_substitute(do, row, var)
         if missing:
-            err_n += 1
             # 필드 힌트도 잘렸으면 잘렸다고 말한다 (F18-1 부류 — 침묵 클램프 금지):
             # 12개에서 끊긴 목록을 전부로 읽으면 있는 필드를 없다고 오판한다.
             if isinstance(row, dict):
@@ -232,36 +342,22 @@ def _execute_table_each(params: dict, project_path: str, agent_id: str = None) -
                 avail = (_names[:12] + [f"…외 {len(_names) - 12}개"]) if len(_names) > 12 else _names
             else:
                 avail = [_EACH_SCALAR_FIELD]
-            out_items.append({**base, "_ok": False,
-                              "_error": (f"행에 없는 필드: {', '.join(sorted(set(missing)))} "
-                                         f"(행 필드: {avail})")})
-            if on_error == "stop":
-                halted = "on_error"
-                break
-            continue
-
+            return base, None, (f"행에 없는 필드: {', '.join(sorted(set(missing)))} "
+                                f"(행 필드: {avail})")
         try:
-            steps = ibl_parse(sentence)
+            steps = slot_plan.bind(values) if slot_plan is not None else parse_cached(sentence)
         except IBLSyntaxError as e:
-            err_n += 1
-            out_items.append({**base, "_ok": False, "_error": f"IBL 문법 오류: {e}"})
-            if on_error == "stop":
-                halted = "on_error"
-                break
-            continue
-
-        substeps += len(steps)
-        if substeps > _EACH_MAX_SUBSTEPS:
-            halted = "budget"
-            break
-
+            return base, None, f"IBL 문법 오류: {e}"
         _stamp_depth(steps, depth + 1)
-        # each 의 do 는 *문자열*이라 행마다 새로 파싱된다 — 바깥에서 찍힌 워크플로우 호출
+        # each 의 step 은 행마다 새 사본이다(결속·캐시 모두) — 바깥에서 찍힌 워크플로우 호출
         # 스택이 여기서 끊기면, 워크플로우 → each → 자기 워크플로우 사슬이 가드를 우회한다.
-        _wf_stack = params.get("_wf_stack")
         if _wf_stack:
             from workflow_contract import _stamp_wf_stack
             _stamp_wf_stack(steps, _wf_stack)
+        return base, steps, None
+
+    def _run(base: dict, steps: list) -> dict:
+        """준비된 행 하나를 실행해 출력 행(_ok + _result/_error)을 만든다."""
         try:
             res = execute_pipeline(steps, project_path, agent_id=agent_id)
         except Exception as e:  # 실행기 자체가 터진 경우도 행 단위로 정직하게
@@ -277,16 +373,32 @@ def _execute_table_each(params: dict, project_path: str, agent_id: str = None) -
                     pass
 
         if isinstance(res, dict) and not res.get("success", True):
-            err_n += 1
-            out_items.append({**base, "_ok": False,
-                              "_error": res.get("error") or "실행 실패",
-                              "_result": final})
-            if on_error == "stop":
+            return {**base, "_ok": False, "_error": res.get("error") or "실행 실패", "_result": final}
+        return {**base, "_ok": True, "_result": final}
+
+    workers = _each_parallel_width(params.get("parallel"))
+    if workers > 1:
+        out_items, substeps, halted = _each_run_parallel(target, _prepare, _run, workers, on_error)
+    else:
+        for row in target:
+            base, steps, prep_err = _prepare(row)
+            if prep_err is not None:
+                out_items.append({**base, "_ok": False, "_error": prep_err})
+                if on_error == "stop":
+                    halted = "on_error"
+                    break
+                continue
+            substeps += len(steps)
+            if substeps > _EACH_MAX_SUBSTEPS:
+                halted = "budget"
+                break
+            item = _run(base, steps)
+            out_items.append(item)
+            if not item["_ok"] and on_error == "stop":
                 halted = "on_error"
                 break
-        else:
-            ok_n += 1
-            out_items.append({**base, "_ok": True, "_result": final})
+    ok_n = sum(1 for r in out_items if r.get("_ok"))
+    err_n = len(out_items) - ok_n
 
     # 중단 시 남은 행은 '처리 안 함'으로 정직하게 집계 (조용히 사라지지 않게)
     if halted:
@@ -298,6 +410,8 @@ def _execute_table_each(params: dict, project_path: str, agent_id: str = None) -
         "ok_count": ok_n,
         "error_count": err_n,
     }
+    if workers > 1:
+        out["parallel"] = workers
     notes = []
     if params.get("collect") and out_items:
         # collect:true (M4 설계 §2.3-1) — 회차 결과(_result 의 items)를 이어붙인 하나의 items 로(= flatten 내장).
@@ -322,6 +436,10 @@ def _execute_table_each(params: dict, project_path: str, agent_id: str = None) -
             notes.append(f"하위 스텝 예산({_EACH_MAX_SUBSTEPS}) 초과로 중단 — {skipped}건 미처리")
         elif halted == "on_error":
             notes.append(f"on_error=stop 으로 중단 — {skipped}건 미처리")
+            _first = next((i for i, r in enumerate(out_items) if not r.get("_ok")), len(out_items))
+            if workers > 1 and len(out_items) - 1 > _first:
+                notes.append(f"실패 시점에 이미 동시 실행 중이던 {len(out_items) - 1 - _first}행은 "
+                             "결과에 포함")
         else:
             notes.append(f"limit={limit} 로 앞에서 잘랐습니다 — {skipped}건 미처리")
         out["skipped"] = skipped
@@ -20,18 +20,10 @@ from typing import Any, Dict, List, Optional, Tuple
 from common.currency import currency_shape_note  # noqa: F401
 
 
-_nodes_cache: Optional[Dict] = None
-
-
 def _load_nodes() -> Dict:
-    """nodes: 섹션 로드 (캐싱)"""
-    global _nodes_cache
-    if _nodes_cache is not None:
-        return _nodes_cache
+    """nodes: 섹션 — 설치본은 ibl_registry 가 사전 세대마다 메모한다 (2026-10-16: 별도 캐시 은퇴)"""
     from ibl_registry import _load_nodes_config
-    data = _load_nodes_config()
-    _nodes_cache = data.get("nodes", {})
-    return _nodes_cache
+    return _load_nodes_config().get("nodes", {})
 
 
 # (2026-08-05 감사 D11) 옛 노드타입 디스패치(_execute_node/_execute_info_node/
@@ -53,7 +45,7 @@ from ibl_exec_goal import (  # noqa: F401
 )
 from ibl_exec_each import (  # noqa: F401
     _EACH_DEFAULT_LIMIT, _EACH_SCALAR_FIELD, _EACH_MAX_SUBSTEPS,
-    _each_escape, _each_substitute, _each_foreign_vars, _stamp_depth,
+    _each_escape, _each_substitute, _each_slot_values, _each_foreign_vars, _stamp_depth,
     _each_input_rows, _execute_table_each,
 )
 from ibl_exec_sense import (  # noqa: F401
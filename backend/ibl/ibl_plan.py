@@ -0,0 +1,230 @@
+"""
+ibl_plan.py — IBL 문장 컴파일 계획(plan) + 원문 키 LRU 캐시 (2026-10-16)
+
+왜 있는가 — 같은 문장이 같은 프로세스 안에서 몇 번이고 다시 파싱된다.
+`execute_pipeline` 은 문자열 step 을 호출마다 `ibl_parser.parse` 에 넣고, `[table:each]` 는
+행마다 `$it` 를 *문자열로* 치환한 do 문장을 통째로 다시 파싱했다. 2,000행 each 의
+네트워크 밖 시간은 대부분 이 재파싱이었다(파서는 순수 파이썬 문자 스캐너다).
+
+두 층:
+  IBLPlan     문장 하나를 한 번 파싱한 불변 계획. `steps()` 는 매번 **새 사본**을 준다 —
+              실행기가 step 에 `_depth`·`_wf_stack`·project_id 를 찍어 넣으므로 캐시 원본을
+              내주면 다음 호출이 오염된다.
+  SlotPlan    each 전용. do 문장의 `$it.필드` 자리를 슬롯 표식으로 바꿔 **한 번만** 파싱하고,
+              행마다 슬롯에 값만 결속한다(재파싱 0회).
+
+★슬롯 결속은 문자열 리터럴 *안의* 참조만 맡는다 — 옛 치환 경로에서 그 값은 이스케이프돼
+리터럴에 들어갔다가 파서가 그대로 풀어내므로, "값을 문자열에 끼워 넣기"와 결과가 같다.
+맨몸 참조(`{n: $it.count}`)는 치환 결과가 숫자·불리언 리터럴로 *다시 해석*되는 자리라
+결속으로 흉내 내지 않는다 — compile_slot_plan 이 None 을 돌려 호출자가 옛 경로(치환+
+캐시 파싱)로 간다. 조용한 근사 금지.
+"""
+import re
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ibl_parser import parse_with_vars, _scan_line_state
+
+# 캐시 상한 — 저장 워크플로우·트리거·each do 문장 수는 수백 단위라 512면 작업 집합을 덮는다.
+_PLAN_CACHE_MAX = 512
+
+# 슬롯 표식 — 사설 영역 문자(U+E000/E001)로 감싼 번호. 사람이 적는 문장·행 값과 충돌하지 않고,
+# 파서의 따옴표 안 스캔은 어떤 글자든 리터럴로 받는다.
+_SLOT_OPEN, _SLOT_CLOSE = "\ue000", "\ue001"
+_SLOT_RE = re.compile(_SLOT_OPEN + r"(\d+)" + _SLOT_CLOSE)
+
+_cache: "OrderedDict[str, IBLPlan]" = OrderedDict()
+_slot_cache: "OrderedDict[Tuple[str, str], Optional[SlotPlan]]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _normalize(code: str) -> str:
+    """캐시 키 — 앞뒤 공백과 줄끝 방언만 접는다(내부 공백은 문자열 리터럴일 수 있어 보존)."""
+    return code.replace("\r\n", "\n").strip()
+
+
+def _clone(v: Any) -> Any:
+    """파싱 결과(dict/list/스칼라) 전용 깊은 복사 — copy.deepcopy 의 memo 비용 없이."""
+    if isinstance(v, dict):
+        return {k: _clone(x) for k, x in v.items()}
+    if isinstance(v, list):
+        return [_clone(x) for x in v]
+    return v
+
+
+class IBLPlan:
+    """한 번 파싱된 IBL 문장. 원본 step 은 감춰 두고 사본만 내준다(불변 계약)."""
+
+    __slots__ = ("source", "_steps", "_variables")
+
+    def __init__(self, source: str, steps: List[Dict], variables: Dict[str, int]):
+        self.source = source
+        self._steps = steps
+        self._variables = variables
+
+    def steps(self) -> List[Dict]:
+        """실행용 step 리스트 사본 (호출자가 자유롭게 변형해도 캐시 원본은 무사)."""
+        return _clone(self._steps)
+
+    def variables(self) -> Dict[str, int]:
+        return dict(self._variables)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+
+def _lru_get(cache: "OrderedDict", key):
+    with _lock:
+        if key in cache:
+            cache.move_to_end(key)
+            _stats["hits"] += 1
+            return True, cache[key]
+        _stats["misses"] += 1
+        return False, None
+
+
+def _lru_put(cache: "OrderedDict", key, value) -> None:
+    with _lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _PLAN_CACHE_MAX:
+            cache.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+def compile_plan(code: str) -> IBLPlan:
+    """문장 → IBLPlan (원문 키 LRU). 문법 오류는 IBLSyntaxError 그대로 — 오류는 캐시하지 않는다
+    (고쳐 쓴 문장이 옛 실패를 물려받지 않게)."""
+    key = _normalize(code or "")
+    hit, plan = _lru_get(_cache, key)
+    if hit:
+        return plan
+    steps, variables = parse_with_vars(code)
+    plan = IBLPlan(key, steps, variables)
+    _lru_put(_cache, key, plan)
+    return plan
+
+
+def parse_cached(code: str) -> List[Dict]:
+    """`ibl_parser.parse` 의 캐시판 — 반환은 매번 새 사본."""
+    return compile_plan(code).steps()
+
+
+# ── [table:each] 슬롯 계획 ─────────────────────────────────────────────────────
+
+def _slot_text(value: Any) -> str:
+    """슬롯에 들어갈 값의 문자열 형태 — ibl_exec_each._each_escape 의 *풀린* 모양과 같다
+    (그쪽은 리터럴에 넣으려 이스케이프하고, 파서가 그 이스케이프를 다시 벗긴다)."""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+class SlotPlan:
+    """do 문장 하나의 슬롯 계획. fields[i] = i번 슬롯이 읽는 행 필드('' = 행 전체)."""
+
+    __slots__ = ("source", "var", "fields", "_steps", "_sites")
+
+    def __init__(self, source: str, var: str, fields: Tuple[str, ...],
+                 steps: List[Dict], sites: List[Tuple[tuple, str]]):
+        self.source = source
+        self.var = var
+        self.fields = fields
+        self._steps = steps
+        # sites: (step 트리 안 경로, 슬롯 표식이 든 원 문자열) — 결속 때 이 자리만 다시 쓴다
+        self._sites = sites
+
+    def bind(self, values: List[Any]) -> List[Dict]:
+        """슬롯 값(fields 순서)을 결속한 실행용 step 사본."""
+        texts = [_slot_text(v) for v in values]
+        steps = _clone(self._steps)
+        for path, template in self._sites:
+            node = steps
+            for k in path[:-1]:
+                node = node[k]
+            node[path[-1]] = _SLOT_RE.sub(lambda m: texts[int(m.group(1))], template)
+        return steps
+
+
+def _collect_sites(v: Any, path: tuple, out: list) -> bool:
+    """step 트리에서 슬롯 표식이 든 문자열 자리를 모은다. dict *키*에 표식이 있으면 False."""
+    if isinstance(v, dict):
+        for k, x in v.items():
+            if isinstance(k, str) and _SLOT_OPEN in k:
+                return False
+            if not _collect_sites(x, path + (k,), out):
+                return False
+    elif isinstance(v, list):
+        for i, x in enumerate(v):
+            if not _collect_sites(x, path + (i,), out):
+                return False
+    elif isinstance(v, str) and _SLOT_OPEN in v:
+        out.append((path, v))
+    return True
+
+
+def _build_slot_plan(do: str, var: str) -> Optional[SlotPlan]:
+    from common.ibl_vars import ref_pattern
+    from ibl_parser import IBLSyntaxError
+
+    if _SLOT_OPEN in do or _SLOT_CLOSE in do:
+        return None
+    fields: List[str] = []
+    parts: List[str] = []
+    last = 0
+    in_str, str_ch = False, None
+    for m in re.finditer(ref_pattern(var), do):
+        # 참조가 문자열 리터럴 안인지 — 앞 구간을 이어 스캔(파서 전처리와 같은 상태 기계)
+        _d, in_str, str_ch = _scan_line_state(do[last:m.start()], in_str, str_ch)
+        if not in_str:
+            return None                 # 맨몸 참조 — 결속 불가(모듈 독스트링 ★)
+        field = ((m.group(1) if m.group(1) is not None else m.group(2)) or "").lstrip(".")
+        parts.append(do[last:m.start()])
+        parts.append(f"{_SLOT_OPEN}{len(fields)}{_SLOT_CLOSE}")
+        fields.append(field)
+        last = m.end()
+    parts.append(do[last:])
+    try:
+        steps, _vars = parse_with_vars("".join(parts))
+    except IBLSyntaxError:
+        return None                     # 옛 경로가 행 단위로 정직하게 진단하게 둔다
+    sites: List[Tuple[tuple, str]] = []
+    if not _collect_sites(steps, (), sites):
+        return None
+    # 표식이 모두, 정확히 한 번씩 살아남았는지 — 파서가 자리를 옮기거나 삼켰으면 결속 불가
+    seen = sorted(int(i) for _p, t in sites for i in _SLOT_RE.findall(t))
+    if seen != list(range(len(fields))):
+        return None
+    return SlotPlan(_normalize(do), var, tuple(fields), steps, sites)
+
+
+def compile_slot_plan(do: str, var: str) -> Optional[SlotPlan]:
+    """each do 문장 → SlotPlan. None = 슬롯 결속이 옛 치환과 같은 뜻을 보장 못 하는 문장
+    (호출자는 치환 + parse_cached 로 간다). 결과(None 포함)를 캐시한다."""
+    key = (_normalize(do or ""), var)
+    hit, plan = _lru_get(_slot_cache, key)
+    if hit:
+        return plan
+    plan = _build_slot_plan(do, var)
+    _lru_put(_slot_cache, key, plan)
+    return plan
+
+
+def plan_cache_stats() -> Dict[str, int]:
+    """관측용 — 캐시 크기·적중·미스·축출 수."""
+    with _lock:
+        return {"plans": len(_cache), "slot_plans": len(_slot_cache), **_stats}
+
+
+def clear_plan_cache() -> None:
+    """어휘 별칭 재적재 등 파서 규칙이 바뀌었을 때 호출 (테스트 격리에도 씀)."""
+    with _lock:
+        _cache.clear()
+        _slot_cache.clear()
+        for k in _stats:
+            _stats[k] = 0
@@ -53,31 +53,23 @@ def _run_sync_with_timeout(fn, args: tuple, timeout: float, tool_name: str):
 
     thread_context(threading.local)는 snapshot/restore 로 워커 스레드에 승계한다
     (패키지 핸들러들은 get_current_task_id 등 *읽기*만 한다 — 전수 확인 2026-08-05).
-    풀 대신 호출마다 새 스레드를 쓰는 이유: 핸들러가 execute_ibl 을 재귀 호출하는
-    구조라 고정 풀은 자기교착 위험이 있다. 타임아웃 시 스레드는 데몬으로 남아 완주한다.
+    실행은 엔진 스케줄러의 network 레인(2026-10-16, 옛 호출마다 새 스레드 대체). 핸들러가
+    execute_ibl 을 재귀 호출하는 구조라 고정 풀은 자기교착 위험이 있는데, 스케줄러는 워커가 낸
+    일을 줄 세우지 않아 그 위험이 없다 — 타임아웃이 걸린 제출이라 빈자리가 없으면 제자리 실행이
+    아니라 넘침 스레드에서 돈다(제자리면 타임아웃이 사라진다). 타임아웃 시 그 일은 포기된다 —
+    슬롯을 반납하고 취소 표식이 서며, 스레드는 강제 종료할 수 없어 고아로 완주하되 세어진다.
+    ★타임아웃은 핸들러가 **시작된 때부터** 잰다(from_start) — 옛 전용 스레드처럼 실행만 센다.
+    레인이 차 있어 줄 선 시간까지 세면 한 번도 돌지 않은 도구가 '시간 초과'로 버려진다.
+    줄 서는 시간도 무제한은 아니다 — QUEUE_WAIT_MAX_S 를 넘기면 넘침 스레드로 올라간다.
     """
-    import threading
-    import thread_context as _tc
-    snap = _tc.snapshot()
-    box: dict = {}
-
-    def _worker():
-        _tc.restore(snap)
-        try:
-            box["result"] = fn(*args)
-        except BaseException as e:  # 원 예외를 호출 스레드로 그대로 재전파
-            box["exc"] = e
-
-    t = threading.Thread(target=_worker, daemon=True,
-                         name=f"ibl-handler-{tool_name}")
-    t.start()
-    t.join(timeout)
-    if t.is_alive():
+    from concurrent.futures import TimeoutError as FuturesTimeoutError
+    import lane_scheduler
+    try:
+        return lane_scheduler.run("network", fn, *args, timeout=timeout, name=tool_name,
+                                  from_start=True)
+    except FuturesTimeoutError:
         raise _SyncHandlerTimeout(
             f"도구 실행 시간 초과 ({int(timeout)}초): {tool_name}")
-    if "exc" in box:
-        raise box["exc"]
-    return box.get("result")
 
 
 # === 파라미터 alias 정규화 ===
@@ -273,6 +265,64 @@ def _route_handler(mapped_tool: str, params: dict,
         - "project" (기본): project_path 필요. 없으면 에러.
         - "workspace"/"system": project_path 무시, get_base_path()를 ToolContext에 주입.
     """
+    call = _handler_call(mapped_tool, params, project_path, scope)
+    if isinstance(call, dict):
+        return call
+    handler, merged_params, context = call
+    # ★침묵 실패 방지: 핸들러 실행 예외(특히 의존성 미설치 ModuleNotFoundError)를 여기서
+    #   잡아 사용자에게 보이는 명확한 에러로 바꾼다. 예전엔 [sense:search] 등이 없는
+    #   라이브러리(ddgs)를 top-level import 하다 예외가 조용히 전파돼 빈 응답으로 뭉개졌다
+    #   (browser-action 은 자기 핸들러에서 감싸 명확했지만 나머지는 아니었다 — 불일관 해소).
+    try:
+        # ★동기 경로 타임아웃(D6): router:handler 동기 핸들러도 무제한 행하지 않게
+        #   워커 스레드 오프로드 + join(timeout). async 핸들러는 코루틴을 즉시 반환하므로
+        #   여기서는 빠르게 통과하고 아래 async 경로에서 기존 타임아웃이 걸린다.
+        result = _run_sync_with_timeout(
+            handler.execute, (merged_params, context),
+            SYNC_TOOL_EXECUTION_TIMEOUT, mapped_tool)
+    except _SyncHandlerTimeout as _to_err:
+        print(f"[IBL] 동기 도구 실행 타임아웃 ({SYNC_TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}")
+        return {
+            "success": False,
+            "error": (
+                f"도구 실행 시간 초과 ({SYNC_TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}. "
+                "작업이 백그라운드에서 계속될 수 있으니 잠시 후 상태를 확인하거나 다른 방법을 시도하세요."
+            ),
+        }
+    except (ModuleNotFoundError, ImportError) as _dep_err:
+        return _dependency_error(mapped_tool, _dep_err)
+    except Exception as _exec_err:
+        print(f"[IBL] 도구 실행 실패 ({mapped_tool}): {_exec_err}")
+        return {"error": f"도구 실행 실패 ({mapped_tool}): {_exec_err}"}
+
+    # async 핸들러 지원 (persistent 이벤트 루프 + 타임아웃)
+    if asyncio.iscoroutine(result):
+        async def _run_with_timeout(coro):
+            return await asyncio.wait_for(coro, timeout=TOOL_EXECUTION_TIMEOUT)
+
+        try:
+            import concurrent.futures
+            from ibl_engine import _get_persistent_loop
+            loop = _get_persistent_loop()
+            # persistent 루프에 코루틴을 제출하고 결과를 기다림
+            future = asyncio.run_coroutine_threadsafe(
+                _run_with_timeout(result), loop
+            )
+            result = future.result(timeout=TOOL_EXECUTION_TIMEOUT + 5)
+        except (asyncio.TimeoutError, concurrent.futures.TimeoutError):
+            result = _async_handler_failure(mapped_tool, None)
+        except Exception as e:
+            result = _async_handler_failure(mapped_tool, e)
+
+    return result
+
+
+def _handler_call(mapped_tool: str, params: dict, project_path: str, scope: str = "project"):
+    """핸들러 호출 준비 → (handler, merged_params, ToolContext) 또는 그대로 돌려줄 오류 dict.
+
+    동기 _route_handler 와 비동기 경로(ibl_async — async 핸들러를 직접 await)가 같은 검사
+    (시그니처·scope 경로·ToolContext)를 거치도록 떼어 냈다(2026-10-16).
+    """
     from tool_loader import load_tool_handler
 
     if not mapped_tool:
@@ -313,75 +363,36 @@ def _route_handler(mapped_tool: str, params: dict,
         context = ToolContext.from_thread_context(resolved_path, mapped_tool)
     except ToolContextError as e:
         return {"error": f"ToolContext 생성 실패: {e}"}
-    # ★침묵 실패 방지: 핸들러 실행 예외(특히 의존성 미설치 ModuleNotFoundError)를 여기서
-    #   잡아 사용자에게 보이는 명확한 에러로 바꾼다. 예전엔 [sense:search] 등이 없는
-    #   라이브러리(ddgs)를 top-level import 하다 예외가 조용히 전파돼 빈 응답으로 뭉개졌다
-    #   (browser-action 은 자기 핸들러에서 감싸 명확했지만 나머지는 아니었다 — 불일관 해소).
-    try:
-        # ★동기 경로 타임아웃(D6): router:handler 동기 핸들러도 무제한 행하지 않게
-        #   워커 스레드 오프로드 + join(timeout). async 핸들러는 코루틴을 즉시 반환하므로
-        #   여기서는 빠르게 통과하고 아래 async 경로에서 기존 타임아웃이 걸린다.
-        result = _run_sync_with_timeout(
-            handler.execute, (merged_params, context),
-            SYNC_TOOL_EXECUTION_TIMEOUT, mapped_tool)
-    except _SyncHandlerTimeout as _to_err:
-        print(f"[IBL] 동기 도구 실행 타임아웃 ({SYNC_TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}")
-        return {
-            "success": False,
-            "error": (
-                f"도구 실행 시간 초과 ({SYNC_TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}. "
-                "작업이 백그라운드에서 계속될 수 있으니 잠시 후 상태를 확인하거나 다른 방법을 시도하세요."
-            ),
-        }
-    except (ModuleNotFoundError, ImportError) as _dep_err:
-        _missing = getattr(_dep_err, "name", None) or str(_dep_err)
-        print(f"[IBL] 도구 의존성 누락 ({mapped_tool}): {_missing}")
-        return {
-            "error": (
-                f"도구 '{mapped_tool}' 실행에 필요한 라이브러리 '{_missing}' 가 설치돼 있지 않습니다. "
-                f"사용자에게 설치할지 물어본 뒤, 승낙하면 [self:install_lib]{{package: \"{_missing}\"}} 로 "
-                f"설치를 요청하고 다시 시도하세요. (설치는 사람 승인 게이트를 거칩니다 — "
-                f"승인 전이면 대기열에 등록되니 사용자의 승인을 기다리세요. 거절하면 이 도구는 건너뜁니다.)"
-            ),
-            # 인지층/UI가 '설치할까요?' 흐름을 태울 수 있도록 기계가독 신호도 함께.
-            "missing_dependency": _missing,
-            "install_action": f'[self:install_lib]{{package: "{_missing}"}}',
-        }
-    except Exception as _exec_err:
-        print(f"[IBL] 도구 실행 실패 ({mapped_tool}): {_exec_err}")
-        return {"error": f"도구 실행 실패 ({mapped_tool}): {_exec_err}"}
+    return handler, merged_params, context
 
-    # async 핸들러 지원 (persistent 이벤트 루프 + 타임아웃)
-    if asyncio.iscoroutine(result):
-        async def _run_with_timeout(coro):
-            return await asyncio.wait_for(coro, timeout=TOOL_EXECUTION_TIMEOUT)
 
-        try:
-            import concurrent.futures
-            from ibl_engine import _get_persistent_loop
-            loop = _get_persistent_loop()
-            # persistent 루프에 코루틴을 제출하고 결과를 기다림
-            future = asyncio.run_coroutine_threadsafe(
-                _run_with_timeout(result), loop
-            )
-            result = future.result(timeout=TOOL_EXECUTION_TIMEOUT + 5)
-        except asyncio.TimeoutError:
-            print(f"[IBL] 도구 실행 타임아웃 ({TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}")
-            result = json.dumps({
-                "success": False,
-                "error": f"도구 실행 시간 초과 ({TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}. 다른 방법을 시도하세요."
-            })
-        except concurrent.futures.TimeoutError:
-            print(f"[IBL] 도구 스레드 타임아웃 ({TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}")
-            result = json.dumps({
-                "success": False,
-                "error": f"도구 실행 시간 초과 ({TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}. 다른 방법을 시도하세요."
-            })
-        except Exception as e:
-            print(f"[IBL] async 핸들러 실행 실패: {e}")
-            result = json.dumps({"success": False, "error": f"async 실행 오류: {str(e)}"})
+def _dependency_error(mapped_tool: str, dep_err: BaseException) -> dict:
+    """핸들러 의존성 누락(ModuleNotFoundError/ImportError) → 설치 안내 오류."""
+    _missing = getattr(dep_err, "name", None) or str(dep_err)
+    print(f"[IBL] 도구 의존성 누락 ({mapped_tool}): {_missing}")
+    return {
+        "error": (
+            f"도구 '{mapped_tool}' 실행에 필요한 라이브러리 '{_missing}' 가 설치돼 있지 않습니다. "
+            f"사용자에게 설치할지 물어본 뒤, 승낙하면 [self:install_lib]{{package: \"{_missing}\"}} 로 "
+            f"설치를 요청하고 다시 시도하세요. (설치는 사람 승인 게이트를 거칩니다 — "
+            f"승인 전이면 대기열에 등록되니 사용자의 승인을 기다리세요. 거절하면 이 도구는 건너뜁니다.)"
+        ),
+        # 인지층/UI가 '설치할까요?' 흐름을 태울 수 있도록 기계가독 신호도 함께.
+        "missing_dependency": _missing,
+        "install_action": f'[self:install_lib]{{package: "{_missing}"}}',
+    }
 
-    return result
+
+def _async_handler_failure(mapped_tool: str, exc: Optional[BaseException]) -> str:
+    """async 핸들러 실패 봉투(JSON 문자열) — exc 가 None 이면 타임아웃."""
+    if exc is None:
+        print(f"[IBL] 도구 실행 타임아웃 ({TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}")
+        return json.dumps({
+            "success": False,
+            "error": f"도구 실행 시간 초과 ({TOOL_EXECUTION_TIMEOUT}초): {mapped_tool}. 다른 방법을 시도하세요."
+        })
+    print(f"[IBL] async 핸들러 실행 실패: {exc}")
+    return json.dumps({"success": False, "error": f"async 실행 오류: {str(exc)}"})
 
 
 
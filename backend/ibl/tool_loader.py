@@ -140,18 +140,15 @@ def build_execute_ibl_tool(allowed_nodes: Optional[List[str]] = None) -> Optiona
                        None/[]이면 모든 노드 포함.
                        지정 시 해당 노드만 description/enum에 포함.
     """
-    import yaml
-
-    yaml_path = get_base_path() / "data" / "ibl_nodes.yaml"
-    if not yaml_path.exists():
-        return None
+    import vocab_snapshot
 
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = vocab_snapshot.registry(get_base_path() / "data" / "ibl_nodes.yaml").data()
     except Exception as e:
         print(f"[tool_loader] ibl_nodes.yaml 파싱 실패: {e}")
         return None
+    if data is None:
+        return None
 
     all_nodes = data.get("nodes", {})
 
@@ -21,6 +21,7 @@ from typing import List, Dict, Any
 # 경로 설정
 BACKEND_PATH = Path(__file__).parent.parent
 from runtime_utils import get_base_path as _get_base_path
+import vocab_snapshot
 DATA_PATH = _get_base_path() / "data"
 INSTALLED_TOOLS_PATH = DATA_PATH / "packages" / "installed" / "tools"
 IBL_NODES_PATH = DATA_PATH / "ibl_nodes.yaml"
@@ -191,8 +192,7 @@ def get_ibl_nodes(use_cache: bool = True) -> List[Dict[str, Any]]:
         return nodes
 
     try:
-        with open(IBL_NODES_PATH, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+        data = vocab_snapshot.registry(IBL_NODES_PATH).data() or {}
 
         for node_name, node_config in data.get("nodes", {}).items():
             if node_name in INFRA_NODES:
@@ -153,14 +153,12 @@ def _bind_items_params(tool_input: dict, prev_result: str):
     if not refs:
         return tool_input, None
 
-    # 이전 결과에서 items 통화 추출 (prev_result 는 _to_prev_currency 가 이미 items 파생을 마친 JSON)
+    # 이전 결과에서 items 통화 추출 (prev_result 는 _to_prev_currency 가 이미 items 파생을 마친
+    # 구조 통화 또는 JSON 문자열 — pipe_obj 가 구조 통화는 재파싱 없이 객체로 준다)
+    from common.currency import pipe_obj
     items = None
-    s = (prev_result or "").strip()
-    if s:
-        try:
-            obj = json.loads(s)
-        except Exception:
-            obj = None
+    if prev_result:
+        obj = pipe_obj(prev_result)
         # 스필 참조 봉투면 본문으로 (M5)
         from common.spill import resolve_ref
         obj, _ref_err = resolve_ref(obj)
@@ -192,12 +190,14 @@ def _bind_items_params(tool_input: dict, prev_result: str):
     return out, None
 
 
-def _inject_prev_result(tool_input: dict, prev_result: str) -> dict:
-    """{{_prev_result}} 템플릿을 이전 결과로 치환"""
+def _inject_prev_result(tool_input: dict, prev_result: Any) -> dict:
+    """{{_prev_result}} 템플릿을 이전 결과로 치환 (텍스트 치환 자리라 구조 통화는 여기서 직렬화)"""
+    from common.currency import pipe_text
     injected = {}
     for key, val in tool_input.items():
         if isinstance(val, str):
-            injected[key] = val.replace("{{_prev_result}}", prev_result)
+            injected[key] = (val.replace("{{_prev_result}}", pipe_text(prev_result))
+                             if "{{_prev_result}}" in val else val)
         elif isinstance(val, dict):
             injected[key] = _inject_prev_result(val, prev_result)
         else:
@@ -215,12 +215,14 @@ def _has_prev_ref(tool_input: dict) -> bool:
     return False
 
 
-def _auto_inject_prev(tool_input: dict, prev_result: str) -> dict:
+def _auto_inject_prev(tool_input: dict, prev_result: Any) -> dict:
     """
     파이프라인 자동 데이터 전달.
 
     prev_result가 있고, step에 {{_prev_result}} 명시 참조가 없으면
-    params._prev_result로 자동 주입.
+    params._prev_result로 자동 주입. 구조 통화(PipeCurrency)는 옵트인 소비자(data-ops 변환자·
+    each — ibl_engine._accepts_pipe_currency)에게만 객체 그대로 싣고, 나머지·@주소 지정에는
+    여기서 문자열로 싣는다(소비자 계약은 이음매에서 정한다 — 2026-10-16).
 
     이를 통해 [sense:web_search]{query: "A"} >> [engines:newspaper]{query: "B"} 같은 파이프라인에서
     step 2가 step 1의 결과를 자동으로 받을 수 있다.
@@ -238,12 +240,14 @@ def _auto_inject_prev(tool_input: dict, prev_result: str) -> dict:
         tool_input = dict(tool_input)
         tool_input["params"] = dict(params)
         tool_input["params"]["_prev_result"] = prev_result
+        from ibl_engine import _pipe_currency_boundary
+        _pipe_currency_boundary(tool_input)
 
     return tool_input
 
 
-def _to_prev_currency(result: Any) -> str:
-    """다음 step 주입용 문자열 — **파이프 이음매에서만** 단일 통화(items)를 파생한다.
+def _to_prev_currency(result: Any, text: str = None) -> Any:
+    """다음 step 주입용 통화 — **파이프 이음매에서만** 단일 통화(items)를 파생한다.
 
     감사 D13(2026-08-05): currency.py 문서는 파생 관문을 _route_handler 로 적었지만 실제
     호출처는 렌더러 경계(api_ibl)와 body_ask 뿐이라, table/blocks 만 내는 생산자가
@@ -252,9 +256,15 @@ def _to_prev_currency(result: Any) -> str:
     → 진짜 갭은 파이프 이음매: prev_result 로 다음 step 에 물릴 때만 파생한다.
     results[]/step_results(모델·호출자에게 보이는 쪽)는 원형 유지 = 토큰 중복 0.
 
-    JSON 문자열 결과(대다수 핸들러)도 파싱→파생→재직렬화로 커버. 파싱 불가면 원형 그대로.
+    JSON 문자열 결과(대다수 핸들러)도 파싱→파생으로 커버. 파싱 불가면 원형 문자열 그대로.
+
+    반환(2026-10-16): dict/list 통화는 문자열이 아니라 **PipeCurrency**(common.currency) —
+    다음 변환자가 같은 JSON 을 다시 파싱하지 않게. text = 호출자가 results[] 기록용으로 이미
+    만든 `_to_string(result)`; 파생이 봉투를 바꾸지 않았으면 그 문자열을 물려받아 재덤프도 없다.
     """
-    from common.currency import derive_items
+    from common.currency import PipeCurrency, derive_items
+    if isinstance(result, PipeCurrency):
+        return result                   # 받은 통화를 그대로 되돌린 소비자 — 이미 파생을 마친 통화
     r = result
     if isinstance(r, str):
         s = r.strip()
@@ -264,8 +274,17 @@ def _to_prev_currency(result: Any) -> str:
             r = json.loads(s)
         except Exception:
             return _to_string(result)
+        r_text = None                   # 원문 서식(들여쓰기 등)은 옛 규약대로 재덤프로 정규화
+    else:
+        r_text = text
     if isinstance(r, dict):
-        return _to_string(derive_items(r))
+        if r.get("_forwarded_to") and "items" not in r and "table" not in r:
+            return _to_string(r)        # 포워드 봉투는 본문 문자열로 벗긴다(_to_string 규약)
+        had_items = isinstance(r.get("items"), list)
+        # derive_items 는 봉투를 제자리에서 고친다 — items 가 원래 있었을 때만 옛 텍스트가 유효
+        return PipeCurrency(derive_items(r), r_text if had_items else None)
+    if isinstance(r, (list, tuple)):
+        return PipeCurrency(list(r) if isinstance(r, tuple) else r, r_text)
     return _to_string(result)
 
 
@@ -291,8 +310,11 @@ def _step_label(step: Any) -> Tuple[str, str]:
 
 def _to_string(result: Any) -> str:
     """결과를 문자열로 변환 (다음 step 의 _prev_result 로 주입)."""
+    from common.currency import PipeCurrency, pipe_json_default
     if isinstance(result, str):
         return result
+    if isinstance(result, PipeCurrency):
+        return result.text()
     if isinstance(result, dict):
         # 포워드된 결과 봉투 벗기기 — @hub/@노드 로 원격 실행된 bare-string 읽기는
         # {"result": "<본문>", "_forwarded_to": ...} 로 감싸져 온다. 다음 step 은 전송 봉투가
@@ -304,7 +326,7 @@ def _to_string(result: Any) -> str:
                 _v = result.get(_k)
                 if isinstance(_v, str):
                     return _v
-        return json.dumps(result, ensure_ascii=False)
+        return json.dumps(result, ensure_ascii=False, default=pipe_json_default)
     if isinstance(result, (list, tuple)):
-        return json.dumps(result, ensure_ascii=False)
+        return json.dumps(result, ensure_ascii=False, default=pipe_json_default)
     return str(result)
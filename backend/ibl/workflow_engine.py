@@ -22,11 +22,16 @@ import os
 import re
 import json
 import time
+import types
+import inspect
 import yaml
 from pathlib import Path
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from common.currency import pipe_text as _pipe_text
+from lane_scheduler import cancelled as _lane_cancelled
+
 
 # === 경로 ===
 
@@ -216,8 +221,71 @@ def execute_pipeline(steps: list, project_path: str = ".",
             "error": str (실패 시)
         }
     """
+    return _drive_pipeline(_pipeline_core(steps, project_path, context, agent_id),
+                           project_path, agent_id)
+
+
+# ── 파이프 코어 ↔ 실행 드라이버 (2026-10-16) ──────────────────────────────────
+# 파이프의 의미(정규화·바인딩·실패 처리·봉투 조립)는 제너레이터 _pipeline_core 하나가 갖고,
+# 실제 실행은 코어가 yield 하는 효과를 드라이버가 돌려준다. 효과는 셋:
+#   ("ibl", tool_input)                        → execute_ibl 결과
+#   ("parallel", branches, prev, raw)          → 분기 결과 리스트
+#   ("fallback", chain, prev)                  → (결과, 시도 로그)
+# 예외는 드라이버가 코어에 throw 해 원래 자리의 except 가 받는다. 구동 루프는 _drive_core 한 벌 —
+# 동기 구동(drive_core: 이 파이프·workflow_parallel 의 & 분기)과 비동기 구동(ibl_async 가
+# `await _drive_core(...)`)이 같은 루프를 돈다. 같은 코어·같은 루프라 두 경로의 봉투가 같다.
+@types.coroutine
+def _drive_core(core, run):
+    """효과를 yield 하는 제너레이터 코어(_pipeline_core·_branch_core)의 구동 루프.
+
+    run(효과)의 결과를 코어의 yield 자리로 send, 예외는 throw. run 이 awaitable 을 돌려주면
+    여기서 기다린다 — 그래서 이 루프는 await 할 수 있는 제너레이터 기반 코루틴이다.
+    취소(CancelledError 등 BaseException)는 코어를 닫고 그대로 올린다."""
+    send, exc = None, None
+    while True:
+        try:
+            effect = core.throw(exc) if exc is not None else core.send(send)
+        except StopIteration as stop:
+            return stop.value
+        send, exc = None, None
+        try:
+            send = run(effect)
+            if inspect.isawaitable(send):
+                send = yield from send.__await__()
+        except Exception as e:
+            exc = e
+        except BaseException:
+            core.close()
+            raise
+
+
+def drive_core(core, run):
+    """_drive_core 의 동기 구동 — run 이 값을 바로 돌려주므로 한 번의 send 로 끝난다."""
+    loop = _drive_core(core, run)
+    try:
+        loop.send(None)
+    except StopIteration as stop:
+        return stop.value
+    loop.close()
+    raise RuntimeError("동기 구동자에 awaitable 효과가 왔습니다 — ibl_async 로 구동하세요")
+
+
+def _drive_pipeline(core, project_path: str, agent_id: Optional[str]) -> dict:
     from ibl_engine import execute_ibl
 
+    def _run(effect):
+        kind = effect[0]
+        if kind == "ibl":
+            return execute_ibl(effect[1], project_path, agent_id=agent_id)
+        if kind == "parallel":
+            return _execute_parallel(effect[1], project_path, effect[2], raw=effect[3])
+        return _execute_fallback(effect[1], project_path, effect[2], agent_id=agent_id)
+
+    return drive_core(core, _run)
+
+
+def _pipeline_core(steps: list, project_path: str, context: Optional[dict], agent_id: Optional[str]):
+    """execute_pipeline 의 본체 — 실행 자리에서 효과를 yield 하고 결과 봉투를 return 한다."""
     # ★B1 (2026-08-16 상상훈련): steps 가 IBL 코드 *문자열 하나*로 오면 그대로 두면 안 된다 —
     # str 도 iterable 이라 아래 any(isinstance(s, str)) 관문을 "글자들의 리스트"로 통과해
     # 한 글자씩 파싱을 시도한다(steps_total=글자 수, 'IBL 문법 오류: ['). do/steps 별칭이
@@ -235,8 +303,11 @@ def execute_pipeline(steps: list, project_path: str = ".",
     # 'get' 으로 만성 실패해 왔다. 계약을 정의하는 입구에서 한 번 정규화해 모든 호출처
     # (run_pipeline·calendar·channel_poller·plans)를 함께 고친다.
     # 문자열이 '>>'/'&'/'??' 합성을 품으면 ibl_parse 가 여러 step 으로 펼친다.
+    # 파싱은 원문 키 계획 캐시(ibl_plan)를 거친다 — 같은 저장 문장·트리거가 호출마다 다시
+    # 파싱되지 않게. 반환은 매번 새 사본이라 아래의 project_id 전파 등 변형이 캐시를 더럽히지 않는다.
     if any(isinstance(s, str) for s in steps):
-        from ibl_parser import parse as ibl_parse, IBLSyntaxError
+        from ibl_parser import IBLSyntaxError
+        from ibl_plan import parse_cached as ibl_parse
         normalized = []
         for s in steps:
             if isinstance(s, str):
@@ -311,7 +382,7 @@ def execute_pipeline(steps: list, project_path: str = ".",
             if idx >= 1 and prev_result and not st.get("_seq_boundary"):
                 try:
                     from common.spill import spill_write
-                    ref = spill_write(prev_result, tag=f"resume_step{idx + 1}")["ref"]
+                    ref = spill_write(_pipe_text(prev_result), tag=f"resume_step{idx + 1}")["ref"]
                     abort_payload["resume"] = {
                         "from_step": idx + 1, "prev_ref": ref,
                         "note": (f"step {idx + 1} 부터 다시 돌리려면 execute_ibl(code, resume={{from_step: {idx + 1}, "
@@ -324,7 +395,7 @@ def execute_pipeline(steps: list, project_path: str = ".",
         _seq["failed"] += 1
         return None
 
-    def _after_failure(prev: str) -> str:
+    def _after_failure(prev: Any) -> Any:
         """실패 뒤 다음 step 에 넘길 통화 — skip=직전 통화 그대로, null=빈 items, 그 외=끊김."""
         m = _seq["last_mode"]
         if m == "skip":
@@ -333,17 +404,28 @@ def execute_pipeline(steps: list, project_path: str = ".",
             return '{"items": []}'
         return ""
 
-    def _spill_if_large(prev: str, idx: int) -> str:
-        """자동 스필(M5 §2.5-3): 이음매 통화가 임계를 넘으면 파일로 내리고 참조만 흘린다 — 신고 동반."""
+    def _spill_if_large(prev: Any, idx: int) -> Any:
+        """자동 스필(M5 §2.5-3): 이음매 통화가 임계를 넘으면 파일로 내리고 참조만 흘린다 — 신고 동반.
+        구조 통화는 크기를 표본으로 먼저 재서, 임계 근처일 때만 직렬화한다(PipeCurrency.exceeds)."""
         try:
+            from common.currency import PipeCurrency
             from common.spill import AUTO_SPILL_THRESHOLD, spill_write
-            if idx < total - 1 and isinstance(prev, str) and len(prev) > AUTO_SPILL_THRESHOLD:
-                env = spill_write(prev, tag=f"step{idx + 1}")
-                if results and isinstance(results[-1], dict):
-                    results[-1]["spilled"] = env["ref"]
-                    results[-1]["note"] = (f"통화 {len(prev):,}자 > 임계 {AUTO_SPILL_THRESHOLD:,} — 스필 파일로 내리고 "
-                                           "참조만 다음 step 에 넘겼습니다(변환자·each·$items·write 는 투명하게 읽음)")
-                return json.dumps(env, ensure_ascii=False)
+            if idx >= total - 1:
+                return prev
+            if isinstance(prev, PipeCurrency):
+                if not prev.exceeds(AUTO_SPILL_THRESHOLD):
+                    return prev
+                payload, obj = prev.text(), prev.obj
+            elif isinstance(prev, str) and len(prev) > AUTO_SPILL_THRESHOLD:
+                payload, obj = prev, None
+            else:
+                return prev
+            env = spill_write(payload, tag=f"step{idx + 1}", obj=obj)
+            if results and isinstance(results[-1], dict):
+                results[-1]["spilled"] = env["ref"]
+                results[-1]["note"] = (f"통화 {len(payload):,}자 > 임계 {AUTO_SPILL_THRESHOLD:,} — 스필 파일로 내리고 "
+                                       "참조만 다음 step 에 넘겼습니다(변환자·each·$items·write 는 투명하게 읽음)")
+            return json.dumps(env, ensure_ascii=False)
         except Exception:
             pass
         return prev
@@ -351,6 +433,12 @@ def execute_pipeline(steps: list, project_path: str = ".",
     for i, step in enumerate(steps):
         if i < _seq["skip_until"]:
             continue  # 실패한 문장의 남은 step — 건너뛴다(다음 문장 경계까지)
+        if _lane_cancelled():
+            # 이 파이프를 기다리던 쪽(& 분기 마감·동기 핸들러 타임아웃)이 이미 포기했다 — 남은 step 은
+            # 결과를 받을 사람이 없는 부수효과일 뿐이라 돌리지 않는다(lane_scheduler ★취소, 2026-10-16).
+            return {"success": False, "steps_completed": i, "steps_total": total,
+                    "results": results, "final_result": None, "cancelled": True,
+                    "error": f"Step {i + 1} 전에 취소됨 — 이 실행을 기다리던 호출자가 시간 초과로 포기했습니다."}
         if isinstance(step, dict) and step.get("_seq_boundary"):
             # 문장 경계 — 앞 문장이 성공했어도 결과를 넘기지 않는다(독립).
             # 실패 경로는 각 _handle_failure 뒤에서 리셋하지만, 성공 경로는 여기가 유일한 관문
@@ -392,7 +480,7 @@ def execute_pipeline(steps: list, project_path: str = ".",
         if step.get("_parallel"):
             # 병렬 실행
             try:
-                result = _execute_parallel(step["branches"], project_path, prev_result, raw=(i < total - 1))
+                result = yield ("parallel", step["branches"], prev_result, i < total - 1)
             except Exception as e:
                 results.append({
                     "step": i + 1, "type": "parallel",
@@ -467,15 +555,14 @@ def execute_pipeline(steps: list, project_path: str = ".",
                     return _abort
                 prev_result = _after_failure(prev_result)
                 continue
-            prev_result = _spill_if_large(_to_prev_currency(result), i)  # 파이프 이음매 통화 파생(D13) — results[]는 원형 · 임계 초과=자동 스필(M5)
+            prev_result = _spill_if_large(_to_prev_currency(result, result_str), i)  # 파이프 이음매 통화 파생(D13) — results[]는 원형 · 임계 초과=자동 스필(M5)
 
             continue
 
         if "_fallback_chain" in step:
             # Fallback 실행
             try:
-                result, fallback_log = _execute_fallback(step["_fallback_chain"], project_path,
-                                                         prev_result, agent_id=agent_id)
+                result, fallback_log = yield ("fallback", step["_fallback_chain"], prev_result)
             except Exception as e:
                 results.append({
                     "step": i + 1, "type": "fallback",
@@ -518,7 +605,7 @@ def execute_pipeline(steps: list, project_path: str = ".",
                 prev_result = _after_failure(prev_result)
                 continue
 
-            prev_result = _spill_if_large(_to_prev_currency(result), i)  # 파이프 이음매 통화 파생(D13) — results[]는 원형 · 임계 초과=자동 스필(M5)
+            prev_result = _spill_if_large(_to_prev_currency(result, result_str), i)  # 파이프 이음매 통화 파생(D13) — results[]는 원형 · 임계 초과=자동 스필(M5)
             continue
 
         # 일반 step (기존 로직)
@@ -564,7 +651,7 @@ def execute_pipeline(steps: list, project_path: str = ".",
 
         # IBL 실행
         try:
-            result = execute_ibl(tool_input, project_path, agent_id=agent_id)
+            result = yield ("ibl", tool_input)
         except Exception as e:
             results.append({
                 "step": i + 1,
@@ -640,7 +727,7 @@ def execute_pipeline(steps: list, project_path: str = ".",
             continue
 
         # 다음 step으로 전달
-        prev_result = _spill_if_large(_to_prev_currency(result), i)  # 파이프 이음매 통화 파생(D13) — results[]는 원형 · 임계 초과=자동 스필(M5)
+        prev_result = _spill_if_large(_to_prev_currency(result, result_str), i)  # 파이프 이음매 통화 파생(D13) — results[]는 원형 · 임계 초과=자동 스필(M5)
 
     # 문장 경계를 넘어 계속 실행했더라도 실패는 숨기지 않는다 — 실패한 문장이 있으면 success=False.
     # (건너뛰기는 "계속 실행"이지 "없던 일"이 아니다. 스케줄러·평가자가 조용히 성공으로 읽으면 안 된다.)
@@ -651,7 +738,7 @@ def execute_pipeline(steps: list, project_path: str = ".",
         "steps_total": total,
         "_action_count": action_count,
         "results": results,
-        "final_result": prev_result,
+        "final_result": _pipe_text(prev_result),      # 최종 봉투 = 경계 — 구조 통화는 여기서 문자열로
     }
     if _failed:
         out["statements_failed"] = _failed
@@ -961,7 +1048,8 @@ def execute_workflow(workflow_id: str, project_path: str = ".",
 
     # Phase 15: pipeline 문자열 지원 — steps가 없으면 pipeline 필드를 IBL 파서로 변환
     if not steps and wf.get("pipeline"):
-        from ibl_parser import parse as ibl_parse, IBLSyntaxError
+        from ibl_parser import IBLSyntaxError
+        from ibl_plan import parse_cached as ibl_parse
         try:
             steps = ibl_parse(wf["pipeline"])
         except IBLSyntaxError as e:
@@ -1162,7 +1250,8 @@ def _run_inline(params: dict, project_path: str,
     caller_params 가 있으면 저장본 실행과 동일하게 $변수 주입."""
     pipeline = params.get("pipeline", "")
     if pipeline:
-        from ibl_parser import parse as ibl_parse, IBLSyntaxError
+        from ibl_parser import IBLSyntaxError
+        from ibl_plan import parse_cached as ibl_parse
         try:
             steps = ibl_parse(pipeline)
         except IBLSyntaxError as e:
@@ -7,7 +7,7 @@ import json
 import time
 
 
-def _execute_fallback(chain: list, project_path: str, prev_result: str,
+def _execute_fallback(chain: list, project_path: str, prev_result,
                       agent_id: str = None) -> tuple:
     """
     Fallback 실행 - 첫 번째 성공하는 액션까지 순차 시도 (Phase 9)
@@ -15,7 +15,7 @@ def _execute_fallback(chain: list, project_path: str, prev_result: str,
     Args:
         chain: 순서대로 시도할 step 리스트
         project_path: 프로젝트 경로
-        prev_result: 이전 step 결과
+        prev_result: 이전 step 결과 (문자열 또는 구조 통화 PipeCurrency)
         agent_id: 호출자 신원 — 일반 step 과 같게 전파(빠지면 NameError 로 ?? 가 통째로 죽는다)
 
     Returns:
@@ -9,10 +9,13 @@ IndieBiz OS Core
 """
 
 import time
+import weakref
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
 
+from .context_ledger import CHARS_PER_TOKEN, SizedMessages, estimate_size
+
 
 @dataclass
 class ProviderMetrics:
@@ -707,26 +710,26 @@ class BaseProvider(ABC):
     def _estimate_content_size(self, messages_or_contents) -> int:
         """메시지/컨텐츠의 총 글자 수 추정
 
-        Gemini Content 객체, OpenAI dict, Anthropic dict 모두 처리
+        Gemini Content 객체, OpenAI dict, Anthropic dict 모두 처리.
+        ★SizedMessages(_sized 로 붙인 장부)면 누계를 그대로 — 라운드마다 전부 다시 직렬화하지
+        않는다. 압축·프루닝이 돌려준 plain list 는 직전 장부의 크기를 빌려 새 메시지만 잰다.
         """
-        import json as _json
-        total = 0
-        for msg in messages_or_contents:
-            if isinstance(msg, dict):
-                total += len(_json.dumps(msg, ensure_ascii=False, default=str))
-            else:
-                # Gemini Content 객체
-                parts = getattr(msg, "parts", [])
-                for part in parts:
-                    if hasattr(part, "text") and part.text:
-                        total += len(part.text)
-                    elif hasattr(part, "function_call") and part.function_call:
-                        total += len(str(part.function_call))
-                    elif hasattr(part, "function_response") and part.function_response:
-                        total += len(str(part.function_response))
-                    else:
-                        total += 100  # 이미지 등 기타
-        return total
+        return estimate_size(messages_or_contents, self._live_ledger())
+
+    def _live_ledger(self) -> Optional[SizedMessages]:
+        ref = getattr(self, "_ledger_ref", None)
+        return ref() if ref is not None else None
+
+    def _sized(self, messages_or_contents) -> SizedMessages:
+        """라운드 시작에 크기 장부를 붙인다 (2026-10-16).
+
+        이미 장부면 그대로. 압축·프루닝이 새 list 를 줬으면 직전 장부에서 같은 메시지의 크기를
+        물려받는다. 장부는 약한 참조로만 기억한다 — 대화가 끝나면 히스토리를 붙들지 않게."""
+        if isinstance(messages_or_contents, SizedMessages):
+            return messages_or_contents
+        sized = SizedMessages(messages_or_contents, known=self._live_ledger())
+        self._ledger_ref = weakref.ref(sized)
+        return sized
 
     def _should_compact(self, messages_or_contents, iteration: int) -> bool:
         """Compaction이 필요한지 판단
@@ -735,13 +738,18 @@ class BaseProvider(ABC):
         1. 최소 라운드 이상 진행
         2. 컨텐츠 크기가 임계값 초과
         """
+        # 라운드 증가분 — 장부가 붙은 리스트면 직전 판정 이후 늘어난 글자 수 (로그에 같이)
+        growth = (messages_or_contents.mark()
+                  if isinstance(messages_or_contents, SizedMessages) else None)
         if iteration < self.COMPACTION_MIN_ROUNDS:
             return False
 
         content_size = self._estimate_content_size(messages_or_contents)
         should = content_size >= self.COMPACTION_CHAR_THRESHOLD
         if should:
-            print(f"[Compaction] 임계값 도달: {content_size:,}자 >= {self.COMPACTION_CHAR_THRESHOLD:,}자 (iteration={iteration})")
+            grew = f", 이번 라운드 {growth:+,}자" if growth is not None else ""
+            print(f"[Compaction] 임계값 도달: {content_size:,}자(~{content_size // CHARS_PER_TOKEN:,}토큰) "
+                  f">= {self.COMPACTION_CHAR_THRESHOLD:,}자 (iteration={iteration}{grew})")
         return should
 
     # ── 공유 compaction 절차 (프로바이더는 '요약 1회 호출'만 채운다) ──────
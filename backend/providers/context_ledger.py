@@ -0,0 +1,161 @@
+"""
+context_ledger.py - 대화 메시지 리스트의 크기 장부 (증분 계산)
+IndieBiz OS Core
+
+왜 있는가 (2026-10-16) — BaseProvider._estimate_content_size 는 라운드마다 히스토리의 모든
+메시지를 json.dumps 해서 _should_compact/_should_prune 를 판정했다. 60라운드 리서치
+에이전트는 같은 도구 결과 수 MB 를 라운드마다 다시 직렬화했다 = 도구 루프가 직렬화 기준 O(n²).
+
+SizedMessages 는 list 그대로(SDK·json 에 그대로 넘어간다)이면서, 메시지가 들어오는 순간 그
+크기를 한 번 재어 두고 누계를 들고 다닌다. 크기 규칙은 옛 _estimate_content_size 와 같다:
+  dict (Anthropic·OpenAI·Ollama·Gemini REST)  len(json.dumps(msg, ensure_ascii=False))
+  Gemini SDK Content 객체                      part 별 text/function_call/function_response 길이,
+                                               그 밖(이미지 등)은 100
+토큰은 CHARS_PER_TOKEN(=2, base.py 의 2026-08-17 실측 환산)으로 어림한다.
+
+★들어간 뒤 제자리에서 고친 메시지(msg["content"] = ...)는 장부가 모른다 — 교체는
+messages[i] = new 로(그건 잡는다), 어쩔 수 없으면 refresh(). 프로바이더 루프는 현재 교체만 쓴다.
+★압축·프루닝은 새 plain list 를 돌려준다. SizedMessages(new, known=old) 는 old 에 있던 같은
+객체의 크기를 물려받아, 마스킹된 메시지만 새로 잰다.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+CHARS_PER_TOKEN = 2
+
+
+def message_size(msg: Any) -> int:
+    """메시지 하나의 글자 수 추정 (옛 _estimate_content_size 의 원소 규칙)"""
+    if isinstance(msg, dict):
+        return len(json.dumps(msg, ensure_ascii=False, default=str))
+    total = 0
+    for part in getattr(msg, "parts", None) or []:
+        if hasattr(part, "text") and part.text:
+            total += len(part.text)
+        elif hasattr(part, "function_call") and part.function_call:
+            total += len(str(part.function_call))
+        elif hasattr(part, "function_response") and part.function_response:
+            total += len(str(part.function_response))
+        else:
+            total += 100  # 이미지 등 기타
+    return total
+
+
+def estimate_size(messages: Iterable, known: Optional["SizedMessages"] = None) -> int:
+    """리스트 전체의 글자 수. SizedMessages 면 누계 그대로, 아니면 known 의 크기를 빌려 잰다."""
+    if isinstance(messages, SizedMessages):
+        return messages.total_chars
+    memo = known.sizes_by_id() if known is not None else {}
+    return sum(memo.get(id(m)) or message_size(m) for m in messages)
+
+
+class SizedMessages(list):
+    """크기 장부를 단 메시지 리스트 — list 의 모든 변경 경로에서 누계를 맞춘다"""
+
+    def __init__(self, iterable: Iterable = (), known: Optional["SizedMessages"] = None):
+        super().__init__(iterable)
+        memo = known.sizes_by_id() if known is not None else {}
+        self._sizes: List[int] = [memo.get(id(m)) or message_size(m) for m in self]
+        self.total_chars = sum(self._sizes)
+        self._mark = self.total_chars
+
+    # ── 누계·델타 ──
+    @property
+    def approx_tokens(self) -> int:
+        return self.total_chars // CHARS_PER_TOKEN
+
+    def delta(self) -> int:
+        """마지막 mark() 뒤로 늘어난(줄면 음수) 글자 수 — 정책이 라운드 증가분을 본다."""
+        return self.total_chars - self._mark
+
+    def mark(self) -> int:
+        """지금 누계를 기준점으로 → 직전 기준점 이후 델타"""
+        d = self.delta()
+        self._mark = self.total_chars
+        return d
+
+    def sizes_by_id(self) -> Dict[int, int]:
+        """{id(메시지): 크기} — 이 리스트가 객체를 붙들고 있는 동안만 유효"""
+        return {id(m): s for m, s in zip(self, self._sizes)}
+
+    def refresh(self) -> None:
+        """제자리 수정 뒤 전부 다시 잰다"""
+        self._sizes = [message_size(m) for m in self]
+        self.total_chars = sum(self._sizes)
+
+    def _set_sizes(self, sizes: List[int]) -> None:
+        self._sizes = sizes
+        self.total_chars = sum(sizes)
+
+    # ── list 변경 경로 ──
+    def append(self, msg) -> None:
+        super().append(msg)
+        size = message_size(msg)
+        self._sizes.append(size)
+        self.total_chars += size
+
+    def extend(self, msgs) -> None:
+        msgs = list(msgs)
+        super().extend(msgs)
+        sizes = [message_size(m) for m in msgs]
+        self._sizes.extend(sizes)
+        self.total_chars += sum(sizes)
+
+    def __iadd__(self, msgs):
+        self.extend(msgs)
+        return self
+
+    def insert(self, index, msg) -> None:
+        super().insert(index, msg)
+        size = message_size(msg)
+        self._sizes.insert(index, size)
+        self.total_chars += size
+
+    def pop(self, index=-1):
+        msg = super().pop(index)
+        self.total_chars -= self._sizes.pop(index)
+        return msg
+
+    def remove(self, msg) -> None:
+        index = self.index(msg)
+        del self[index]
+
+    def clear(self) -> None:
+        super().clear()
+        self._set_sizes([])
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            super().__setitem__(index, value)
+            sizes = list(self._sizes)
+            sizes[index] = [message_size(m) for m in value]
+            self._set_sizes(sizes)
+        else:
+            super().__setitem__(index, value)
+            size = message_size(value)
+            self.total_chars += size - self._sizes[index]
+            self._sizes[index] = size
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        if isinstance(index, slice):
+            sizes = list(self._sizes)
+            del sizes[index]
+            self._set_sizes(sizes)
+        else:
+            self.total_chars -= self._sizes.pop(index)
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._set_sizes(self._sizes * max(n, 0))
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.refresh()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._sizes.reverse()
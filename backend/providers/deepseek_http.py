@@ -142,6 +142,8 @@ class DeepSeekHTTPProvider(BaseProvider):
         iteration = 0
         while iteration < self.MAX_TOOL_ITERATIONS:
             self._notify_round(iteration + 1, self.MAX_TOOL_ITERATIONS)
+            # 크기 장부 — 압축·프루닝 판정이 라운드마다 히스토리 전체를 다시 직렬화하지 않게
+            messages = self._sized(messages)
             # ★보존(요약) 먼저, 삭제는 최후 — 순서가 곧 정책이다(base 의 임계값 주석 참조).
             #   2026-08-19: 그전엔 이 자리에 프루닝만 있었다. COMPACTION_CHAR_THRESHOLD 를
             #   선언해 두고도 부르는 쪽이 없어, 폰 두뇌(3 티어 전부 이 프로바이더)는 마스킹
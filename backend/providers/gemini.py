@@ -334,6 +334,9 @@ class GeminiProvider(BaseProvider):
 
             self._notify_round(iteration + 1, self.MAX_TOOL_ITERATIONS)
 
+            # 크기 장부 — 압축·프루닝 판정이 라운드마다 히스토리 전체를 다시 직렬화하지 않게
+            contents = self._sized(contents)
+
             # Rolling Compaction: 컨텍스트가 임계값을 넘으면 요약으로 압축
             if iteration > 0 and self._should_compact(contents, iteration):
                 contents = self._compact_gemini(contents, config)
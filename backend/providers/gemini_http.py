@@ -186,6 +186,8 @@ class GeminiHTTPProvider(BaseProvider):
         iteration = 0
         while iteration < self.MAX_TOOL_ITERATIONS:
             self._notify_round(iteration + 1, self.MAX_TOOL_ITERATIONS)
+            # 크기 장부 — 압축·프루닝 판정이 라운드마다 히스토리 전체를 다시 직렬화하지 않게
+            contents = self._sized(contents)
             # ★보존(요약) 먼저, 삭제는 최후 — deepseek_http 와 대칭(2026-08-19 배선).
             if iteration > 0 and self._should_compact(contents, iteration):
                 contents = self._compact_gemini_http_shape(contents, "GeminiHTTP")
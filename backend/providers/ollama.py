@@ -355,6 +355,9 @@ class OllamaProvider(BaseProvider):
         self._notify_round(depth + 1, MAX_TOOL_DEPTH)
 
         try:
+            # 크기 장부 — 압축·프루닝 판정이 라운드마다 히스토리 전체를 다시 직렬화하지 않게
+            messages = self._sized(messages)
+
             # Session Pruning: 오래된 도구 결과 마스킹 — ★압력이 있을 때만(최후 수단)
             if depth > 0 and self._should_prune(messages, depth):
                 messages = self._prune_messages_openai(messages)
@@ -286,6 +286,9 @@ class OpenAIProvider(BaseProvider):
         self._notify_round(depth + 1, MAX_TOOL_DEPTH)
 
         try:
+            # 크기 장부 — 압축·프루닝 판정이 라운드마다 히스토리 전체를 다시 직렬화하지 않게
+            messages = self._sized(messages)
+
             # Rolling Compaction: 컨텍스트가 임계값을 넘으면 요약으로 압축
             if depth > 0 and self._should_compact(messages, depth):
                 messages = self._compact_openai(messages)
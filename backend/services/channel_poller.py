@@ -28,7 +28,7 @@ sys.path.insert(0, str(GMAIL_PATH))
 try:
     from pynostr.key import PrivateKey, PublicKey
     from pynostr.event import EventKind
-    import websocket
+    import websocket  # noqa: F401 — nostr_relay_pool 의 전송 계층 (HAS_NOSTR 판정)
     HAS_NOSTR = True
 except ImportError:
     HAS_NOSTR = False
@@ -36,6 +36,7 @@ except ImportError:
 
 # 키 표기 변환 정본은 nip17(기저층) — 여기 이름은 내부 소비 호환 별칭 (2026-08-05 ⑦).
 from nip17 import hex_to_npub as _hex_to_npub, npub_to_hex as _npub_to_hex
+import nostr_relay_pool
 
 def _load_owner_identities() -> Dict[str, set]:
     """환경변수에서 사용자 식별 정보 로드"""
@@ -91,7 +92,7 @@ class ChannelPoller:
         # Nostr 관련
         self._nostr_private_key = None
         self._nostr_public_key = None
-        self._nostr_wss = []  # 활성 WebSocket 목록(릴레이별 1개) — stop/토글오프 시 전체 close
+        self._nostr_subs = []  # 릴레이 풀 상주 구독 — stop/토글오프 시 전체 close
         self._nostr_seen_ids = set()
         self._nostr_seen_lock = threading.Lock()  # 멀티릴레이 동시 수신 시 dedupe 체크-추가 원자화
 
@@ -185,12 +186,12 @@ class ChannelPoller:
             except Exception as e:
                 self._log(f"자동응답 서비스 중지 실패: {e}")
 
-        # Nostr WebSocket 종료 (릴레이별 전체)
-        for ws in list(self._nostr_wss):
+        # Nostr 구독 종료 (연결은 릴레이 풀이 들고 있다 — 걸린 게 없으면 알아서 닫힌다)
+        for sub in list(self._nostr_subs):
             try:
-                ws.close()
+                sub.close()
             except Exception as e:
-                self._log(f"Nostr WebSocket 종료 실패: {e}")
+                self._log(f"Nostr 구독 종료 실패: {e}")
 
         # 모든 채널 폴링 중지
         for channel_type in list(self.stop_events.keys()):
@@ -252,14 +253,14 @@ class ChannelPoller:
             self.stop_events[channel_type].set()
             del self.stop_events[channel_type]
 
-        # Nostr WebSocket 종료 (릴레이별 전체)
+        # Nostr 구독 종료
         if channel_type == 'nostr':
-            for ws in list(self._nostr_wss):
+            for sub in list(self._nostr_subs):
                 try:
-                    ws.close()
+                    sub.close()
                 except Exception as e:
-                    self._log(f"Nostr WebSocket 종료 실패: {e}")
-            self._nostr_wss = []
+                    self._log(f"Nostr 구독 종료 실패: {e}")
+            self._nostr_subs = []
 
         if channel_type in self.threads:
             self.threads[channel_type].join(timeout=2)
@@ -293,8 +294,10 @@ class ChannelPoller:
 
         과거엔 relays[0] 한 곳만 실시간 구독해서, 우리 kind:10050 DM inbox 가 여러 릴레이면
         다른 릴레이로만 온 gift-wrap(NIP-17) 이 실시간 누락 → 자동응답 미트리거였다(주기 fetch 는
-        dms.db 만 채움). 이제 릴레이마다 독립 리스너를 띄운다. 같은 이벤트가 여러 릴레이서 중복
-        수신돼도 _nostr_seen_ids 락 + external_id DB dedup 으로 자동응답은 1회만 트리거된다.
+        dms.db 만 채움). 이제 전 릴레이에 구독 하나를 건다 (2026-10-16 부터 릴레이 풀의 상주 연결
+        위 — 릴레이별 리스너 스레드·소켓을 따로 들지 않는다). 같은 이벤트가 여러 릴레이서 중복
+        수신돼도 풀 구독의 id dedupe + _nostr_seen_ids 락 + external_id DB dedup 으로 자동응답은
+        1회만 트리거된다.
         """
         if not HAS_NOSTR:
             self._log("Nostr 라이브러리 없음 (pip install pynostr websocket-client)")
@@ -328,29 +331,48 @@ class ChannelPoller:
         if not relays or stop_event.is_set() or not self.running:
             return
 
-        # 릴레이별 독립 리스너 스레드 (각자 연결·재연결 관리)
-        for relay_url in relays:
-            threading.Thread(
-                target=self._nostr_relay_listener,
-                args=(relay_url, stop_event),
-                daemon=True
-            ).start()
+        # 릴레이 풀 상주 구독 하나 — 릴레이마다 연결 하나, 재연결(backoff)·ping·하이버네이션
+        # 감지는 풀이 맡는다. 같은 소켓을 IndieNet 피드·DM 조회·발행이 나눠 쓴다.
+        pk = self._nostr_public_key.hex()
+        sub = nostr_relay_pool.subscribe(
+            relays,
+            # (재)연결마다 새로 만든다 — NIP-04 DM(kind:4)은 그 시점부터.
+            # NIP-17 gift-wrap(kind:1059) created_at 은 과거로 무작위화되므로 since 를 못 쓴다 →
+            # limit 로 받고, 언랩 후 rumor 실제 시각으로 freshness 판단(_handle_nostr_giftwrap).
+            lambda: [{"kinds": [4], "#p": [pk], "since": int(time.time())},
+                     {"kinds": [1059], "#p": [pk], "limit": 50}],
+            self._on_nostr_event,
+            on_open=self._on_nostr_relay_open,
+            persistent=True, prefix="dm",
+        )
+        self._nostr_subs.append(sub)
         self._log(f"Nostr 실시간 구독: {len(relays)}개 릴레이")
 
-        # stop_event 까지 대기 (리스너 스레드들이 각자 재연결 관리)
-        while not stop_event.is_set() and self.running:
-            time.sleep(1)
-
-    def _nostr_relay_listener(self, relay_url: str, stop_event: threading.Event):
-        """단일 릴레이 연결 + 재연결 루프 (릴레이마다 독립 스레드)."""
-        while not stop_event.is_set() and self.running:
+        # stop_event 까지 대기 (연결 관리는 풀이)
+        try:
+            while not stop_event.is_set() and self.running:
+                time.sleep(1)
+        finally:
+            sub.close()
             try:
-                self._connect_nostr_websocket(relay_url, stop_event)
-            except Exception as e:
-                self._log(f"Nostr 릴레이 오류({relay_url}): {e}")
-            # 재연결 대기 (로그 없이 조용히)
-            if not stop_event.is_set() and self.running:
-                time.sleep(5)
+                self._nostr_subs.remove(sub)
+            except ValueError:
+                pass
+
+    def _on_nostr_event(self, event: dict, relay_url: str):
+        """풀 구독 이벤트 → DM 처리 (구독 전달 스레드에서 불린다 — 소켓 스레드가 아니라 답장 발행이 제 OK 를 읽는다)"""
+        if event.get('kind') == 4:  # NIP-04 DM (레거시)
+            self._handle_nostr_dm(event)
+        elif event.get('kind') == 1059:  # NIP-17 gift-wrap DM (최신 클라이언트)
+            self._handle_nostr_giftwrap(event)
+
+    def _on_nostr_relay_open(self, relay_url: str):
+        """릴레이 (재)연결 — 구독 REQ 가 막 나갔다"""
+        # 최초 연결 시에만 로그
+        if not hasattr(self, '_nostr_connected_once'):
+            self._log(f"Nostr 연결됨: {relay_url}")
+            self._nostr_connected_once = True
+        self._update_last_poll_time('nostr')
 
     def _init_nostr_keys(self) -> bool:
         """Nostr 키 초기화 - IndieNet identity를 항상 우선 사용"""
@@ -424,115 +446,6 @@ class ChannelPoller:
             self._log(f"Nostr 키 초기화 실패: {e}")
             return False
 
-    def _connect_nostr_websocket(self, relay_url: str, stop_event: threading.Event):
-        """Nostr WebSocket 연결 (단일 릴레이). 멀티릴레이 동시 연결을 위해 ws·last_active 는 연결별 로컬."""
-        import uuid
-
-        connected = threading.Event()
-        last_active = [time.time()]  # 연결별 하이버네이션 감지용 (closure-local)
-        HIBERNATION_THRESHOLD = 30  # 30초 이상 점프하면 하이버네이션으로 판단
-        PING_INTERVAL = 20  # 20초마다 ping
-
-        def on_message(ws, message):
-            try:
-                data = json.loads(message)
-                if data[0] == "EVENT":
-                    event = data[2]
-                    if event.get('kind') == 4:  # NIP-04 DM (레거시)
-                        self._handle_nostr_dm(event)
-                    elif event.get('kind') == 1059:  # NIP-17 gift-wrap DM (최신 클라이언트)
-                        self._handle_nostr_giftwrap(event)
-            except Exception as e:
-                pass
-
-        def on_error(ws, error):
-            # 정상적인 연결 끊김은 로그 안 남김
-            error_str = str(error)
-            if "Connection to remote host was lost" not in error_str:
-                self._log(f"Nostr WebSocket 에러({relay_url}): {error}")
-
-        def on_close(ws, close_status_code, close_msg):
-            pass  # 정상적인 닫힘은 로그 안 남김
-
-        def on_open(ws):
-            connected.set()
-            # 나에게 온 NIP-04 DM 구독 (현재 시점부터)
-            req = json.dumps([
-                "REQ",
-                f"dm_{uuid.uuid4().hex[:8]}",
-                {
-                    "kinds": [4],
-                    "#p": [self._nostr_public_key.hex()],
-                    "since": int(time.time())
-                }
-            ])
-            ws.send(req)
-            # 나에게 온 NIP-17 gift-wrap(kind:1059) 구독.
-            # gift-wrap created_at 은 과거로 무작위화되므로 since 를 못 쓴다 →
-            # limit 로 받고, 언랩 후 rumor 실제 시각으로 freshness 판단(_handle_nostr_giftwrap).
-            req17 = json.dumps([
-                "REQ",
-                f"gw_{uuid.uuid4().hex[:8]}",
-                {
-                    "kinds": [1059],
-                    "#p": [self._nostr_public_key.hex()],
-                    "limit": 50
-                }
-            ])
-            ws.send(req17)
-            last_active[0] = time.time()
-            # 최초 연결 시에만 로그
-            if not hasattr(self, '_nostr_connected_once'):
-                self._log(f"Nostr 연결됨: {relay_url}")
-                self._nostr_connected_once = True
-            self._update_last_poll_time('nostr')
-
-        ws = websocket.WebSocketApp(
-            relay_url,
-            on_open=on_open,
-            on_message=on_message,
-            on_error=on_error,
-            on_close=on_close
-        )
-        self._nostr_wss.append(ws)  # stop/토글오프 시 전체 close 대상
-
-        # 별도 스레드에서 WebSocket 실행 (ping으로 좀비 연결 감지)
-        ws_thread = threading.Thread(
-            target=ws.run_forever,
-            kwargs={"ping_interval": PING_INTERVAL, "ping_timeout": 10},
-            daemon=True
-        )
-        ws_thread.start()
-
-        # 연결 대기
-        connected.wait(timeout=10)
-
-        # stop_event가 설정될 때까지 대기 + 하이버네이션 감지
-        try:
-            while not stop_event.is_set() and self.running:
-                if not ws_thread.is_alive():
-                    break
-
-                # 하이버네이션 감지: 시간 점프 체크
-                now = time.time()
-                elapsed = now - last_active[0]
-                if elapsed > HIBERNATION_THRESHOLD:
-                    self._log(f"하이버네이션 감지 ({int(elapsed)}초 경과) - Nostr 재연결({relay_url})")
-                    break  # while 탈출 → ws.close() → 릴레이 리스너에서 재연결
-
-                last_active[0] = now
-                time.sleep(1)
-        finally:
-            # 종료 — 로컬 ws 닫고 활성 목록에서 제거
-            try:
-                ws.close()
-            except Exception:
-                pass
-            try:
-                self._nostr_wss.remove(ws)
-            except ValueError:
-                pass
-
     def _handle_nostr_dm(self, event: dict):
         """Nostr DM 처리 → DB 저장"""
         try:
@@ -1,9 +1,7 @@
 """IndieNet 릴레이 I/O·영구 캐시 계층 (2026-07-18 모듈화): _publish_event/_query_relays·글/DM 캐시."""
 import json
 import time
-import uuid
 import sqlite3
-import threading
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -13,8 +11,7 @@ from indienet_common import (
     DEFAULT_RELAYS, INDIENET_TAG,
     Event, EventKind, PrivateKey, PublicKey,
 )
-if HAS_NOSTR:
-    import websocket
+import nostr_relay_pool
 
 
 class IndieNetRelayMixin:
@@ -27,70 +24,12 @@ class IndieNetRelayMixin:
         if not relays:
             relays = self.settings.relays if self.settings.relays else DEFAULT_RELAYS
         event_dict = event if isinstance(event, dict) else event.to_dict()
-        event_message = json.dumps(["EVENT", event_dict])
 
-        first_event_id = None
-        success = threading.Event()
-        ok_count = [0]
+        # 상주 연결 풀 — 릴레이마다 소켓을 새로 맺지 않는다. 첫 OK 최대 5초 + 나머지 2초.
+        first_event_id, ok_count = nostr_relay_pool.publish(relays, event_dict, timeout=5, linger=2)
 
-        def _send_to_relay(relay_url: str):
-            nonlocal first_event_id
-
-            relay_success = threading.Event()
-
-            def on_message(ws, message):
-                nonlocal first_event_id
-                try:
-                    data = json.loads(message)
-                    if data[0] == "OK":
-                        if first_event_id is None:
-                            first_event_id = data[1]
-                        ok_count[0] += 1
-                        relay_success.set()
-                        success.set()
-                except:
-                    pass
-
-            def on_open(ws):
-                ws.send(event_message)
-
-            def on_error(ws, error):
-                relay_success.set()
-
-            def on_close(ws, close_status_code, close_msg):
-                relay_success.set()
-
-            try:
-                ws = websocket.WebSocketApp(
-                    relay_url,
-                    on_open=on_open,
-                    on_message=on_message,
-                    on_error=on_error,
-                    on_close=on_close
-                )
-                wst = threading.Thread(target=ws.run_forever, daemon=True)
-                wst.start()
-                relay_success.wait(timeout=5)
-                ws.close()
-            except Exception as e:
-                print(f"  릴레이 전송 실패 ({relay_url}): {e}")
-
-        # 모든 릴레이에 병렬 전송
-        threads = []
-        for relay_url in relays:
-            t = threading.Thread(target=_send_to_relay, args=(relay_url,), daemon=True)
-            t.start()
-            threads.append(t)
-
-        # 첫 번째 OK 응답 대기 (최대 5초)
-        success.wait(timeout=5)
-
-        # 나머지 릴레이도 잠시 대기 (최대 2초 추가)
-        for t in threads:
-            t.join(timeout=2)
-
-        if ok_count[0] > 0:
-            print(f"  릴레이 {ok_count[0]}/{len(relays)}개 발행 성공")
+        if ok_count > 0:
+            print(f"  릴레이 {ok_count}/{len(relays)}개 발행 성공")
 
         return first_event_id
 
@@ -323,88 +262,13 @@ class IndieNetRelayMixin:
                 print(f"  폰 릴레이 조회 실패: {e}")
                 return []
 
-        collected: Dict[str, dict] = {}
-        lock = threading.Lock()
-        total = len(relays)
-        all_done = threading.Event()          # 모든 릴레이가 EOSE/에러/종료
-        first_eose_at = [None]                # 첫 응답(EOSE) 시각 — 낙오 릴레이 유예 기준
-        finished = [0]                        # 완료(성공/실패 무관) 릴레이 수
-
-        def _mark_finished():
-            with lock:
-                finished[0] += 1
-                if finished[0] >= total:
-                    all_done.set()
-
-        def _query_one(relay_url: str):
-            done = threading.Event()
-
-            def on_open(ws):
-                req_id = f"q_{uuid.uuid4().hex[:8]}"
-                ws.send(json.dumps(["REQ", req_id, req_filter]))
-
-            def on_message(ws, message):
-                try:
-                    data = json.loads(message)
-                    if data[0] == "EVENT":
-                        event = data[2]
-                        item = accept(event)
-                        if item is not None:
-                            eid = event.get('id')
-                            with lock:
-                                if eid not in collected:
-                                    collected[eid] = item
-                    elif data[0] == "EOSE":
-                        with lock:
-                            if first_eose_at[0] is None:
-                                first_eose_at[0] = time.monotonic()
-                        done.set()
-                except:
-                    pass
-
-            def on_error(ws, error):
-                done.set()
-
-            def on_close(ws, close_status_code, close_msg):
-                done.set()
-
-            try:
-                ws = websocket.WebSocketApp(
-                    relay_url,
-                    on_open=on_open,
-                    on_message=on_message,
-                    on_error=on_error,
-                    on_close=on_close
-                )
-                wst = threading.Thread(target=ws.run_forever, daemon=True)
-                wst.start()
-                done.wait(timeout=timeout)
-                ws.close()
-            except Exception as e:
-                print(f"  릴레이 조회 실패 ({relay_url}): {e}")
-            finally:
-                _mark_finished()
-
-        for relay_url in relays:
-            t = threading.Thread(target=_query_one, args=(relay_url,), daemon=True)
-            t.start()
-
-        # 조기 반환: (1) 전 릴레이 완료, 또는 (2) 첫 응답 후 grace 만큼만 낙오 릴레이를
-        # 더 기다리고 반환. 죽은 릴레이 하나가 timeout(=10초)을 통째로 먹지 않게 한다.
-        # replaceable(kind:0/10002 등)은 아무 릴레이나 하나면 충분하고, 피드도 살아있는
-        # 릴레이는 수백 ms 안에 응답하므로 grace 안에 다 잡힌다.
+        # 상주 연결 풀의 구독 하나로 다중화 — 릴레이별 EOSE 를 모아, 전 릴레이 완료 또는 첫 응답 후
+        # grace 만큼만 낙오 릴레이를 기다리고 반환. 죽은 릴레이 하나가 timeout(=10초)을 통째로 먹지
+        # 않게 한다. replaceable(kind:0/10002 등)은 아무 릴레이나 하나면 충분하고, 피드도 살아있는
+        # 릴레이는 수백 ms 안에 응답하므로 grace 안에 다 잡힌다. backoff 중인 죽은 릴레이·평소 느린
+        # 릴레이는 풀의 지연 점수로 아예 기다리지 않는다.
         grace = grace_after_first if grace_after_first is not None else 1.5
-        start = time.monotonic()
-        while not all_done.is_set():
-            elapsed = time.monotonic() - start
-            if elapsed >= timeout:
-                break
-            fe = first_eose_at[0]
-            if fe is not None and (time.monotonic() - fe) >= grace:
-                break
-            all_done.wait(timeout=0.1)
-
-        return list(collected.values())
+        return nostr_relay_pool.query(relays, req_filter, accept, timeout=timeout, grace=grace)
 
     def fetch_posts(self, limit: int = 50, since: int = None) -> List[dict]:
         """
@@ -1,9 +1,7 @@
 """IndieNet 소셜 계층 (2026-07-18 모듈화): 팔로우·저자 피드/프로필·DM(NIP-04/17)."""
 import json
 import time
-import uuid
 import sqlite3
-import threading
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -13,8 +11,6 @@ from indienet_common import (
     DEFAULT_RELAYS, INDIENET_TAG,
     Event, EventKind, PrivateKey, PublicKey,
 )
-if HAS_NOSTR:
-    import websocket
 
 
 class IndieNetSocialMixin:
@@ -243,63 +239,24 @@ class IndieNetSocialMixin:
             else:
                 pubkey_hex = pubkey
 
-            user_info = None
-            connected = threading.Event()
-            done = threading.Event()
-
-            def on_message(ws, message):
-                nonlocal user_info
-                try:
-                    data = json.loads(message)
-                    if data[0] == "EVENT":
-                        event = data[2]
-                        if event.get('kind') == 0:  # Metadata
-                            content = json.loads(event.get('content', '{}'))
-                            user_info = {
-                                'pubkey': event.get('pubkey'),
-                                'name': content.get('name', ''),
-                                'display_name': content.get('display_name', ''),
-                                'about': content.get('about', ''),
-                                'picture': content.get('picture', ''),
-                                'nip05': content.get('nip05', '')
-                            }
-                    elif data[0] == "EOSE":
-                        done.set()
-                except:
-                    pass
-
-            def on_open(ws):
-                connected.set()
-                req_filter = {
-                    "kinds": [0],  # Metadata
-                    "authors": [pubkey_hex],
-                    "limit": 1
+            def _accept(event):
+                if event.get('kind') != 0:  # Metadata
+                    return None
+                content = json.loads(event.get('content', '{}'))
+                return {
+                    'pubkey': event.get('pubkey'),
+                    'name': content.get('name', ''),
+                    'display_name': content.get('display_name', ''),
+                    'about': content.get('about', ''),
+                    'picture': content.get('picture', ''),
+                    'nip05': content.get('nip05', '')
                 }
-                req_id = f"profile_{uuid.uuid4().hex[:8]}"
-                ws.send(json.dumps(["REQ", req_id, req_filter]))
-
-            def on_error(ws, error):
-                done.set()
-
-            def on_close(ws, close_status_code, close_msg):
-                done.set()
 
+            # 첫 릴레이 한 곳만 (옛 동작) — 연결은 릴레이 풀의 상주 소켓을 빌린다
             relay_url = self.settings.relays[0] if self.settings.relays else DEFAULT_RELAYS[0]
-
-            ws = websocket.WebSocketApp(
-                relay_url,
-                on_open=on_open,
-                on_message=on_message,
-                on_error=on_error,
-                on_close=on_close
-            )
-
-            wst = threading.Thread(target=ws.run_forever, daemon=True)
-            wst.start()
-
-            connected.wait(timeout=5)
-            done.wait(timeout=5)
-            ws.close()
+            got = self._query_relays({"kinds": [0], "authors": [pubkey_hex], "limit": 1},
+                                     _accept, timeout=5, relays=[relay_url])
+            user_info = got[0] if got else None
 
             return user_info
 
@@ -469,26 +426,27 @@ class IndieNetSocialMixin:
             my_hex = self.identity.public_key.hex()
             my_priv = self.identity.private_key.hex()
 
-            def accept(event):
-                try:
-                    out = nip17.unwrap_dm(my_priv, event)
-                except Exception:
-                    return None  # 우리 대상 아님/복호 실패 → 스킵
+            # 조회는 gift wrap 원본만 모으고(릴레이 소켓 스레드에서 암호 연산을 돌리지 않게),
+            # 언랩은 끝난 뒤 한 번에 — 밀린 backlog 는 unwrap_many 가 cpu 레인에 나눠 푼다.
+            raw = self._query_relays(
+                {"kinds": [1059], "#p": [my_hex], "limit": limit},
+                lambda event: event, relays=self._self_dm_relays(),
+            )
+            dms = []
+            for event, out in zip(raw, nip17.unwrap_many(my_priv, raw)):
+                if out is None:
+                    continue  # 우리 대상 아님/복호·검증 실패 → 스킵
                 ca = out.get("created_at") or event.get("created_at") or 0
                 if since and ca < since:
-                    return None
-                return {
+                    continue
+                dms.append({
                     "id": (out.get("rumor") or {}).get("id") or event.get("id"),
                     "from": out["sender"],
                     "content": out["content"],
                     "created_at": ca,
                     "tags": [],
-                }
-
-            return self._query_relays(
-                {"kinds": [1059], "#p": [my_hex], "limit": limit},
-                accept, relays=self._self_dm_relays(),
-            )
+                })
+            return dms
         except Exception as e:
             print(f"✗ NIP-17 DM 수신 실패 - {e}")
             return []
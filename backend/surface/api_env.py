@@ -15,11 +15,11 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 import requests
-import yaml
 from fastapi import APIRouter, HTTPException
 
 from api_config import _read_env_value, _write_env_value, ENV_PATH
 from runtime_utils import get_data_path as _get_data_path
+import vocab_snapshot
 
 router = APIRouter()
 
@@ -262,7 +262,7 @@ def _build_usage_map() -> Dict[str, Dict[str, Any]]:
     # 1) ibl_nodes.yaml: tool 이름 → [(액션 코드, 짧은 설명)]
     tool_to_actions: Dict[str, list] = {}
     try:
-        nodes = yaml.safe_load((data_path / "ibl_nodes.yaml").read_text(encoding="utf-8"))["nodes"]
+        nodes = vocab_snapshot.registry(data_path / "ibl_nodes.yaml").data()["nodes"]
         for node_name, node in nodes.items():
             for action_name, action in (node.get("actions") or {}).items():
                 tool = action.get("tool")
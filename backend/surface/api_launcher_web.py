@@ -17,6 +17,7 @@ from datetime import datetime
 
 # 원격런처 표면 조립(2026-07-22 표면 분리) — 정체(어떤 탭)는 launcher_surface_remote 가 정한다.
 from launcher_surface_remote import launcher_html as _launcher_surface_html
+import vocab_snapshot
 
 router = APIRouter(prefix="/launcher")
 
@@ -225,24 +226,15 @@ _APP_MODE_FIELDS = ("note", "auto_run", "inputs", "buttons", "action", "view", "
 
 # 폰 프로파일(#3 runs_on): INDIEBIZ_PROFILE=phone 이면 phone_manifest.json 의 runnable_actions 에
 # 없는 계기(=폰서 못 도는 액션)를 홈 그리드에서 숨긴다. PC(프로파일 미설정)면 필터 없음.
-_phone_runnable_cache = {"loaded": False, "set": None}
-
-
 def _phone_runnable_actions():
-    """폰 프로파일이면 runnable 액션 집합 반환, 아니면 None(필터 안 함)."""
+    """폰 프로파일이면 runnable 액션 집합 반환, 아니면 None(필터 안 함).
+    집합은 어휘 스냅샷의 phone_runnable 색인 — 매니페스트가 없으면 None(필터 비활성, 안전)."""
     if os.environ.get("INDIEBIZ_PROFILE") != "phone":
         return None
-    if not _phone_runnable_cache["loaded"]:
-        s = None
-        try:
-            mp = os.path.join(os.path.dirname(IBL_NODES_PATH), "phone_manifest.json")
-            with open(mp, "r", encoding="utf-8") as f:
-                s = set(json.load(f).get("runnable_actions") or [])
-        except Exception:
-            s = None  # 매니페스트 없으면 필터 비활성(안전)
-        _phone_runnable_cache["set"] = s
-        _phone_runnable_cache["loaded"] = True
-    return _phone_runnable_cache["set"]
+    try:
+        return vocab_snapshot.registry(IBL_NODES_PATH).index("phone_runnable")
+    except Exception:
+        return None
 
 
 def _derive_instruments() -> dict:
@@ -252,9 +244,8 @@ def _derive_instruments() -> dict:
     - icon+name 을 선언한 멤버가 계기의 primary (빌드 검증이 정확히 1개 강제)
     - 홈 그리드 정렬은 app.order (미지정 999)
     """
-    import yaml
-    with open(IBL_NODES_PATH, 'r', encoding='utf-8') as f:
-        nodes = (yaml.safe_load(f) or {}).get("nodes", {})
+    # 사본 — 매니페스트가 app 블록의 리스트·dict 를 그대로 물고 나가므로 공유 트리를 내주지 않는다
+    nodes = (vocab_snapshot.registry(IBL_NODES_PATH).fresh() or {}).get("nodes", {})
 
     runnable = _phone_runnable_actions()  # 폰이면 집합, PC면 None
 
@@ -618,8 +609,7 @@ def app_source(app_id: str):
 
     # 3) 선언형 app: 블록 (액션의 app.instrument==id 또는 액션명==id)
     try:
-        with open(IBL_NODES_PATH, "r", encoding="utf-8") as f:
-            nodes = (yaml.safe_load(f) or {}).get("nodes", {})
+        nodes = (vocab_snapshot.registry(IBL_NODES_PATH).data() or {}).get("nodes", {})
     except Exception:
         nodes = {}
     for nname, nd in nodes.items():
@@ -46,6 +46,15 @@ NAS_CONFIG_PATH = DATA_PATH / "nas_config.json"
 # 스트리밍 청크 크기 (64KB - 8KB에서 8배 증가, Cloudflare Tunnel 호환성 유지)
 STREAM_CHUNK_SIZE = 64 * 1024
 
+# 텍스트 charset 감지 (2026-10-16) — 앞부분만 읽고 (dev, inode, mtime, 크기) 별로 기억한다
+CHARSET_SNIFF_BYTES = 64 * 1024
+_CHARSET_CACHE_MAX = 512
+_charset_cache: dict = {}
+_MISS = object()
+
+# Starlette FileResponse 가 Range·다중 Range·If-Range 를 스스로 처리하는가 (0.39+)
+_FILE_RESPONSE_RANGES = hasattr(FileResponse, "_parse_range_header")
+
 # 기본 설정
 DEFAULT_CONFIG = {
     "enabled": False,
@@ -258,6 +267,42 @@ def get_file_info(path: Path) -> dict:
     return info
 
 
+def sniff_charset(path: Path, st: os.stat_result) -> Optional[str]:
+    """텍스트 파일 charset — 앞 CHARSET_SNIFF_BYTES 만 디코드해 본다 (utf-8 → cp949 → euc-kr).
+
+    예전엔 10MB 까지 파일 전체를 인코딩 네 벌로 통째 디코드했다. 자른 끝의 반쪽 멀티바이트는
+    증분 디코더(final=False)가 봐준다. 결과는 (dev, inode, mtime_ns, 크기) 키로 캐시.
+    """
+    import codecs
+
+    key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    hit = _charset_cache.get(key, _MISS)
+    if hit is not _MISS:
+        return hit
+    try:
+        with open(path, "rb") as f:
+            head = f.read(CHARSET_SNIFF_BYTES)
+    except OSError:
+        return None
+    whole = st.st_size <= len(head)
+    charset = None
+    for enc in ("utf-8", "cp949", "euc-kr"):
+        try:
+            codecs.getincrementaldecoder(enc)().decode(head, final=whole)
+            charset = enc
+            break
+        except (UnicodeDecodeError, LookupError):
+            continue
+
+    # 캐시 저장 (최대치 초과 시 절반 삭제). 동시 요청이 같은 키를 먼저 지웠을 수 있다 —
+    # del 이 아니라 pop(k, None) 이어야 그 경합이 파일 읽기 500 으로 번지지 않는다.
+    if len(_charset_cache) >= _CHARSET_CACHE_MAX:
+        for k in list(_charset_cache)[:_CHARSET_CACHE_MAX // 2]:
+            _charset_cache.pop(k, None)
+    _charset_cache[key] = charset
+    return charset
+
+
 def format_size(size: int) -> str:
     """파일 크기를 읽기 쉬운 형태로 변환"""
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -590,14 +635,37 @@ async def get_file(
     if not session_token or not verify_session(session_token):
         raise HTTPException(status_code=401, detail="인증이 필요합니다")
 
-    # 경로 검증
-    allowed_paths = config.get("allowed_paths", [])
-    safe_path = get_safe_path(allowed_paths, path)
+    # ★경로 검증·stat·charset 감지는 스레드풀에서 한 번에 (2026-10-16) — 예전엔 async 핸들러
+    #   안에서 exists/is_dir/stat 을 네 번, 텍스트는 파일 전체 디코드까지 루프 위에서 했다.
+    from starlette.concurrency import run_in_threadpool
+    safe_path, st, mime_type = await run_in_threadpool(
+        _resolve_download, config.get("allowed_paths", []), path)
+
+    # ★본문은 FileResponse 가 보낸다 — Range(다중 포함)·If-Range·ETag/Last-Modified 를 스스로
+    #   처리하고, 파일 읽기는 스레드풀에서, Range 없는 전체 응답은 서버가 http.response.pathsend
+    #   를 지원하면 무복사로 넘긴다. stat 은 이미 했으니 넘겨서 다시 하지 않게.
+    if _FILE_RESPONSE_RANGES or not request.headers.get("range"):
+        return FileResponse(
+            safe_path,
+            media_type=mime_type,
+            filename=safe_path.name,
+            stat_result=st,
+            headers={"Accept-Ranges": "bytes"},
+        )
+    return _legacy_range_response(safe_path, st.st_size, mime_type, request.headers["range"])
 
-    if not safe_path or not safe_path.exists():
+
+def _resolve_download(allowed_paths: List[str], path: str):
+    """경로 검증 + stat 1회 + MIME(텍스트는 charset 포함) — 블로킹, 스레드풀에서 부른다."""
+    safe_path = get_safe_path(allowed_paths, path)
+    try:
+        st = safe_path.stat() if safe_path else None
+    except OSError:
+        st = None
+    if st is None:
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
 
-    if safe_path.is_dir():
+    if stat_module.S_ISDIR(st.st_mode):
         raise HTTPException(status_code=400, detail="디렉토리는 다운로드할 수 없습니다")
 
     # MIME 타입 결정
@@ -608,60 +676,48 @@ async def get_file(
     # 텍스트 파일은 감지된 charset 을 Content-Type 에 명시 — 구형 iOS Safari(lite2 대상)는
     # 다운로드/공유시트가 없어 브라우저 인라인 보기가 최선인데, charset 이 없으면 cp949/euc-kr
     # 한글이 utf-8 로 렌더돼 글자가 다 깨졌다. 인코딩만 맞추면 어떤 한글 텍스트도 읽힌다.
-    if mime_type.startswith("text/") and safe_path.stat().st_size <= 10 * 1024 * 1024:
-        for enc in ("utf-8", "utf-8-sig", "cp949", "euc-kr"):
-            try:
-                safe_path.read_text(encoding=enc)
-                mime_type = f"text/plain; charset={'utf-8' if enc == 'utf-8-sig' else enc}"
-                break
-            except (UnicodeDecodeError, LookupError):
-                continue
-
-    # Range 요청 처리 (동영상 스트리밍용)
-    range_header = request.headers.get("range")
-    file_size = safe_path.stat().st_size
-
-    if range_header:
-        # Range 헤더 파싱
-        range_match = range_header.replace("bytes=", "").split("-")
-        start = int(range_match[0]) if range_match[0] else 0
-        end = int(range_match[1]) if range_match[1] else file_size - 1
-
-        if start >= file_size:
-            raise HTTPException(status_code=416, detail="Range Not Satisfiable")
-
-        end = min(end, file_size - 1)
-        content_length = end - start + 1
-
-        def iter_file():
-            with open(safe_path, "rb") as f:
-                f.seek(start)
-                remaining = content_length
-                while remaining > 0:
-                    chunk_size = min(STREAM_CHUNK_SIZE, remaining)
-                    data = f.read(chunk_size)
-                    if not data:
-                        break
-                    remaining -= len(data)
-                    yield data
-
-        return StreamingResponse(
-            iter_file(),
-            status_code=206,
-            media_type=mime_type,
-            headers={
-                "Content-Range": f"bytes {start}-{end}/{file_size}",
-                "Accept-Ranges": "bytes",
-                "Content-Length": str(content_length),
-            },
-        )
+    if mime_type.startswith("text/"):
+        charset = sniff_charset(safe_path, st)
+        if charset:
+            mime_type = f"text/plain; charset={charset}"
+
+    return safe_path, st, mime_type
+
+
+def _legacy_range_response(safe_path: Path, file_size: int, mime_type: str, range_header: str):
+    """Range 를 모르는 옛 Starlette(<0.39) 용 단일 Range 응답 — 예전 경로 그대로."""
+    # Range 헤더 파싱
+    range_match = range_header.replace("bytes=", "").split(",")[0].split("-")
+    start = int(range_match[0]) if range_match[0] else 0
+    end = int(range_match[1]) if range_match[1] else file_size - 1
+
+    if start >= file_size:
+        raise HTTPException(status_code=416, detail="Range Not Satisfiable")
+
+    end = min(end, file_size - 1)
+    content_length = end - start + 1
+
+    def iter_file():
+        with open(safe_path, "rb") as f:
+            f.seek(start)
+            remaining = content_length
+            while remaining > 0:
+                chunk_size = min(STREAM_CHUNK_SIZE, remaining)
+                data = f.read(chunk_size)
+                if not data:
+                    break
+                remaining -= len(data)
+                yield data
 
-    # 전체 파일 반환
-    return FileResponse(
-        safe_path,
+    return StreamingResponse(
+        iter_file(),
+        status_code=206,
         media_type=mime_type,
-        filename=safe_path.name,
-        headers={"Accept-Ranges": "bytes"},
+        headers={
+            "Content-Range": f"bytes {start}-{end}/{file_size}",
+            "Accept-Ranges": "bytes",
+            "Content-Length": str(content_length),
+        },
     )
 
 
@@ -660,15 +660,14 @@ async def get_ibl_nodes():
         node_groups: 타입별 노드 그룹 (info, store, exec, output)
     """
     try:
-        import yaml as _yaml
+        import vocab_snapshot
         from runtime_utils import get_base_path
 
         nodes_path = get_base_path() / "data" / "ibl_nodes.yaml"
         if not nodes_path.exists():
             return {"nodes": [], "always_allowed": [], "node_groups": {}}
 
-        with open(nodes_path, 'r', encoding='utf-8') as f:
-            data = _yaml.safe_load(f) or {}
+        data = vocab_snapshot.registry(nodes_path).data() or {}
 
         # Phase 22: 구 노드명(system, workflow, automation, output)은 모두 system 단일 노드로 통합됨
         always_allowed = {"system"}
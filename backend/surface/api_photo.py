@@ -13,9 +13,11 @@ from fastapi.responses import FileResponse, Response
 
 router = APIRouter(prefix="/photo", tags=["photo"])
 
-# 썸네일 캐시 디렉토리
+# 썸네일 캐시 디렉토리 (렌더·합치기·LRU 는 thumbnail_service 몫)
 from runtime_utils import get_base_path as _get_base_path
-THUMBNAIL_CACHE_DIR = os.path.join(str(_get_base_path()), "data", "thumbnail_cache")
+import thumbnail_service
+THUMBNAIL_CACHE_DIR = thumbnail_service.CACHE_DIR
+PREWARM_PAGE = 200   # 스캔 직후 미리 그리는 갤러리 첫 페이지 크기
 
 
 def _get_photo_modules():
@@ -57,8 +59,8 @@ async def list_scans():
 
 
 @router.post("/scan")
-async def scan_directory(path: str = Query(...)):
-    """새 스캔 실행"""
+async def scan_directory(path: str = Query(...), full: bool = Query(False)):
+    """새 스캔 실행 — 기본은 증분(바뀐 파일만), full=true 면 비우고 전부 다시"""
     photo_db, scanner = _get_photo_modules()
 
     path = os.path.expanduser(path)
@@ -87,7 +89,14 @@ async def scan_directory(path: str = Query(...)):
     scan_id = photo_db.get_or_create_scan(scan_name, path)
 
     # 스캔 실행
-    result = scanner.scan_media(path, scan_id)
+    result = scanner.scan_media(path, scan_id, full=full)
+
+    # 갤러리 첫 페이지 썸네일 예열 (뒤에서 — 응답을 기다리게 하지 않는다)
+    if result.get("success"):
+        gallery = photo_db.get_gallery(path, 1, PREWARM_PAGE)
+        if gallery.get("success"):
+            result["thumbnails_prewarming"] = thumbnail_service.prewarm(
+                [it["path"] for it in gallery["items"]])
     return result
 
 
@@ -174,29 +183,35 @@ async def get_media_detail(media_id: int):
 
 @router.get("/thumbnail")
 async def get_thumbnail(path: str = Query(...), size: int = Query(200)):
-    """이미지 썸네일 생성/반환"""
+    """이미지 썸네일 생성/반환 — 렌더는 cpu 레인, 같은 (경로, 크기) 동시 요청은 한 번만 그린다"""
     path = os.path.expanduser(path)
 
     if not os.path.exists(path):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
 
-    # 썸네일 캐시 경로 생성
-    path_hash = hashlib.md5(f"{path}:{size}".encode()).hexdigest()
-    os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
-    cache_path = os.path.join(THUMBNAIL_CACHE_DIR, f"{path_hash}.jpg")
-
-    # 캐시된 썸네일이 있고, 원본보다 새로우면 반환
-    if os.path.exists(cache_path):
-        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
-            return FileResponse(cache_path, media_type="image/jpeg")
-
-    # 썸네일 생성 (공유 소스 backend/thumbnails.py — showcase 와 동일 로직)
-    from thumbnails import generate_image_thumbnail
-    if generate_image_thumbnail(path, cache_path, size):
+    cache_path = await thumbnail_service.get(path, size, "photo")
+    if cache_path:
         return FileResponse(cache_path, media_type="image/jpeg")
     raise HTTPException(status_code=500, detail="썸네일 생성 실패")
 
 
+@router.post("/thumbnails/prewarm")
+async def prewarm_thumbnails(path: str = Query(...), page: int = Query(1),
+                             limit: int = Query(PREWARM_PAGE), size: int = Query(200),
+                             media_type: Optional[str] = Query(None),
+                             sort_by: str = Query("taken_date")):
+    """갤러리 한 페이지의 썸네일을 뒤에서 미리 그린다 (기다리지 않음)"""
+    from starlette.concurrency import run_in_threadpool
+
+    photo_db, _ = _get_photo_modules()
+    path = os.path.abspath(os.path.expanduser(path))
+    gallery = await run_in_threadpool(photo_db.get_gallery, path, page, limit, media_type, sort_by)
+    if not gallery.get("success"):
+        return gallery
+    queued = thumbnail_service.prewarm([it["path"] for it in gallery["items"]], size)
+    return {"success": True, "queued": queued, "page_items": len(gallery["items"])}
+
+
 @router.get("/image")
 async def get_image(path: str = Query(...)):
     """원본 이미지 반환"""
@@ -266,27 +281,14 @@ async def get_video(path: str = Query(...), request: Request = None):
 
 @router.get("/video-thumbnail")
 async def get_video_thumbnail(path: str = Query(...), size: int = Query(200)):
-    """동영상 썸네일 생성/반환 (ffmpeg 사용)"""
-    import subprocess
-
+    """동영상 썸네일 생성/반환 (ffmpeg — subprocess 레인, 동시 요청은 합친다)"""
     path = os.path.expanduser(path)
 
     if not os.path.exists(path):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
 
-    # 썸네일 캐시 경로 생성
-    path_hash = hashlib.md5(f"video:{path}:{size}".encode()).hexdigest()
-    os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
-    cache_path = os.path.join(THUMBNAIL_CACHE_DIR, f"{path_hash}.jpg")
-
-    # 캐시된 썸네일이 있고, 원본보다 새로우면 반환
-    if os.path.exists(cache_path):
-        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
-            return FileResponse(cache_path, media_type="image/jpeg")
-
-    # ffmpeg로 썸네일 생성 (공유 소스 backend/thumbnails.py — showcase 와 동일 로직)
-    from thumbnails import generate_video_thumbnail
-    if generate_video_thumbnail(path, cache_path, size, timeout=10):
+    cache_path = await thumbnail_service.get(path, size, "video")
+    if cache_path:
         return FileResponse(cache_path, media_type="image/jpeg")
     raise HTTPException(status_code=500, detail="동영상 썸네일 생성 실패 (ffmpeg 미설치 또는 시간 초과)")
 
@@ -466,8 +468,12 @@ async def get_usb_video(path: str = Query(...), request: Request = None):
 # ============ 중복 탐지 ============
 
 @router.get("/duplicates")
-async def get_duplicates(path: str = Query(...)):
-    """중복 파일 조회 (MD5 해시 기반) - 비동기 실행"""
+async def get_duplicates(path: str = Query(...), offset: int = Query(0),
+                         limit: Optional[int] = Query(None)):
+    """중복 파일 조회 (크기 → 표본 해시 → 전체 해시) - 비동기 실행
+
+    limit 을 주면 그 페이지만큼 찾는 즉시 돌려준다(has_more 로 다음 페이지 여부).
+    """
     import asyncio
     from concurrent.futures import ThreadPoolExecutor
 
@@ -479,11 +485,36 @@ async def get_duplicates(path: str = Query(...)):
     # 스레드풀에서 실행하여 이벤트 루프 블로킹 방지
     loop = asyncio.get_event_loop()
     with ThreadPoolExecutor() as executor:
-        result = await loop.run_in_executor(executor, photo_db.get_duplicates, path)
+        result = await loop.run_in_executor(executor, photo_db.get_duplicates, path, offset, limit)
 
     return result
 
 
+@router.get("/duplicates/stream")
+async def stream_duplicates(path: str = Query(...)):
+    """중복 그룹을 찾는 대로 한 줄씩(NDJSON) — 마지막 줄은 {"done": true, ...} 요약"""
+    import json
+    from starlette.responses import StreamingResponse
+
+    photo_db, _ = _get_photo_modules()
+
+    path = os.path.abspath(os.path.expanduser(path))
+    scan = photo_db._find_scan(path)
+    if not scan or not os.path.exists(photo_db._get_db_path(scan['id'])):
+        raise HTTPException(status_code=404, detail="스캔 데이터가 없습니다")
+
+    def _lines():
+        # 동기 제너레이터 — Starlette 가 스레드풀에서 돌린다(해시가 루프를 막지 않는다)
+        stats, n = {}, 0
+        for group in photo_db.iter_duplicate_groups(scan['id'], stats):
+            n += 1
+            yield json.dumps(group, ensure_ascii=False) + "\n"
+        yield json.dumps({"done": True, "total_groups": n,
+                          "hash_calculated": stats.get("hash_calculated", 0)}) + "\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
 # ============ 통계 ============
 
 @router.get("/stats")
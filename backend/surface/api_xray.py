@@ -20,6 +20,8 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, JSONResponse
 
 from runtime_utils import get_base_path
+import telemetry_sink
+import vocab_snapshot
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/xray")
@@ -56,12 +58,12 @@ def _collect_ibl_stats() -> Dict:
     - assumed: 기록 없음 (디폴트)
     - failed: 기록 있고 최근 실패
     """
-    import yaml
 
     pulse_db = DATA_PATH / "world_pulse.db"
     if not pulse_db.exists():
         return {"by_node": {}, "slow_actions": [], "failing_actions": [],
                 "proprioception": {}, "total_checks": 0}
+    telemetry_sink.flush(timeout=2.0)   # 버퍼에 남은 최근 호출까지 집계
 
     try:
         conn = sqlite3.connect(str(pulse_db), timeout=5)
@@ -113,8 +115,7 @@ def _collect_ibl_stats() -> Dict:
         nodes_yaml = DATA_PATH / "ibl_nodes.yaml"
         if nodes_yaml.exists():
             try:
-                with open(nodes_yaml, "r", encoding="utf-8") as f:
-                    nodes_data = yaml.safe_load(f) or {}
+                nodes_data = vocab_snapshot.registry(nodes_yaml).data() or {}
                 for section_key in ("nodes", "actions"):
                     section = nodes_data.get(section_key, {})
                     if isinstance(section, dict):
@@ -613,8 +614,7 @@ def _collect_tool_inventory() -> Dict[str, Any]:
     try:
         nodes_yaml = DATA_PATH / "ibl_nodes.yaml"
         if nodes_yaml.exists():
-            with open(nodes_yaml, 'r', encoding='utf-8') as f:
-                nodes_data = yaml.safe_load(f)
+            nodes_data = vocab_snapshot.registry(nodes_yaml).data() or {}
             # 노드는 nodes: 키 아래에 있음
             nodes_section = nodes_data.get("nodes", nodes_data)
             for node_name, node_info in nodes_section.items():
@@ -0,0 +1,176 @@
+"""
+lazy_router.py — 라우터 지연 등록: 첫 요청 때 import + include (2026-10-16)
+
+왜 있는가 — api.py 는 api_* 라우터 35여 개를 모듈 로드 때 전부 import 했고, 각자가 제 의존
+그래프(PIL·ffmpeg 헬퍼·nostr 암호·포털 하위 라우터 …)를 끌고 들어왔다. 자가수리(red_apply) 뒤
+백엔드 재시작마다 UI 가 그 import 를 기다렸는데, 한 세션에서 사진·NAS·포털·엑스레이 같은 라우터
+대부분은 한 번도 불리지 않는다.
+
+쓰는 법 (api.py 조립 루트에서만):
+  mount(app, name)     LAZY_ROUTERS[name] 의 자리표(placeholder)를 지금 위치에 둔다. 그 접두 경로로
+                       첫 요청(http·websocket)이 오면 모듈을 import 해 include 하고, 진짜 라우트를
+                       자리표 위치에 끼운 뒤 같은 요청을 다시 라우팅한다. 이후 요청은 자리표를 거치지
+                       않는다. INDIEBIZ_EAGER_ROUTERS 에 든 이름이면 그 자리에서 바로 include.
+  eager_names()        INDIEBIZ_EAGER_ROUTERS="photo,nas" (쉼표) | "*" (전부 즉시 — 옛 동작)
+  warmup(names=None)   이미 뜬 서버에서 뒤늦게 미리 데우기 (None = 미룬 것 전부)
+  pending()            아직 안 올라온 이름들
+
+★순서 보존: 자리표는 옛 include_router 줄의 자리에 앉고, 진짜 라우트도 그 자리에 끼워진다 —
+그 뒤에 오는 /nas/app 마운트·/health 같은 앱 라우트보다 앞이라는 옛 우선순위가 그대로다.
+★import 는 스레드풀에서(루프가 멈추지 않게), 라우트 목록 수정은 루프 스레드에서만 한다.
+★import 비용은 boot_status.record_import 로 남는다 (phase: boot=즉시 · lazy=첫 요청 · deferred).
+★OpenAPI(/docs)에는 올라온 라우터만 보인다 — 올라올 때 스키마 캐시를 비운다.
+★여기 넣는 모듈은 import 부작용이 없어야 하고(전역 매니저 주입·lifespan 훅 보유 라우터는 즉시 쪽),
+라우트가 전부 prefixes 아래여야 한다 (test_lazy_router 가 지킨다).
+"""
+import importlib
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.routing import BaseRoute, Match, NoMatchFound, get_route_path
+
+import boot_status
+
+EAGER_ENV = "INDIEBIZ_EAGER_ROUTERS"
+
+# 이름 → (모듈, 접두 경로들, tags). 모듈의 `router` 를 include 한다.
+# 같은 접두를 나눠 쓰는 것(/nas ⊃ /nas/hls, /portal ← warehouse_likes)은 따로 둬도 된다 —
+# 앞 자리표가 모듈을 올리고 다시 라우팅하면, 맞는 라우트가 없을 때 다음 자리표가 받는다.
+LAZY_ROUTERS: Dict[str, tuple] = {
+    "pcmanager": ("api_pcmanager", ("/pcmanager",), ["pcmanager"]),
+    "photo": ("api_photo", ("/photo",), ["photo"]),
+    "music": ("api_music", ("/music",), ["music"]),
+    "ytrelay": ("api_ytrelay", ("/yt",), ["yt-relay"]),
+    "nas": ("api_nas", ("/nas",), ["nas"]),
+    "nas_hls": ("api_nas_hls", ("/nas/hls",), ["nas-hls"]),
+    "showcase": ("api_showcase", ("/showcase",), ["showcase"]),
+    "family_news": ("api_family_news", ("/family-news",), ["family-news"]),
+    "portal": ("api_portal", ("/portal",), ["portal"]),
+    "warehouse_feed": ("api_warehouse_feed", ("/warehouse-feed",), ["warehouse-feed"]),
+    "warehouse_likes": ("warehouse_likes", ("/portal",), ["portal"]),
+    "bulletin": ("api_bulletin", ("/bulletin",), ["bulletin"]),
+    "report": ("api_report", ("/report",), ["report"]),
+    "health_sync": ("api_health", ("/health/sync",), ["health-sync"]),   # /health 자체는 앱 라우트
+    "nodes": ("api_nodes", ("/nodes",), ["nodes"]),
+    "limb": ("api_limb", ("/limb",), ["limb"]),
+    "xray": ("api_xray", ("/xray",), ["xray"]),
+    "lecture_workspace": ("api_lecture_workspace", ("/lectures",), ["lecture-workspace"]),
+    "phone": ("api_phone", ("/phone",), ["phone"]),
+}
+
+_lock = threading.Lock()
+_modules: Dict[str, object] = {}        # 이름 → import 된 모듈 (스레드풀에서 채움)
+_placeholders: Dict[str, "LazyRouterRoute"] = {}
+
+
+def eager_names() -> Set[str]:
+    raw = os.environ.get(EAGER_ENV, "").strip()
+    if raw == "*":
+        return set(LAZY_ROUTERS)
+    return {n.strip() for n in raw.split(",") if n.strip()}
+
+
+def _import(name: str, phase: str):
+    """모듈 import (스레드 안전, 한 번만). 비용을 boot_status 에 남긴다. 실패는 올린다."""
+    with _lock:
+        mod = _modules.get(name)
+        if mod is not None:
+            return mod
+        t0 = time.perf_counter()
+        try:
+            mod = importlib.import_module(LAZY_ROUTERS[name][0])
+        except Exception as e:
+            boot_status.record(f"router:{name}", False, e)     # 건강 원장 — degraded 로 보인다
+            raise
+        boot_status.record_import(f"router:{name}", (time.perf_counter() - t0) * 1000, phase)
+        if f"router:{name}" in boot_status.failed_names():      # 앞선 실패 뒤 재시도 성공
+            boot_status.record(f"router:{name}", True)
+        _modules[name] = mod
+        return mod
+
+
+def _include(app, name: str) -> List[BaseRoute]:
+    """app 끝에 include 하고, 그로써 새로 붙은 라우트들을 떼어 돌려준다."""
+    routes = app.router.routes
+    before = len(routes)
+    app.include_router(_modules[name].router, tags=LAZY_ROUTERS[name][2])
+    added = routes[before:]
+    del routes[before:]
+    return added
+
+
+class LazyRouterRoute(BaseRoute):
+    """접두 경로 아래 http·websocket 을 받아 진짜 라우터로 갈아끼우는 자리표"""
+
+    def __init__(self, app, name: str):
+        self.app = app
+        self.name = name
+        self.prefixes = LAZY_ROUTERS[name][1]
+
+    def covers(self, path: str) -> bool:
+        return any(path == p or path.startswith(p + "/") for p in self.prefixes)
+
+    def matches(self, scope):
+        if scope["type"] in ("http", "websocket") and self.covers(get_route_path(scope)):
+            return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params):
+        raise NoMatchFound(name, path_params)     # 아직 안 올라옴 — 다음 라우트가 찾게
+
+    def splice(self) -> None:
+        """루프 스레드에서 — 자리표를 진짜 라우트로 바꾼다 (두 번째 호출은 아무것도 안 함)"""
+        routes = self.app.router.routes
+        at = next((i for i, r in enumerate(routes) if r is self), None)
+        if at is None:
+            return
+        added = _include(self.app, self.name)
+        routes[at:at + 1] = added
+        self.app.openapi_schema = None
+        _placeholders.pop(self.name, None)
+
+    async def handle(self, scope, receive, send):
+        try:
+            await run_in_threadpool(_import, self.name, "lazy")
+        except Exception as e:
+            print(f"[LazyRouter] {self.name} 적재 실패: {e}")
+            if scope["type"] == "websocket":
+                await send({"type": "websocket.close", "code": 1011})
+            else:
+                await JSONResponse({"detail": f"라우터 적재 실패: {self.name}"},
+                                   status_code=503)(scope, receive, send)
+            return
+        self.splice()
+        await self.app.router.app(scope, receive, send)
+
+
+def mount(app, name: str) -> None:
+    """name 의 라우터를 지금 위치에 — 즉시 목록이면 include, 아니면 자리표."""
+    if name in eager_names():
+        app.include_router(_import(name, "boot").router, tags=LAZY_ROUTERS[name][2])
+        return
+    route = LazyRouterRoute(app, name)
+    app.router.routes.append(route)
+    _placeholders[name] = route
+    boot_status.record_import(f"router:{name}", None, "deferred")
+
+
+def pending() -> List[str]:
+    return list(_placeholders)
+
+
+def warmup(names: Optional[Iterable[str]] = None) -> List[str]:
+    """미룬 라우터를 지금 올린다 (루프 스레드에서 부를 것 — 라우트 목록을 고친다). → 올린 이름들"""
+    done = []
+    for name in list(names if names is not None else _placeholders):
+        route = _placeholders.get(name)
+        if route is None:
+            continue
+        _import(name, "lazy")
+        route.splice()
+        done.append(name)
+    return done
@@ -0,0 +1,153 @@
+"""0단계 연상 회상 동시 실행(_run_recall_sources)·memory_db.read_many 회귀 테스트 (2026-10-16)
+
+왜 있는가 — _build_execution_memory 의 여섯 원천(해마·관련기억·포식기억·손발·자기수리·디스크골격)이
+차례로 돌아 매 사용자 턴의 첫 토큰 지연이 그 합이었고, 관련기억은 검색 N건마다 memory_db.read 로
+연결을 N번 열었다. 이 배터리는 원천들이 **겹쳐 돌고**, 예산을 넘긴 원천은 빠지며, 합성 순서와
+에피소드 기록(로그·steps)이 유지되는지를 본다.
+
+    R1. 동시 회상 — 원천 여섯 × 0.2s 가 ~0.2s, 합성 순서는 예전 그대로
+    R2. 예산 초과 — 늦은 원천은 이번 턴에서 빠지고, 나머지는 기다리지 않는다
+    R3. 에피소드 — 원천 안의 에피소드 문맥이 살아 있고, steps 에 원천별 ms·제외가 남는다
+    R4. read_many — 새 연결 없이(풀) 전문 + used_at 일괄 갱신, 관련기억은 쓰일 때만 갱신
+    R5. 부작용 — 예산 초과로 버려진 자기수리 블록은 판정을 '보고됨'으로 만들지 않는다
+
+실행: python3 -m pytest backend/test_cognitive_recall.py
+"""
+import os
+import sqlite3
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import episode_logger as EL  # noqa: E402
+import ibl_usage_rag  # noqa: E402
+import red_report  # noqa: E402
+from cognitive_recall import CognitiveRecallMixin, _Deferred  # noqa: E402
+
+_MEM_PKG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                        "data", "packages", "installed", "tools", "memory")
+if _MEM_PKG not in sys.path:
+    sys.path.insert(0, _MEM_PKG)
+import memory_db  # noqa: E402
+
+
+class _Agent(CognitiveRecallMixin):
+    def __init__(self, project_path="."):
+        self.config = {}
+        self.project_path = project_path
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """원천 여섯을 각자 delay 뒤 표식 블록을 내는 가짜로 바꾼다."""
+    a = _Agent()
+    delays = {n: 0.2 for n in a.RECALL_BUDGETS}
+    seen_episode = {}
+
+    def _after(name, out):
+        time.sleep(delays[name])
+        seen_episode[name] = EL.EpisodeLogger.current()
+        return out
+
+    monkeypatch.setattr(ibl_usage_rag, "build_execution_memory",
+                        lambda msg, allowed=None: _after("hippocampus",
+                                                         ("<execution_memory/>", 0.9, "[sense:x]")))
+    monkeypatch.setattr(a, "_search_related_memory", lambda m: _after("related", "<related_memory/>"))
+    monkeypatch.setattr(a, "_search_forage_memory", lambda m: _after("forage", "<forage_memory/>"))
+    monkeypatch.setattr(a, "_limb_presence_scent", lambda: _after("limbs", "<connected_limbs/>"))
+    monkeypatch.setattr(a, "_pending_repair_scent", lambda: _after("repair", "<repair/>"))
+    monkeypatch.setattr(a, "_build_disk_skeleton", lambda m: _after("skeleton", "<disk_skeleton/>"))
+    a.delays, a.seen_episode = delays, seen_episode
+    return a
+
+
+def test_r1_sources_run_concurrently_in_order(agent):
+    t0 = time.monotonic()
+    xml, score, code = agent._build_execution_memory("파일 찾아줘")
+    assert time.monotonic() - t0 < 0.8                               # 합(1.2s)이 아니라 최댓값
+    assert (score, code) == (0.9, "[sense:x]")
+    assert xml.split("\n") == ["<execution_memory/>", "<related_memory/>", "<forage_memory/>",
+                               "<connected_limbs/>", "<repair/>", "<disk_skeleton/>"]
+
+
+def test_r2_slow_source_dropped(agent, monkeypatch):
+    monkeypatch.setattr(agent, "RECALL_BUDGETS", {**agent.RECALL_BUDGETS, "forage": 0.3})
+    agent.delays["forage"] = 3
+    t0 = time.monotonic()
+    xml, _s, _c = agent._build_execution_memory("안녕", include_related=False)
+    assert time.monotonic() - t0 < 1.0
+    assert "forage_memory" not in xml and "related_memory" not in xml
+    assert xml.startswith("<execution_memory/>") and "<connected_limbs/>" in xml
+
+
+def test_r3_episode_context_and_steps(agent, monkeypatch, capsys):
+    monkeypatch.setattr(agent, "RECALL_BUDGETS", {**agent.RECALL_BUDGETS, "repair": 0.3})
+    agent.delays["repair"] = 2
+    ep = EL._Episode("test_recall", "회상")
+    token = EL._current_episode.set(ep)
+    try:
+        agent._build_execution_memory("질문")
+    finally:
+        EL._current_episode.reset(token)
+    assert all(agent.seen_episode[n] is ep for n in ("hippocampus", "related", "limbs"))
+    rec = [s for s in ep.steps if s["event"] == "recall"]
+    assert len(rec) == 1 and rec[0]["dropped"] == ["repair"]
+    assert set(rec[0]["ms"]) == set(agent.RECALL_BUDGETS) and rec[0]["ms"]["hippocampus"] >= 150
+    assert "[연상:타이밍]" in capsys.readouterr().out
+
+
+def test_r4_read_many_single_connection(tmp_path, monkeypatch):
+    proj = tmp_path / "proj"
+    proj.mkdir()
+    conn = memory_db.get_db(str(proj), "agent_a")
+    ids = [conn.execute("INSERT INTO memories (category, keywords, content) VALUES (?, ?, ?)",
+                        ("사용자정보", f"k{i}", f"내용 {i}")).lastrowid for i in range(4)]
+    conn.commit()
+    conn.close()
+
+    real = sqlite3.connect
+    opened = []
+    monkeypatch.setattr(sqlite3, "connect", lambda *a, **k: opened.append(a) or real(*a, **k))
+    got = memory_db.read_many(str(proj), "agent_a", [ids[2], ids[0], 9999, ids[2]])
+    assert len(opened) == 0                                          # get_db 가 데운 풀을 쓴다
+    assert set(got) == {ids[0], ids[2]} and got[ids[2]]["content"] == "내용 2"
+    assert got[ids[0]]["used_at"] == memory_db.get_by_id(str(proj / "memory_a.db"), ids[0])["used_at"]
+    assert memory_db.get_by_id(str(proj / "memory_a.db"), ids[1])["used_at"] is None
+
+    monkeypatch.setattr(memory_db, "search", lambda **kw: [{"id": i, "created_at": "2026-10-01"}
+                                                           for i in ids[:3]])
+    monkeypatch.setattr(memory_db, "read", lambda *a: pytest.fail("건별 read 를 부르면 안 된다"))
+    monkeypatch.setattr("thread_context.get_current_agent_id", lambda: "agent_a")
+    got = _Agent(str(proj))._search_related_memory("내용")
+    assert isinstance(got, _Deferred)
+    assert got.block.count("<memory ") == 3 and 'last_seen="2026-10-01"' in got.block
+    assert memory_db.get_by_id(str(proj / "memory_a.db"), ids[1])["used_at"] is None  # 아직 안 쓰였다
+    got.on_used()
+    assert memory_db.get_by_id(str(proj / "memory_a.db"), ids[1])["used_at"]
+    assert memory_db.get_by_id(str(proj / "memory_a.db"), ids[3])["used_at"] is None
+
+
+def test_r5_dropped_repair_scent_stays_unannounced(agent, monkeypatch, tmp_path):
+    marked = []
+    monkeypatch.setattr(red_report, "mark_announced", lambda items: marked.append(items))
+    monkeypatch.setattr(red_report, "peek_scent", lambda repo: ("<repair/>", [{"_path": "r.json"}]))
+    monkeypatch.setattr("runtime_utils.get_base_path", lambda: tmp_path)
+    agent.config["_is_system_ai"] = True
+    monkeypatch.delattr(agent, "_pending_repair_scent")              # 진짜 원천 (지연만 얹는다)
+    real = agent._pending_repair_scent
+    monkeypatch.setattr(agent, "_pending_repair_scent", lambda: agent.delays["repair"] and
+                        time.sleep(agent.delays["repair"]) or real())
+    monkeypatch.setattr(agent, "RECALL_BUDGETS", {**agent.RECALL_BUDGETS, "repair": 0.3})
+
+    agent.delays["repair"] = 0.6
+    xml, _s, _c = agent._build_execution_memory("질문")
+    time.sleep(0.5)                                                  # 늦은 원천이 끝까지 돌게
+    assert "<repair/>" not in xml and marked == []                   # 버려졌으니 다음 턴이 말한다
+
+    agent.delays["repair"] = 0
+    xml, _s, _c = agent._build_execution_memory("질문")
+    assert "<repair/>" in xml and marked == [[{"_path": "r.json"}]]
@@ -0,0 +1,141 @@
+"""컨텍스트 크기 장부(providers.context_ledger) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — BaseProvider._estimate_content_size 가 라운드마다 히스토리 전체를 json.dumps 해
+_should_compact/_should_prune 를 판정했다. 60라운드 도구 루프는 같은 도구 결과를 라운드마다 다시
+직렬화했다(O(n²)). 이제 메시지는 들어올 때 한 번 재고 누계를 들고 다닌다. 이 배터리는 장부가
+**옛 계산과 같은 숫자**를 내고, 직렬화가 라운드 수에 선형이며, 압축·프루닝 뒤에도 안 바뀐
+메시지는 다시 재지 않는지를 본다.
+
+    C1. 동등 — 세 형식(Anthropic·OpenAI·Gemini dict·Content 객체)과 list 변경 경로 전부에서 누계 = 전수 재계산
+    C2. 선형 — 60라운드 append + 매 라운드 판정에서 dumps 횟수 = 메시지 수
+    C3. 물려받기 — 프루닝이 준 새 list 는 마스킹된 메시지만 새로 잰다
+    C4. 델타·토큰 — mark()/delta(), 토큰 어림(2자=1토큰), 장부는 히스토리를 붙들지 않는다
+
+실행: python3 -m pytest backend/test_context_ledger.py
+"""
+import gc
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+from providers import context_ledger as cl  # noqa: E402
+from providers.base import BaseProvider  # noqa: E402
+
+
+class _Provider(BaseProvider):
+    def init_client(self) -> bool:
+        return True
+
+    def process_message(self, message, history=None, images=None, execute_tool=None):
+        return ""
+
+
+class _Part:
+    def __init__(self, text=None, function_response=None):
+        self.text = text
+        self.function_call = None
+        self.function_response = function_response
+
+
+class _Content:
+    def __init__(self, *parts):
+        self.parts = list(parts)
+
+
+def _recount(messages):
+    """옛 _estimate_content_size 규칙 그대로의 전수 계산"""
+    return sum(cl.message_size(m) for m in messages)
+
+
+def _tool_round(i, payload=2000):
+    return [
+        {"role": "assistant", "content": None,
+         "tool_calls": [{"id": f"c{i}", "type": "function",
+                         "function": {"name": "read", "arguments": "{}"}}]},
+        {"role": "tool", "tool_call_id": f"c{i}", "content": f"결과{i} " + "가" * payload},
+    ]
+
+
+@pytest.fixture
+def provider():
+    return _Provider(api_key="x", model="m", system_prompt="s")
+
+
+@pytest.fixture
+def dumps_calls(monkeypatch):
+    calls = []
+    real = json.dumps
+    monkeypatch.setattr(cl.json, "dumps", lambda *a, **k: calls.append(1) or real(*a, **k))
+    return calls
+
+
+def test_c1_totals_match_full_recount():
+    msgs = cl.SizedMessages([
+        {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t", "content": "ok"}]},
+        {"role": "model", "parts": [{"functionResponse": {"name": "f", "response": {"r": 1}}}]},
+        _Content(_Part(text="안녕"), _Part(function_response={"x": 1}), _Part()),
+    ])
+    assert msgs.total_chars == _recount(msgs)
+    msgs.append({"role": "user", "content": "하나"})
+    msgs.extend(_tool_round(1))
+    msgs += _tool_round(2)
+    msgs.insert(1, {"role": "system", "content": "s"})
+    msgs.pop()
+    msgs.pop(0)
+    msgs[0] = {"role": "user", "content": "교체"}
+    msgs[1:3] = [{"role": "user", "content": "슬라이스"}]
+    del msgs[-1]
+    del msgs[:1]
+    msgs.remove(msgs[0])
+    msgs.reverse()
+    assert msgs.total_chars == _recount(msgs) and len(msgs._sizes) == len(msgs)
+    msgs.clear()
+    assert msgs.total_chars == 0 and json.loads(json.dumps(msgs)) == []
+
+
+def test_c2_round_checks_are_linear(provider, dumps_calls, monkeypatch):
+    monkeypatch.setattr(provider, "COMPACTION_CHAR_THRESHOLD", 10 ** 9)
+    messages = [{"role": "system", "content": "s"}, {"role": "user", "content": "질문"}]
+    for depth in range(60):
+        messages = provider._sized(messages)
+        assert not provider._should_compact(messages, depth)
+        assert not provider._should_prune(messages, depth)
+        messages.extend(_tool_round(depth))
+    assert len(dumps_calls) == len(messages) == 122                  # 옛 구현이면 ~3,800회
+    assert provider._estimate_content_size(messages) == _recount(messages)
+
+
+def test_c3_pruned_list_inherits_sizes(provider, dumps_calls):
+    messages = provider._sized([{"role": "user", "content": "질문"}])
+    for i in range(6):
+        messages.extend(_tool_round(i))
+    dumps_calls.clear()
+    pruned = provider._prune_messages_openai(messages)               # 새 plain list, 마스킹·trim 된 것만 새 dict
+    fresh = sum(1 for a, b in zip(messages, pruned) if a is not b)
+    assert provider._estimate_content_size(pruned) == _recount(pruned)
+    dumps_calls.clear()
+    sized = provider._sized(pruned)
+    assert len(dumps_calls) == fresh and 0 < fresh < len(pruned)
+    assert sized.total_chars == _recount(pruned) < messages.total_chars
+
+
+def test_c4_delta_tokens_and_no_retention(provider, capsys, monkeypatch):
+    messages = provider._sized([{"role": "user", "content": "질문"}])
+    base = messages.total_chars
+    assert messages.mark() == 0
+    messages.extend(_tool_round(0, payload=500))
+    grown = messages.total_chars - base
+    assert messages.delta() == grown and messages.approx_tokens == messages.total_chars // 2
+
+    monkeypatch.setattr(provider, "COMPACTION_CHAR_THRESHOLD", 1)
+    assert provider._should_compact(messages, provider.COMPACTION_MIN_ROUNDS)
+    assert f"이번 라운드 +{grown:,}자" in capsys.readouterr().out
+    assert messages.delta() == 0                                     # 판정이 기준점을 옮겼다
+
+    del messages
+    gc.collect()
+    assert provider._live_ledger() is None                           # 끝난 대화를 붙들지 않는다
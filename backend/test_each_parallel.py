@@ -0,0 +1,100 @@
+"""[table:each]{parallel: N} 회귀 테스트 (2026-10-16)
+
+왜 있는가 — each 는 행마다 독립 네트워크 호출이어도 순차로만 돌았다. parallel 모드는 행
+실행만 워커 풀에 태우므로, 이 배터리는 **순차와 같은 봉투 계약**이 동시성 아래서도
+지켜지는지를 본다.
+
+    Q1. 출력은 입력 순 · 실제로 겹쳐 돈다 · thread_context(task_id·허용 노드) 승계
+    Q2. on_error=stop — 실패를 본 뒤 새 행을 내지 않고, 이미 떠난 행은 결과에 싣는다
+    Q3. 하위 스텝 예산(_EACH_MAX_SUBSTEPS) — 순차와 같은 행에서 끊긴다
+    Q4. parallel 해석 — 없음·1·쓰레기 = 순차, 상한 8
+
+실행: python3 -m pytest backend/test_each_parallel.py
+"""
+import json
+import sys
+import threading
+import time
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import ibl_exec_each  # noqa: E402
+import thread_context  # noqa: E402
+import workflow_engine  # noqa: E402
+from ibl_exec_each import _each_parallel_width, _execute_table_each  # noqa: E402
+
+
+def _each(rows, **kw):
+    return _execute_table_each({"items": rows, "do": "[sense:weather]{q: '$it.q'}", **kw}, ".")
+
+
+def test_q1_ordered_concurrent_and_context(monkeypatch):
+    live = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    seen_ctx = set()
+
+    def _fake(steps, project_path, agent_id=None, **_kw):
+        q = steps[0]["params"]["q"]
+        with lock:
+            live["now"] += 1
+            live["peak"] = max(live["peak"], live["now"])
+            seen_ctx.add((thread_context.get_current_task_id(), tuple(thread_context.get_allowed_nodes() or ())))
+        time.sleep(0.02 if int(q) % 2 else 0.05)        # 짝수 행이 늦게 끝난다 — 완료 순 ≠ 입력 순
+        with lock:
+            live["now"] -= 1
+        return {"success": True, "final_result": json.dumps({"q": q})}
+
+    monkeypatch.setattr(workflow_engine, "execute_pipeline", _fake)
+    thread_context.set_current_task_id("task-each")
+    thread_context.set_allowed_nodes(["sense"])
+    try:
+        out = _each([{"q": str(i)} for i in range(16)], parallel=4, limit=100)
+    finally:
+        thread_context.set_current_task_id(None)
+        thread_context.set_allowed_nodes(None)
+    assert [r["_result"]["q"] for r in out["items"]] == [str(i) for i in range(16)]
+    assert out["ok_count"] == 16 and out["parallel"] == 4
+    assert 1 < live["peak"] <= 4, live
+    assert seen_ctx == {("task-each", ("sense",))}, seen_ctx
+
+
+def test_q2_stop_halts_dispatch(monkeypatch):
+    def _fake(steps, project_path, agent_id=None, **_kw):
+        q = int(steps[0]["params"]["q"])
+        time.sleep(0.01)
+        if q == 2:
+            return {"success": False, "error": "boom"}
+        return {"success": True, "final_result": "ok"}
+
+    monkeypatch.setattr(workflow_engine, "execute_pipeline", _fake)
+    out = _each([{"q": str(i)} for i in range(40)], parallel=3, on_error="stop", limit=100)
+    ran = out["count"]
+    assert 3 <= ran < 40, ran                           # 창(3) 안에서 멈춘다
+    assert out["items"][2]["_ok"] is False and out["skipped"] == 40 - ran
+    assert [r.get("q") for r in out["items"]] == [str(i) for i in range(ran)]
+    # 실행 전 실패(없는 필드)도 stop 이면 즉시 끊긴다
+    out = _each([{"q": "0"}, {"x": 1}, {"q": "2"}], parallel=2, on_error="stop")
+    assert out["items"][1]["_ok"] is False and "행에 없는 필드" in out["items"][1]["_error"]
+    assert out["count"] == 2 and out["skipped"] == 1
+
+
+def test_q3_substep_budget_same_row(monkeypatch):
+    monkeypatch.setattr(workflow_engine, "execute_pipeline",
+                        lambda steps, *_a, **_k: {"success": True, "final_result": "ok"})
+    monkeypatch.setattr(ibl_exec_each, "_EACH_MAX_SUBSTEPS", 7)
+    rows = [{"q": str(i)} for i in range(20)]
+    seq = _each(rows, limit=100)
+    par = _each(rows, limit=100, parallel=8)
+    assert seq["count"] == par["count"] == 7 and seq["skipped"] == par["skipped"] == 13
+    assert "예산" in par["message"]
+
+
+def test_q4_width_parsing():
+    assert _each_parallel_width(None) == 1
+    assert _each_parallel_width("x") == 1
+    assert _each_parallel_width(0) == 1
+    assert _each_parallel_width(1) == 1
+    assert _each_parallel_width("6") == 6
+    assert _each_parallel_width(64) == 8
+    assert _each_parallel_width(True) == 4
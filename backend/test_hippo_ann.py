@@ -0,0 +1,147 @@
+"""해마 ANN 색인(hippo_ann)·배치 질의(search_hybrid_many) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — 해마 시맨틱 검색이 전수 비교(vec0 KNN · 렌트 `vecs @ qv`)에서 NumPy IVF 색인으로
+옮겨 갔다. 색인은 원본 벡터 옆에 저장돼 memmap 으로 열리고, add_examples_batch 의 증분을 재학습
+없이 받는다. 이 배터리는 **전수와 같은 답**을 내면서 덜 훑고, 디스크·증분·배치가 맞물리는지를 본다.
+
+    N1. IVF 재현율 — 군집 데이터에서 전수 top-10 과 ≥0.95 일치, 작은 색인은 평면(정확)
+    N2. 증분·저장 — add(교체 포함)/remove 가 곧바로 보이고, 다시 열면 memmap + 델타·묘비 유지,
+        지문이 다르면 열지 않는다
+    N3. 렌트 해마 — f32 는 memmap, 색인은 f32 옆에 지어지고, 질의 여럿은 /embed 왕복 1회로
+        search_hybrid 를 하나씩 부른 것과 같은 결과
+    N4. 로컬 배치 — 질의 여럿이 읽기 연결 하나를 재사용하고 결과는 하나씩과 같다
+
+실행: python3 -m pytest backend/test_hippo_ann.py
+"""
+import json
+import sqlite3
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import hippo_ann  # noqa: E402
+import ibl_usage_db  # noqa: E402
+from ibl_usage_db import IBLUsageDB  # noqa: E402
+
+
+def _clustered(n, dim, seed=1, centers=None):
+    rng = np.random.default_rng(seed)
+    c = centers if centers is not None else rng.normal(size=(max(8, n // 100), dim))
+    x = c[rng.integers(0, len(c), n)] + rng.normal(scale=0.6, size=(n, dim))
+    return hippo_ann._unit(x.astype(np.float32)), c
+
+
+def _exact(x, keys, q, k):
+    return [set(keys[np.argsort(-(x @ qv))[:k]].tolist()) for qv in q]
+
+
+def test_n1_ivf_recall_and_flat_small():
+    x, cents = _clustered(6000, 64)
+    q, _ = _clustered(50, 64, seed=2, centers=cents)
+    keys = np.arange(1000, 7000)
+    idx = hippo_ann.IVFIndex.build(x, keys)
+    assert idx.nlist > 1
+    got = idx.search(q, 10)
+    recall = np.mean([len(set(g[0].tolist()) & e) / 10 for g, e in zip(got, _exact(x, keys, q, 10))])
+    assert recall >= 0.95, recall
+    assert all(np.all(np.diff(g[1]) <= 0) for g in got)          # 점수 내림차순
+
+    small = hippo_ann.IVFIndex.build(x[:500], keys[:500])
+    assert small.nlist == 0
+    assert [set(g[0].tolist()) for g in small.search(q, 5)] == _exact(x[:500], keys[:500], q, 5)
+
+
+def test_n2_incremental_and_persist(tmp_path):
+    x, _ = _clustered(3000, 32)
+    idx = hippo_ann.IVFIndex.build(x, np.arange(3000), signature="s1")
+    new = hippo_ann._unit(np.random.default_rng(9).normal(size=(2, 32)).astype(np.float32))
+    idx.add(new, [5000, 7])                                         # 7 은 교체
+    idx.remove([11])
+    hit = idx.search(new, 1)
+    assert [int(h[0][0]) for h in hit] == [5000, 7]
+    assert 11 not in idx.search(x[11], 3)[0][0].tolist()
+    assert len(idx) == 3000 - 1 + 1                                 # 11 빠지고 5000 더해짐(7 은 교체)
+
+    idx.save(tmp_path / "ivf")
+    back = hippo_ann.IVFIndex.load(tmp_path / "ivf", "s1")
+    assert isinstance(back._vecs, np.memmap)
+    assert [int(h[0][0]) for h in back.search(new, 1)] == [5000, 7]
+    assert 11 not in back.search(x[11], 3)[0][0].tolist()
+    assert hippo_ann.IVFIndex.load(tmp_path / "ivf", "other") is None
+
+    back.add(new[:1], [6000])                                       # 본체 그대로 → 델타·메타만 다시
+    before = (tmp_path / "ivf" / "vecs.npy").stat().st_mtime_ns
+    back.save(tmp_path / "ivf")
+    assert (tmp_path / "ivf" / "vecs.npy").stat().st_mtime_ns == before
+    assert not back.disk_changed() and idx.disk_changed()
+
+
+@pytest.fixture
+def fresh_db(tmp_path, monkeypatch):
+    """임시 DB 경로의 새 IBLUsageDB — 싱글턴·클래스 상태는 테스트 뒤 되돌린다."""
+    monkeypatch.setattr(ibl_usage_db, "DB_PATH", str(tmp_path / "ibl_usage.db"))
+    for attr in ("_instance", "_rented_vecs", "_rented_metas", "_rented_ann", "_ann"):
+        monkeypatch.setattr(IBLUsageDB, attr, None)
+    monkeypatch.setattr(IBLUsageDB, "_rented_load_attempted", False)
+    monkeypatch.setattr(IBLUsageDB, "_is_foreign_vocab", staticmethod(lambda code: False))
+    return IBLUsageDB()
+
+
+def test_n3_rented_memmap_ann_and_batched_embed(tmp_path, monkeypatch, fresh_db):
+    n, dim = 300, IBLUsageDB.EMBEDDING_DIM
+    vecs, cents = _clustered(n, dim)
+    data = tmp_path / "base" / "data"
+    data.mkdir(parents=True)
+    vecs.tofile(data / "ibl_hippo_vecs.f32")
+    examples = [{"id": i + 1, "intent": f"의도 {i}", "ibl_code": f"[sense:a{i}]",
+                 "nodes": "sense" if i % 2 else "self", "category": "single", "difficulty": 1,
+                 "source": "synthetic", "success_count": 0, "fail_count": 0} for i in range(n)]
+    (data / "ibl_hippo_index.json").write_text(
+        json.dumps({"dim": dim, "count": n, "examples": examples}), encoding="utf-8")
+    monkeypatch.setenv("INDIEBIZ_BASE_PATH", str(tmp_path / "base"))
+    monkeypatch.setenv("INDIEBIZ_MAC_URL", "http://mac.invalid")
+    monkeypatch.setenv("INDIEBIZ_HIPPO", "on")
+
+    queries = {f"질의{i}": v for i, v in enumerate(_clustered(4, dim, seed=3, centers=cents)[0])}
+    calls = []
+
+    def _rent(texts):
+        calls.append(list(texts))
+        return np.stack([queries[t] for t in texts])
+
+    monkeypatch.setattr(fresh_db, "_rent_query_vecs", _rent)
+    many = fresh_db.search_hybrid_many(list(queries), top_k=3, allowed_nodes={"sense"})
+    assert len(calls) == 1 and len(calls[0]) == 4                   # 왕복 1회
+    assert isinstance(IBLUsageDB._rented_vecs, np.memmap)
+    assert (data / "ibl_hippo_ivf" / "meta.json").exists()
+    for (text, qv), got in zip(queries.items(), many):
+        best = [examples[i] for i in np.argsort(-(vecs @ qv)) if examples[i]["nodes"] == "sense"][:3]
+        assert [r.id for r in got] == [e["id"] for e in best]
+    fresh_db._search_cache.clear()
+    assert [fresh_db.search_hybrid(t, top_k=3, allowed_nodes={"sense"}) for t in queries] == many
+    assert len(calls) == 5                                           # 하나씩은 질의마다 한 번
+
+
+def test_n4_local_batch_reuses_connection(monkeypatch, fresh_db):
+    monkeypatch.setenv("INDIEBIZ_HIPPO", "on")
+    monkeypatch.delenv("INDIEBIZ_MAC_URL", raising=False)
+    fresh_db.add_examples_batch([
+        {"intent": "서울 날씨 알려줘", "ibl_code": '[sense:weather]("서울")', "nodes": "sense"},
+        {"intent": "비트코인 가격 조회", "ibl_code": '[sense:price]("BTC")', "nodes": "sense"},
+        {"intent": "부산 날씨 예보", "ibl_code": '[sense:weather]("부산")', "nodes": "sense"},
+    ])
+    texts = ["날씨 알려줘", "비트코인 가격", "없는단어질의"]
+    real = sqlite3.connect
+    opened = []
+    monkeypatch.setattr(sqlite3, "connect", lambda *a, **k: opened.append(a) or real(*a, **k))
+    many = fresh_db.search_hybrid_many(texts, top_k=2)
+    many_again = fresh_db.search_hybrid_many(texts, top_k=2)         # 캐시 + 같은 읽기 연결
+    assert len(opened) <= 1
+    assert [e.ibl_code for e in many[1]] == ['[sense:price]("BTC")']
+    assert many[2] == [] and many_again == many
+    fresh_db._search_cache.clear()
+    assert [fresh_db.search_hybrid(t, top_k=2) for t in texts] == many
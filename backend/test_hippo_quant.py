@@ -0,0 +1,94 @@
+"""렌트 해마 양자화 색인(hippo_ann quantize) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — 폰 콜드스타트·RSS 의 최대 단일 할당이던 렌트 해마 인덱스를 f32 memmap + 양자화
+ANN 색인(기본 int8)으로 바꿨다. 색인은 ¼ 크기로 훑고 상위 후보만 원본 f32 로 재채점한다.
+이 배터리는 **점수·순서가 f32 전수와 같으면서** 저장이 작아지고, 미리 지은 색인이 번들 전개
+(복사·mtime 변경) 뒤에도 다시 지어지지 않는지를 본다.
+
+    Q1. int8/f16 — 저장 크기 ¼/½, 재채점 결과가 f32 전수 top-k 와 같은 키·같은 점수
+    Q2. 재채점 원본이 없으면 — 거친 점수라도 오차가 작다(int8 ±0.02)
+    Q3. 번들 전개 — 색인을 통째로 다른 곳에 복사해도 내용 지문이 맞아 그대로 열린다
+    Q4. 양자화 설정 변경 — INDIEBIZ_HIPPO_QUANT 가 바뀌면 다시 짓는다
+
+실행: python3 -m pytest backend/test_hippo_quant.py
+"""
+import shutil
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import hippo_ann  # noqa: E402
+from ibl_usage_db import IBLUsageDB  # noqa: E402
+
+
+def _data(n=3000, dim=96, seed=4):
+    rng = np.random.default_rng(seed)
+    c = rng.normal(size=(40, dim))
+    x = hippo_ann._unit((c[rng.integers(0, 40, n)] + rng.normal(scale=0.7, size=(n, dim))).astype(np.float32))
+    q = hippo_ann._unit((c[rng.integers(0, 40, 20)] + rng.normal(scale=0.7, size=(20, dim))).astype(np.float32))
+    return x, q
+
+
+@pytest.mark.parametrize("mode,ratio", [("int8", 4), ("f16", 2)])
+def test_q1_quantized_rerank_matches_exact(tmp_path, mode, ratio):
+    x, q = _data()
+    keys = np.arange(len(x))
+    idx = hippo_ann.IVFIndex.build(x, keys, quantize=mode, nlist=0)
+    idx.full_vectors = lambda ks: x[ks]
+    idx.save(tmp_path / mode)
+    ref = hippo_ann.IVFIndex.build(x, keys, nlist=0)
+    ref.save(tmp_path / "f32")
+    size = (tmp_path / mode / "vecs.npy").stat().st_size
+    assert size * ratio <= (tmp_path / "f32" / "vecs.npy").stat().st_size + 512
+
+    for (ks, ss), qv in zip(idx.search(q, 5), q):
+        exact = np.argsort(-(x @ qv))[:5]
+        assert ks.tolist() == exact.tolist()
+        assert np.allclose(ss, (x @ qv)[exact], atol=1e-6)
+
+
+def test_q2_coarse_scores_close_without_rerank():
+    x, q = _data()
+    idx = hippo_ann.IVFIndex.build(x, np.arange(len(x)), quantize="int8", nlist=0)
+    for (ks, ss), qv in zip(idx.search(q, 5), q):
+        assert np.max(np.abs(ss - x[ks] @ qv)) < 0.02
+
+
+def _bundle(base, x):
+    data = base / "data"
+    data.mkdir(parents=True)
+    x.tofile(data / "ibl_hippo_vecs.f32")
+    return data / "ibl_hippo_vecs.f32"
+
+
+def test_q3_prebuilt_index_survives_copy(tmp_path, monkeypatch):
+    monkeypatch.delenv("INDIEBIZ_HIPPO_QUANT", raising=False)
+    x, q = _data(n=500, dim=IBLUsageDB.EMBEDDING_DIM)
+    src = _bundle(tmp_path / "mac", x)
+    built = IBLUsageDB._open_rented_ann(src, np.memmap(src, np.float32, "r", shape=x.shape))
+    assert built.quantize == "int8"
+
+    shutil.copytree(tmp_path / "mac", tmp_path / "phone")          # 전개 — mtime 이 모두 새로
+    dst = tmp_path / "phone" / "data" / "ibl_hippo_vecs.f32"
+    loaded = hippo_ann.IVFIndex.load(dst.with_name("ibl_hippo_ivf"), built.signature, quantize="int8")
+    assert loaded is not None
+    vecs = np.memmap(dst, np.float32, "r", shape=x.shape)
+    opened = IBLUsageDB._open_rented_ann(dst, vecs)
+    assert isinstance(opened._vecs, np.memmap) and opened._vecs.dtype == np.int8
+    ks, ss = opened.search(q[:1], 3)[0]
+    assert ks.tolist() == np.argsort(-(x @ q[0]))[:3].tolist()
+
+
+def test_q4_quant_setting_change_rebuilds(tmp_path, monkeypatch):
+    x, _q = _data(n=300, dim=IBLUsageDB.EMBEDDING_DIM)
+    path = _bundle(tmp_path, x)
+    vecs = np.memmap(path, np.float32, "r", shape=x.shape)
+    monkeypatch.setenv("INDIEBIZ_HIPPO_QUANT", "int8")
+    assert IBLUsageDB._open_rented_ann(path, vecs).quantize == "int8"
+    monkeypatch.setenv("INDIEBIZ_HIPPO_QUANT", "f32")
+    assert IBLUsageDB._open_rented_ann(path, vecs).quantize == "f32"
+    assert np.load(path.with_name("ibl_hippo_ivf") / "vecs.npy", mmap_mode="r").dtype == np.float32
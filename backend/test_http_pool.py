@@ -0,0 +1,116 @@
+"""레지스트리 API 연결 풀·응답 캐시·속도 제한(http_pool) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — api_engine._do_request 가 모듈 수준 requests.request 대신 서비스별 세션 풀을
+쓰고, 도구별 TTL 캐시(ETag/Last-Modified 재검증)와 호스트별 토큰 버킷을 거친다. 이 배터리는
+로컬 HTTP 서버 하나로 **옛 호출과 같은 결과**를 내면서 연결·왕복·429 를 줄이는지를 본다.
+
+    H1. keep-alive — 같은 서비스의 연속 호출이 연결 하나를 재사용, 쿠키는 들고 다니지 않는다
+    H2. 캐시 — ttl 안이면 요청 없음, 지나면 If-None-Match → 304 → 같은 결과. 설정 없으면 매번
+    H3. 속도 제한 — 한도를 넘는 호출은 줄 서서 통과, max_wait 초과는 정직한 error
+    H4. 429 Retry-After — 재시도가 그만큼 기다렸다 성공
+
+실행: python3 -m pytest backend/test_http_pool.py
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import http_pool  # noqa: E402
+from api_engine import _do_request  # noqa: E402
+
+
+class _Srv:
+    def __init__(self):
+        self.hits = []              # (path, client_port, If-None-Match, Cookie)
+        self.too_many = 0
+        srv = self
+
+        class H(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *a):
+                pass
+
+            def do_GET(self):
+                srv.hits.append((self.path.split("?")[0], self.client_address[1],
+                                 self.headers.get("If-None-Match"), self.headers.get("Cookie")))
+                if self.path.startswith("/busy") and srv.too_many:
+                    srv.too_many -= 1
+                    return self._send(429, b"", {"Retry-After": "0.3"})
+                if self.path.startswith("/etag") and self.headers.get("If-None-Match") == '"v1"':
+                    return self._send(304, b"", {"ETag": '"v1"'})
+                body = json.dumps({"path": self.path, "n": len(srv.hits)}).encode()
+                self._send(200, body, {"ETag": '"v1"', "Content-Type": "application/json",
+                                       "Set-Cookie": "sid=abc; Path=/"})
+
+            def _send(self, code, body, headers):
+                self.send_response(code)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), H)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def srv():
+    http_pool.clear_cache()
+    s = _Srv()
+    yield s
+    s.httpd.shutdown()
+    http_pool._buckets.clear()
+
+
+def _get(srv, path, **kw):
+    return _do_request("GET", srv.url + path, {}, {"q": "x"}, 5, "json", service=f"t-{id(srv)}", **kw)
+
+
+def test_h1_keep_alive_and_no_cookies(srv):
+    for _ in range(4):
+        assert _get(srv, "/a")["path"] == "/a?q=x"
+    assert len({port for _p, port, _e, _c in srv.hits}) == 1, srv.hits
+    assert all(c is None for *_x, c in srv.hits)        # Set-Cookie 를 다음 호출에 싣지 않는다
+
+
+def test_h2_cache_ttl_and_revalidate(srv):
+    first = _get(srv, "/etag", cache={"ttl": 0.2})
+    assert _get(srv, "/etag", cache={"ttl": 0.2}) == first and len(srv.hits) == 1
+    time.sleep(0.25)
+    assert _get(srv, "/etag", cache={"ttl": 0.2}) == first     # 304 → 저장본
+    assert len(srv.hits) == 2 and srv.hits[1][2] == '"v1"'
+    assert _get(srv, "/etag", cache={"ttl": 0.2}) == first and len(srv.hits) == 2
+    _get(srv, "/plain")
+    _get(srv, "/plain")
+    assert len(srv.hits) == 4                            # 캐시 설정 없으면 옛 동작 그대로
+    assert http_pool.stats()["cache_revalidated"] >= 1
+
+
+def test_h3_rate_limit_queues_then_rejects(srv):
+    t0 = time.monotonic()
+    outs = [_get(srv, "/r", rate_limit={"per_second": 20, "burst": 1}) for _ in range(5)]
+    assert all("error" not in o for o in outs)
+    assert time.monotonic() - t0 >= 0.18                 # 4번의 50ms 간격 — 실패가 아니라 대기
+    http_pool._buckets.clear()
+    cfg = {"per_minute": 1, "burst": 1, "max_wait": 0.1}
+    assert "error" not in _get(srv, "/r2", rate_limit=cfg)
+    out = _get(srv, "/r2", rate_limit=cfg)
+    assert "한도 대기" in out["error"], out
+
+
+def test_h4_retry_after_honoured(srv):
+    srv.too_many = 1
+    t0 = time.monotonic()
+    out = _get(srv, "/busy", retry_config={"max_attempts": 2, "delay": 0.01})
+    assert out["path"] == "/busy?q=x" and len(srv.hits) == 2
+    assert time.monotonic() - t0 >= 0.28
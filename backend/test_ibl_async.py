@@ -0,0 +1,212 @@
+"""IBL 비동기 실행 경로(ibl_async) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — execute_ibl_async / execute_pipeline_async 는 async 핸들러를 스레드 없이 await 하고,
+파이프는 동기와 같은 코어(_pipeline_core)를 같은 구동 루프(_drive_core)로 await 한다. 이 배터리는 **동기와 같은
+봉투**를 내면서 스레드를 쓰지 않고, 취소가 진행 중인 step 까지 진짜로 번지는지를 본다.
+
+    A1. async 핸들러 — 동시 호출이 겹쳐 돌고 레인 스레드를 하나도 쓰지 않는다
+    A2. 파이프(& 포함) — 동기 execute_pipeline 과 같은 봉투(소요시간 제외)
+    A3. & 마감 — 마감을 넘긴 async 분기는 CancelledError 를 받고 정직한 타임아웃 오류로
+    A4. 태스크 취소 — 레인에서 돌던 동기 step 은 포기(취소 표식)된다
+    A5. 구동 루프 — drive_core(동기)와 await _drive_core(비동기)가 같은 send·throw 순서를 낸다
+    A6. & 상한 — 동기·비동기 모두 한 묶음에서 동시에 도는 분기가 PARALLEL_MAX_BRANCHES 를 넘지 않는다
+    A7. 호출자 컨텍스트 — 한 루프에서 겹쳐 도는 호출의 도구 로그가 각자의 작업에 붙는다
+
+실행: python3 -m pytest backend/test_ibl_async.py
+"""
+import asyncio
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import ibl_engine  # noqa: E402
+import lane_scheduler  # noqa: E402
+import thread_context  # noqa: E402
+import tool_loader  # noqa: E402
+import workflow_engine  # noqa: E402
+import workflow_parallel  # noqa: E402
+from ibl_async import execute_ibl_async, execute_pipeline_async  # noqa: E402
+
+_seen = {"cancelled": 0, "threads": set()}
+
+
+async def _async_execute(tool_input, context):
+    _seen["threads"].add(threading.current_thread().name)
+    try:
+        await asyncio.sleep(float(tool_input.get("sleep", 0.1)))
+    except asyncio.CancelledError:
+        _seen["cancelled"] += 1
+        raise
+    return {"success": True, "echo": tool_input.get("q")}
+
+
+@pytest.fixture
+def fake_async_node(monkeypatch):
+    real = ibl_engine._load_nodes_config()
+    nodes = dict(real.get("nodes", {}))
+    nodes["tasync"] = {"actions": {"slow": {"router": "handler", "tool": "t_async", "scope": "workspace"}}}
+    monkeypatch.setattr(ibl_engine, "_load_nodes_config", lambda: {**real, "nodes": nodes})
+    real_loader = tool_loader.load_tool_handler
+    mod = types.SimpleNamespace(execute=_async_execute)
+    monkeypatch.setattr(tool_loader, "load_tool_handler",
+                        lambda name: mod if name == "t_async" else real_loader(name))
+    _seen["cancelled"] = 0
+    _seen["threads"].clear()
+
+
+def _leaf(q, sleep=0.1):
+    return {"_node": "tasync", "action": "slow", "params": {"q": q, "sleep": sleep}}
+
+
+def test_a1_async_handler_needs_no_thread(fake_async_node):
+    before = lane_scheduler.stats()["network"].get("submitted", 0)
+
+    async def _go():
+        return await asyncio.gather(*(execute_ibl_async(_leaf(str(i)), ".") for i in range(8)))
+
+    # 첫 호출 비용(텔레메트리의 지연 import·어휘 derive 첫 계산)은 겹침과 무관 — 한 번 데워 둔다
+    asyncio.run(execute_ibl_async(_leaf("warm", sleep=0), "."))
+    t0 = time.monotonic()
+    out = asyncio.run(_go())
+    assert [o["echo"] for o in out] == [str(i) for i in range(8)]
+    assert time.monotonic() - t0 < 0.6                  # 8 × 0.1s(직렬 0.8s)가 겹쳐 돈다
+    assert lane_scheduler.stats()["network"].get("submitted", 0) == before
+    assert len(_seen["threads"]) == 1                   # 전부 persistent 루프 한 스레드
+
+
+def test_a2_pipeline_envelope_matches_sync(monkeypatch):
+    def _fake(tool_input, project_path, agent_id=None):
+        return {"success": True, "v": tool_input["action"],
+                "got": str((tool_input.get("params") or {}).get("_prev_result", ""))[:40]}
+
+    monkeypatch.setattr(ibl_engine, "execute_ibl", _fake)
+    steps = [{"_parallel": True, "branches": [{"_node": "self", "action": "a", "params": {}},
+                                              {"_node": "self", "action": "b", "params": {}}]},
+             {"_node": "self", "action": "c", "params": {}},
+             {"_node": "self", "action": "d", "params": {}, "_seq_boundary": True}]
+
+    def _strip(env):
+        for r in env["results"]:
+            r.pop("duration_ms", None)
+        return env
+
+    sync = _strip(workflow_engine.execute_pipeline([dict(s) for s in steps], "."))
+    asyn = _strip(asyncio.run(execute_pipeline_async([dict(s) for s in steps], ".")))
+    assert sync["success"] and asyn == sync
+
+
+def test_a3_parallel_deadline_cancels_async_branch(fake_async_node, monkeypatch):
+    monkeypatch.setattr(workflow_parallel, "PARALLEL_BRANCH_TIMEOUT", 0.3)
+    steps = [{"_parallel": True, "branches": [_leaf("fast", 0.01), _leaf("stuck", 5)]}]
+    t0 = time.monotonic()
+    out = asyncio.run(execute_pipeline_async(steps, "."))
+    assert time.monotonic() - t0 < 2
+    rec = out["results"][0]
+    assert rec["branches_failed"][0]["branch"] == 2 and "시간 초과" in rec["branches_failed"][0]["error"]
+    deadline = time.time() + 2
+    while not _seen["cancelled"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert _seen["cancelled"] == 1                      # 스레드처럼 버려지지 않고 진짜 취소
+
+
+def test_a4_task_cancel_abandons_lane_step(monkeypatch):
+    flags = []
+    gate = threading.Event()
+
+    def _blocking(tool_input, project_path, agent_id=None):
+        gate.wait(5)
+        flags.append(lane_scheduler.cancelled())
+        return {"success": True}
+
+    monkeypatch.setattr(ibl_engine, "execute_ibl", _blocking)
+
+    async def _go():
+        task = asyncio.ensure_future(execute_pipeline_async(
+            [{"_node": "self", "action": "x", "params": {}}], "."))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_go())
+    gate.set()
+    deadline = time.time() + 2
+    while not flags and time.time() < deadline:
+        time.sleep(0.01)
+    assert flags == [True]
+
+
+def test_a5_one_drive_loop_sync_and_async():
+    def core():
+        got = [(yield "a")]
+        try:
+            yield "boom"
+        except ValueError as e:
+            got.append(f"잡음:{e}")
+        got.append((yield "b"))
+        return got
+
+    def run(effect):
+        if effect == "boom":
+            raise ValueError("x")
+        return effect.upper()
+
+    async def arun(effect):
+        await asyncio.sleep(0)
+        return run(effect)
+
+    want = ["A", "잡음:x", "B"]
+    assert workflow_engine.drive_core(core(), run) == want
+    assert asyncio.run(workflow_engine._drive_core(core(), arun)) == want
+    with pytest.raises(RuntimeError):
+        workflow_engine.drive_core(core(), arun)                     # 동기 구동자는 await 하지 않는다
+
+
+def test_a6_parallel_branch_cap(monkeypatch):
+    monkeypatch.setattr(workflow_parallel, "PARALLEL_MAX_BRANCHES", 2)
+    lock = threading.Lock()
+    live = {"now": 0, "peak": 0}
+
+    def _fake(tool_input, project_path, agent_id=None):
+        with lock:
+            live["now"] += 1
+            live["peak"] = max(live["peak"], live["now"])
+        time.sleep(0.05)
+        with lock:
+            live["now"] -= 1
+        return {"success": True, "v": tool_input["action"]}
+
+    monkeypatch.setattr(ibl_engine, "execute_ibl", _fake)
+    branches = [{"_node": "self", "action": f"b{i}", "params": {}} for i in range(6)]
+    out = workflow_parallel._execute_parallel([dict(b) for b in branches], ".", None)
+    assert [o["v"] for o in out] == [f"b{i}" for i in range(6)]
+    assert live["peak"] == 2, live
+    live["peak"] = 0
+    steps = [{"_parallel": True, "branches": [dict(b) for b in branches]}]
+    env = asyncio.run(execute_pipeline_async(steps, "."))
+    assert env["success"] and live["peak"] == 2, (env, live)
+
+
+def test_a7_concurrent_calls_keep_their_own_context(fake_async_node):
+    async def _one(task_id, sleep):
+        thread_context.set_current_task_id(task_id)     # 같은 루프 스레드 — 서로 덮어쓴다
+        thread_context.clear_tool_calls()
+        calls = thread_context.get_tool_calls()
+        await execute_ibl_async(_leaf(task_id, sleep), ".")
+        return calls
+
+    async def _go():
+        return await asyncio.gather(_one("tA", 0.15), _one("tB", 0.05))
+
+    try:
+        got_a, got_b = asyncio.run(_go())
+    finally:
+        thread_context.clear_all_context()
+    assert [c["input"]["params"]["q"] for c in got_a] == ["tA"], got_a
+    assert [c["input"]["params"]["q"] for c in got_b] == ["tB"], got_b
@@ -0,0 +1,79 @@
+"""IBL 컴파일 계획 캐시 + [table:each] 슬롯 결속 회귀 테스트 (2026-10-16)
+
+왜 있는가 — each 는 행마다 `$it` 를 문자열로 치환한 do 문장을 다시 파싱했고,
+execute_pipeline 은 문자열 step 을 호출마다 파싱했다. ibl_plan 이 문장을 한 번만
+파싱하게 바꿨으므로, 이 배터리는 **뜻이 옛 경로와 같은지**를 본다.
+
+    P1. 캐시는 매번 새 사본 — 실행기의 step 변형이 다음 호출을 오염시키지 않는다
+    P2. 슬롯 결속 = 치환+파싱 (따옴표·백슬래시·None·dict 행 값·괄호형 참조)
+    P3. 맨몸 참조는 결속하지 않는다(None → 옛 경로)
+    P4. each 실행 — do 는 1회만 파싱, 없는 필드는 여전히 행 단위 실패
+
+실행: python3 -m pytest backend/test_ibl_plan_cache.py
+"""
+import json
+import sys
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import ibl_parser  # noqa: E402
+import ibl_plan  # noqa: E402
+from ibl_exec_each import _each_substitute, _each_slot_values, _execute_table_each  # noqa: E402
+
+
+def test_p1_cached_steps_are_fresh_copies():
+    ibl_plan.clear_plan_cache()
+    first = ibl_plan.parse_cached('[sense:time]{} >> [self:notify_user]{message: "x"}')
+    first[1]["params"]["message"] = "오염"
+    first[0]["_depth"] = 3
+    again = ibl_plan.parse_cached('  [sense:time]{} >> [self:notify_user]{message: "x"}\r\n')
+    assert again[1]["params"]["message"] == "x"
+    assert "_depth" not in again[0]
+    stats = ibl_plan.plan_cache_stats()
+    assert stats["plans"] == 1 and stats["hits"] == 1, stats
+
+
+def test_p2_slot_binding_matches_substitution():
+    do = ('[self:notify_user]{message: "$it.title — ${it.n}건", '
+          "raw: '$it', tag: \"$it.tag\"}")
+    plan = ibl_plan.compile_slot_plan(do, "it")
+    assert plan is not None and plan.fields == ("title", "n", "", "tag")
+    rows = [
+        {"title": "따옴표 ' 와 \" 와 \\ 백슬래시", "n": 3, "tag": None},
+        {"title": "$x = [a:b]{}", "n": 0, "tag": {"k": [1, 2]}},
+    ]
+    for row in rows:
+        values, missing = _each_slot_values(plan.fields, row)
+        assert not missing
+        sentence, _m = _each_substitute(do, row, "it")
+        assert plan.bind(values) == ibl_parser.parse(sentence), row
+
+
+def test_p3_bare_reference_falls_back():
+    assert ibl_plan.compile_slot_plan("[self:x]{n: $it.count}", "it") is None
+    assert ibl_plan.compile_slot_plan('[self:x]{n: "$it.count"}', "it") is not None
+
+
+def test_p4_each_parses_do_once(monkeypatch):
+    ibl_plan.clear_plan_cache()
+    calls = {"parse": 0, "run": []}
+    real = ibl_plan.parse_with_vars
+
+    def _counting(code):
+        calls["parse"] += 1
+        return real(code)
+
+    def _fake_pipeline(steps, project_path, agent_id=None, **_kw):
+        calls["run"].append(steps[0]["params"]["q"])
+        return {"success": True, "final_result": json.dumps({"q": steps[0]["params"]["q"]})}
+
+    import workflow_engine
+    monkeypatch.setattr(ibl_plan, "parse_with_vars", _counting)
+    monkeypatch.setattr(workflow_engine, "execute_pipeline", _fake_pipeline)
+    rows = [{"city": f"도시{i}"} for i in range(30)] + [{"name": "필드 없음"}]
+    out = _execute_table_each({"items": rows, "do": "[sense:weather]{q: '$it.city'}", "limit": 100}, ".")
+    assert calls["parse"] == 1, calls["parse"]
+    assert calls["run"] == [f"도시{i}" for i in range(30)]
+    assert out["ok_count"] == 30 and out["error_count"] == 1
+    assert "행에 없는 필드: city" in out["items"][-1]["_error"]
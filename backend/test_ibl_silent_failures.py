@@ -195,6 +195,31 @@ def test_d6_sync_handler_timeout():
     print("D6 OK — 동기 핸들러 타임아웃·컨텍스트 승계·예외 재전파")
 
 
+def test_d6_queue_wait_not_counted():
+    """D6: 타임아웃은 핸들러 시작부터 — network 레인이 차 있어 줄 선 시간은 세지 않는다."""
+    import threading
+    import lane_scheduler
+    from ibl_routing import _run_sync_with_timeout
+
+    saved = lane_scheduler._lanes.get("network")
+    lane_scheduler._lanes["network"] = lane_scheduler._Lane("network", 1, True)
+    try:
+        gate = threading.Event()
+        busy = lane_scheduler.submit("network", gate.wait, 5)
+        threading.Timer(0.6, gate.set).start()
+        # 0.6초 줄 서지만 핸들러 자체는 즉시 끝남 → 0.3초 타임아웃에 걸리지 않아야 함
+        assert _run_sync_with_timeout(lambda a, b: a * b, (6, 7), 0.3, "queued-tool") == 42
+        assert busy.result(timeout=5) is True
+        assert lane_scheduler.stats()["network"]["timed_out"] == 0
+    finally:
+        gate.set()
+        if saved is None:
+            lane_scheduler._lanes.pop("network", None)
+        else:
+            lane_scheduler._lanes["network"] = saved
+    print("D6 OK — 레인 큐 대기는 실행 타임아웃에 들지 않음")
+
+
 if __name__ == "__main__":
     print("=== IBL 침묵 실패 수리 회귀 테스트 (D1~D6) ===\n")
     test_d1_mixed_operators_rejected()
@@ -204,4 +229,5 @@ if __name__ == "__main__":
     test_d4_var_binding_engine()
     test_d5_recursive_acl()
     test_d6_sync_handler_timeout()
+    test_d6_queue_wait_not_counted()
     print("\n=== 전부 통과 ===")
@@ -0,0 +1,197 @@
+"""엔진 전역 실행 스케줄러(lane_scheduler) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — & 분기·each 행·동기 핸들러·루프 오프로드가 각자 스레드를 만들던 것을 이름 붙은
+레인 하나로 모았다. 이 배터리는 스케줄러가 **옛 자리들의 약속**(컨텍스트 승계·타임아웃·
+중첩 무교착)을 지키면서 스레드 수를 묶는지를 본다.
+
+    L1. 레인 상한 — 동시 실행이 cap 을 넘지 않고, thread_context 는 일마다 깨끗이 교체
+    L2. 중첩 — 워커가 포화 레인에 낸 일은 제자리 실행(교착 없음), async-loop 는 넘침 스레드
+    L3. 포기 — 큐의 일은 취소, 도는 일은 취소 표식 + 슬롯 반납, 끝나면 abandoned_live 0
+    L4. execute_pipeline 은 취소된 일 안에서 다음 step 을 돌리지 않는다
+    L5. from_start — 포화 레인에 줄 선 짧은 일은 큐 대기 시간으로 시간 초과되지 않는다
+    L6. 중첩 + 포화 — 워커가 낸 timed 일은 제자리 실행이 아니라 넘침 스레드라 timeout 이 선다,
+        제자리 실행은 current_job() 을 세우고, 큐 대기는 queue_timeout 을 넘으면 넘침으로 오른다
+
+실행: python3 -m pytest backend/test_lane_scheduler.py
+"""
+import sys
+import threading
+import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import lane_scheduler as ls  # noqa: E402
+import thread_context  # noqa: E402
+
+
+@pytest.fixture
+def lane(monkeypatch):
+    """상한 2짜리 시험 레인 — 전역 레인 상태를 건드리지 않는다."""
+    monkeypatch.setitem(ls.LANE_CAPS, "t", 2)
+    monkeypatch.setitem(ls._INLINE_OK, "t", True)
+    monkeypatch.setitem(ls.LANE_CAPS, "t-loop", 1)
+    monkeypatch.setitem(ls._INLINE_OK, "t-loop", False)
+    yield "t"
+    ls._lanes.pop("t", None)
+    ls._lanes.pop("t-loop", None)
+
+
+def test_l1_cap_and_context(lane):
+    live = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _job(i):
+        with lock:
+            live["now"] += 1
+            live["peak"] = max(live["peak"], live["now"])
+        time.sleep(0.03)
+        with lock:
+            live["now"] -= 1
+        return i, thread_context.get_current_task_id(), thread_context.get_allowed_nodes()
+
+    thread_context.set_current_task_id("T1")
+    try:
+        futs = [ls.submit(lane, _job, i) for i in range(6)]
+        thread_context.set_current_task_id(None)
+        thread_context.set_allowed_nodes({"sense"})
+        futs.append(ls.submit(lane, _job, 6))
+        out = [f.result(timeout=5) for f in futs]
+    finally:
+        thread_context.set_current_task_id(None)
+        thread_context.set_allowed_nodes(None)
+    assert live["peak"] == 2, live
+    assert out[:6] == [(i, "T1", None) for i in range(6)]
+    assert out[6] == (6, None, {"sense"})           # 앞 일의 task_id 가 재사용 워커에 새지 않는다
+    st = ls.stats()["t"]
+    assert st["completed"] == 7 and st["peak_queued"] >= 1 and st["cap"] == 2
+
+
+def test_l2_nested_runs_inline_and_loop_overflows(lane):
+    def _leaf(x):
+        return threading.current_thread().name, x
+
+    def _fan():
+        # 워커 2개가 모두 여기서 자식 3개씩을 기다린다 — 줄 세웠다면 교착
+        futs = [ls.submit(lane, _leaf, k) for k in range(3)]
+        return [f.result(timeout=5)[1] for f in futs]
+
+    outer = [ls.submit(lane, _fan) for _ in range(2)]
+    assert [f.result(timeout=5) for f in outer] == [[0, 1, 2], [0, 1, 2]]
+    assert ls.stats()["t"]["inline"] >= 1
+
+    def _loop_parent():
+        busy = ls.submit("t-loop", time.sleep, 0.2)     # 레인 하나를 점유
+        time.sleep(0.02)
+        name = ls.submit("t-loop", lambda: threading.current_thread().name).result(timeout=5)
+        busy.result(timeout=5)
+        return name, threading.current_thread().name
+
+    child, parent = ls.submit(lane, _loop_parent).result(timeout=5)
+    assert child.endswith("overflow") and child != parent   # 루프 레인은 제자리 실행 금지
+    assert ls.stats()["t-loop"]["overflow"] == 1
+
+
+def test_l3_abandon_cancels_queued_and_flags_running(lane):
+    gate = threading.Event()
+    flags = []
+
+    def _slow():
+        gate.wait(5)
+        flags.append(ls.cancelled())
+        return "late"
+
+    running = [ls.submit(lane, _slow) for _ in range(2)]
+    queued = ls.submit(lane, lambda: "never")
+    with pytest.raises(FuturesTimeoutError):
+        ls.wait_for(queued, 0.05)
+    assert queued.cancelled()
+    with pytest.raises(FuturesTimeoutError):
+        ls.wait_for(running[0], 0.05)
+    st = ls.stats()["t"]
+    assert st["abandoned_live"] == 1 and st["workers"] == 1 and st["cancelled_queued"] == 1
+    # 반납된 슬롯으로 새 일이 바로 돈다
+    assert ls.run(lane, lambda: "fresh", timeout=2) == "fresh"
+    gate.set()
+    assert running[1].result(timeout=5) == "late"
+    deadline = time.time() + 5
+    while ls.stats()["t"]["abandoned_live"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert ls.stats()["t"]["abandoned_live"] == 0
+    assert sorted(flags) == [False, True]           # 포기된 일만 취소 표식을 본다
+
+
+def test_l4_pipeline_stops_at_step_boundary(lane, monkeypatch):
+    import workflow_engine
+    ran = []
+
+    def _fake_execute_ibl(tool_input, project_path, *a, **k):
+        ran.append(tool_input.get("action"))
+        time.sleep(0.15)
+        return {"success": True, "items": []}
+
+    import ibl_engine
+    monkeypatch.setattr(ibl_engine, "execute_ibl", _fake_execute_ibl)
+    steps = [{"_node": "self", "action": f"a{i}", "params": {}} for i in range(4)]
+    fut = ls.submit(lane, workflow_engine.execute_pipeline, steps, ".")
+    with pytest.raises(FuturesTimeoutError):
+        ls.wait_for(fut, 0.05)
+    out = fut.result(timeout=5)
+    assert out.get("cancelled") is True and out["success"] is False, out
+    assert ran == ["a0"], ran
+
+
+def test_l5_timeout_counts_from_start(lane):
+    gate = threading.Event()
+    busy = [ls.submit(lane, gate.wait, 5) for _ in range(2)]       # 상한 2 — 레인 포화
+    threading.Timer(0.5, gate.set).start()
+    t0 = time.time()
+    # 0.5초 줄 서도 timeout 0.2 는 실행에만 적용된다
+    assert ls.run(lane, lambda: "ok", timeout=0.2, from_start=True) == "ok"
+    assert time.time() - t0 >= 0.4
+    st = ls.stats()["t"]
+    assert st["timed_out"] == 0 and st["abandoned_live"] == 0, st
+    assert all(f.result(timeout=5) for f in busy)
+    # 시작한 뒤의 행은 여전히 제때 끊긴다
+    with pytest.raises(FuturesTimeoutError):
+        ls.run(lane, time.sleep, 5, timeout=0.2, from_start=True)
+
+
+def test_l6_nested_timeout_survives_saturation(lane, monkeypatch):
+    monkeypatch.setitem(ls.LANE_CAPS, "t", 1)       # 상한 1 — 바깥 일이 레인을 다 쥔다
+
+    def _outer():
+        t0 = time.monotonic()
+        with pytest.raises(FuturesTimeoutError):
+            ls.run(lane, time.sleep, 3, timeout=0.3, from_start=True)
+        took = time.monotonic() - t0
+        # 시간 제한 없는 중첩은 여전히 제자리 실행 — 그 안에서도 current_job() 은 자식이다
+        me = ls.current_job()
+        child = ls.submit(lane, ls.current_job).result(timeout=5)
+        return took, child is not me and child.parent is me and ls.current_job() is me
+
+    took, inline_job_ok = ls.submit(lane, _outer).result(timeout=10)
+    assert took < 1.5, took
+    assert inline_job_ok
+    st = ls.stats()["t"]
+    assert st["overflow"] == 1 and st["inline"] == 1 and st["timed_out"] == 1, st
+    assert st["abandoned_live"] == 1                # 넘침 스레드의 고아도 센다
+    deadline = time.time() + 5
+    while ls.stats()["t"]["abandoned_live"] and time.time() < deadline:
+        time.sleep(0.05)
+    assert ls.stats()["t"]["abandoned_live"] == 0
+
+    # 바깥 호출자의 큐 대기도 queue_timeout 으로 묶인다
+    gate = threading.Event()
+    busy = ls.submit(lane, gate.wait, 5)
+    try:
+        t0 = time.monotonic()
+        assert ls.run(lane, lambda: "ok", timeout=1, from_start=True, queue_timeout=0.2) == "ok"
+        assert time.monotonic() - t0 < 1.0
+        assert ls.stats()["t"]["queue_promoted"] == 1
+    finally:
+        gate.set()
+    assert busy.result(timeout=5)
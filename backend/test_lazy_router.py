@@ -0,0 +1,198 @@
+"""지연 라우터(lazy_router) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — api.py 가 api_* 라우터를 모듈 로드 때 전부 import 해, 자가수리 뒤 재시작마다 UI 가
+한 번도 안 부를 라우터의 import 를 기다렸다. 이제 매니저 주입이 없는 라우터는 자리표로 앉았다가
+첫 요청 때 올라온다. 이 배터리는 그 자리표가 **옛 라우팅과 같은 답**을 내는지를 본다 — 빠뜨리는
+경로 없이, 옛 순서대로, 웹소켓까지.
+
+    L1. 접두 — LAZY_ROUTERS 모듈의 모든 라우트가 선언한 prefixes 아래 (아니면 첫 요청이 못 깨운다)
+    L2. 첫 요청 — import 는 그때 한 번, 진짜 라우트가 자리표 자리에(뒤 앱 라우트보다 앞) 끼워진다
+    L3. 웹소켓·공유 접두 — /f 가 먼저 올라와도 /f/ws 는 다음 자리표가 받는다
+    L4. 즉시 목록·실패 — INDIEBIZ_EAGER_ROUTERS 는 그 자리 include, 실패는 503 + 원장, 고치면 회복
+    L5. 예산 — import_report 가 boot 합계를 예산과 견주고 deferred·lazy 를 가른다
+    L6. 공개 라우트 가드 — check_public_routes 가 세는 라우트 수가 전부 즉시 올린 앱과 같다
+
+실행: python3 -m pytest backend/test_lazy_router.py
+"""
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+pytest.importorskip("httpx")
+from fastapi import FastAPI  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+import boot_status  # noqa: E402
+import lazy_router  # noqa: E402
+
+_FAKE = '''\
+from fastapi import APIRouter, WebSocket
+router = APIRouter(prefix="/f")
+
+@router.get("/hello")
+def hello():
+    return {"from": "lazy"}
+
+@router.get("/{anything}")
+def catch(anything: str):
+    return {"from": "lazy-catch", "x": anything}
+'''
+
+_FAKE_WS = '''\
+from fastapi import APIRouter, WebSocket
+router = APIRouter(prefix="/f/ws")
+
+@router.websocket("/echo")
+async def echo(ws: WebSocket):
+    await ws.accept()
+    await ws.send_text("pong:" + await ws.receive_text())
+    await ws.close()
+'''
+
+
+@pytest.fixture
+def fake(tmp_path, monkeypatch):
+    """임시 모듈 둘(lz_fake·lz_fake_ws) + 원장·레지스트리 초기화"""
+    (tmp_path / "lz_fake.py").write_text(_FAKE, encoding="utf-8")
+    (tmp_path / "lz_fake_ws.py").write_text(_FAKE_WS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for mod in ("lz_fake", "lz_fake_ws"):
+        monkeypatch.delitem(sys.modules, mod, raising=False)
+    monkeypatch.setattr(lazy_router, "LAZY_ROUTERS", {
+        "fake": ("lz_fake", ("/f",), ["fake"]),
+        "fake_ws": ("lz_fake_ws", ("/f/ws",), ["fake"]),
+    })
+    monkeypatch.setattr(lazy_router, "_modules", {})
+    monkeypatch.setattr(lazy_router, "_placeholders", {})
+    monkeypatch.setattr(boot_status, "_IMPORTS", {})
+    monkeypatch.setattr(boot_status, "_ENTRIES", {})
+    monkeypatch.delenv(lazy_router.EAGER_ENV, raising=False)
+    return tmp_path
+
+
+def _app():
+    app = FastAPI()
+
+    @app.get("/before")
+    def before():
+        return {"from": "eager"}
+
+    lazy_router.mount(app, "fake")
+    lazy_router.mount(app, "fake_ws")
+
+    @app.get("/f/late")                     # 옛 순서: 라우터 include 뒤에 정의된 앱 라우트
+    def late():
+        return {"from": "app"}
+
+    return app
+
+
+def _declared_paths(router):
+    app = FastAPI()
+    app.include_router(router)
+    paths = set(app.openapi().get("paths", {}))                       # 중첩 하위 라우터 포함(http)
+    paths.update(p for p in (getattr(r, "path", None) for r in router.routes) if p)  # 웹소켓
+    return paths
+
+
+@pytest.mark.parametrize("name", sorted(lazy_router.LAZY_ROUTERS))
+def test_l1_routes_under_declared_prefixes(name):
+    module, prefixes, _tags = lazy_router.LAZY_ROUTERS[name]
+    paths = _declared_paths(importlib.import_module(module).router)
+    assert paths
+    stray = [p for p in paths if not any(p == pre or p.startswith(pre + "/") for pre in prefixes)]
+    assert not stray, f"{name}: 자리표가 깨우지 못하는 경로 {stray}"
+
+
+def test_l2_first_request_imports_and_splices(fake):
+    app = _app()
+    assert "lz_fake" not in sys.modules and lazy_router.pending() == ["fake", "fake_ws"]
+    client = TestClient(app)
+    assert client.get("/before").json() == {"from": "eager"}
+    assert "lz_fake" not in sys.modules                                # 다른 경로는 안 깨운다
+
+    assert client.get("/f/hello").json() == {"from": "lazy"}
+    assert "lz_fake" in sys.modules and lazy_router.pending() == ["fake_ws"]
+    assert client.get("/f/late").json()["from"] == "lazy-catch"        # 옛 순서대로 라우터가 먼저
+    assert not any(isinstance(r, lazy_router.LazyRouterRoute) and r.name == "fake" for r in app.routes)
+    assert any(p.startswith("/f/") for p in app.openapi()["paths"])
+
+    rep = boot_status.import_report()
+    assert [r["name"] for r in rep["lazy"]] == ["router:fake"] and rep["deferred"] == ["router:fake_ws"]
+
+
+def test_l3_websocket_behind_shared_prefix(fake):
+    client = TestClient(_app())
+    with client.websocket_connect("/f/ws/echo") as ws:
+        ws.send_text("ping")
+        assert ws.receive_text() == "pong:ping"
+    assert {"lz_fake", "lz_fake_ws"} <= set(sys.modules) and lazy_router.pending() == []
+
+
+def test_l4_eager_list_and_failure(fake, monkeypatch):
+    monkeypatch.setenv(lazy_router.EAGER_ENV, "fake")
+    app = _app()
+    assert "lz_fake" in sys.modules and lazy_router.pending() == ["fake_ws"]
+    assert boot_status.import_report()["slowest"][0]["name"] == "router:fake"
+
+    (fake / "lz_fake_ws.py").write_text("raise ImportError('boom')\n", encoding="utf-8")
+    client = TestClient(app)
+    assert client.get("/f/ws/x").status_code == 503
+    assert boot_status.failed_names() == ["router:fake_ws"] and lazy_router.pending() == ["fake_ws"]
+
+    (fake / "lz_fake_ws.py").write_text(_FAKE_WS, encoding="utf-8")
+    importlib.invalidate_caches()
+    monkeypatch.delitem(sys.modules, "lz_fake_ws", raising=False)
+    with client.websocket_connect("/f/ws/echo") as ws:
+        ws.send_text("again")
+        assert ws.receive_text() == "pong:again"
+    assert boot_status.failed_names() == []
+
+
+def test_l5_budget_report(fake, monkeypatch):
+    boot_status.record_import("api:head", 900)
+    boot_status.record_import("routers:eager", 700)
+    boot_status.record_import("router:photo", None, "deferred")
+    rep = boot_status.import_report(budget_ms=1500)
+    assert rep["boot_ms"] == 1600 and rep["over_budget"]
+    assert [r["name"] for r in rep["slowest"]] == ["api:head", "routers:eager"]
+    assert rep["deferred"] == ["router:photo"] and rep["lazy"] == []
+    assert not boot_status.import_report(budget_ms=2000)["over_budget"]
+    assert "imports" in boot_status.snapshot() and boot_status.snapshot()["ok"]
+    monkeypatch.setattr(boot_status, "BOOT_IMPORT_BUDGET_MS", 1500)
+    assert "⚠ 초과: api:head 900ms" in boot_status.import_summary()
+
+
+_COUNT = """
+import sys
+sys.path.insert(0, {scripts!r})
+import check_public_routes as c
+import lazy_router
+app = c._load_app()
+assert not any(isinstance(r, lazy_router.LazyRouterRoute) for r in app.routes), lazy_router.pending()
+print("ROUTES", c._count_routes(app))
+"""
+
+
+def _guard_count(eager):
+    backend = __file__.rsplit('/', 1)[0]
+    env = dict(os.environ)
+    env.pop(lazy_router.EAGER_ENV, None)
+    if eager:
+        env[lazy_router.EAGER_ENV] = "*"
+    scripts = os.path.join(os.path.dirname(backend), "scripts")
+    out = subprocess.run([sys.executable, "-c", "import boot_paths" + _COUNT.format(scripts=scripts)],
+                         cwd=backend, env=env, capture_output=True, text=True, timeout=120)
+    assert out.returncode == 0, out.stderr[-2000:]
+    return int(out.stdout.rsplit("ROUTES", 1)[1])
+
+
+def test_l6_public_route_guard_sees_every_router():
+    lazy, eager = _guard_count(eager=False), _guard_count(eager=True)
+    assert lazy == eager and eager >= 150                              # 자리표 뒤 라우트도 감사 대상
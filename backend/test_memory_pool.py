@@ -0,0 +1,143 @@
+"""에이전트 메모리 DB 연결 풀(memory_db._pooled) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — memory_db 는 함수마다 sqlite3.connect 를 새로 열고 get_db 마다 스키마를 다시 돌렸으며,
+vec 연결마다 sqlite-vec 를 다시 실었다. 이제 경로별 풀이 연결을 빌려 주고 스키마 확인은 경로당
+한 번이다. 이 배터리는 반복 호출이 **새 연결을 열지 않고**, 여러 스레드가 한 경로를 함께 써도
+안전하며, 파일이 바뀌면 풀이 스스로 새로 열고, 예외가 트랜잭션을 흘리지 않는지를 본다.
+
+    P1. 재사용 — 저장·검색·조회 반복에도 연결은 처음 한 개, 스키마 확인은 한 번
+    P2. 스레드 — 여러 스레드의 동시 저장·조회가 잃는 것 없이 끝나고 풀 상한을 지킨다
+    P3. 파일 교체 — DB 파일을 지우면 풀을 버리고 새 파일에 스키마를 다시 만든다
+    P4. WAL·정리 — journal_mode=wal, 예외 뒤 커밋 안 된 쓰기는 되돌려진 채 반납된다
+    P5. 놓아주기 — close_pool(프로젝트 폴더)은 그 아래 연결만 닫고, 빌려 간 연결은 반납 때 닫힌다;
+        ProjectManager 가 휴지통 이동·삭제 전에 부른다
+
+실행: python3 -m pytest backend/test_memory_pool.py
+"""
+import os
+import sqlite3
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+_MEM_PKG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                        "data", "packages", "installed", "tools", "memory")
+if _MEM_PKG not in sys.path:
+    sys.path.insert(0, _MEM_PKG)
+import memory_db  # noqa: E402
+
+
+@pytest.fixture
+def mem(tmp_path, monkeypatch):
+    """임시 프로젝트 + 빈 풀. 임베딩은 끄고(LIKE 경로) 스키마 확인 횟수를 센다."""
+    memory_db.close_pools()
+    monkeypatch.setattr(memory_db, "_embed", lambda text: None)
+    monkeypatch.setattr(memory_db, "_search_semantic", lambda *a, **k: [])
+    schema_runs = []
+    real_schema = memory_db._ensure_schema_on
+    monkeypatch.setattr(memory_db, "_ensure_schema_on",
+                        lambda conn: schema_runs.append(1) or real_schema(conn))
+    proj = tmp_path / "proj"
+    proj.mkdir()
+    yield str(proj), schema_runs
+    memory_db.close_pools()
+
+
+def _count_connects(monkeypatch):
+    real = sqlite3.connect
+    opened = []
+    monkeypatch.setattr(sqlite3, "connect", lambda *a, **k: opened.append(a) or real(*a, **k))
+    return opened
+
+
+def test_p1_repeated_calls_reuse_connection(mem, monkeypatch):
+    proj, schema_runs = mem
+    opened = _count_connects(monkeypatch)
+    for i in range(10):
+        mid = memory_db.save(proj, "agent_a", f"사과 메모 {i}", keywords="사과")
+        assert memory_db.read(proj, "agent_a", mid)["content"] == f"사과 메모 {i}"
+        assert memory_db.search(proj, "agent_a", "사과")
+    assert memory_db.count(proj, "agent_a") == 10
+    assert len(opened) == 1 and len(schema_runs) == 1
+
+
+def test_p2_concurrent_checkout_is_safe(mem):
+    proj, _runs = mem
+    errors = []
+
+    def _work(t):
+        try:
+            for i in range(15):
+                mid = memory_db.save(proj, "agent_a", f"스레드 {t} 메모 {i}")
+                assert memory_db.read(proj, "agent_a", mid) is not None
+        except Exception as e:                                       # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=_work, args=(t,)) for t in range(8)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert errors == []
+    assert memory_db.count(proj, "agent_a") == 8 * 15
+    key = memory_db._path_key(memory_db._get_db_path(proj, "agent_a"))
+    assert len(memory_db._pools[key]) <= memory_db._MAX_POOL_SIZE
+
+
+def test_p3_replaced_file_resets_pool(mem):
+    proj, schema_runs = mem
+    memory_db.save(proj, "agent_a", "지워질 메모")
+    db_path = memory_db._get_db_path(proj, "agent_a")
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    assert memory_db.count(proj, "agent_a") == 0                    # no such table 로 죽지 않는다
+    assert len(schema_runs) == 2
+    memory_db.save(proj, "agent_a", "새 파일 메모")
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT content FROM memories").fetchall() == [("새 파일 메모",)]
+    conn.close()
+
+
+def test_p4_wal_and_rollback_on_error(mem):
+    proj, _runs = mem
+    db_path = memory_db._get_db_path(proj, "agent_a")
+    with memory_db._pooled(db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with pytest.raises(RuntimeError):
+        with memory_db._pooled(db_path) as conn:
+            conn.execute("INSERT INTO memories (content) VALUES ('반쯤 쓴 것')")
+            raise RuntimeError("중간에 실패")
+    assert not conn.in_transaction                                  # 되돌린 채 풀로
+    assert memory_db.count(proj, "agent_a") == 0
+    memory_db.set_meta(db_path, "last_consolidated", "2026-10-16")
+    assert memory_db.get_meta(db_path, "last_consolidated") == "2026-10-16"
+
+
+def test_p5_close_pool_releases_project_files(mem, tmp_path, monkeypatch):
+    proj, _runs = mem
+    other = tmp_path / "other"
+    other.mkdir()
+    memory_db.save(proj, "agent_a", "a")
+    memory_db.save(proj, "agent_b", "b")
+    memory_db.save(str(other), "agent_a", "c")
+    key_a = memory_db._path_key(memory_db._get_db_path(proj, "agent_a"))
+    key_o = memory_db._path_key(memory_db._get_db_path(str(other), "agent_a"))
+    with memory_db._pooled(key_a) as borrowed:
+        memory_db.close_pool(proj)
+        assert key_a not in memory_db._pools and key_o in memory_db._pools
+    assert key_a not in memory_db._pools                            # 빌려 간 것은 돌아오지 않고 닫혔다
+    with pytest.raises(sqlite3.ProgrammingError):
+        borrowed.execute("SELECT 1")
+    assert memory_db.count(proj, "agent_a") == 1                    # 다음 호출은 새로 연다
+
+    import project_manager
+    released = []
+    real = memory_db.close_pool
+    monkeypatch.setattr(memory_db, "close_pool", lambda path: released.append(path) or real(path))
+    project_manager._release_db_handles(tmp_path / "proj")
+    assert released == [str(tmp_path / "proj")] and key_a not in memory_db._pools
@@ -0,0 +1,120 @@
+"""NAS 파일 서빙(api_nas.get_file) Range·charset 회귀 테스트 (2026-10-16)
+
+왜 있는가 — get_file 은 Range 를 64KB 파이썬 제너레이터로 흘렸고, 그 전에 텍스트 파일(≤10MB)을
+인코딩 네 벌로 통째 디코드했으며, exists/is_dir/stat 을 async 핸들러 안에서 따로 불렀다. 이제 본문은
+FileResponse(다중 Range·If-Range·ETag)가 보내고 경로 검증·stat·charset 감지는 스레드풀에서 한 번이다.
+이 배터리는 Range 계약이 **그대로이거나 넓어졌고**, charset 감지가 앞부분만 읽고 캐시되는지를 본다.
+
+    F1. 단일 Range — 206·Content-Range·본문 일치, 범위 밖은 416
+    F2. 다중 Range — multipart/byteranges 로 두 조각
+    F3. If-Range — 같은 ETag 면 206, 다른 ETag 면 전체 200
+    F4. charset — cp949 한글 감지, 앞부분만 읽음, (inode, mtime) 캐시
+    F5. 캐시 경합 — 다른 요청이 먼저 비운 키를 다시 비워도 감지가 실패하지 않는다
+
+실행: python3 -m pytest backend/test_nas_file_serving.py
+"""
+import sys
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+pytest.importorskip("httpx")
+from datetime import datetime, timedelta  # noqa: E402
+
+from fastapi import FastAPI  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+import api_nas  # noqa: E402
+
+_BODY = bytes(range(256)) * 40          # 10240 바이트
+
+
+@pytest.fixture
+def nas(tmp_path, monkeypatch):
+    """허용 경로 = tmp, 세션 하나, 파일 둘(바이너리·cp949 텍스트)."""
+    monkeypatch.setattr(api_nas, "load_config",
+                        lambda: {**api_nas.DEFAULT_CONFIG, "enabled": True,
+                                 "allowed_paths": [str(tmp_path)]})
+    monkeypatch.setitem(api_nas.sessions, "tok", {"expires_at": datetime.now() + timedelta(hours=1)})
+    monkeypatch.setattr(api_nas, "_charset_cache", {})
+    (tmp_path / "movie.mp4").write_bytes(_BODY)
+    (tmp_path / "memo.txt").write_bytes(("가나다 한글 메모\n" * 5000).encode("cp949"))
+    app = FastAPI()
+    app.include_router(api_nas.router)
+    client = TestClient(app)
+    client.headers["X-NAS-Session"] = "tok"
+    return client, tmp_path
+
+
+def _get(client, path, **headers):
+    return client.get("/nas/file", params={"path": str(path)}, headers=headers)
+
+
+def test_f1_single_range(nas):
+    client, root = nas
+    r = _get(client, root / "movie.mp4", range="bytes=100-299")
+    assert r.status_code == 206 and r.content == _BODY[100:300]
+    assert r.headers["content-range"] == f"bytes 100-299/{len(_BODY)}"
+    assert _get(client, root / "movie.mp4").content == _BODY
+    assert _get(client, root / "movie.mp4", range=f"bytes={len(_BODY) + 5}-").status_code == 416
+    assert _get(client, root / "nope.mp4").status_code == 404
+    assert client.get("/nas/file", params={"path": str(root)}).status_code == 400
+
+
+def test_f2_multi_range(nas):
+    client, root = nas
+    r = _get(client, root / "movie.mp4", range="bytes=0-9,500-509")
+    assert r.status_code == 206
+    assert r.headers["content-type"].startswith("multipart/byteranges")
+    assert _BODY[0:10] in r.content and _BODY[500:510] in r.content
+
+
+def test_f3_if_range(nas):
+    client, root = nas
+    etag = _get(client, root / "movie.mp4").headers["etag"]
+    assert _get(client, root / "movie.mp4", range="bytes=0-9", **{"if-range": etag}).status_code == 206
+    r = _get(client, root / "movie.mp4", range="bytes=0-9", **{"if-range": '"stale"'})
+    assert r.status_code == 200 and r.content == _BODY
+
+
+def test_f4_charset_sniff_bounded_and_cached(nas, monkeypatch):
+    client, root = nas
+    r = _get(client, root / "memo.txt", range="bytes=0-99")
+    assert "charset=cp949" in r.headers["content-type"]
+    read_sizes = []
+    real_open = open
+
+    def _spy(path, mode="r", *a, **k):
+        f = real_open(path, mode, *a, **k)
+        if "b" in mode and str(path).endswith("memo.txt"):
+            real_read = f.read
+            f.read = lambda n=-1: read_sizes.append(n) or real_read(n)
+        return f
+
+    monkeypatch.setattr(api_nas, "_charset_cache", {})
+    monkeypatch.setattr("builtins.open", _spy)
+    st = (root / "memo.txt").stat()
+    assert api_nas.sniff_charset(root / "memo.txt", st) == "cp949"
+    assert read_sizes == [api_nas.CHARSET_SNIFF_BYTES] and st.st_size > api_nas.CHARSET_SNIFF_BYTES
+    assert api_nas.sniff_charset(root / "memo.txt", st) == "cp949" and len(read_sizes) == 1
+
+
+class _RacyCache(dict):
+    """비울 키 목록을 뜬 직후 다른 요청이 첫 키를 먼저 비운 것처럼 군다."""
+
+    def __iter__(self):
+        keys = list(dict.__iter__(self))
+        if keys:
+            dict.pop(self, keys[0])
+        return iter(keys)
+
+
+def test_f5_charset_cache_eviction_race(nas, monkeypatch):
+    _client, root = nas
+    monkeypatch.setattr(api_nas, "_CHARSET_CACHE_MAX", 4)
+    monkeypatch.setattr(api_nas, "_charset_cache", _RacyCache({(0, i, 0, 0): "utf-8" for i in range(4)}))
+    st = (root / "memo.txt").stat()
+    assert api_nas.sniff_charset(root / "memo.txt", st) == "cp949"
+    assert len(api_nas._charset_cache) == 3                          # 절반 비우고 새 키 하나
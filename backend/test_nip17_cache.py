@@ -0,0 +1,112 @@
+"""NIP-17 대화키 캐시·서명 검증 메모·묶음 언랩(nip17) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — unwrap_dm 이 한 통마다 nip44.get_conversation_key 를 두 번(= secp256k1 ECDH 두 번)
+불렀고, 그중 seal 층은 같은 상대와는 늘 같은 키였다. 오프라인 뒤 밀린 DM 수천 통이 분 단위로
+걸렸다. 이제 seal 층 키는 LRU 로, gift wrap 서명 검증은 (id, sig) 별 한 번, backlog 는 cpu
+레인에 나눠 푼다. 이 배터리는 그 캐시들이 **옛 unwrap 과 같은 답**을 내면서 ECDH·검증을 덜
+하는지를 본다.
+
+    K1. 같은 값 — conversation_key 는 nip44 와 같은 바이트, 왕복 그대로, LRU 상한 지킴
+    K2. ECDH 횟수 — 같은 발신자 20통 = 임시키 층 20 + seal 층 1
+    K3. 서명 — 같은 이벤트 재검증은 메모, 본문만 바꿔 끼운 위조는 메모를 못 탄다
+    K4. 묶음 — unwrap_many 가 입력 순서·중복·실패(None)를 지키며 cpu 레인에 나눠 낸다
+
+실행: python3 -m pytest backend/test_nip17_cache.py
+"""
+import sys
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+pytest.importorskip("pynostr")
+from pynostr.key import PrivateKey  # noqa: E402
+
+import lane_scheduler  # noqa: E402
+import nip17  # noqa: E402
+import nip44  # noqa: E402
+
+
+@pytest.fixture
+def keys():
+    nip17.clear_caches()
+    me, alice, bob = PrivateKey(), PrivateKey(), PrivateKey()
+    yield me.hex(), me.public_key.hex(), alice.hex(), bob.hex()
+    nip17.clear_caches()
+
+
+@pytest.fixture
+def ecdh_calls(monkeypatch):
+    calls = []
+    real = nip44.get_conversation_key
+    monkeypatch.setattr(nip17.nip44, "get_conversation_key",
+                        lambda priv, pub: calls.append(pub) or real(priv, pub))
+    return calls
+
+
+def test_k1_same_bytes_and_lru_bound(keys, monkeypatch):
+    me, me_pub, alice, bob = keys
+    alice_pub = PrivateKey.from_hex(alice).public_key.hex()
+    assert nip17.conversation_key(me, alice_pub) == nip44.get_conversation_key(me, alice_pub)
+    assert nip17.conversation_key(me, alice_pub.upper()) is nip17.conversation_key(me, alice_pub)
+
+    out = nip17.unwrap_dm(me, nip17.wrap_dm(alice, me_pub, "안녕 ✓"))
+    assert out["sender"] == alice_pub and out["content"] == "안녕 ✓"
+
+    monkeypatch.setattr(nip17, "CONV_KEY_CACHE_MAX", 2)
+    for _ in range(3):
+        nip17.conversation_key(me, PrivateKey().public_key.hex())
+    assert nip17.cache_stats()["conv_keys"] == 2
+
+
+def test_k2_seal_ecdh_once_per_sender(keys, ecdh_calls):
+    me, me_pub, alice, _bob = keys
+    wraps = [nip17.wrap_dm(alice, me_pub, f"메시지 {i}") for i in range(20)]
+    nip17.clear_caches()
+    ecdh_calls.clear()
+    got = [nip17.unwrap_dm(me, w)["content"] for w in wraps]
+    assert got == [f"메시지 {i}" for i in range(20)]
+    assert len(ecdh_calls) == 21                                     # 옛 구현이면 40
+    st = nip17.cache_stats()
+    assert (st["conv_key_miss"], st["conv_key_hit"]) == (1, 19)
+
+
+def test_k3_verify_memo_and_tamper(keys):
+    me, me_pub, alice, _bob = keys
+    wrap = nip17.wrap_dm(alice, me_pub, "검증")
+    assert nip17.verify_event(wrap) and nip17.verify_event(dict(wrap))   # 두 번째 릴레이 사본
+    st = nip17.cache_stats()
+    assert (st["verify_miss"], st["verify_hit"]) == (1, 1)
+
+    other = nip17.wrap_dm(alice, me_pub, "위조")
+    forged = dict(wrap, content=other["content"], pubkey=other["pubkey"])
+    assert not nip17.verify_event(forged)                            # id·sig 그대로여도 메모를 못 탄다
+    with pytest.raises(ValueError, match="서명"):
+        nip17.unwrap_dm(me, forged)
+    assert nip17.unwrap_dm(me, forged, verify=False)["content"] == "위조"   # 옛 동작(검증 없음)
+
+
+def test_k4_unwrap_many_batches_on_cpu_lane(keys, monkeypatch):
+    me, me_pub, alice, bob = keys
+    other_pub = PrivateKey().public_key.hex()
+    wraps = [nip17.wrap_dm(alice if i % 2 else bob, me_pub, f"밀린 {i}") for i in range(24)]
+    batch = wraps + [wraps[3], {"kind": 1, "id": "x"}, nip17.wrap_dm(alice, other_pub, "남의 것")]
+
+    submitted = []
+    real_submit = lane_scheduler.submit
+    monkeypatch.setattr(lane_scheduler, "submit",
+                        lambda lane, fn, chunk, **kw: submitted.append((lane, len(chunk))) or
+                        real_submit(lane, fn, chunk, **kw))
+    nip17.clear_caches()
+    out = nip17.unwrap_many(me, batch)
+    assert [o["content"] for o in out[:24]] == [f"밀린 {i}" for i in range(24)]
+    assert out[24] == out[3] and out[25] is None and out[26] is None
+    assert submitted and {lane for lane, _ in submitted} == {"cpu"}
+    assert sum(n for _, n in submitted) == 26                        # 중복 wraps[3] 은 한 번만
+    st = nip17.cache_stats()
+    assert st["conv_key_miss"] + st["conv_key_hit"] == 24            # 남의 것은 wrap 층에서 떨어진다
+    assert 2 <= st["conv_key_miss"] <= 2 * len(submitted)            # 발신자당 (구간마다 많아야) 한 번
+
+    submitted.clear()
+    assert nip17.unwrap_many(me, wraps[:3])[2]["content"] == "밀린 2" and not submitted  # 작은 묶음은 그 자리에서
@@ -0,0 +1,235 @@
+"""Nostr 릴레이 상주 연결 풀(nostr_relay_pool) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — IndieNet._query_relays·_publish_event 가 호출마다 릴레이별 WebSocketApp + 스레드를
+새로 열었고 ChannelPoller 는 제 리스너 소켓을 따로 들었다. 이제 셋 다 URL 당 연결 하나를 나눠
+쓴다. 이 배터리는 메모리 속 가짜 릴레이(WebSocketApp 대역)로 그 풀이 **옛 조회·발행과 같은 답**을
+내면서 핸드셰이크를 한 번만 치르는지를 본다.
+
+    R1. 다중화 — 조회 여러 번·동시 조회·발행이 릴레이당 연결 하나, 구독 ID 는 제각각, 끝나면 CLOSE
+    R2. EOSE·점수 — 전 릴레이 EOSE 면 즉시, 죽은 릴레이는 backoff 뒤 기다리지 않고, 느린 릴레이는 점수로 뺀다
+    R3. 재연결 — 상주 구독은 끊기면 backoff 로 다시 붙어 (새로 만든) REQ 를 다시 보내고, 닫으면 CLOSE
+    R4. 믹스인 — IndieNet _query_relays 가 릴레이 간 중복을 한 번만 accept, _publish_event 는 첫 OK id
+    R5. 상주 구독 콜백은 소켓 스레드 밖 — 그 안에서 낸 발행이 제 OK 를 읽고, backoff 중 발행은 즉시 재시도
+
+실행: python3 -m pytest backend/test_nostr_relay_pool.py
+"""
+import json
+import queue
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import nostr_relay_pool as nrp  # noqa: E402
+
+
+class _Relay:
+    """메모리 속 릴레이 — kinds 만 보는 필터, EOSE 전 delay 초 지연"""
+
+    def __init__(self, events=(), delay=0.0, down=False):
+        self.events = list(events)
+        self.delay = delay
+        self.down = down
+        self.frames = []            # 받은 프레임 (REQ·CLOSE·EVENT)
+
+    def reply(self, frame):
+        self.frames.append(frame)
+        if frame[0] == "REQ":
+            sid, filters = frame[1], frame[2:]
+            for ev in self.events:
+                if any(ev["kind"] in f.get("kinds", [ev["kind"]]) for f in filters):
+                    yield ["EVENT", sid, ev]
+            if self.delay:
+                time.sleep(self.delay)
+            yield ["EOSE", sid]
+        elif frame[0] == "EVENT":
+            yield ["OK", frame[1]["id"], True, ""]
+
+
+class _FakeApp:
+    """websocket.WebSocketApp 대역 — 콜백은 run_forever 스레드에서(진짜처럼)"""
+    relays = {}
+    opened = []
+
+    def __init__(self, url, on_open=None, on_message=None, on_error=None, on_close=None):
+        self.url, self.on_open, self.on_message, self.on_error = url, on_open, on_message, on_error
+        self._inbox = queue.Queue()
+
+    def run_forever(self, **kw):
+        relay = self.relays[self.url]
+        if relay.down:
+            self.on_error(self, ConnectionRefusedError("down"))
+            return
+        _FakeApp.opened.append(self.url)
+        self.on_open(self)
+        while True:
+            frame = self._inbox.get()
+            if frame is None:
+                return
+            for out in relay.reply(frame):
+                self.on_message(self, json.dumps(out))
+
+    def send(self, data):
+        self._inbox.put(json.loads(data))
+
+    def close(self, **kw):
+        self._inbox.put(None)
+
+
+def _ev(i, kind=1):
+    return {"id": f"e{i}", "kind": kind, "pubkey": "p", "content": f"글{i}", "tags": [], "created_at": i}
+
+
+@pytest.fixture
+def relays(monkeypatch):
+    """가짜 전송 계층 + 새 풀. → {url: _Relay} (테스트가 채운다)"""
+    table = {}
+    monkeypatch.setattr(_FakeApp, "relays", table)
+    monkeypatch.setattr(_FakeApp, "opened", [])
+    monkeypatch.setattr(nrp, "websocket", SimpleNamespace(WebSocketApp=_FakeApp))
+    monkeypatch.setattr(nrp, "BACKOFF_BASE", 0.05)
+    monkeypatch.setattr(nrp, "_pool", None)
+    yield table
+    nrp.pool().close_all()
+
+
+def _accept(ev):
+    return {"id": ev["id"], "content": ev["content"]}
+
+
+def test_r1_one_connection_per_relay(relays):
+    relays["wss://a"] = _Relay([_ev(1), _ev(2)])
+    relays["wss://b"] = _Relay([_ev(2), _ev(3)])
+    urls = ["wss://a", "wss://b/"]                                   # 끝 슬래시는 같은 릴레이
+    for _ in range(3):
+        got = nrp.query(urls, {"kinds": [1]}, _accept, timeout=2)
+        assert sorted(g["id"] for g in got) == ["e1", "e2", "e3"]
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(nrp.query(urls, {"kinds": [1]}, _accept)))
+               for _ in range(4)]
+    [t.start() for t in threads]
+    [t.join(5) for t in threads]
+    assert [len(r) for r in results] == [3, 3, 3, 3]
+
+    assert nrp.publish(urls, _ev(9)) == ("e9", 2)
+    assert sorted(_FakeApp.opened) == ["wss://a", "wss://b"]          # 핸드셰이크 릴레이당 한 번
+    reqs = [f[1] for f in relays["wss://a"].frames if f[0] == "REQ"]
+    closes = [f[1] for f in relays["wss://a"].frames if f[0] == "CLOSE"]
+    assert len(set(reqs)) == len(reqs) == 7 and sorted(closes) == sorted(reqs)
+    assert nrp.stats()["wss://a"]["subs"] == 0 and nrp.stats()["wss://a"]["state"] == "open"
+
+
+def test_r2_eose_tracking_and_scoring(relays, monkeypatch):
+    relays["wss://fast"] = _Relay([_ev(1)])
+    relays["wss://dead"] = _Relay(down=True)
+    t0 = time.monotonic()
+    assert [g["id"] for g in nrp.query(["wss://fast"], {"kinds": [1]}, _accept, grace=5)] == ["e1"]
+    assert time.monotonic() - t0 < 1                                  # 전원 EOSE — grace 를 안 기다린다
+
+    for _ in range(nrp.DEAD_AFTER):                                   # 조회마다 연결 시도 한 번씩 실패
+        nrp.query(["wss://fast", "wss://dead"], {"kinds": [1]}, _accept, grace=0.2)
+        time.sleep(0.1)
+    dead = nrp.pool().conn("wss://dead")
+    assert dead.failures >= nrp.DEAD_AFTER and not dead.waits()
+    t0 = time.monotonic()
+    assert len(nrp.query(["wss://fast", "wss://dead"], {"kinds": [1]}, _accept, grace=5)) == 1
+    assert time.monotonic() - t0 < 1                                  # 죽은 릴레이는 기다리지 않는다
+
+    relays["wss://slow"] = _Relay([_ev(2)], delay=0.4)
+    nrp.query(["wss://slow"], {"kinds": [1]}, _accept, timeout=2)      # 점수 쌓기 (~400ms)
+    assert nrp.stats()["wss://slow"]["latency_ms"] >= 350
+    monkeypatch.setattr(nrp, "SLOW_MS", 200)
+    t0 = time.monotonic()
+    got = nrp.query(["wss://fast", "wss://slow"], {"kinds": [1]}, _accept, grace=5)
+    assert time.monotonic() - t0 < 0.35 and "e1" in {g["id"] for g in got}  # 느린 릴레이 EOSE 를 안 기다렸다
+
+
+def test_r3_persistent_subscription_reconnects(relays):
+    relays["wss://a"] = _Relay([_ev(1, kind=4)])
+    built, seen, opens = [], [], []
+
+    def filters():
+        built.append(1)
+        return [{"kinds": [4], "since": len(built)}, {"kinds": [1059], "limit": 50}]
+
+    sub = nrp.subscribe(["wss://a"], filters, lambda ev, url: seen.append(ev["id"]),
+                        on_open=opens.append, persistent=True, prefix="dm")
+    deadline = time.monotonic() + 2
+    while not seen and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert seen == ["e1"] and opens == ["wss://a"]
+
+    relays["wss://a"].events.append(_ev(2, kind=4))
+    nrp.pool().reconnect("wss://a")                                   # 하이버네이션 감지와 같은 경로
+    deadline = time.monotonic() + 2
+    while len(seen) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert seen == ["e1", "e2"] and opens == ["wss://a", "wss://a"]   # e1 재수신은 dedupe
+    assert len(built) == 2 and _FakeApp.opened == ["wss://a", "wss://a"]
+    reqs = [f for f in relays["wss://a"].frames if f[0] == "REQ"]
+    assert [r[2]["since"] for r in reqs] == [1, 2] and reqs[0][1] == reqs[1][1] == sub.sid
+
+    sub.close()
+    time.sleep(0.05)
+    assert relays["wss://a"].frames[-1] == ["CLOSE", sub.sid]
+    conn = nrp.pool().conn("wss://a")
+    conn.last_used -= 10
+    assert conn.close_if_idle(5)                                      # 걸린 게 없으면 닫힌다
+
+
+def test_r4_indienet_mixin_uses_pool(relays):
+    from indienet_relay import IndieNetRelayMixin
+
+    relays["wss://a"] = _Relay([_ev(1), _ev(2)])
+    relays["wss://b"] = _Relay([_ev(2)])
+    calls = []
+
+    class _Net(IndieNetRelayMixin):
+        settings = SimpleNamespace(relays=["wss://a", "wss://b"])
+
+    def accept(ev):
+        calls.append(ev["id"])
+        return None if ev["id"] == "e1" else _accept(ev)
+
+    net = _Net()
+    assert net._query_relays({"kinds": [1]}, accept) == [{"id": "e2", "content": "글2"}]
+    assert sorted(calls) == ["e1", "e2"]                              # 두 릴레이의 e2 는 한 번만
+    assert net._publish_event(_ev(7)) == "e7"
+    assert net._publish_event(_ev(8), relays=["wss://b"]) == "e8"
+    assert sorted(_FakeApp.opened) == ["wss://a", "wss://b"]
+
+
+def test_r5_publish_from_persistent_callback(relays, monkeypatch):
+    relays["wss://a"] = _Relay([_ev(1, kind=4)])
+    replies = []
+
+    def on_event(ev, url):                                            # DM 리스너 → 답장 발행
+        replies.append(nrp.publish(["wss://a"], _ev(f"reply{ev['id']}"), timeout=2, linger=0.5))
+
+    sub = nrp.subscribe(["wss://a"], {"kinds": [4]}, on_event, persistent=True, prefix="dm")
+    deadline = time.monotonic() + 3
+    while not replies and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert replies == [("ereplye1", 1)]
+    assert nrp.query(["wss://a"], {"kinds": [1]}, _accept, timeout=1) == []   # 소켓은 그새도 답한다
+    sub.close()
+
+    relays["wss://b"] = _Relay(down=True)
+    monkeypatch.setattr(nrp, "BACKOFF_BASE", 30.0)
+    keep = nrp.subscribe(["wss://b"], {"kinds": [4]}, lambda ev, url: None, persistent=True)
+    conn = nrp.pool().conn("wss://b")
+    deadline = time.monotonic() + 2
+    while conn.state != "backoff" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert conn.state == "backoff"
+    relays["wss://b"].down = False
+    t0 = time.monotonic()
+    assert nrp.publish(["wss://b"], _ev(5), timeout=2, linger=0) == ("e5", 1)
+    assert time.monotonic() - t0 < 1                                  # 30초 backoff 를 기다리지 않았다
+    keep.close()
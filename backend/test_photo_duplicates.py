@@ -0,0 +1,156 @@
+"""사진 중복 탐지 단계식 해시(photo_db.iter_duplicate_groups) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — get_duplicates 가 같은 크기 묶음마다 질의하고 후보마다 첫 64KB MD5 를 계산해, 앞부분만
+같은 파일을 중복으로 묶었고 해시는 mtime 없이 남아 다시 쓰였다. 이제 크기 → 앞·뒤 표본 → 전체
+해시 순으로 좁히고, 해시는 (크기, mtime_ns) 도장과 함께 저장된다. 이 배터리는 **진짜 같은 것만**
+묶이고, 바뀌지 않은 파일은 다시 읽지 않으며, 그룹을 페이지로 나눠 받을 수 있는지를 본다.
+
+    D1. 단계 — 앞만 같은 것은 표본에서, 앞·뒤만 같은 큰 파일은 전체 해시에서 갈린다 (해시는 cpu 레인)
+    D2. 해시 캐시 — 재조회는 읽기 0회, 건드린 파일 하나만 다시 읽는다
+    D3. 이관 — 옛 DB 에 컬럼이 생기고 첫 64KB 시절 md5_hash 는 비워진다
+    D4. 페이지 — limit/offset 은 큰 크기부터 같은 순서, has_more 로 다음 페이지를 알린다
+    D5. 창 — 해시 일은 HASH_INFLIGHT 개씩만 레인에 올라가고 결과는 입력 순서
+
+실행: python3 -m pytest backend/test_photo_duplicates.py
+"""
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+_PHOTO_PKG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                          "data", "packages", "installed", "tools", "photo-manager")
+if _PHOTO_PKG not in sys.path:
+    sys.path.insert(0, _PHOTO_PKG)
+import photo_db  # noqa: E402
+import scanner  # noqa: E402
+
+_BIG = 3 * photo_db.SAMPLE_BYTES
+
+
+def _write(path, head, middle, tail, size=_BIG):
+    body = head * photo_db.SAMPLE_BYTES
+    body += middle * (size - 2 * photo_db.SAMPLE_BYTES)
+    body += tail * photo_db.SAMPLE_BYTES
+    path.write_bytes(body)
+
+
+@pytest.fixture
+def lib(tmp_path, monkeypatch):
+    """임시 스캔 저장소 + 중복 후보 폴더. 해시 함수는 읽은 경로를 센다."""
+    monkeypatch.setattr(photo_db, "SCANS_DIR", str(tmp_path / "scans"))
+    monkeypatch.setattr(photo_db, "SCANS_JSON", str(tmp_path / "scans" / "scans.json"))
+    monkeypatch.setattr(photo_db, "_hash_cols_ready", set())
+    monkeypatch.setattr(scanner, "extract_photo_metadata", lambda fp: {})
+    monkeypatch.setattr(scanner, "extract_video_metadata", lambda fp: {})
+    reads = []
+    for name in ("_sample_md5", "_full_md5"):
+        real = getattr(photo_db, name)
+        monkeypatch.setattr(photo_db, name,
+                            lambda p, *a, _r=real, _n=name: reads.append((_n, os.path.basename(p)))
+                            or _r(p, *a))
+    root = tmp_path / "photos"
+    root.mkdir()
+    _write(root / "a1.mp4", b"A", b"m", b"Z")
+    _write(root / "a2.mp4", b"A", b"m", b"Z")                       # a1 과 진짜 중복
+    _write(root / "a3.mp4", b"A", b"x", b"Z")                       # 앞·뒤만 같다
+    _write(root / "a4.mp4", b"A", b"m", b"Y")                       # 앞만 같다
+    (root / "s1.jpg").write_bytes(b"small" * 10)
+    (root / "s2.jpg").write_bytes(b"small" * 10)                    # 작은 중복
+    (root / "s3.jpg").write_bytes(b"SMALL" * 10)
+    scan_id = photo_db.get_or_create_scan("photos", str(root))
+    scanner.scan_media(str(root), scan_id)
+    return root, scan_id, reads
+
+
+def _names(result):
+    return [sorted(f["filename"] for f in g["files"]) for g in result["groups"]]
+
+
+def test_d1_staged_hashing_only_true_duplicates(lib, monkeypatch):
+    root, _scan_id, reads = lib
+    lanes = []
+    real = photo_db.lane_scheduler.submit
+    monkeypatch.setattr(photo_db.lane_scheduler, "submit",
+                        lambda lane, fn, *a, **kw: lanes.append(lane) or real(lane, fn, *a, **kw))
+    res = photo_db.get_duplicates(str(root))
+    assert lanes and set(lanes) == {"cpu"}                           # 제 풀 없이 엔진 cpu 레인
+    assert _names(res) == [["a1.mp4", "a2.mp4"], ["s1.jpg", "s2.jpg"]]
+    assert res["total_duplicates"] == 2 and res["complete"] is True
+    full_big = sorted(n for kind, n in reads if kind == "_full_md5" and n.endswith(".mp4"))
+    assert full_big == ["a1.mp4", "a2.mp4", "a3.mp4"]               # a4 는 표본에서 탈락
+
+
+def test_d2_hash_cache_reused_until_file_changes(lib):
+    root, _scan_id, reads = lib
+    photo_db.get_duplicates(str(root))
+    reads.clear()
+    res = photo_db.get_duplicates(str(root))
+    assert reads == [] and res["hash_calculated"] == 0
+    st = os.stat(root / "a2.mp4")
+    os.utime(root / "a2.mp4", ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    res = photo_db.get_duplicates(str(root))
+    assert sorted(n for _k, n in reads) == ["a2.mp4", "a2.mp4"]    # 표본 + 전체, 그 파일만
+    assert _names(res)[0] == ["a1.mp4", "a2.mp4"]
+
+
+def test_d3_legacy_db_migrated(lib, monkeypatch):
+    root, scan_id, _reads = lib
+    conn = sqlite3.connect(photo_db._get_db_path(scan_id))
+    conn.execute("CREATE TABLE old AS SELECT id, path, filename, extension, size, mtime, md5_hash, "
+                 "media_type, width, height, taken_date, camera_make, camera_model, gps_lat, gps_lon, "
+                 "duration, fps, codec FROM media_files")
+    conn.execute("DROP TABLE media_files")
+    conn.execute("ALTER TABLE old RENAME TO media_files")
+    conn.execute("UPDATE media_files SET md5_hash = 'head-only'")
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(photo_db, "_hash_cols_ready", set())
+    assert _names(photo_db.get_duplicates(str(root))) == [["a1.mp4", "a2.mp4"], ["s1.jpg", "s2.jpg"]]
+    conn = sqlite3.connect(photo_db._get_db_path(scan_id))
+    assert conn.execute("SELECT COUNT(*) FROM media_files WHERE md5_hash = 'head-only'").fetchone()[0] == 0
+    conn.close()
+
+
+def test_d4_paging_and_stream_order(lib):
+    root, scan_id, _reads = lib
+    first = photo_db.get_duplicates(str(root), offset=0, limit=1)
+    assert _names(first) == [["a1.mp4", "a2.mp4"]] and first["has_more"] is True
+    second = photo_db.get_duplicates(str(root), offset=1, limit=1)
+    assert _names(second) == [["s1.jpg", "s2.jpg"]] and second["has_more"] is False
+    streamed = [sorted(f["filename"] for f in g["files"])
+                for g in photo_db.iter_duplicate_groups(scan_id)]
+    assert streamed == _names(first) + _names(second)
+
+
+def test_d5_hash_jobs_bounded_in_lane(monkeypatch):
+    out = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    real = photo_db.lane_scheduler.submit
+
+    def _done(_f):
+        with lock:
+            out["now"] -= 1
+
+    def _submit(lane, fn, *a, **kw):                                 # 레인에 올라가 있는(안 끝난) 일 수
+        with lock:
+            out["now"] += 1
+            out["peak"] = max(out["peak"], out["now"])
+        fut = real(lane, fn, *a, **kw)
+        fut.add_done_callback(_done)
+        return fut
+
+    monkeypatch.setattr(photo_db.lane_scheduler, "submit", _submit)
+
+    def _job(i):
+        time.sleep(0.01)
+        return i
+
+    assert photo_db._lane_map(_job, list(range(40))) == list(range(40))
+    assert out["peak"] <= photo_db.HASH_INFLIGHT
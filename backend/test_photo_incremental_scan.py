@@ -0,0 +1,113 @@
+"""사진 폴더 증분 재스캔(scanner.scan_media) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — scan_media 가 매번 clear_scan_data 후 전 파일의 EXIF/ffprobe 를 다시 뽑아, 몇백 장만
+바뀐 30만 장 NAS 재스캔도 몇 시간이 걸렸다. 이제 걸음의 path+size+mtime 을 기존 media_files 와
+견준다. 이 배터리는 재스캔이 **바뀐 것만** 다시 뽑고, id·해시가 유지되며, 사라진 파일은 지우되
+열지 못한 폴더 아래는 남기는지를 본다.
+
+    I1. 무변화 재스캔 — 추출 0회, 진행률 total 0, 통계는 그대로
+    I2. 추가·변경·삭제 — 새 파일과 바뀐 파일만 추출, 바뀐 행의 id 유지, 사라진 행 삭제
+    I3. 못 연 폴더 — 그 아래 기존 행은 지우지 않는다
+    I4. full=True — 예전처럼 비우고 전부 다시 뽑는다
+
+실행: python3 -m pytest backend/test_photo_incremental_scan.py
+"""
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+_PHOTO_PKG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                          "data", "packages", "installed", "tools", "photo-manager")
+if _PHOTO_PKG not in sys.path:
+    sys.path.insert(0, _PHOTO_PKG)
+import photo_db  # noqa: E402
+import scanner  # noqa: E402
+
+
+@pytest.fixture
+def lib(tmp_path, monkeypatch):
+    """임시 스캔 저장소 + 사진 폴더. 메타데이터 추출은 호출만 센다."""
+    monkeypatch.setattr(photo_db, "SCANS_DIR", str(tmp_path / "scans"))
+    monkeypatch.setattr(photo_db, "SCANS_JSON", str(tmp_path / "scans" / "scans.json"))
+    extracted = []
+    monkeypatch.setattr(scanner, "extract_photo_metadata",
+                        lambda fp: extracted.append(os.path.basename(fp)) or {"width": 10})
+    monkeypatch.setattr(scanner, "extract_video_metadata",
+                        lambda fp: extracted.append(os.path.basename(fp)) or {"duration": 1.0})
+    root = tmp_path / "photos"
+    (root / "2026").mkdir(parents=True)
+    for i in range(5):
+        (root / "2026" / f"p{i}.jpg").write_bytes(b"x" * (i + 1))
+    (root / "clip.mp4").write_bytes(b"v" * 10)
+    scan_id = photo_db.get_or_create_scan("photos", str(root))
+    first = scanner.scan_media(str(root), scan_id)
+    assert first["added"] == 6 and len(extracted) == 6
+    extracted.clear()
+    return root, scan_id, extracted
+
+
+def _rows(scan_id):
+    conn = sqlite3.connect(photo_db._get_db_path(scan_id))
+    rows = {os.path.basename(p): (i, h) for i, p, h in
+            conn.execute("SELECT id, path, md5_hash FROM media_files")}
+    conn.close()
+    return rows
+
+
+def test_i1_unchanged_rescan_extracts_nothing(lib):
+    root, scan_id, extracted = lib
+    progress = []
+    res = scanner.scan_media(str(root), scan_id, progress_callback=lambda c, t: progress.append((c, t)))
+    assert extracted == [] and progress == []
+    assert (res["added"], res["updated"], res["removed"], res["unchanged"]) == (0, 0, 0, 6)
+    assert (res["photo_count"], res["video_count"]) == (5, 1)
+
+
+def test_i2_add_change_delete(lib):
+    root, scan_id, extracted = lib
+    conn = sqlite3.connect(photo_db._get_db_path(scan_id))
+    conn.execute("UPDATE media_files SET md5_hash = 'kept' WHERE filename = 'p0.jpg'")
+    conn.commit()
+    conn.close()
+    before = _rows(scan_id)
+
+    (root / "2026" / "p1.jpg").write_bytes(b"changed content")
+    (root / "2026" / "p2.jpg").unlink()
+    (root / "new.png").write_bytes(b"n")
+    progress = []
+    res = scanner.scan_media(str(root), scan_id, progress_callback=lambda c, t: progress.append((c, t)))
+    assert sorted(extracted) == ["new.png", "p1.jpg"]
+    assert (res["added"], res["updated"], res["removed"], res["unchanged"]) == (1, 1, 1, 4)
+    assert progress == [(2, 2)]                                      # 실제 일한 만큼만
+
+    after = _rows(scan_id)
+    assert "p2.jpg" not in after and "new.png" in after
+    assert after["p1.jpg"][0] == before["p1.jpg"][0]                 # upsert — id 유지
+    assert after["p0.jpg"] == before["p0.jpg"] == (before["p0.jpg"][0], "kept")
+
+
+def test_i3_unreadable_dir_keeps_rows(lib, monkeypatch):
+    root, scan_id, _extracted = lib
+    real_walk = os.walk
+
+    def _walk(top, onerror=None, **kw):
+        for root_, dirs, files in real_walk(top, onerror=onerror, **kw):
+            if "2026" in dirs:
+                dirs.remove("2026")
+                onerror(PermissionError(13, "denied", os.path.join(root_, "2026")))
+            yield root_, dirs, files
+
+    monkeypatch.setattr(scanner.os, "walk", _walk)
+    res = scanner.scan_media(str(root), scan_id)
+    assert res["removed"] == 0 and len(_rows(scan_id)) == 6
+
+
+def test_i4_full_rescan_extracts_everything(lib):
+    root, scan_id, extracted = lib
+    res = scanner.scan_media(str(root), scan_id, full=True)
+    assert res["mode"] == "full" and res["added"] == 6 and len(extracted) == 6
@@ -0,0 +1,149 @@
+"""사진 스캐너 병렬 추출 파이프라인(scanner._extract_records) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — scan_media 가 EXIF(PIL)·ffprobe 추출을 한 스레드에서 파일마다 차례로 돌려 16코어
+머신에서 한 코어만 썼다. 이제 걸음 → 엔진 스케줄러 레인(사진 cpu·동영상 subprocess) → 배치 쓰기
+단계로 나뉜다. 이 배터리는 추출이 **겹쳐 돌고**, 동시 ffprobe 와 진행 중인 일의 수가 상한을
+지키며, progress_callback 계약과 결과 행이 차례 실행과 같은지를 본다.
+
+    X1. 병렬 — 파일 40개 × 50ms 추출이 (상한 8 레인에서) 차례 실행의 몇 분의 일
+    X2. ffprobe 상한 — 동영상은 subprocess 레인으로, 동시 extract_video_metadata 는 그 상한 안
+    X3. 배압 — 소비(쓰기)가 멈춰 있으면 시작된 추출은 window 언저리에서 선다, 기본 창은 레인 상한의 몇 배
+    X4. 계약 — 진행 콜백 (끝낸 수, 할 일 수), 읽기 실패는 errors_count, parallel=False 와 같은 행
+
+실행: python3 -m pytest backend/test_photo_scan_pipeline.py
+"""
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import lane_scheduler  # noqa: E402
+
+_PHOTO_PKG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                          "data", "packages", "installed", "tools", "photo-manager")
+if _PHOTO_PKG not in sys.path:
+    sys.path.insert(0, _PHOTO_PKG)
+import photo_db  # noqa: E402
+import scanner  # noqa: E402
+
+
+@pytest.fixture
+def lanes(monkeypatch):
+    """시험 레인 둘(사진 상한 8·동영상 상한 2) — 전역 cpu·subprocess 레인을 건드리지 않는다."""
+    caps = {"t-scan-cpu": 8, "t-scan-sub": 2}
+    for name, cap in caps.items():
+        monkeypatch.setitem(lane_scheduler.LANE_CAPS, name, cap)
+        monkeypatch.setitem(lane_scheduler._INLINE_OK, name, True)
+    monkeypatch.setattr(scanner, "_LANES", {"photo": "t-scan-cpu", "video": "t-scan-sub"})
+    yield caps
+    for name in caps:
+        lane_scheduler._lanes.pop(name, None)
+
+
+@pytest.fixture
+def lib(tmp_path, monkeypatch, lanes):
+    """임시 스캔 저장소 + 사진 30장·동영상 10개. 추출은 delay 만큼 자고 동시 수를 잰다."""
+    monkeypatch.setattr(photo_db, "SCANS_DIR", str(tmp_path / "scans"))
+    monkeypatch.setattr(photo_db, "SCANS_JSON", str(tmp_path / "scans" / "scans.json"))
+    state = {"delay": 0.05, "live_video": 0, "max_video": 0, "started": 0, "video_lanes": set()}
+    lock = threading.Lock()
+
+    def _photo(fp):
+        with lock:
+            state["started"] += 1
+        time.sleep(state["delay"])
+        return {"width": len(os.path.basename(fp))}
+
+    def _video(fp):
+        with lock:
+            state["started"] += 1
+            state["live_video"] += 1
+            state["video_lanes"].add(threading.current_thread().name.rsplit("-", 1)[0])
+            state["max_video"] = max(state["max_video"], state["live_video"])
+        time.sleep(state["delay"])
+        with lock:
+            state["live_video"] -= 1
+        return {"duration": 2.0}
+
+    monkeypatch.setattr(scanner, "extract_photo_metadata", _photo)
+    monkeypatch.setattr(scanner, "extract_video_metadata", _video)
+    root = tmp_path / "photos"
+    root.mkdir()
+    for i in range(30):
+        (root / f"p{i:02d}.jpg").write_bytes(b"x")
+    for i in range(10):
+        (root / f"v{i:02d}.mp4").write_bytes(b"v")
+    scan_id = photo_db.get_or_create_scan("photos", str(root))
+    return root, scan_id, state
+
+
+def _rows(scan_id):
+    conn = sqlite3.connect(photo_db._get_db_path(scan_id))
+    rows = sorted(conn.execute("SELECT filename, width, duration FROM media_files"))
+    conn.close()
+    return rows
+
+
+def test_x1_extraction_runs_in_parallel(lib):
+    root, scan_id, _state = lib
+    t0 = time.monotonic()
+    res = scanner.scan_media(str(root), scan_id)
+    assert time.monotonic() - t0 < 40 * 0.05 / 3                      # 차례 실행이면 2s
+    assert res["added"] == 40 and len(_rows(scan_id)) == 40
+
+
+def test_x2_ffprobe_concurrency_capped(lib):
+    root, scan_id, state = lib
+    scanner.scan_media(str(root), scan_id)
+    assert 1 <= state["max_video"] <= 2
+    assert state["video_lanes"] == {"lane-t-scan-sub"}
+
+
+def test_x3_backpressure_bounds_in_flight(lib):
+    root, _scan_id, state = lib
+    state["delay"] = 0
+    todo = [(str(p), os.stat(p)) for p in sorted(root.iterdir())]
+    gen = scanner._extract_records(todo, parallel=True, window=8)
+    next(gen)                                                        # 하나만 소비하고 멈춤
+    time.sleep(0.2)
+    assert state["started"] <= 8 + 1                                  # 40개를 다 시작하지 않는다
+    gen.close()
+
+    state["started"] = 0
+    assert scanner._lane_window() == scanner.SCAN_LANE_FACTOR * 8      # 큰 레인 상한의 몇 배
+    gen = scanner._extract_records(todo, parallel=True)               # 기본 창 — 256 이 아니다
+    next(gen)
+    time.sleep(0.2)
+    assert state["started"] <= scanner._lane_window() + 1
+    gen.close()
+
+
+def test_x4_progress_contract_and_errors(lib, monkeypatch):
+    root, scan_id, state = lib
+    state["delay"] = 0
+    for i in range(170):
+        (root / f"extra{i:03d}.png").write_bytes(b"e")
+    real = scanner.build_media_record
+
+    def _flaky(fp, st):
+        if fp.endswith("extra000.png"):
+            raise PermissionError(13, "denied", fp)
+        return real(fp, st)
+
+    monkeypatch.setattr(scanner, "build_media_record", _flaky)
+    progress = []
+    res = scanner.scan_media(str(root), scan_id,
+                             progress_callback=lambda c, t: progress.append((c, t)))
+    assert progress == [(100, 210), (200, 210), (210, 210)]
+    assert res["errors_count"] == 1 and res["added"] == 210
+    parallel_rows = _rows(scan_id)
+    assert len(parallel_rows) == 209
+
+    scanner.scan_media(str(root), scan_id, full=True, parallel=False)
+    assert _rows(scan_id) == parallel_rows
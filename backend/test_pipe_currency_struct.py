@@ -0,0 +1,105 @@
+"""파이프 이음매 구조 통화(PipeCurrency) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — `>>` 이음매가 통화를 JSON 문자열로 나르던 시절엔 변환자 사슬의 매 이음매가
+덤프→파싱 왕복을 치렀다. 이음매가 객체를 들고 다니게 바꿨으므로, 이 배터리는 **경계에서는
+여전히 문자열**이고 **옵트인 변환자 사이에서는 재파싱이 없는지**를 본다.
+
+    S1. _to_prev_currency — dict 는 구조 통화, 결과 기록 텍스트를 물려받음, 비JSON 은 문자열
+    S2. 옵트인 경계 — data-ops 변환자·each 는 객체째, 나머지·@주소 지정은 문자열
+    S3. data-ops 사슬 — filter >> sort >> take 가 이음매마다 json.loads 를 부르지 않는다
+    S4. 큰 구조 통화도 자동 스필(M5) — 참조 봉투로 바뀌고 final_result 는 문자열
+
+실행: python3 -m pytest backend/test_pipe_currency_struct.py
+"""
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+from common import spill  # noqa: E402
+from common.currency import PipeCurrency, pipe_obj, pipe_text  # noqa: E402
+from workflow_binding import _to_prev_currency  # noqa: E402
+import ibl_engine  # noqa: E402
+
+
+@pytest.fixture
+def _spill_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(spill, "_root", lambda: str(tmp_path / "spill"))
+    return tmp_path / "spill"
+
+
+def test_s1_prev_currency_is_structured():
+    env = {"success": True, "items": [{"a": 1}, {"a": 2}]}
+    text = json.dumps(env, ensure_ascii=False)
+    cur = _to_prev_currency(env, text)
+    assert isinstance(cur, PipeCurrency) and cur.obj is env
+    assert cur.text() is text                       # 기록용 텍스트 재사용 — 재덤프 없음
+    assert pipe_obj(cur) is env and pipe_text(cur) == text
+    # JSON 문자열 결과도 파싱 한 번으로 구조 통화가 된다
+    cur2 = _to_prev_currency(text)
+    assert isinstance(cur2, PipeCurrency) and cur2.obj["items"][1]["a"] == 2
+    # 비JSON 텍스트는 옛 규약 그대로 문자열
+    assert _to_prev_currency("그냥 문장") == "그냥 문장"
+
+
+def test_s2_boundary_materializes_for_non_opted_in():
+    cur = PipeCurrency({"items": [{"a": 1}]})
+    inp = {"_node": "table", "action": "filter", "params": {"_prev_result": cur}}
+    ibl_engine._pipe_currency_boundary(inp)
+    assert inp["params"]["_prev_result"] is cur     # data-ops 변환자 = 옵트인
+    inp = {"_node": "table", "action": "each", "params": {"_prev_result": cur}}
+    ibl_engine._pipe_currency_boundary(inp)
+    assert inp["params"]["_prev_result"] is cur
+    inp = {"_node": "self", "action": "notify_user", "params": {"_prev_result": cur}}
+    ibl_engine._pipe_currency_boundary(inp)
+    assert inp["params"]["_prev_result"] == cur.text()
+    inp = {"_node": "table", "action": "filter", "target_node": "phone",
+           "params": {"_prev_result": cur}}
+    ibl_engine._pipe_currency_boundary(inp)
+    assert isinstance(inp["params"]["_prev_result"], str)   # 전선을 건너면 항상 문자열
+
+
+def test_s3_dataops_chain_skips_reparse(monkeypatch):
+    from workflow_engine import execute_pipeline
+    import tool_loader
+    h = tool_loader.load_tool_handler("data_filter")
+    rows = [{"name": f"r{i}", "n": i} for i in range(40)]
+
+    loads = {"n": 0}
+    real_loads = h.json.loads
+
+    class _CountingJson:
+        def __getattr__(self, k):
+            return getattr(json, k)
+
+        @staticmethod
+        def loads(s, *a, **kw):
+            loads["n"] += 1
+            return real_loads(s, *a, **kw)
+
+    monkeypatch.setattr(h, "json", _CountingJson())
+    code = (f"[table:filter]{{items: {json.dumps(rows, ensure_ascii=False)}, where: \"n >= 10\"}}"
+            " >> [table:sort]{by: \"n\", order: \"desc\"} >> [table:take]{n: 3}")
+    out = execute_pipeline(code, ".")
+    assert out.get("success"), out
+    assert isinstance(out["final_result"], str)
+    final = json.loads(out["final_result"])
+    assert [r["n"] for r in final["items"]] == [39, 38, 37]
+    assert loads["n"] == 0, loads
+
+
+def test_s4_large_structured_currency_spills(_spill_root):
+    from common.spill import AUTO_SPILL_THRESHOLD
+    from workflow_engine import execute_pipeline
+    n = AUTO_SPILL_THRESHOLD // 100 + 50
+    rows = [{"t": "x" * 100, "i": i} for i in range(n)]
+    code = (f"[table:filter]{{items: {json.dumps(rows)}, where: \"i >= 0\"}}"
+            " >> [table:take]{n: 2}")
+    out = execute_pipeline(code, ".")
+    assert out.get("success"), out
+    assert out["results"][0].get("spilled"), out["results"][0]
+    assert [r["i"] for r in json.loads(out["final_result"])["items"]] == [0, 1]
+    assert any(_spill_root.iterdir())                               # 스필은 임시 루트에 — repo data/spill 아님
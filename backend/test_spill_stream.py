@@ -0,0 +1,129 @@
+"""행 형식 스필 + 스트리밍 소비자 회귀 테스트 (2026-10-16)
+
+왜 있는가 — 스필은 임계를 넘은 통화를 파일로 내렸지만 소비자마다 `resolve_ref` 로 전량을
+다시 읽었다. items 통화를 한 줄 한 행(.jsonl)으로 쓰고 filter·take·each·write 가 행을 흘려
+읽게 바꿨으므로, 이 배터리는 **전량 경로와 같은 결과**가 나는지를 본다.
+
+    T1. 행 형식 왕복 — resolve_ref/read_ref 재조립(거울 키 동일성·키 순서), 텍스트는 옛 .json
+    T2. filter·take — 전량 봉투와 같은 출력, 빠진 필드·문법 오류는 같은 정직 거절
+    T3. each — limit 까지만 읽는 뷰(len·skipped 는 참조의 count)
+    T4. write — 흘려 쓴 파일이 json.dumps(indent=2) 와 바이트 동일, RED 아님
+
+실행: python3 -m pytest backend/test_spill_stream.py
+"""
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+from common import spill  # noqa: E402
+
+_PKG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                    "data", "packages", "installed", "tools")
+
+
+def _load(name, rel):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_PKG, rel))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class _Ctx:
+    def __init__(self, tool, project_path="/tmp"):
+        self.tool_name = tool
+        self.project_path = project_path
+        self.agent_id = "test"
+
+
+@pytest.fixture(autouse=True)
+def _spill_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(spill, "_root", lambda: str(tmp_path / "spill"))
+
+
+def _env(n=300):
+    rows = [{"i": i, "city": ["서울", "부산", "대구"][i % 3], "t": "줄\n바꿈 " if i % 7 == 0 else "x"}
+            for i in range(n)]
+    return {"success": True, "items": rows, "triggers": rows, "message": "총 건수", "meta": {"k": 1}}
+
+
+def test_t1_rows_format_round_trip():
+    env = _env()
+    ref_env = spill.spill_write(json.dumps(env, ensure_ascii=False), tag="t", obj=env)
+    ref = ref_env["ref"]
+    assert ref["path"].endswith(".jsonl") and ref["format"] == "rows" and ref["count"] == 300
+    with open(ref["path"], encoding="utf-8", newline="\n") as f:
+        assert sum(1 for _ in f) == 301                 # 헤더 + 한 줄 한 행(  도 줄을 안 쪼갠다)
+    back, err = spill.resolve_ref(ref_env)
+    assert err is None and back == env and list(back) == list(env)
+    assert back["triggers"] is back["items"]            # 거울 키는 같은 리스트로 재조립
+    body, err = spill.read_ref({"path": ref["path"]})   # resume 처럼 경로만 줘도
+    assert err is None and json.loads(body) == env
+    rows = spill.open_rows(json.dumps(ref_env))
+    assert len(rows) == 300 and rows.head(2) == env["items"][:2] and rows.tail(1) == env["items"][-1:]
+    # 텍스트 통화는 옛 형식 그대로 — open_rows 는 None(전량 경로)
+    txt = spill.spill_write("가" * 50, tag="t")
+    assert txt["ref"]["path"].endswith(".json") and spill.open_rows(txt) is None
+    assert spill.resolve_ref(txt)[0] == "가" * 50
+
+
+def test_t2_filter_take_match_full_path():
+    h = _load("_t_dataops_spill", "data-ops/handler.py")
+    env = _env(1200)
+    ref_env = spill.spill_write(json.dumps(env, ensure_ascii=False), tag="t", obj=env)
+
+    def run(tool, prev, **p):
+        return h.execute({**p, "_prev_result": json.dumps(prev, ensure_ascii=False)}, _Ctx(tool))
+
+    for where in ["i >= 1100", "city == 부산", ["i < 50", "city != 서울"], "nope > 1", "i approx 3"]:
+        assert run("data_filter", ref_env, where=where) == run("data_filter", env, where=where), where
+    for n in (0, 5, -3, 5000):
+        assert run("data_take", ref_env, n=n) == run("data_take", env, n=n), n
+    out = run("data_take", ref_env, n=2)
+    assert out["triggers"] == out["items"] and "message" not in out and out["meta"] == {"k": 1}
+
+
+def test_t3_each_reads_only_limit_rows(monkeypatch):
+    from ibl_exec_each import _each_input_rows, _execute_table_each
+    import workflow_engine
+    env = _env(500)
+    ref_env = spill.spill_write(json.dumps(env, ensure_ascii=False), tag="t", obj=env)
+    rows, _shell = _each_input_rows({"_prev_result": json.dumps(ref_env)})
+    assert isinstance(rows, spill.SpillRows) and len(rows) == 500
+    head = rows[:4]
+    assert len(head) == 4 and list(head) == env["items"][:4]
+
+    loads = {"n": 0}
+    real = spill.json.loads
+
+    def _counting(s, *a, **kw):
+        loads["n"] += 1
+        return real(s, *a, **kw)
+
+    monkeypatch.setattr(workflow_engine, "execute_pipeline",
+                        lambda steps, *_a, **_k: {"success": True, "final_result": "ok"})
+    monkeypatch.setattr(spill.json, "loads", _counting)
+    out = _execute_table_each({"_prev_result": json.dumps(ref_env), "do": "[self:x]{c: '$it.city'}",
+                               "limit": 10}, ".")
+    monkeypatch.setattr(spill.json, "loads", real)
+    assert out["ok_count"] == 10 and out["skipped"] == 490, out
+    assert loads["n"] < 20, loads                       # 헤더·참조 몇 번 + 10행 — 500행 전량이 아니다
+
+
+def test_t4_write_streams_identical_bytes(tmp_path):
+    sysess = _load("_t_sysess_spill", "system_essentials/handler.py")
+    env = _env(400)
+    env.pop("message")
+    ref_env = spill.spill_write(json.dumps(env, ensure_ascii=False), tag="t", obj=env)
+    dest = tmp_path / "out.json"
+    out = json.loads(sysess.execute({"path": str(dest), "_prev_result": json.dumps(ref_env)},
+                                    _Ctx("write_file", str(tmp_path))))
+    assert out["success"], out
+    text = dest.read_text(encoding="utf-8")
+    assert text == json.dumps(env, ensure_ascii=False, indent=2)
+    assert out["size"] == len(text)
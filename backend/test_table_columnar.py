@@ -0,0 +1,140 @@
+"""data-ops 열 지향 가속 경로(columnar.py) 동치 테스트 (2026-10-16)
+
+왜 있는가 — filter/sort/groupby/join/compute 가 큰 표에서 열 단위로 돌게 됐다. 정본은 옛 행
+경로이므로, 이 배터리는 **같은 입력에 같은 봉투**가 나오는지를 INDIEBIZ_COLUMNAR=off 결과와
+바이트 단위로 대조한다(NumPy 경로·list 경로 둘 다). 섞인 값(숫자 문자열·콤마·None·빈칸·
+대소문자·빠진 키)을 일부러 넣는다.
+
+    C1. filter — 기호·워드 op, 구조형·단축형·AND 목록, 전-필드 검색, 빠진 키
+    C2. sort — 수치/문자열/None 혼합, asc·desc 의 동률 순서
+    C3. groupby — count/sum/avg/min/max, 0·비수치만 있는 그룹의 int 0
+    C4. join — items(접미사 충돌)·table(동명 열)
+    C5. compute — 사칙 벡터 + 0 나눗셈·비수치 칸의 행 경로 재계산(오류 수·예시 문구까지)
+    C6. 작은 표·모르는 op — 열 경로를 안 타거나 같은 정직 거절
+
+실행: python3 -m pytest backend/test_table_columnar.py
+"""
+import importlib.util
+import json
+import os
+import random
+
+import pytest
+
+_PKG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                    "data", "packages", "installed", "tools", "data-ops")
+_spec = importlib.util.spec_from_file_location("_t_dataops_col", os.path.join(_PKG, "handler.py"))
+H = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(H)
+
+
+class _Ctx:
+    def __init__(self, tool):
+        self.tool_name = tool
+
+    def output_dir(self):
+        return "/tmp"
+
+
+def _rows(n=1500, seed=7):
+    rnd = random.Random(seed)
+    cities = ["Seoul", "seoul ", "부산", "대구", "Incheon", None, ""]
+    out = []
+    for i in range(n):
+        price = rnd.choice([rnd.randint(0, 900), f"{rnd.randint(1, 9)},{rnd.randint(100, 999)}",
+                            rnd.random() * 100, "n/a", None, 0, "0"])
+        out.append({"id": i, "city": rnd.choice(cities), "price": price,
+                    "qty": rnd.choice([1, 2, 3, "4", 0]), "name": f"Item-{rnd.randint(0, 50)}"})
+    return out
+
+
+def _run(tool, prev, **params):
+    p = dict(params)
+    p["_prev_result"] = json.dumps(prev, ensure_ascii=False)
+    out = H.execute(p, _Ctx(tool))
+    return json.dumps(out, ensure_ascii=False, sort_keys=False)
+
+
+@pytest.fixture(params=["numpy", "list"])
+def backend(request, monkeypatch):
+    if request.param == "list":
+        monkeypatch.setattr(H._colx, "_np_state", {"checked": True, "mod": None})
+    return request.param
+
+
+def _same(monkeypatch, tool, prev, **params):
+    monkeypatch.delenv("INDIEBIZ_COLUMNAR", raising=False)
+    fast = _run(tool, prev, **params)
+    monkeypatch.setenv("INDIEBIZ_COLUMNAR", "off")
+    slow = _run(tool, prev, **params)
+    monkeypatch.delenv("INDIEBIZ_COLUMNAR", raising=False)
+    assert fast == slow, (tool, params)
+    return json.loads(fast)
+
+
+def test_c1_filter_matches_row_path(backend, monkeypatch):
+    env = {"success": True, "items": _rows()}
+    for where in ["price >= 300", "price < 5,000", "city == seoul", "city != 부산", "qty eq 4",
+                  "name contains item-1", "name startswith ITEM", "name endswith 7", "city in 부산",
+                  "price gt n/a", "city matches ^S", "seoul",
+                  {"field": "price", "op": "le", "value": 10}, {"city": "대구", "qty": "2"},
+                  ["price > 100", "city == Seoul", "qty >= 2"], ["qty == 3", "city matches [가-힣]"]]:
+        out = _same(monkeypatch, "data_filter", env, where=where)
+        assert out.get("success") is not False, (where, out)
+    ragged = {"items": _rows()[:700] + [{"id": -1, "city": "seoul"}]}
+    _same(monkeypatch, "data_filter", ragged, where="seoul")
+    _same(monkeypatch, "data_filter", ragged, where="price > 10")
+
+
+def test_c2_sort_stable_both_directions(backend, monkeypatch):
+    env = {"items": _rows()}
+    for by in ("price", "city", "qty", "name"):
+        _same(monkeypatch, "data_sort", env, by=by)
+        _same(monkeypatch, "data_sort", env, by=by, desc=True)
+    rows = _rows()
+    table = {"table": {"columns": list(rows[0]), "rows": [list(r.values()) for r in rows]}}
+    _same(monkeypatch, "data_sort", table, by="price", order="desc")
+
+
+def test_c3_groupby_aggregates(backend, monkeypatch):
+    env = {"items": _rows()}
+    out = _same(monkeypatch, "data_groupby", env, by="city",
+                agg={"합": ["sum", "price"], "평균": ["avg", "price"], "최소": ["min", "qty"],
+                     "최대": ["max", "price"], "n": ["count", "id"]})
+    assert out["table"]["rows"] if "table" in out else out["rows"]
+    zeros = {"items": [{"k": i % 3, "v": ("0" if i % 2 else "x")} for i in range(900)]}
+    out = _same(monkeypatch, "data_groupby", zeros, by="k", agg={"s": ["sum", "v"]})
+    assert all(r[1] == 0 and isinstance(r[1], int) for r in out["rows"])
+    _same(monkeypatch, "data_groupby", env, by="name")
+    # 상쇄가 큰 합 — 3.12+ sum() 은 보정 합산(200.0), bincount 는 0.0 이었다. 열 경로도 sum() 이어야
+    cancel = [1e16, 1.0, -1e16] * 200
+    big = {"items": [{"k": i % 2, "v": v} for i, v in enumerate(cancel * 2)]}
+    out = _same(monkeypatch, "data_groupby", big, by="k", agg={"s": ["sum", "v"], "a": ["avg", "v"]})
+    want = H._AGG["sum"](cancel[0::2] + cancel[0::2])
+    assert out["rows"][0][1] == want
+
+
+def test_c4_join_items_and_tables(backend, monkeypatch):
+    left = [{"key": f"K{i % 400}", "name": f"l{i}", "v": i} for i in range(800)]
+    right = [{"key": f"k{i}" if i % 2 else f"K{i} ", "name": f"r{i}", "w": i * 2} for i in range(400)]
+    _same(monkeypatch, "data_join", None, on="key", left={"items": left}, right={"items": right})
+    ta = {"table": {"columns": ["key", "v"], "rows": [[r["key"], r["v"]] for r in left]}}
+    tb = {"table": {"columns": ["key", "w", "w"], "rows": [[r["key"], r["w"], -r["w"]] for r in right]}}
+    _same(monkeypatch, "data_join", None, on="key", left=ta, right=tb)
+
+
+def test_c5_compute_vector_and_fallback_cells(backend, monkeypatch):
+    rows = [{"a": i % 7, "b": (i % 5) - 2, "c": f"{i},000", "s": "x"} for i in range(1200)]
+    out = _same(monkeypatch, "data_compute", {"items": rows},
+                set={"r": "a / b", "m": "a * 1.5 - c / 1000", "neg": "-a + 2", "t": "a / (b - b)",
+                     "mixed": "s + 1", "fn": "round(a / 3, 2)"})
+    assert out["compute_errors"] > 0 and "note" in out
+
+
+def test_c6_small_tables_and_unknown_op(backend, monkeypatch):
+    small = {"items": _rows(20)}
+    _same(monkeypatch, "data_filter", small, where="price > 3")
+    out = _same(monkeypatch, "data_filter", {"items": _rows()}, where={"field": "price", "op": "approx", "value": 1})
+    assert out["success"] is False and "approx" in out["error"]
+    out = _same(monkeypatch, "data_filter", {"items": _rows()}, where="name matches [")
+    assert out["success"] is False
@@ -0,0 +1,125 @@
+"""관측 기록 배치 쓰기(telemetry_sink) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — record_action_health / bump_action_usage 가 실행마다 연결을 열고 커밋하던 것을
+링 버퍼 + 백그라운드 플러셔로 옮겼다. 이 배터리는 핫패스가 **DB 를 건드리지 않고**, 플러시가
+한 트랜잭션으로 같은 내용을 남기며, 넘칠 때·쓰기가 실패할 때 숫자가 남는지를 본다.
+
+    T1. emit 은 DB 를 열지 않는다 — flush 뒤 action_health 가 연결 1개로 다 들어간다
+    T2. 플러셔 — FLUSH_BATCH 만큼 쌓이면 간격을 기다리지 않고 쓴다
+    T3. 링 넘침 — RING_SIZE 를 넘긴 만큼 가장 오래된 것부터 버리고 dropped 로 센다
+    T4. action_usage — 같은 키는 합산 upsert, writer 예외는 write_errors·dropped 로 센다
+    T5. 읽기·청소는 버퍼를 먼저 비운다 — 요약에 최근 행이 보이고, purge 뒤 지운 행이 되살아나지 않는다
+
+실행: python3 -m pytest backend/test_telemetry_sink.py
+"""
+import sqlite3
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import ibl_usage_db  # noqa: E402
+import pulse_db  # noqa: E402
+import telemetry_sink  # noqa: E402
+
+
+@pytest.fixture
+def sink(tmp_path, monkeypatch):
+    """임시 DB 경로 + 비운 버퍼. 플러셔가 테스트 사이에 끼어들지 않게 간격은 길게."""
+    telemetry_sink.flush()
+    monkeypatch.setattr(pulse_db, "CONSCIOUSNESS_DB_PATH", tmp_path / "world_pulse.db")
+    monkeypatch.setattr(ibl_usage_db, "DB_PATH", str(tmp_path / "ibl_usage.db"))
+    monkeypatch.setattr(telemetry_sink, "FLUSH_INTERVAL", 60)
+    yield tmp_path
+    telemetry_sink.flush()
+
+
+def _count_connects(monkeypatch):
+    real = sqlite3.connect
+    opened = []
+    monkeypatch.setattr(sqlite3, "connect", lambda *a, **k: opened.append(a) or real(*a, **k))
+    return opened
+
+
+def test_t1_emit_is_io_free_and_flush_batches(sink, monkeypatch):
+    pulse_db._get_pulse_db().close()                                # 스키마는 미리
+    opened = _count_connects(monkeypatch)
+    for i in range(50):
+        pulse_db.record_action_health("sense", f"a{i % 5}", i % 3 != 0, response_ms=i,
+                                      source="usage", channel="t", error=None if i % 3 else "x")
+    assert opened == []                                             # 핫패스 I/O 0
+    assert telemetry_sink.flush()
+    assert len(opened) == 1                                         # 한 배치 = 연결 1개
+    conn = sqlite3.connect(str(sink / "world_pulse.db"))
+    rows = conn.execute("SELECT action, success, response_ms, source, error FROM action_health "
+                        "ORDER BY id").fetchall()
+    conn.close()
+    assert len(rows) == 50
+    assert rows[3] == ("a3", 0, 3, "test", "x")                     # 시험 격리(source=test) 유지
+
+
+def test_t2_flusher_wakes_on_batch_size(sink, monkeypatch):
+    monkeypatch.setattr(telemetry_sink, "FLUSH_BATCH", 10)
+    seen = []
+    telemetry_sink.register("t2", lambda recs: seen.append(len(recs)))
+    for i in range(10):
+        telemetry_sink.emit("t2", i)
+    deadline = time.time() + 3
+    while not seen and time.time() < deadline:
+        time.sleep(0.01)
+    assert seen and sum(seen) == 10                                 # 간격(60s) 전에 깨어 씀
+
+
+def test_t3_ring_overflow_drops_oldest(sink, monkeypatch):
+    monkeypatch.setattr(telemetry_sink, "RING_SIZE", 100)
+    monkeypatch.setattr(telemetry_sink, "FLUSH_BATCH", 10 ** 9)
+    got = []
+    telemetry_sink.register("t3", got.extend)
+    before = telemetry_sink.stats()["dropped"]
+    for i in range(130):
+        telemetry_sink.emit("t3", i)
+    assert telemetry_sink.stats()["dropped"] - before == 30
+    telemetry_sink.flush()
+    assert got == list(range(30, 130))
+
+
+def test_t4_usage_aggregates_and_errors_counted(sink):
+    ibl_usage_db.bump_action_usage([("sense", "weather")] * 7 + [("self", "time")], "app")
+    telemetry_sink.flush()
+    ibl_usage_db.bump_action_usage([("sense", "weather")] * 3, "app")
+    by = {(r["node"], r["action"]): r["uses"] for r in ibl_usage_db.action_usage_summary(1)}
+    assert by[("sense", "weather")] == 10 and by[("self", "time")] == 1
+
+    def _boom(recs):
+        raise OSError("disk full")
+
+    telemetry_sink.register("t4", _boom)
+    s0 = telemetry_sink.stats()
+    for i in range(5):
+        telemetry_sink.emit("t4", i)
+    assert telemetry_sink.flush()
+    s1 = telemetry_sink.stats()
+    assert s1["write_errors"] - s0["write_errors"] == 1
+    assert s1["dropped"] - s0["dropped"] == 5 and s1["queued"] == 0
+
+
+def test_t5_readers_and_purge_flush_first(sink):
+    import world_pulse_health
+    pulse_db._get_pulse_db().close()
+    for ok in (True, False, True):
+        pulse_db.record_action_health("sense", "gone", ok, response_ms=5, source="usage")
+    pulse_db.record_action_health("sense", "kept", True, response_ms=5, source="usage")
+    assert telemetry_sink.stats()["queued"] >= 4                    # 아직 버퍼에만
+    summary = world_pulse_health.get_action_health_summary()
+    assert "gone" in str(summary) and "kept" in str(summary)
+
+    pulse_db.record_action_health("sense", "gone", True, response_ms=5, source="usage")
+    assert pulse_db.purge_action_records(["gone"])["action_health"] == 4
+    telemetry_sink.flush()
+    conn = sqlite3.connect(str(sink / "world_pulse.db"))
+    left = conn.execute("SELECT action, COUNT(*) FROM action_health GROUP BY action").fetchall()
+    conn.close()
+    assert left == [("kept", 1)]                                    # 청소가 되돌려지지 않음
@@ -0,0 +1,137 @@
+"""썸네일 렌더 서비스(thumbnail_service) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — api_photo.get_thumbnail 이 async def 안에서 PIL 렌더를 그대로 불러 캐시 빈 사진마다
+이벤트 루프가 멈췄고, 같은 경로 동시 요청은 같은 썸네일을 두 번 그렸으며 캐시는 끝없이 자랐다.
+이 배터리는 렌더가 **루프 밖**에서 돌고, 같은 키는 한 번만 그리며, 캐시가 상한을 지키고, 예열이
+레인을 한꺼번에 채우지 않는지를 본다.
+
+    N1. 루프 — 렌더 0.3s 동안 같은 루프의 다른 코루틴이 계속 돈다
+    N2. 합치기 — 같은 (경로, 크기) 동시 10건은 렌더 1번, 신선한 캐시는 렌더 0번
+    N3. LRU — 상한을 넘으면 오래 안 본 것부터 지우고, 원본이 바뀌면 다시 그린다
+    N4. 예열 — 신선한 것은 건너뛰고, 동시에 도는 렌더는 PREWARM_WINDOW 이하
+    N5. 계수 — 묵은 캐시가 남은 채 렌더가 실패하면 rendered 가 아니라 failed 로 센다
+
+실행: python3 -m pytest backend/test_thumbnail_service.py
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import thumbnail_service as ts  # noqa: E402
+import thumbnails  # noqa: E402
+
+
+@pytest.fixture
+def svc(tmp_path, monkeypatch):
+    """임시 캐시 + 렌더는 delay 만큼 자고 파일을 쓰는 가짜. 호출·동시 수를 센다."""
+    monkeypatch.setattr(ts, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(ts, "_inflight", {})
+    monkeypatch.setattr(ts, "_since_sweep", 0)
+    state = {"delay": 0.3, "calls": [], "live": 0, "max_live": 0}
+    lock = threading.Lock()
+
+    def _fake(src, dst, size=512):
+        with lock:
+            state["calls"].append(os.path.basename(src))
+            state["live"] += 1
+            state["max_live"] = max(state["max_live"], state["live"])
+        time.sleep(state["delay"])
+        with open(dst, "wb") as f:
+            f.write(b"J" * 100)
+        with lock:
+            state["live"] -= 1
+        return True
+
+    monkeypatch.setattr(thumbnails, "generate_image_thumbnail", _fake)
+    src_dir = tmp_path / "photos"
+    src_dir.mkdir()
+    for i in range(12):
+        (src_dir / f"p{i:02d}.jpg").write_bytes(b"x")
+    return src_dir, state
+
+
+def test_n1_render_does_not_block_loop(svc):
+    src_dir, _state = svc
+    ticks = []
+
+    async def _ticker():
+        for _ in range(10):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.02)
+
+    async def _go():
+        path, _ = await asyncio.gather(ts.get(str(src_dir / "p00.jpg"), 200), _ticker())
+        return path
+
+    path = asyncio.run(_go())
+    assert path and os.path.exists(path)
+    assert len(ticks) == 10 and ticks[-1] - ticks[0] < 0.29          # 렌더 중에도 돌았다
+
+
+def test_n2_concurrent_requests_coalesce(svc):
+    src_dir, state = svc
+    src = str(src_dir / "p01.jpg")
+
+    async def _go():
+        return await asyncio.gather(*(ts.get(src, 200) for _ in range(10)))
+
+    paths = asyncio.run(_go())
+    assert len(set(paths)) == 1 and state["calls"] == ["p01.jpg"]
+    assert ts.stats()["inflight"] == 0
+    assert ts.request(src, 200).result() == paths[0] and len(state["calls"]) == 1
+
+
+def test_n3_lru_eviction_and_staleness(svc, monkeypatch):
+    src_dir, state = svc
+    state["delay"] = 0
+    monkeypatch.setattr(ts, "CACHE_CAP_BYTES", 250)
+    monkeypatch.setattr(ts, "SWEEP_EVERY", 1)
+    old = [ts.request(str(src_dir / f"p0{i}.jpg")).result() for i in range(2)]
+    for i, p in enumerate(old):
+        os.utime(p, (1000 + i, 1000 + i))                            # 아주 오래 안 본 것
+        os.utime(src_dir / f"p0{i}.jpg", (900, 900))
+    newest = ts.request(str(src_dir / "p05.jpg")).result()           # 300B > 250B → 정리
+    assert not os.path.exists(old[0]) and os.path.exists(newest)
+
+    os.utime(src_dir / "p05.jpg", (time.time() + 60, time.time() + 60))  # 원본이 더 새롭다
+    state["calls"].clear()
+    ts.request(str(src_dir / "p05.jpg")).result()
+    assert state["calls"] == ["p05.jpg"]
+
+
+def test_n4_prewarm_windowed(svc, monkeypatch):
+    src_dir, state = svc
+    state["delay"] = 0.05
+    monkeypatch.setattr(ts, "PREWARM_WINDOW", 2)
+    ts.request(str(src_dir / "p00.jpg")).result()
+    state["calls"].clear()
+    paths = [str(src_dir / f"p{i:02d}.jpg") for i in range(12)] + [str(src_dir / "notes.txt")]
+    assert ts.prewarm(paths, 200) == 11
+    deadline = time.time() + 5
+    while len(state["calls"]) < 11 and time.time() < deadline:
+        time.sleep(0.02)
+    time.sleep(0.1)
+    assert sorted(state["calls"]) == [f"p{i:02d}.jpg" for i in range(1, 12)]
+    assert state["max_live"] <= 2
+
+
+def test_n5_failed_render_over_stale_cache_counts_as_failed(svc, monkeypatch):
+    src_dir, state = svc
+    state["delay"] = 0
+    src = src_dir / "p07.jpg"
+    stale = ts.request(str(src)).result()
+    os.utime(src, (time.time() + 60, time.time() + 60))             # 캐시가 묵었다
+    monkeypatch.setattr(thumbnails, "generate_image_thumbnail", lambda *a, **k: False)
+    before = ts.stats()
+    assert ts.request(str(src)).result() is None
+    after = ts.stats()
+    assert os.path.exists(stale)                                     # 묵은 파일은 그대로 남아 있다
+    assert after["rendered"] == before["rendered"]
+    assert after["failed"] == before["failed"] + 1
@@ -0,0 +1,192 @@
+"""어휘 스냅샷 레지스트리(vocab_snapshot) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — ibl_nodes.yaml 을 ibl_registry·ibl_access·node_registry·tool_selector·system_tools·
+api_launcher_web … 가 저마다 순수 파이썬 yaml 로 파싱하고 따로 캐시했다. 이제 빌드가 스냅샷
+(파생 색인 포함)을 굽고 모든 소비자가 레지스트리 하나를 거친다. 이 배터리는 스냅샷이 **파싱 없이**
+풀리고, 원본이 바뀌면 알아서 다시 읽으며, 소비자들이 한 벌을 나눠 쓰되 서로의 수정에 오염되지
+않는지를 본다.
+
+    V1. 적중 — 새 레지스트리는 스냅샷에서 풀려 yaml 파싱 0회, 트리는 safe_load 와 같다
+    V2. 검증 — 내용이 바뀌면 다시 파싱·세대 증가·derive 재계산, touch 만이면 sha 로 재사용
+    V3. 색인 — node_actions·action_router·tool_action·params·phone_runnable(매니페스트 따라감)
+    V4. 소비자 — ibl_access·ibl_registry·node_registry 가 파싱 한 번을 나눠 쓰고, 설치 필터는 사본에
+    V5. 안전 — 옛 pickle 판·심어 둔 pickle 은 풀지 않고(객체 생성 0) yaml 에서 다시 굽는다
+    V6. 인터프리터 — 다른 python 버전·marshal 판이 구운 스냅샷은 낡은 것으로 보고 다시 굽는다
+
+실행: python3 -m pytest backend/test_vocab_snapshot.py
+"""
+import json
+import marshal
+import os
+import pickle
+import sys
+
+import pytest
+import yaml
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import vocab_snapshot as vs  # noqa: E402
+
+_NODES = """\
+meta:
+  constraint: test
+nodes:
+  sense:
+    actions:
+      world:
+        router: system
+        target_key: op
+        ops: {default: snapshot, values: {snapshot: s}}
+        args: &shared [1, 2]
+      weather:
+        router: handler
+        tool: weather_tool
+        aliases: {city: [town, location]}
+        also: *shared
+  limbs:
+    actions:
+      buzz:
+        router: handler
+        tool: buzz_tool
+        runs_on: phone_only
+"""
+
+
+@pytest.fixture
+def base(tmp_path, monkeypatch):
+    """임시 INDIEBIZ_BASE_PATH + 레지스트리 초기화 + yaml 파싱 횟수 계측"""
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "ibl_nodes.yaml").write_text(_NODES, encoding="utf-8")
+    monkeypatch.setenv("INDIEBIZ_BASE_PATH", str(tmp_path))
+    monkeypatch.setattr(vs, "_registries", {})
+    monkeypatch.setattr(vs, "CHECK_INTERVAL_S", 0)
+    parses = []
+    real = yaml.load
+    monkeypatch.setattr(vs.yaml, "load", lambda *a, **k: parses.append(1) or real(*a, **k))
+    return tmp_path, parses
+
+
+def test_v1_snapshot_hit_skips_parse(base, monkeypatch):
+    root, parses = base
+    path = root / "data" / "ibl_nodes.yaml"
+    first = vs.registry().data()
+    assert vs.registry().source == "yaml" and len(parses) == 1
+    assert path.with_name("ibl_nodes.yaml.snapshot").is_file()
+
+    monkeypatch.setattr(vs, "_registries", {})                      # 새 프로세스 흉내
+    reg = vs.registry()
+    data = reg.data()
+    assert reg.source == "snapshot" and len(parses) == 1
+    assert data == first == yaml.safe_load(_NODES)
+    acts = data["nodes"]["sense"]["actions"]
+    assert acts["world"]["args"] is acts["weather"]["also"]         # yaml 앵커 공유 보존
+    copy = reg.fresh()
+    copy["nodes"]["sense"]["actions"].clear()
+    assert reg.data()["nodes"]["sense"]["actions"]                  # 사본 수정은 공유 트리에 안 번진다
+
+
+def test_v2_mtime_validation_and_derive(base):
+    root, parses = base
+    path = root / "data" / "ibl_nodes.yaml"
+    reg = vs.registry()
+    built = []
+    assert reg.derive("t", lambda r: built.append(1) or len(r.data()["nodes"])) == 2
+    assert reg.derive("t", lambda r: built.append(1) or 0) == 2 and built == [1]
+    gen = reg.generation
+
+    path.write_text(_NODES.replace("  limbs:", "  others:\n    actions: {}\n  limbs:"), encoding="utf-8")
+    assert set(reg.data()["nodes"]) == {"sense", "others", "limbs"}
+    assert reg.generation == gen + 1 and len(parses) == 2
+    assert reg.derive("t", lambda r: len(r.data()["nodes"])) == 3
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))   # 내용 그대로, mtime 만
+    vs._registries.clear()
+    assert vs.registry().data()["nodes"]["others"] == {"actions": {}}
+    assert vs.registry().source == "snapshot" and len(parses) == 2
+
+
+def test_v3_indexes(base):
+    root, _parses = base
+    reg = vs.registry()
+    assert reg.index("node_actions") == {"sense": ("world", "weather"), "limbs": ("buzz",)}
+    assert reg.index("action_router")["sense:weather"] == "handler"
+    assert reg.index("tool_action") == {"weather_tool": ("sense", "weather"), "buzz_tool": ("limbs", "buzz")}
+    assert reg.index("params")["sense:world"] == {"op"}
+    assert reg.index("params")["sense:weather"] == {"city", "town", "location"}
+    assert reg.index("phone_runnable") is None                      # 매니페스트 없음 = 필터 없음
+
+    (root / "data" / "phone_manifest.json").write_text(
+        json.dumps({"runnable_actions": ["limbs:buzz"]}), encoding="utf-8")
+    assert reg.index("phone_runnable") == {"limbs:buzz"}
+
+
+def test_v4_consumers_share_one_parse(base, monkeypatch):
+    root, parses = base
+    import ibl_access
+    import ibl_registry
+    import node_registry
+
+    monkeypatch.setattr(ibl_registry, "_nodes_path", root / "data" / "ibl_nodes.yaml")
+    ibl_access.invalidate_nodes_cache()
+
+    shared = ibl_access._load_nodes_data()
+    installed = ibl_registry._load_nodes_config()
+    flat = {n["id"] for n in node_registry.list_nodes(include_agents=False)}
+    assert node_registry._get_tool_node_map() == {"weather_tool": "sense", "buzz_tool": "limbs"}
+    assert len(parses) == 1 and flat == {"sense", "limbs"}
+
+    assert "buzz" not in installed["nodes"]["limbs"]["actions"]      # PC 설치본: phone_only 걷힘
+    assert "buzz" in shared["nodes"]["limbs"]["actions"]             # 공유 트리는 그대로
+    assert ibl_registry.pruned_reason("limbs", "buzz")
+    assert ibl_registry._load_nodes_config() is installed            # 세대 동안 메모
+
+    ibl_access.invalidate_nodes_cache()                              # /packages/reload
+    assert ibl_registry._load_nodes_config() is not installed and len(parses) == 1
+
+
+_PLANTED = []
+
+
+class _Planted:
+    def __reduce__(self):
+        return (_PLANTED.append, ("실행됨",))
+
+
+def test_v5_planted_pickle_is_never_loaded(base):
+    root, parses = base
+    reg = vs.registry()
+    reg.data()
+    snap = reg.snapshot_path
+    magic, head, _rest = snap.read_bytes().split(b"\n", 2)
+    header = json.loads(head)
+    evil = pickle.dumps({"data": pickle.dumps(_Planted()), "index": {}})
+    want = yaml.safe_load(_NODES)
+    parses.clear()
+    for fmt in (1, vs.FORMAT):                                       # 옛 판 머리 · 지금 머리 위장
+        snap.write_bytes(magic + b"\n" + json.dumps(dict(header, format=fmt)).encode() + b"\n" + evil)
+        vs._registries.clear()
+        assert vs.registry().data() == want
+        assert vs.registry().source == "yaml" and _PLANTED == []
+    assert len(parses) == 2
+
+
+def test_v6_foreign_interpreter_snapshot_is_rebuilt(base):
+    root, parses = base
+    reg = vs.registry()
+    reg.data()
+    snap = reg.snapshot_path
+    magic, head, rest = snap.read_bytes().split(b"\n", 2)
+    header = json.loads(head)
+    assert header["python"] == list(sys.version_info[:2]) and header["marshal"] == marshal.version
+    want = yaml.safe_load(_NODES)
+    parses.clear()
+    for foreign in ({"python": [3, 1]}, {"marshal": marshal.version + 1}):
+        snap.write_bytes(magic + b"\n" + json.dumps(dict(header, **foreign)).encode() + b"\n" + rest)
+        vs._registries.clear()
+        assert vs.registry().data() == want and vs.registry().source == "yaml"
+    assert len(parses) == 2
+    vs._registries.clear()
+    assert vs.registry().data() == want and vs.registry().source == "snapshot"   # 다시 구운 것은 적중
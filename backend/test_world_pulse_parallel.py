@@ -0,0 +1,109 @@
+"""World Pulse 병렬 수집(collect_snapshot) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — 경제·뉴스·기술·날씨 수집기가 차례로 돌던 것을 network 레인에 동시에 내고 수집기별
+제한시간 + 전체 마감으로 묶었다. 이 배터리는 스냅샷 지연이 **합이 아니라 가장 느린 것(≤마감)**
+이고, 늦거나 죽은 칸은 마지막 정상값을 stale 표시와 함께 남기는지를 본다.
+
+    W1. 동시 수집 — 네 칸 × 0.3s 가 ~0.3s 에 끝나고 stale 이 없다
+    W2. 늦은 칸 — 제한시간을 넘긴 칸은 직전 정상값 + stale(timeout), 나머지는 새 값
+    W3. 전체 마감 — 모든 칸이 멈춰도 마감에 돌아오고, 수집 플래그가 풀린다
+    W4. 빈손·실패 — 빈 결과는 새 값(stale 아님, 변화분에선 빠짐), 예외만 저장된 스냅샷 값으로(stale: error)
+
+실행: python3 -m pytest backend/test_world_pulse_parallel.py
+"""
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import pulse_db  # noqa: E402
+import world_pulse  # noqa: E402
+import world_pulse_collectors as wpc  # noqa: E402
+
+_VALUES = {"economy": {"kospi": {"price": 1}}, "news": ["n1"], "tech": ["t1"], "weather": "맑음"}
+
+
+@pytest.fixture
+def pulse(tmp_path, monkeypatch):
+    """임시 스냅샷 DB + 빈 마지막 정상값 + 칸마다 바꿔 끼울 수 있는 가짜 수집기."""
+    monkeypatch.setattr(world_pulse, "PULSE_DB_PATH", tmp_path / "world_pulse_db.json")
+    monkeypatch.setattr(pulse_db, "CONSCIOUSNESS_DB_PATH", tmp_path / "world_pulse.db")
+    monkeypatch.setattr(wpc, "_snap_cache", None)
+    monkeypatch.setattr(world_pulse, "_config_cache", {"collect": {"timeout_s": 2, "deadline_s": 3}})
+    monkeypatch.setattr(wpc, "_last_good", {})
+    behave = {name: (0.3, value) for name, value in _VALUES.items()}
+    release = threading.Event()
+
+    def _make(name):
+        def _fn():
+            delay, value = behave[name]
+            if delay is None:
+                release.wait(10)                                     # 죽은 상류
+            else:
+                time.sleep(delay)
+            if isinstance(value, Exception):
+                raise value
+            return value
+        return _fn
+
+    for name, (_fn, section) in list(wpc._SNAPSHOT_COLLECTORS.items()):
+        monkeypatch.setitem(wpc._SNAPSHOT_COLLECTORS, name, (_make(name), section))
+    yield behave
+    release.set()
+
+
+def test_w1_collectors_run_concurrently(pulse):
+    t0 = time.monotonic()
+    snap = wpc.collect_snapshot()
+    assert time.monotonic() - t0 < 0.9                               # 합(1.2s)이 아니라 최댓값
+    assert "stale" not in snap
+    assert {k: snap[k] for k in _VALUES} == _VALUES
+
+
+def test_w2_slow_slot_keeps_last_good(pulse):
+    first = wpc.collect_snapshot()
+    world_pulse.save_snapshot(first)
+    pulse["news"] = (None, ["안 옴"])
+    pulse["weather"] = (0.05, "흐림")
+    t0 = time.monotonic()
+    snap = wpc.collect_snapshot()
+    assert time.monotonic() - t0 < 2.8
+    assert snap["news"] == ["n1"] and snap["weather"] == "흐림"
+    assert snap["stale"] == {"news": {"reason": "timeout", "as_of": first["collected_at"]}}
+
+
+def test_w3_overall_deadline_and_flag_released(pulse, monkeypatch):
+    monkeypatch.setattr(world_pulse, "_config_cache", {"collect": {"timeout_s": 5, "deadline_s": 0.5}})
+    for name in _VALUES:
+        pulse[name] = (None, None)
+    t0 = time.monotonic()
+    snap = wpc.collect_snapshot()
+    assert time.monotonic() - t0 < 1.5
+    assert set(snap["stale"]) == set(_VALUES)
+    assert all(v["reason"] == "timeout" and v["as_of"] is None for v in snap["stale"].values())
+    assert snap["economy"] == {} and snap["news"] == [] and snap["weather"] == ""
+    assert wpc._collecting is False
+
+
+def test_w4_empty_is_fresh_only_errors_use_saved_snapshot(pulse, monkeypatch):
+    first = wpc.collect_snapshot()
+    world_pulse.save_snapshot(first)
+    monkeypatch.setattr(wpc, "_last_good", {})                       # 재시작 — 디스크에서 채운다
+    monkeypatch.setattr(wpc, "_snap_cache", None)
+    pulse["news"] = (0.01, [])                                       # 상류가 정말 비웠다
+    pulse["economy"] = (0.01, OSError("upstream down"))
+    snap = wpc.collect_snapshot()
+    assert snap["news"] == []                                        # 어제 뉴스를 되살리지 않는다
+    assert snap["economy"] == _VALUES["economy"]
+    assert snap["stale"] == {"economy": {"reason": "error", "as_of": first["collected_at"]}}
+
+    pulse["economy"] = (0.01, {})                                   # 빈 값은 변화분이 아니다
+    pulse["news"] = (0.01, _VALUES["news"])
+    monkeypatch.setattr(world_pulse, "_get_pulse_db", lambda: (_ for _ in ()).throw(OSError("x")))
+    delta = wpc._collect_world_delta()
+    assert "economy" not in delta
+    assert delta == {k: _VALUES[k] for k in ("weather", "news", "tech")}
@@ -0,0 +1,91 @@
+"""World Pulse 스냅샷 저장소(world_snapshots) 회귀 테스트 (2026-10-16)
+
+왜 있는가 — world_pulse_db.json 은 저장마다 전체를 다시 쓰고 get_pulse_trend·get_pulse_summary
+마다 전체를 파싱했다. 스냅샷이 world_pulse.db 의 날짜 키 테이블로 옮겨 가고 최근 며칠은 메모리
+캐시에 산다. 이 배터리는 옛 파일이 **잃는 것 없이** 옮겨지고, 저장은 그날 한 줄만, 반복 읽기는
+DB 를 열지 않는지를 본다.
+
+    S1. 이관 — 옛 JSON 의 스냅샷이 그대로 보이고, 파일은 .migrated 로 남는다
+    S2. 증분 저장 — 같은 날 다시 저장하면 그 줄만 바뀌고 캐시가 곧바로 새 값
+    S3. 캐시 — 연속 trend/summary/today 는 연결을 열지 않는다
+    S4. 캐시 밖 — SNAPSHOT_CACHE_DAYS 보다 긴 기간은 DB 에서 읽는다
+
+실행: python3 -m pytest backend/test_world_snapshots.py
+"""
+import json
+import sqlite3
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+import boot_paths  # noqa: F401,E402
+
+import pulse_db  # noqa: E402
+import world_pulse  # noqa: E402
+import world_pulse_collectors as wpc  # noqa: E402
+
+
+def _snap(days_ago, price=1.0):
+    d = (date.today() - timedelta(days=days_ago)).isoformat()
+    return {"date": d, "collected_at": f"{d}T09:00:00", "economy": {"kospi": {"price": price}},
+            "news": [f"뉴스 {days_ago}"], "tech": [], "weather": "맑음"}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_pulse, "PULSE_DB_PATH", tmp_path / "world_pulse_db.json")
+    monkeypatch.setattr(pulse_db, "CONSCIOUSNESS_DB_PATH", tmp_path / "world_pulse.db")
+    monkeypatch.setattr(wpc, "_snap_cache", None)
+    monkeypatch.setattr(wpc, "_migrated_paths", set())
+    return tmp_path
+
+
+def _count_connects(monkeypatch):
+    real = sqlite3.connect
+    opened = []
+    monkeypatch.setattr(sqlite3, "connect", lambda *a, **k: opened.append(a) or real(*a, **k))
+    return opened
+
+
+def test_s1_json_migrates_once(store):
+    old = {"snapshots": {s["date"]: s for s in (_snap(0), _snap(1), _snap(40))}}
+    (store / "world_pulse_db.json").write_text(json.dumps(old, ensure_ascii=False), encoding="utf-8")
+    assert [s["date"] for s in wpc.get_pulse_trend(2)] == [_snap(0)["date"], _snap(1)["date"]]
+    assert not (store / "world_pulse_db.json").exists()
+    assert (store / "world_pulse_db.json.migrated").exists()
+    assert wpc._load_db()["snapshots"] == old["snapshots"]           # 캐시 밖(40일 전)까지
+
+
+def test_s2_save_is_incremental_and_write_through(store):
+    for i in range(3):
+        wpc.save_snapshot(_snap(i))
+    assert wpc.get_today_pulse()["economy"]["kospi"]["price"] == 1.0
+    wpc.save_snapshot(_snap(0, price=2.5))
+    assert wpc.get_today_pulse()["economy"]["kospi"]["price"] == 2.5
+    conn = sqlite3.connect(str(store / "world_pulse.db"))
+    assert conn.execute("SELECT COUNT(*) FROM world_snapshots").fetchone()[0] == 3
+    conn.close()
+
+
+def test_s3_repeated_reads_hit_cache(store, monkeypatch):
+    for i in range(5):
+        wpc.save_snapshot(_snap(i))
+    wpc.get_pulse_trend(7)                                            # 캐시 채움
+    opened = _count_connects(monkeypatch)
+    for _ in range(20):
+        assert len(wpc.get_pulse_trend(7)) == 5
+        assert "뉴스 0" in wpc.get_pulse_summary(3)
+        assert wpc.get_today_pulse()["date"] == date.today().isoformat()
+    assert opened == []
+    trend = wpc.get_pulse_trend(7)
+    trend[0]["economy"] = {}                                          # 돌려준 dict 를 고쳐도
+    assert wpc.get_pulse_trend(7)[0]["economy"]                       # 캐시는 그대로
+
+
+def test_s4_long_range_reads_db(store, monkeypatch):
+    far = wpc.SNAPSHOT_CACHE_DAYS + 5
+    pulse_db.put_world_snapshots([_snap(0), _snap(far - 1)])
+    assert [s["date"] for s in wpc.get_pulse_trend(far)] == [_snap(0)["date"], _snap(far - 1)["date"]]
+    assert [s["date"] for s in wpc.get_pulse_trend(7)] == [_snap(0)["date"]]
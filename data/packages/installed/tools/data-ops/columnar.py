@@ -0,0 +1,509 @@
+"""columnar.py — data-ops 변환자의 열 지향(columnar) 가속 경로 (2026-10-16).
+
+왜 있는가 — filter/sort/groupby/join/compute 는 행 dict 를 한 줄씩 돌며 where_dsl._OPS 람다를
+행×조건마다 불렀다. KOSIS·금융 표는 수십만 행이라 groupby+join 이 순수 인터프리터 시간만으로
+수 초를 먹었다. 여기서는 행 목록을 **열**로 한 번 펼치고(_Frame — NumPy 가 있으면 ndarray,
+없으면 list), 값 해석(_as_num·소문자화·키 정규화)을 열마다 한 번만 한 뒤 비교·정렬·집계를
+열 단위로 한다.
+
+계약 — 뜻은 옛 행 경로와 **같다**. 결과가 갈릴 수 있는 모양이면 None 을 돌려 호출자(handler)가
+옛 경로로 간다(조용한 근사 금지):
+  · 행 수가 _MIN_ROWS 미만 — 열로 펼치는 비용이 더 크다
+  · 전-필드 검색(연산자 없는 where)인데 행마다 키 집합이 다름(ragged)
+  · 정렬·min/max 의 수치 열에 NaN·-0.0 이 섞임 — 파이썬 비교 순서에 기대는 자리
+  · 그룹 키가 해시 불가(옛 경로가 같은 TypeError 를 정직하게 낸다)
+  · compute 식이 사칙(+ - * /) 밖의 구문을 쓰거나 참조 열이 전부 유한 수치가 아님 — 그 식은
+    행 경로(eval)가 정본이고, 벡터 결과가 0 나눗셈을 밟은 행도 행 경로로 다시 계산한다
+sort·groupby 의 벡터 경로는 NumPy 전용이다(없으면 옛 경로 — 거기선 키 함수가 이미 행마다 한 번
+뿐이라 list 로는 이득이 없다). filter·join·compute 의 열 캐시는 list 로도 돈다.
+
+모듈레벨은 stdlib 만(폰 import-safe) — numpy 는 함수 안 지연 import.
+INDIEBIZ_COLUMNAR=off 면 전부 옛 경로, =list 면 NumPy 가 있어도 list 경로(비교 측정용).
+"""
+
+import ast
+import math
+import operator
+import os
+
+# 열 경로를 타는 최소 행 수 — 이 아래는 열 펼치기·배열 변환 비용이 아끼는 시간보다 크다
+_MIN_ROWS = 512
+
+_np_state = {"checked": False, "mod": None}
+_dsl = None          # where_dsl 모듈 — handler 가 자기 인스턴스를 묶는다(_WhereError 클래스 동일성)
+
+
+def bind_dsl(wdsl):
+    """handler 가 로드한 where_dsl 을 묶는다 — 같은 모듈 인스턴스여야 handler 의 except 가 잡는다."""
+    global _dsl
+    _dsl = wdsl
+
+
+def _mode():
+    return os.environ.get("INDIEBIZ_COLUMNAR", "").strip().lower()
+
+
+def _np():
+    """numpy 모듈 또는 None (미설치·list 강제)."""
+    if not _np_state["checked"]:
+        _np_state["checked"] = True
+        if _mode() != "list":
+            try:
+                import numpy
+                _np_state["mod"] = numpy
+            except ImportError:
+                _np_state["mod"] = None
+    return _np_state["mod"]
+
+
+def _eligible(rows):
+    return _dsl is not None and _mode() != "off" and isinstance(rows, list) and len(rows) >= _MIN_ROWS
+
+
+class _Frame:
+    """행 dict 목록의 열 뷰 — 열 값과 그 해석값을 처음 물을 때 한 번만 만든다.
+
+    행 객체는 그대로 둔다(filter/sort 는 원 행을 돌려준다 — 옛 경로와 동일성까지 같게).
+    빠진 키는 옛 경로의 item.get() 처럼 None 으로 읽힌다.
+    """
+
+    __slots__ = ("rows", "n", "_cols", "_nums", "_lows", "_keys", "_strs")
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.n = len(rows)
+        self._cols, self._nums, self._lows, self._keys, self._strs = {}, {}, {}, {}, {}
+
+    def col(self, name):
+        c = self._cols.get(name)
+        if c is None:
+            c = self._cols[name] = [r.get(name) for r in self.rows]
+        return c
+
+    def nums(self, name):
+        """(수치 list[float|None], 수치 여부 list[bool]) — _as_num 을 값마다 1회."""
+        v = self._nums.get(name)
+        if v is None:
+            as_num = _dsl._as_num
+            vals = [as_num(x) for x in self.col(name)]
+            v = self._nums[name] = (vals, [x is not None for x in vals])
+        return v
+
+    def arrays(self, name):
+        """NumPy 판 nums — (float64 값[비수치=0.0], bool 수치 여부)."""
+        key = ("np", name)
+        v = self._nums.get(key)
+        if v is None:
+            np = _np()
+            vals, isnum = self.nums(name)
+            arr = np.fromiter((x if x is not None else 0.0 for x in vals), dtype=float, count=self.n)
+            v = self._nums[key] = (arr, np.fromiter(isnum, dtype=bool, count=self.n))
+        return v
+
+    def lows(self, name):
+        """str(v).lower() — contains/startswith/endswith·전-필드 검색용."""
+        c = self._lows.get(name)
+        if c is None:
+            c = self._lows[name] = [str(x).lower() for x in self.col(name)]
+        return c
+
+    def eq_keys(self, name):
+        """str(v).strip().lower() — _num_eq 의 문자열 비교 쪽."""
+        c = self._keys.get(name)
+        if c is None:
+            c = self._keys[name] = [str(x).strip().lower() for x in self.col(name)]
+        return c
+
+    def strs(self, name):
+        """str(v) — _num_cmp 의 문자열 비교 쪽(대소문자 그대로)."""
+        c = self._strs.get(name)
+        if c is None:
+            c = self._strs[name] = [str(x) for x in self.col(name)]
+        return c
+
+
+# ───────────────────────── filter ─────────────────────────
+
+def _flatten_where(where):
+    """where → AND 조건 목록 [(kind, ...)] — where_dsl._match 와 같은 해석, 같은 평가 순서.
+
+    ('cmp', field, op, value) · ('any', 소문자 검색어). 조건 없음 = [] (전 행 통과).
+    """
+    if where is None or where == "":
+        return []
+    if isinstance(where, str):
+        parsed = _dsl._parse_where_str(where)
+        if parsed:
+            field, op, val = parsed
+            return [("cmp", field, op, val)]
+        return [("any", where.lower())]
+    if isinstance(where, list):
+        out = []
+        for w in where:
+            out.extend(_flatten_where(w))
+        return out
+    if isinstance(where, dict):
+        field = where.get("field") or where.get("col") or where.get("column")
+        if field is not None:
+            return [("cmp", str(field), str(where.get("op", "==")).lower(), where.get("value"))]
+        return [("cmp", str(k), "==", v) for k, v in where.items()]
+    return []
+
+
+_CMP = {"<": operator.lt, "lt": operator.lt, "<=": operator.le, "le": operator.le,
+        ">": operator.gt, "gt": operator.gt, ">=": operator.ge, "ge": operator.ge}
+_EQ = {"==": False, "eq": False, "!=": True, "ne": True}      # 값 = 부정 여부
+
+
+def _eq_mask(f, field, val, alive):
+    """_num_eq(a, val) — 수치끼리면 float 비교, 아니면 strip·lower 문자열 비교."""
+    nb = _dsl._as_num(val)
+    kb = str(val).strip().lower()
+    if nb is None:
+        keys = f.eq_keys(field)
+        return [keys[i] == kb for i in alive]
+    col = f.col(field)
+    np = _np()
+    if np is not None:
+        arr, isnum = f.arrays(field)
+        idx = np.asarray(alive, dtype=np.intp)
+        res = arr[idx] == nb
+        for j in np.flatnonzero(~isnum[idx]).tolist():
+            res[j] = str(col[alive[j]]).strip().lower() == kb
+        return res.tolist()
+    vals, isnum = f.nums(field)
+    return [(vals[i] == nb) if isnum[i] else (str(col[i]).strip().lower() == kb) for i in alive]
+
+
+def _cmp_mask(f, field, op, val, alive):
+    """_num_cmp(a, val) <op> 0 — 부호 함수 (a>b)-(a<b) 를 그대로 재현(NaN 이면 0 → <=·>= 참)."""
+    cmp0 = _CMP[op]
+    nb = _dsl._as_num(val)
+    sb = str(val)
+    if nb is None:
+        strs = f.strs(field)
+        return [cmp0((s > sb) - (s < sb), 0) for s in (strs[i] for i in alive)]
+    col = f.col(field)
+    np = _np()
+    if np is not None:
+        arr, isnum = f.arrays(field)
+        idx = np.asarray(alive, dtype=np.intp)
+        a = arr[idx]
+        sign = (a > nb).astype(np.int8) - (a < nb).astype(np.int8)
+        res = cmp0(sign, 0)
+        for j in np.flatnonzero(~isnum[idx]).tolist():
+            s = str(col[alive[j]])
+            res[j] = cmp0((s > sb) - (s < sb), 0)
+        return res.tolist()
+    vals, isnum = f.nums(field)
+    out = []
+    for i in alive:
+        if isnum[i]:
+            a = vals[i]
+            out.append(cmp0((a > nb) - (a < nb), 0))
+        else:
+            s = str(col[i])
+            out.append(cmp0((s > sb) - (s < sb), 0))
+    return out
+
+
+def _cond_mask(f, cond, alive, keyset):
+    kind = cond[0]
+    if kind == "any":
+        s = cond[1]
+        hit = [False] * len(alive)
+        for name in keyset:
+            low = f.lows(name)
+            for j, i in enumerate(alive):
+                if not hit[j] and s in low[i]:
+                    hit[j] = True
+        return hit
+    _k, field, op, val = cond
+    o = str(op).lower()
+    fn = _dsl._OPS.get(o)
+    if fn is None:
+        _dsl._apply_op(op, None, val)          # 모르는 op — where_dsl 의 정직 거절 문구 그대로 raise
+    if o in _EQ:
+        m = _eq_mask(f, field, val, alive)
+        return [not x for x in m] if _EQ[o] else m
+    if o in _CMP:
+        return _cmp_mask(f, field, o, val, alive)
+    if o in ("contains", "startswith", "endswith"):
+        sb = str(val).lower()
+        low = f.lows(field)
+        if o == "contains":
+            return [sb in low[i] for i in alive]
+        if o == "startswith":
+            return [low[i].startswith(sb) for i in alive]
+        return [low[i].endswith(sb) for i in alive]
+    col = f.col(field)                          # matches·in — 행마다 원래 판정(정규식 오류 시점까지 같게)
+    return [fn(col[i], val) for i in alive]
+
+
+def filter_rows(rows, where):
+    """where 를 만족하는 행(원 객체) 목록 — `[r for r in rows if _match(r, where)]` 와 같다.
+
+    AND 조건은 앞 조건을 통과한 행에만 평가한다(all() 단락과 같은 (행, 조건) 쌍 — 깨진
+    정규식·모르는 op 의 거절 시점까지 같다). None = 열 경로가 맡지 않는 모양.
+    """
+    if not _eligible(rows):
+        return None
+    conds = _flatten_where(where)
+    keyset = None
+    if any(c[0] == "any" for c in conds):
+        k0 = rows[0].keys()
+        if any(r.keys() != k0 for r in rows):
+            return None                         # ragged — 전-필드 검색은 행마다 values() 가 달라진다
+        keyset = list(k0)
+    f = _Frame(rows)
+    alive = list(range(f.n))
+    for cond in conds:
+        if not alive:
+            break
+        mask = _cond_mask(f, cond, alive, keyset)
+        alive = [i for i, m in zip(alive, mask) if m]
+    return [rows[i] for i in alive]
+
+
+# ───────────────────────── sort ─────────────────────────
+
+def sort_rows(rows, by, desc=False):
+    """`sorted(rows, key=_sort_key(by), reverse=desc)` 의 NumPy 판 — 안정 정렬, 같은 키는 입력 순서.
+
+    키 = (범주 0 수치·1 문자열·2 None, 수치, 소문자 문자열). 문자열 순위는 파이썬 정렬로 매겨
+    코드포인트 순서가 옛 경로와 같다. reverse 는 키 부정 + 안정 정렬(동률 순서 보존 = sorted 의 reverse).
+    """
+    np = _np()
+    if np is None or not _eligible(rows):
+        return None
+    f = _Frame(rows)
+    col = f.col(by)
+    arr, isnum = f.arrays(by)
+    if np.isnan(arr[isnum]).any():
+        return None
+    isnone = np.fromiter((v is None for v in col), dtype=bool, count=f.n)
+    cat = np.where(isnone, 2, np.where(isnum, 0, 1)).astype(np.int8)
+    sub = np.where(isnum, arr, 0.0)
+    str_idx = np.flatnonzero(cat == 1).tolist()
+    if str_idx:
+        lows = [str(col[i]).lower() for i in str_idx]
+        rank = {s: k for k, s in enumerate(sorted(set(lows)))}
+        sub[str_idx] = [rank[s] for s in lows]
+    if desc:
+        sub, cat = -sub, -cat
+    order = np.argsort(sub, kind="stable")
+    order = order[np.argsort(cat[order], kind="stable")]
+    return [rows[i] for i in order.tolist()]
+
+
+# ───────────────────────── groupby ─────────────────────────
+
+def groupby_rows(dicts, by, specs):
+    """그룹 집계 out_rows — handler._op_groupby 의 그룹핑·_AGG 와 같은 값.
+
+    그룹 부호화는 파이썬 dict(키 동등성 = 옛 경로 그대로, 입력 순서 보존)로 한 번, 집계는
+    np.bincount·ufunc.at 으로 열마다 한 번. sum 은 `_as_num(v) or 0` 규약까지 재현한다 —
+    수치 0 이 아닌 값이 하나도 없는 그룹의 합은 int 0(옛 sum 의 시작값)이다.
+    sum·avg 의 합만은 bincount(단순 누적)가 아니라 그룹별 내장 sum() 이다 — 같은 값을 같은 순서로
+    더하므로 옛 경로와 비트까지 같다. 3.12+ 의 sum() 은 보정 합산이라 [1e16, 1.0, -1e16]*200 이
+    200.0 인데 bincount 는 0.0 이다. math.fsum 도 3.11 이하의 단순 합산과는 갈린다.
+    """
+    np = _np()
+    if np is None or not _eligible(dicts):
+        return None
+    f = _Frame(dicts)
+    groups, order, codes = {}, [], []
+    try:
+        for gk in f.col(by):
+            g = groups.get(gk)
+            if g is None:
+                g = groups[gk] = len(order)
+                order.append(gk)
+            codes.append(g)
+    except TypeError:
+        return None                             # 해시 불가 키 — 옛 경로가 같은 오류를 낸다
+    ng = len(order)
+    codes = np.asarray(codes, dtype=np.intp)
+    counts = np.bincount(codes, minlength=ng)
+    grouped = np.argsort(codes, kind="stable")          # 그룹별로 모으되 그룹 안은 입력 순서
+    bounds = np.cumsum(counts)[:-1].tolist()
+    cols = []
+    for _out, op, src in specs:
+        if op == "count":
+            cols.append([int(c) for c in counts.tolist()])
+            continue
+        arr, isnum = f.arrays(src)
+        if op in ("sum", "avg"):
+            w = np.where(isnum, arr, 0.0)
+            sums = [sum(part.tolist()) for part in np.split(w[grouped], bounds)]
+            if op == "avg":
+                cols.append([round(s / c, 6) for s, c in zip(sums, counts.tolist())])
+                continue
+            nz = np.bincount(codes, weights=(isnum & (arr != 0)).astype(float), minlength=ng)
+            cols.append([round(s, 6) if z else 0 for s, z in zip(sums, nz.tolist())])
+            continue
+        a = arr[isnum]
+        if np.isnan(a).any() or (np.signbit(a) & (a == 0)).any():
+            return None                         # min()/max() 의 NaN·±0 동률 순서는 파이썬 몫
+        c = codes[isnum]
+        ufunc, init = (np.minimum, np.inf) if op == "min" else (np.maximum, -np.inf)
+        res = np.full(ng, init)
+        ufunc.at(res, c, a)
+        has = np.bincount(c, minlength=ng) > 0
+        cols.append([float(v) if h else None for v, h in zip(res.tolist(), has.tolist())])
+    return [[gk] + [col[g] for col in cols] for g, gk in enumerate(order)]
+
+
+# ───────────────────────── join ─────────────────────────
+
+def join_items(ra, rb, on, norm, suffix):
+    """items inner join — handler._op_join items 분기와 같은 출력(행 순서·키 순서·_2 접미사).
+
+    옛 경로는 매칭 짝마다 `_suffix_collisions` 를 다시 불렀다. 좌측 키 *집합*과 우측 키 *순서*가
+    행마다 같으면 접미사 표는 한 번이면 된다.
+    """
+    if _dsl is None or _mode() == "off" or len(ra) + len(rb) < _MIN_ROWS:
+        return None
+    if not ra or not rb or not all(isinstance(r, dict) for r in ra) or not all(isinstance(r, dict) for r in rb):
+        return None
+    rk0 = tuple(rb[0])
+    lk0 = ra[0].keys()
+    if any(tuple(r) != rk0 for r in rb) or any(l.keys() != lk0 for l in ra):
+        return None
+    add = [k for k in rk0 if k != on]
+    disp = list(zip(add, suffix(list(lk0), add)))
+    index = {}
+    for r in rb:
+        v = r.get(on)
+        if v is not None:
+            index.setdefault(norm(v), []).append(r)
+    out = []
+    for l in ra:
+        v = l.get(on)
+        if v is None:
+            continue
+        for r in index.get(norm(v), ()):
+            merged = dict(l)
+            for orig, name in disp:
+                merged[name] = r[orig]
+            out.append(merged)
+    return out
+
+
+def join_table_rows(ta, tb, on, norm):
+    """table inner join 의 결과 행 — 매칭 짝마다 우측 {열: 값} dict 를 짓던 것을 열 인덱스 표로.
+
+    동명 열이 겹치면 옛 dict 처럼 **마지막** 열의 값을 읽는다. 짧은 행은 None 으로 채운다.
+    """
+    if _mode() == "off":
+        return None
+    ca = [str(c) for c in (ta.get("columns") or [])]
+    cb = [str(c) for c in (tb.get("columns") or [])]
+    lki, rki = ca.index(on), cb.index(on)
+    last = {c: i for i, c in enumerate(cb)}
+    extra_idx = [last[c] for c in cb if c != on]
+    index = {}
+    for r in tb.get("rows") or []:
+        index.setdefault(norm(r[rki] if rki < len(r) else None), []).append(r)
+    out_rows = []
+    for r in ta.get("rows") or []:
+        for rb_row in index.get(norm(r[lki] if lki < len(r) else None), ()):
+            n = len(rb_row)
+            out_rows.append(list(r) + [rb_row[j] if j < n else None for j in extra_idx])
+    return out_rows
+
+
+# ───────────────────────── compute ─────────────────────────
+
+_VEC_BINOPS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
+
+
+def _vec_plan(expr):
+    """식 → 벡터 평가 가능한 AST(사칙·단항 부호·유한 수 상수·이름만) 또는 None."""
+    try:
+        tree = ast.parse(str(expr), mode="eval")
+    except SyntaxError:
+        return None
+    names = set()
+    for n in ast.walk(tree):
+        if isinstance(n, ast.BinOp):
+            if type(n.op) not in _VEC_BINOPS:
+                return None
+        elif isinstance(n, ast.UnaryOp):
+            if not isinstance(n.op, (ast.USub, ast.UAdd)):
+                return None
+        elif isinstance(n, ast.Constant):
+            v = n.value
+            if isinstance(v, bool) or not isinstance(v, (int, float)):
+                return None
+            if isinstance(v, int) and abs(v) >= 2 ** 53:
+                return None
+            if isinstance(v, float) and not math.isfinite(v):
+                return None
+        elif isinstance(n, ast.Name):
+            names.add(n.id)
+        elif not isinstance(n, (ast.Expression, ast.Load, ast.USub, ast.UAdd, *_VEC_BINOPS)):
+            return None
+    if not names:
+        return None                             # 상수식 — 결과 형(int)이 파이썬 쪽 몫
+    return tree.body, names
+
+
+def _vec_eval(node, env, bad):
+    """AST 를 열 배열로 평가. 0 으로 나누는 행은 bad 에 표시(파이썬이면 ZeroDivisionError 인 자리)."""
+    np = _np()
+    if isinstance(node, ast.Name):
+        return env[node.id]
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.UnaryOp):
+        v = _vec_eval(node.operand, env, bad)
+        return -v if isinstance(node.op, ast.USub) else +v
+    left = _vec_eval(node.left, env, bad)
+    right = _vec_eval(node.right, env, bad)
+    if isinstance(node.op, ast.Div):
+        if isinstance(right, np.ndarray):
+            bad |= right == 0
+        elif right == 0:
+            bad[:] = True                       # 상수 0 나눗셈 — 전 행이 행 경로 몫
+            return np.zeros(bad.shape)
+    return _VEC_BINOPS[type(node.op)](left, right)
+
+
+def compute_vectors(rows, spec):
+    """compute 식 중 벡터로 풀리는 것의 열 결과 — {새열: (값 list, 행 경로 재계산 여부 list)}.
+
+    자격: NumPy·행 수, 식이 사칙·부호·상수·이름뿐, 참조 열이 모든 행에서 식별자 키로 있고
+    유한 수치. 유한 결과이고 0 나눗셈을 안 밟은 행은 IEEE 연산이 파이썬 float 와 같으므로 그대로
+    쓰고, 나머지 행은 호출자가 행 경로(eval)로 다시 계산한다 — 오류 집계·예시 문구가 옛 경로와 같게.
+    """
+    np = _np()
+    if np is None or not _eligible(rows) or not spec:
+        return {}
+    f = _Frame(rows)
+    out = {}
+    with np.errstate(all="ignore"):
+        for new_col, expr in spec.items():
+            plan = _vec_plan(expr)
+            if plan is None:
+                continue
+            body, names = plan
+            env = {}
+            for name in names:
+                if not name.isidentifier() or any(name not in r for r in rows):
+                    env = None
+                    break
+                arr, isnum = f.arrays(name)
+                if not isnum.all() or not np.isfinite(arr).all():
+                    env = None
+                    break
+                env[name] = arr
+            if env is None:
+                continue
+            bad = np.zeros(f.n, dtype=bool)
+            res = _vec_eval(body, env, bad)
+            if not isinstance(res, np.ndarray):
+                continue
+            redo = bad | ~np.isfinite(res)
+            out[str(new_col)] = (res.tolist(), redo.tolist())
+    return out
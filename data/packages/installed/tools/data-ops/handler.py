@@ -28,11 +28,18 @@ import re
 # ───────────────────────── 통화 추출/주입 (공유) ─────────────────────────
 
 def _parse_prev(prev):
-    """_prev_result(JSON 문자열 또는 dict/list) → 파이썬 객체."""
+    """_prev_result(JSON 문자열·dict/list·파이프 구조 통화) → 파이썬 객체.
+
+    구조 통화(common.currency.PipeCurrency)는 앞 step 의 객체를 재파싱 없이 그대로 쓴다 —
+    변환자는 봉투를 dict() 사본으로만 고치므로 공유 객체를 변형하지 않는다(옵트인 약속).
+    """
     if prev is None:
         return None
     if isinstance(prev, (dict, list)):
         return prev
+    _obj = getattr(prev, "obj", None)
+    if _obj is not None and callable(getattr(prev, "text", None)):
+        return _obj
     if isinstance(prev, str):
         try:
             return json.loads(prev)
@@ -298,8 +305,62 @@ _num_eq = _wdsl._num_eq
 _num_cmp = _wdsl._num_cmp
 _parse_where_str = _wdsl._parse_where_str
 
+# 열 지향 가속 경로(columnar.py, 2026-10-16) — 큰 표에서 filter/sort/groupby/join/compute 를 열
+# 단위로. 뜻이 갈릴 수 있는 모양이면 None 을 돌려 아래 행 경로가 그대로 돈다(정본은 행 경로).
+_colx = _load_sibling_where(__file__, "columnar")
+_colx.bind_dsl(_wdsl)
+
+
+def _filtered_rows(rows, where):
+    kept = _colx.filter_rows(rows, where)
+    return kept if kept is not None else [r for r in rows if _match(r, where)]
 
 
+def _sorted_rows(rows, by, desc):
+    srt = _colx.sort_rows(rows, by, desc)
+    return srt if srt is not None else sorted(rows, key=_sort_key(by), reverse=desc)
+
+
+
+
+def _spill_rows(prev):
+    """행 형식 스필 참조(items 종류)면 스트리밍 뷰(common.spill.SpillRows), 아니면 None.
+    filter·take 는 이 뷰를 한 줄씩 읽어 입력 전량을 메모리에 올리지 않는다 (2026-10-16)."""
+    if not (isinstance(prev, dict) and isinstance(prev.get("ref"), dict)):
+        return None
+    try:
+        from common.spill import open_rows
+    except ImportError:
+        return None
+    rows = open_rows(prev)
+    return rows if rows is not None and rows.kind == "items" else None
+
+
+def _filter_spilled(rows, where):
+    """스필 행을 흘려 읽으며 거른다. where 필드가 어느 행에도 없으면 None — 파고들기·정직한
+    필드 에러는 전량 경로(_get_items_for_fields)의 몫이다. 문법 오류는 필드가 다 있을 때만 낸다
+    (전량 경로의 판정 순서: 빠진 필드 → 문법)."""
+    fields = set(_where_fields(where))
+    seen, kept, err = set(), [], None
+    for r in rows:
+        if not isinstance(r, dict):
+            continue
+        if len(seen) < len(fields):
+            seen.update(f for f in fields if f in r)
+        if err is None:
+            try:
+                if _match(r, where):
+                    kept.append(r)
+            except _WhereError as e:
+                err = e
+        elif len(seen) == len(fields):
+            break
+    if len(seen) < len(fields):
+        return None
+    if err is not None:
+        raise err
+    return _emit_items(rows.shell(), kept)
+
 
 def _row_dicts(table):
     """table rows → [{col: val}] (where/sort/dedup이 items와 같은 코드 쓰도록)."""
@@ -332,6 +393,11 @@ def _op_filter_impl(prev, params):
     '필드 오타'는 구별돼야 한다).
     """
     where = params.get("where") or params.get("condition")
+    spilled = _spill_rows(prev)
+    if spilled is not None:
+        out = _filter_spilled(spilled, where)
+        if out is not None:
+            return out
     # 파고들기는 입구(_get_items_for_fields)가 담당 — R5 개별 구현을 F6 에서 입구로 접음.
     recs, env = _get_items_for_fields(prev, _where_fields(where))
     if recs is not None:
@@ -340,7 +406,7 @@ def _op_filter_impl(prev, params):
             missing = [f for f in _where_fields(where) if not any(f in r for r in dict_recs)]
             if missing:
                 return _field_missing_error("filter", missing, dict_recs)
-        return _emit_items(env, [r for r in dict_recs if _match(r, where)])
+        return _emit_items(env, _filtered_rows(dict_recs, where))
     table, env = _get_table(prev)
     if table is not None:
         dicts = _row_dicts(table)
@@ -348,7 +414,7 @@ def _op_filter_impl(prev, params):
             missing = [f for f in _where_fields(where) if not any(f in d for d in dicts)]
             if missing:
                 return _field_missing_error("filter", missing, dicts)
-        kept = [d for d in dicts if _match(d, where)]
+        kept = _filtered_rows(dicts, where)
         cols = table.get("columns") or []
         rows = [[d.get(str(c)) for c in cols] for d in kept]
         return _emit_table(env, {"columns": cols, "rows": rows})
@@ -359,7 +425,7 @@ def _op_filter_impl(prev, params):
         missing = [f for f in _wf if not any(f in r for r in dug)]
         if missing:
             return _field_missing_error("filter", missing, dug)
-        return _emit_items({}, [r for r in dug if _match(r, where)])
+        return _emit_items({}, _filtered_rows(dug, where))
     return _no_currency_error("filter", prev)
 
 
@@ -386,19 +452,17 @@ def _op_sort(prev, params):
     if recs is not None:
         dict_recs = [r for r in recs if isinstance(r, dict)]
         if not dict_recs or any(by in r for r in dict_recs):
-            srt = sorted(dict_recs, key=_sort_key(by), reverse=desc)
-            return _emit_items(env, srt)
+            return _emit_items(env, _sorted_rows(dict_recs, by, desc))
     table, tenv = _get_table(prev)
     if table is not None and by in [str(c) for c in (table.get("columns") or [])]:
-        dicts = _row_dicts(table)
-        dicts.sort(key=_sort_key(by), reverse=desc)
+        dicts = _sorted_rows(_row_dicts(table), by, desc)
         cols = table.get("columns") or []
         rows = [[d.get(str(c)) for c in cols] for d in dicts]
         return _emit_table(tenv, {"columns": cols, "rows": rows})
     # 손실 투영(예: 주가 table=날짜·종가)이 정렬 키를 접은 경우 — 원천 행까지 거슬러 찾기
     dug = _rows_for_field(prev, by)
     if dug and any(by in r for r in dug):
-        srt = sorted(dug, key=_sort_key(by), reverse=desc)
+        srt = _sorted_rows(dug, by, desc)
         base_env = env if env is not None else (tenv if tenv is not None else (prev if isinstance(prev, dict) else {}))
         return _emit_items(base_env, srt)
     if recs is None and table is None and not dug:
@@ -425,6 +489,9 @@ def _op_take(prev, params):
     except Exception:
         # 비정수 n 을 조용히 10 으로 위장하지 않는다(⑧′)
         return {"success": False, "error": f"take: n 이 정수가 아닙니다: {n!r}"}
+    spilled = _spill_rows(prev)
+    if spilled is not None:             # 앞 n행만 읽고 멈춘다(음수면 끝까지 흘리며 뒤 n행만 쥔다)
+        return _emit_items(spilled.shell(), spilled.tail(-n) if n < 0 else spilled.head(n))
     recs, env = _get_items(prev)
     if recs is not None:
         sliced = recs[n:] if n < 0 else recs[:n]
@@ -477,8 +544,9 @@ def _op_select(prev, params):
 
 
 def _norm(s):
-    import re
-    return re.sub(r"\s+", " ", str(s or "").strip().lower())
+    # 공백 런 → 한 칸 + 양끝 제거. split() 은 re `\s`·strip() 과 같은 유니코드 공백 정의라
+    # re.sub 판과 결과가 같고, join·dedup 키로 행마다 불리는 자리라 정규식 비용을 뺐다(2026-10-16).
+    return " ".join(str(s or "").lower().split())
 
 
 def _op_rename(prev, params):
@@ -679,24 +747,26 @@ def _op_groupby(prev, params):
             return _field_missing_error("groupby", src, dicts)
     if not specs:
         specs = [("count", "count", by)]
-    # 그룹핑 (입력 순서 보존)
-    groups, order = {}, []
-    for d in dicts:
-        gk = d.get(by)
-        if gk not in groups:
-            groups[gk] = []
-            order.append(gk)
-        groups[gk].append(d)
     out_cols = [by] + [s[0] for s in specs]
-    out_rows = []
-    for gk in order:
-        members = groups[gk]
-        row = [gk]
-        for out_col, op, src in specs:
-            vals = [m.get(src) for m in members]
-            fn = _AGG.get(op, _AGG["count"])
-            row.append(fn(vals))
-        out_rows.append(row)
+    out_rows = _colx.groupby_rows(dicts, by, specs)      # 큰 표 = 열 집계, None = 아래 행 경로
+    if out_rows is None:
+        # 그룹핑 (입력 순서 보존)
+        groups, order = {}, []
+        for d in dicts:
+            gk = d.get(by)
+            if gk not in groups:
+                groups[gk] = []
+                order.append(gk)
+            groups[gk].append(d)
+        out_rows = []
+        for gk in order:
+            members = groups[gk]
+            row = [gk]
+            for out_col, op, src in specs:
+                vals = [m.get(src) for m in members]
+                fn = _AGG.get(op, _AGG["count"])
+                row.append(fn(vals))
+            out_rows.append(row)
     res = _emit_table(env, {"columns": out_cols, "rows": out_rows})
     if auto_named and isinstance(res, dict) and res.get("success", True):
         # 자동 명명 열을 봉투에 자백 — 다음 스텝(sort{by:...} 등)이 이 이름을 알아야
@@ -1184,41 +1254,45 @@ def _op_join(prev, params):
         rb, _ = _get_items(b)
         if ra is None or rb is None:
             return {"success": False, "error": "join: 두 입력이 같은 통화여야 합니다(둘 다 table 또는 둘 다 items)."}
-        index = {}
-        for r in rb:
-            if isinstance(r, dict) and r.get(on) is not None:
-                index.setdefault(_norm(r.get(on)), []).append(r)
-        out = []
-        for l in ra:
-            if not isinstance(l, dict) or l.get(on) is None:
-                continue
-            lkeys = list(l.keys())
-            for r in index.get(_norm(l.get(on)), []):
-                add = [k for k in r.keys() if k != on]
-                disp = _suffix_collisions(lkeys, add)  # 동명 필드 _2 (침묵 오선택 방지)
-                merged = dict(l)
-                for orig, name in zip(add, disp):
-                    merged[name] = r[orig]
-                out.append(merged)
+        out = _colx.join_items(ra, rb, on, _norm, _suffix_collisions)   # 고른 모양 = 접미사 표 1회
+        if out is None:
+            index = {}
+            for r in rb:
+                if isinstance(r, dict) and r.get(on) is not None:
+                    index.setdefault(_norm(r.get(on)), []).append(r)
+            out = []
+            for l in ra:
+                if not isinstance(l, dict) or l.get(on) is None:
+                    continue
+                lkeys = list(l.keys())
+                for r in index.get(_norm(l.get(on)), []):
+                    add = [k for k in r.keys() if k != on]
+                    disp = _suffix_collisions(lkeys, add)  # 동명 필드 _2 (침묵 오선택 방지)
+                    merged = dict(l)
+                    for orig, name in zip(add, disp):
+                        merged[name] = r[orig]
+                    out.append(merged)
         return _attach_branch_warning(_emit_items(_carry_flags([a, b], with_total=False), out), [a, b])
     ca = [str(c) for c in (ta.get("columns") or [])]
     cb = [str(c) for c in (tb.get("columns") or [])]
     if on not in ca or on not in cb:
         return {"success": False, "error": f"join: 키 '{on}'이 양쪽 table 열에 모두 있어야 합니다(좌:{ca} 우:{cb})."}
-    lki, rki = ca.index(on), cb.index(on)
-    # 우측을 키로 인덱싱
-    index = {}
-    for r in tb.get("rows") or []:
-        k = _norm(r[rki] if rki < len(r) else None)
-        index.setdefault(k, []).append(r)
     extra = [c for c in cb if c != on]  # 우측에서 가져올 열(키 제외, 읽기는 원본 이름)
     out_cols = ca + _suffix_collisions(ca, extra)  # 표시 이름만 충돌 회피
-    out_rows = []
-    for r in ta.get("rows") or []:
-        k = _norm(r[lki] if lki < len(r) else None)
-        for rb_row in index.get(k, []):
-            rbd = {cb[i]: (rb_row[i] if i < len(rb_row) else None) for i in range(len(cb))}
-            out_rows.append(list(r) + [rbd.get(c) for c in extra])
+    out_rows = _colx.join_table_rows(ta, tb, on, _norm)   # 열 인덱스 표 1회 + 키 정규화 값당 1회
+    if out_rows is None:
+        lki, rki = ca.index(on), cb.index(on)
+        # 우측을 키로 인덱싱
+        index = {}
+        for r in tb.get("rows") or []:
+            k = _norm(r[rki] if rki < len(r) else None)
+            index.setdefault(k, []).append(r)
+        out_rows = []
+        for r in ta.get("rows") or []:
+            k = _norm(r[lki] if lki < len(r) else None)
+            for rb_row in index.get(k, []):
+                rbd = {cb[i]: (rb_row[i] if i < len(rb_row) else None) for i in range(len(cb))}
+                out_rows.append(list(r) + [rbd.get(c) for c in extra])
     return _attach_branch_warning(
         _emit_table({**_carry_flags([a, b], with_total=False), "table": {}},
                     {"columns": out_cols, "rows": out_rows}), [a, b])
@@ -1287,12 +1361,20 @@ def _op_compute(prev, params):
         return _field_missing_error("compute", missing, dict_recs)
     out, errors = [], 0
     sample_err = None
-    for r in dict_recs:
+    # 사칙 식은 열 단위로 미리 (columnar) — 그 결과를 못 믿는 칸(0 나눗셈·비유한)만 아래 eval 로
+    vec = _colx.compute_vectors(dict_recs, {str(k): v for k, v in spec.items()})
+    for ri, r in enumerate(dict_recs):
         row = dict(r)
-        scope = {k: _as_num(v) if _as_num(v) is not None else v for k, v in r.items()
-                 if isinstance(k, str) and k.isidentifier()}
-        scope["col"] = (lambda _r: (lambda name: (_as_num(_r.get(name)) if _as_num(_r.get(name)) is not None else _r.get(name))))(r)
+        scope = None
         for new_col, code in compiled.items():
+            pre = vec.get(new_col)
+            if pre is not None and not pre[1][ri]:
+                row[new_col] = pre[0][ri]
+                continue
+            if scope is None:
+                scope = {k: _as_num(v) if _as_num(v) is not None else v for k, v in r.items()
+                         if isinstance(k, str) and k.isidentifier()}
+                scope["col"] = (lambda _r: (lambda name: (_as_num(_r.get(name)) if _as_num(_r.get(name)) is not None else _r.get(name))))(r)
             try:
                 row[new_col] = eval(code, {"__builtins__": {}, **_COMPUTE_FUNCS}, scope)
             except Exception as e:
@@ -1324,6 +1406,11 @@ _DISPATCH = {
 }
 
 
+# 파이프 구조 통화를 객체째 받는 도구(ibl_engine._accepts_pipe_currency 가 읽는다) —
+# 변환자 전부. structure/document emitter 는 _prev_result 를 문자열로 다루므로 제외.
+PIPE_CURRENCY_TOOLS = frozenset(_DISPATCH)
+
+
 def execute(tool_input: dict, context):
     """표준 시그니처. context.tool_name 으로 동사 분기, _prev_result에서 통화 수용."""
     tool_name = getattr(context, "tool_name", None)
@@ -4,11 +4,14 @@ memory_db.py - 에이전트별 메모리 SQLite 저장소
 
 검색 방식: LIKE 키워드 + 시맨틱(임베딩, vec0) 하이브리드
 임베딩 모델: backend/ibl_usage_db.py의 fine-tuned 모델 공유 사용
+연결: DB 경로별 풀(_pooled) — sqlite-vec 로드·WAL 은 연결 생성 때 한 번, 스키마 확인은 경로당 한 번
 """
 import os
 import sys
 import struct
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
@@ -106,18 +109,18 @@ def _prepare_text(content: str, keywords: str = "", category: str = "") -> str:
     return " ".join(parts)
 
 
-def _get_vec_conn(db_path: str) -> Optional[sqlite3.Connection]:
-    """sqlite-vec 확장 로드된 연결 반환 (불가 시 None)"""
-    try:
-        import sqlite_vec
-        conn = sqlite3.connect(db_path)
-        conn.enable_load_extension(True)
-        sqlite_vec.load(conn)
-        conn.enable_load_extension(False)
-        conn.row_factory = sqlite3.Row
-        return conn
-    except Exception as e:
-        return None
+@contextmanager
+def _vec_conn(db_path: str):
+    """sqlite-vec 가 실린 풀 연결 (불가 시 None 을 낸다) — vec0 테이블은 경로당 한 번 보장."""
+    with _pooled(db_path) as conn:
+        if not _VEC_STATE.get("ok"):
+            yield None
+            return
+        key = _path_key(db_path)
+        if key not in _vec_ready:
+            _ensure_vec_table(conn)
+            _vec_ready.add(key)
+        yield conn
 
 
 def _ensure_vec_table(conn):
@@ -137,14 +140,16 @@ def _index_one(db_path: str, mem_id: int, content: str,
     sqlite-vec의 vec0 가상 테이블은 INSERT OR REPLACE를 제대로 지원하지 않아
     같은 rowid로 다시 INSERT 시 UNIQUE constraint failed가 발생한다.
     명시적 DELETE 후 INSERT 패턴을 사용해 업데이트 의미를 보장한다."""
-    conn = _get_vec_conn(db_path)
-    if conn is None:
+    if not _vec_available():
+        return
+    # 임베딩(수백 ms)은 연결을 쥐기 전에 — 풀 연결을 모델 대기에 묶지 않는다
+    emb = _embed(_prepare_text(content, keywords, category))
+    if not emb:
         return
     try:
-        _ensure_vec_table(conn)
-        text = _prepare_text(content, keywords, category)
-        emb = _embed(text)
-        if emb:
+        with _vec_conn(db_path) as conn:
+            if conn is None:
+                return
             conn.execute("DELETE FROM memories_vec WHERE rowid = ?", (mem_id,))
             conn.execute(
                 "INSERT INTO memories_vec(rowid, embedding) VALUES (?, ?)",
@@ -153,22 +158,21 @@ def _index_one(db_path: str, mem_id: int, content: str,
             conn.commit()
     except Exception as e:
         print(f"[memory_db] 인덱싱 실패 (id={mem_id}): {e}")
-    finally:
-        conn.close()
 
 
-def _delete_vec(db_path: str, mem_id: int):
-    """vec 인덱스에서 항목 삭제"""
-    conn = _get_vec_conn(db_path)
-    if conn is None:
+def _delete_vec(db_path: str, mem_ids):
+    """vec 인덱스에서 항목 삭제 (id 하나 또는 여러 개 — 한 트랜잭션)"""
+    ids = [mem_ids] if isinstance(mem_ids, int) else list(mem_ids)
+    if not ids or not _vec_available():
         return
     try:
-        conn.execute("DELETE FROM memories_vec WHERE rowid = ?", (mem_id,))
-        conn.commit()
+        with _vec_conn(db_path) as conn:
+            if conn is None:
+                return
+            conn.executemany("DELETE FROM memories_vec WHERE rowid = ?", [(i,) for i in ids])
+            conn.commit()
     except Exception:
         pass
-    finally:
-        conn.close()
 
 
 def _search_semantic(db_path: str, query: str, top_k: int = 10) -> List[Tuple[int, float]]:
@@ -177,24 +181,22 @@ def _search_semantic(db_path: str, query: str, top_k: int = 10) -> List[Tuple[in
     normalize_embeddings=True를 가정하므로 vec0의 distance(L2제곱)는
     L2^2 = 2 - 2*cos 이며, cos = 1 - distance/2 로 환산."""
     model = _get_model()
-    if model is None:
-        return []
-    conn = _get_vec_conn(db_path)
-    if conn is None:
+    if model is None or not _vec_available():
         return []
     try:
         q_vec = model.encode(query, normalize_embeddings=True, convert_to_numpy=True)
         q_blob = struct.pack(f"{EMBEDDING_DIM}f", *q_vec.tolist())
-        rows = conn.execute(
-            "SELECT rowid, distance FROM memories_vec "
-            "WHERE embedding MATCH ? ORDER BY distance LIMIT ?",
-            (q_blob, top_k)
-        ).fetchall()
+        with _vec_conn(db_path) as conn:
+            if conn is None:
+                return []
+            rows = conn.execute(
+                "SELECT rowid, distance FROM memories_vec "
+                "WHERE embedding MATCH ? ORDER BY distance LIMIT ?",
+                (q_blob, top_k)
+            ).fetchall()
         return [(int(r["rowid"]), 1.0 - float(r["distance"]) / 2.0) for r in rows]
     except Exception as e:
         return []
-    finally:
-        conn.close()
 
 
 # =============================================================================
@@ -220,63 +222,191 @@ def _get_db_path(project_path: str, agent_id: str) -> str:
         return str(project_dir / f"memory_{agent_name}.db")
 
 
-def _ensure_schema(db_path: str):
-    """memories 테이블 보장 — get_db 를 거치지 않는 읽기 경로(search 등)용.
+# ★연결 풀 (2026-10-16) — 함수마다 sqlite3.connect 를 새로 열고, vec 연결마다 sqlite-vec 를 다시
+#   싣고, get_db 마다 CREATE TABLE IF NOT EXISTS 를 다시 돌렸다. 회상은 턴마다 여러 번, 에이전트
+#   DB 수십 개에 걸쳐 일어난다. 이제 경로별 풀(ConversationDB._get_pooled_connection 과 같은 꼴):
+#   연결은 만들 때 WAL·row_factory·sqlite-vec 를 한 번 싣고, 스키마·vec0 테이블 확인은 경로당
+#   한 번. 파일이 지워지거나 바뀌면(inode) 그 경로의 풀·확인 기록을 버리고 새로 연다.
+
+_MAX_POOL_SIZE = 4          # 경로당 쉬는 연결 상한 (넘는 반납은 닫는다)
+_pools: Dict[str, List[sqlite3.Connection]] = {}
+_pool_ino: Dict[str, int] = {}
+_pool_lock = threading.Lock()
+_schema_ready: set = set()
+_vec_ready: set = set()
+_VEC_STATE: Dict[str, bool] = {}     # {"ok": sqlite-vec 를 실을 수 있는가} — 첫 연결 때 정해진다
+
+_SCHEMA_SQL = '''
+    CREATE TABLE IF NOT EXISTS memories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category TEXT DEFAULT '',
+        keywords TEXT DEFAULT '',
+        content TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        used_at DATETIME DEFAULT NULL,
+        source_ref TEXT DEFAULT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_mem_keywords ON memories(keywords);
+    CREATE INDEX IF NOT EXISTS idx_mem_category ON memories(category);
+    CREATE TABLE IF NOT EXISTS _meta (key TEXT PRIMARY KEY, value TEXT);   -- 마지막 정리 시각 등
+'''
+
+
+def _path_key(db_path: str) -> str:
+    return os.path.abspath(db_path)
+
+
+def _file_ino(key: str) -> int:
+    try:
+        return os.stat(key).st_ino
+    except OSError:
+        return -1
+
+
+def _new_conn(key: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(key, timeout=30.0, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.Error:
+        pass
+    if _VEC_STATE.get("ok", True):
+        try:
+            import sqlite_vec
+            conn.enable_load_extension(True)
+            sqlite_vec.load(conn)
+            conn.enable_load_extension(False)
+            _VEC_STATE["ok"] = True
+        except Exception:
+            _VEC_STATE["ok"] = False
+    return conn
+
+
+def _vec_available() -> bool:
+    """sqlite-vec 사용 가능 여부 — 아직 모르면 한 번 시험해 본다(메모리 연결로)."""
+    if "ok" not in _VEC_STATE:
+        _new_conn(":memory:").close()
+    return _VEC_STATE.get("ok", False)
+
+
+def _checkout(key: str) -> sqlite3.Connection:
+    ino = _file_ino(key)
+    stale = []
+    with _pool_lock:
+        if _pool_ino.get(key, ino) != ino:            # 지워졌거나 바뀐 파일 — 옛 연결은 옛 inode 를 본다
+            stale = _pools.pop(key, [])
+            _schema_ready.discard(key)
+            _vec_ready.discard(key)
+        _pool_ino[key] = ino
+        pool = _pools.get(key)
+        conn = pool.pop() if pool else None
+    for c in stale:
+        c.close()
+    if conn is None:
+        conn = _new_conn(key)
+    if key not in _schema_ready:
+        _ensure_schema_on(conn)
+        _schema_ready.add(key)
+        if ino == -1:                                 # 방금 만들어진 파일 — 이제 inode 가 있다
+            with _pool_lock:
+                _pool_ino[key] = _file_ino(key)
+    return conn
+
+
+def _checkin(key: str, conn: sqlite3.Connection):
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except sqlite3.Error:
+        conn.close()
+        return
+    with _pool_lock:
+        if key in _pool_ino:                          # 빌려 간 사이 close_pool 됐으면 되돌리지 않는다
+            pool = _pools.setdefault(key, [])
+            if len(pool) < _MAX_POOL_SIZE:
+                pool.append(conn)
+                return
+    conn.close()
+
+
+@contextmanager
+def _pooled(db_path: str):
+    """경로별 풀에서 연결 하나를 빌려 쓴다(스키마 보장됨). 끝나면 커밋 안 된 것은 되돌리고 반납."""
+    key = _path_key(db_path)
+    conn = _checkout(key)
+    try:
+        yield conn
+    except sqlite3.Error:
+        conn.close()                                  # 상태를 모르는 연결은 풀에 돌려놓지 않는다
+        raise
+    except BaseException:
+        _checkin(key, conn)
+        raise
+    else:
+        _checkin(key, conn)
+
+
+def close_pool(path: str):
+    """path(DB 파일 또는 그 파일들이 든 폴더) 아래 풀의 연결을 닫는다.
+
+    프로젝트를 휴지통으로 옮기거나 지우기 전에 부른다 — 윈도우는 열린 파일을 옮기거나 지울 수
+    없다. 지금 빌려 간 연결은 반납될 때 풀로 돌아오지 않고 닫힌다.
+    """
+    root = _path_key(path)
+    prefix = os.path.join(root, "")
+    with _pool_lock:
+        keys = [k for k in set(_pools) | set(_pool_ino) if k == root or k.startswith(prefix)]
+        pools = [_pools.pop(k, []) for k in keys]
+        for k in keys:
+            _pool_ino.pop(k, None)
+            _schema_ready.discard(k)
+            _vec_ready.discard(k)
+    for pool in pools:
+        for c in pool:
+            c.close()
+
+
+def close_pools():
+    """풀의 연결을 모두 닫는다 (종료·테스트용)."""
+    with _pool_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        _pool_ino.clear()
+        _schema_ready.clear()
+        _vec_ready.clear()
+    for pool in pools:
+        for c in pool:
+            c.close()
+
+
+def _ensure_schema_on(conn: sqlite3.Connection):
+    """memories 테이블 + 지연 컬럼(used_at/source_ref) 보장 — 경로당 한 번(_checkout 이 부른다).
 
     sqlite 는 connect 시 빈 파일을 생성하므로, 한 번도 save 한 적 없는 신규 프로젝트의
     첫 search/distill 이 '_search_like → SELECT FROM memories' 에서
     'no such table: memories' 로 죽던 버그를 막는다.
     """
-    conn = sqlite3.connect(db_path)
-    try:
-        conn.executescript('''
-            CREATE TABLE IF NOT EXISTS memories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category TEXT DEFAULT '',
-                keywords TEXT DEFAULT '',
-                content TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                used_at DATETIME DEFAULT NULL,
-                source_ref TEXT DEFAULT NULL
-            );
-            CREATE INDEX IF NOT EXISTS idx_mem_keywords ON memories(keywords);
-            CREATE INDEX IF NOT EXISTS idx_mem_category ON memories(category);
-        ''')
-        conn.commit()
-    finally:
-        conn.close()
+    conn.executescript(_SCHEMA_SQL)
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(memories)")}
+    if "used_at" not in cols:
+        conn.execute("ALTER TABLE memories ADD COLUMN used_at DATETIME DEFAULT NULL")
+    if "source_ref" not in cols:
+        conn.execute("ALTER TABLE memories ADD COLUMN source_ref TEXT DEFAULT NULL")
+    conn.commit()
+
+
+def _ensure_schema(db_path: str):
+    """memories 테이블 보장 (호환 — 이제 풀이 경로당 한 번 한다)."""
+    with _pooled(db_path):
+        pass
 
 
 def get_db(project_path: str, agent_id: str):
-    """DB 연결 및 테이블 초기화"""
+    """DB 연결 반환(스키마 보장됨) — ★호출자가 닫는 독립 연결. 모듈 안에서는 _pooled 를 쓴다."""
     db_path = _get_db_path(project_path, agent_id)
+    _ensure_schema(db_path)
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
-
-    conn.executescript('''
-        CREATE TABLE IF NOT EXISTS memories (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            category TEXT DEFAULT '',
-            keywords TEXT DEFAULT '',
-            content TEXT NOT NULL,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            used_at DATETIME DEFAULT NULL,
-            source_ref TEXT DEFAULT NULL
-        );
-        CREATE INDEX IF NOT EXISTS idx_mem_keywords ON memories(keywords);
-        CREATE INDEX IF NOT EXISTS idx_mem_category ON memories(category);
-    ''')
-
-    # 기존 DB에 used_at / source_ref 컬럼이 없으면 추가
-    try:
-        conn.execute("SELECT used_at FROM memories LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE memories ADD COLUMN used_at DATETIME DEFAULT NULL")
-    try:
-        conn.execute("SELECT source_ref FROM memories LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE memories ADD COLUMN source_ref TEXT DEFAULT NULL")
-
     return conn
 
 
@@ -297,18 +427,15 @@ def save(project_path: str, agent_id: str,
     if source_ref:
         source_ref = mask_secrets(source_ref)
     db_path = _get_db_path(project_path, agent_id)
-    conn = get_db(project_path, agent_id)
-    try:
+    with _pooled(db_path) as conn:
         now = datetime.now().isoformat()
-        conn.execute(
+        cur = conn.execute(
             "INSERT INTO memories (category, keywords, content, created_at, source_ref) "
             "VALUES (?, ?, ?, ?, ?)",
             (category, keywords, content, now, source_ref)
         )
         conn.commit()
-        mem_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-    finally:
-        conn.close()
+        mem_id = cur.lastrowid
 
     # 임베딩 인덱싱 (실패해도 저장은 성공으로 처리)
     _index_one(db_path, mem_id, content, keywords, category)
@@ -318,9 +445,7 @@ def save(project_path: str, agent_id: str,
 def _search_like(db_path: str, query: str, category: str = None,
                  limit: int = 20) -> List[Dict]:
     """기존 LIKE 키워드 검색"""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
+    with _pooled(db_path) as conn:
         words = query.strip().split()
         if not words:
             return []
@@ -352,8 +477,6 @@ def _search_like(db_path: str, query: str, category: str = None,
         params.extend([first, limit])
         rows = conn.execute(sql, params).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
 def search(project_path: str, agent_id: str,
@@ -372,7 +495,7 @@ def search(project_path: str, agent_id: str,
     명시 검색(memory 액션)·증류 dedup 은 기본값(폴백 유지)이라 무영향.
     """
     db_path = _get_db_path(project_path, agent_id)
-    _ensure_schema(db_path)  # 신규 프로젝트(미save) 빈 DB에서 LIKE 폴백이 죽지 않도록 테이블 보장
+    # (신규 프로젝트 빈 DB의 테이블 보장은 풀이 첫 연결 때 한다)
 
     eff_threshold = max(SEMANTIC_THRESHOLD, min_score)
 
@@ -395,34 +518,19 @@ def search(project_path: str, agent_id: str,
     if not sorted_ids:
         return []
 
-    # 카테고리 필터 (시맨틱 경로에서도 적용)
+    # 메타 로드 (카테고리 필터는 시맨틱 경로에서도 적용 — 같은 질의에서)
+    ph = ",".join("?" * len(sorted_ids))
+    sql = (f"SELECT id, category, keywords, "
+           f"SUBSTR(content,1,100) as preview, created_at, used_at "
+           f"FROM memories WHERE id IN ({ph})")
+    params = list(sorted_ids)
     if category and sem_pairs:
-        conn = sqlite3.connect(db_path)
-        try:
-            ph = ",".join("?" * len(sorted_ids))
-            allowed = {r[0] for r in conn.execute(
-                f"SELECT id FROM memories WHERE id IN ({ph}) AND category = ?",
-                sorted_ids + [category]
-            )}
-            sorted_ids = [mid for mid in sorted_ids if mid in allowed]
-        finally:
-            conn.close()
-        if not sorted_ids:
-            return []
-
-    # 메타 로드
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
-        ph = ",".join("?" * len(sorted_ids))
-        rows = conn.execute(
-            f"SELECT id, category, keywords, "
-            f"SUBSTR(content,1,100) as preview, created_at, used_at "
-            f"FROM memories WHERE id IN ({ph})",
-            sorted_ids
-        ).fetchall()
-    finally:
-        conn.close()
+        sql += " AND category = ?"
+        params.append(category)
+    with _pooled(db_path) as conn:
+        rows = conn.execute(sql, params).fetchall()
+    if not rows:
+        return []
 
     by_id = {r["id"]: dict(r) for r in rows}
     return [by_id[mid] for mid in sorted_ids if mid in by_id]
@@ -430,8 +538,7 @@ def search(project_path: str, agent_id: str,
 
 def read(project_path: str, agent_id: str, memory_id: int) -> Optional[Dict]:
     """메모리 전문 조회 + used_at 갱신"""
-    conn = get_db(project_path, agent_id)
-    try:
+    with _pooled(_get_db_path(project_path, agent_id)) as conn:
         row = conn.execute(
             "SELECT * FROM memories WHERE id = ?", (memory_id,)
         ).fetchone()
@@ -445,8 +552,48 @@ def read(project_path: str, agent_id: str, memory_id: int) -> Optional[Dict]:
         result = dict(row)
         result['used_at'] = now
         return result
-    finally:
-        conn.close()
+
+
+def read_many(project_path: str, agent_id: str, memory_ids: List[int],
+              touch: bool = True) -> Dict[int, Dict]:
+    """여러 메모리 전문 조회 + used_at 일괄 갱신 — {id: 행}. 없는 id 는 빠진다.
+
+    read() 를 건마다 부르던 회상 경로(검색 N건 → 조회·커밋 N번)의 묶음판:
+    SELECT 1번·UPDATE 1번·커밋 1번 (2026-10-16).
+    touch=False 면 읽기만 한다 — 실제로 쓰일지 아직 모르는 호출(예산 안에서만 쓰이는 연상
+    관련기억)은 쓰인 것만 나중에 touch_many() 로 갱신한다. 버려진 회상이 LRU 를 속이지 않게.
+    """
+    ids = [int(i) for i in dict.fromkeys(memory_ids or [])]
+    if not ids:
+        return {}
+    with _pooled(_get_db_path(project_path, agent_id)) as conn:
+        ph = ",".join("?" * len(ids))
+        rows = conn.execute(f"SELECT * FROM memories WHERE id IN ({ph})", ids).fetchall()
+        if not rows:
+            return {}
+        out = {r["id"]: dict(r) for r in rows}
+        if touch:
+            now = _touch_on(conn, list(out))
+            for d in out.values():
+                d['used_at'] = now
+        return out
+
+
+def touch_many(project_path: str, agent_id: str, memory_ids: List[int]) -> str:
+    """used_at 만 일괄 갱신 (read_many(touch=False) 의 짝) → 갱신 시각"""
+    ids = [int(i) for i in dict.fromkeys(memory_ids or [])]
+    if not ids:
+        return ""
+    with _pooled(_get_db_path(project_path, agent_id)) as conn:
+        return _touch_on(conn, ids)
+
+
+def _touch_on(conn: sqlite3.Connection, ids: List[int]) -> str:
+    now = datetime.now().isoformat()
+    conn.execute(f"UPDATE memories SET used_at = ? WHERE id IN ({','.join('?' * len(ids))})",
+                 [now] + ids)
+    conn.commit()
+    return now
 
 
 def update(project_path: str, agent_id: str, memory_id: int,
@@ -454,10 +601,7 @@ def update(project_path: str, agent_id: str, memory_id: int,
            source_ref: str = None) -> bool:
     """기존 항목 업데이트 (변경 필드만; used_at 자동 갱신; 임베딩 재생성)"""
     db_path = _get_db_path(project_path, agent_id)
-    get_db(project_path, agent_id).close()  # source_ref 등 지연 마이그레이션 보장
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
+    with _pooled(db_path) as conn:       # source_ref 등 지연 마이그레이션은 풀이 보장
         sets, params = [], []
         if content is not None:
             sets.append("content = ?"); params.append(mask_secrets(content))
@@ -489,8 +633,6 @@ def update(project_path: str, agent_id: str, memory_id: int,
             "SELECT content, keywords, category FROM memories WHERE id = ?",
             (memory_id,)
         ).fetchone()
-    finally:
-        conn.close()
 
     if row:
         _index_one(db_path, memory_id, row["content"], row["keywords"], row["category"])
@@ -500,13 +642,10 @@ def update(project_path: str, agent_id: str, memory_id: int,
 def delete(project_path: str, agent_id: str, memory_id: int) -> bool:
     """메모리 + vec 인덱스 동시 삭제"""
     db_path = _get_db_path(project_path, agent_id)
-    conn = sqlite3.connect(db_path)
-    try:
+    with _pooled(db_path) as conn:
         cur = conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
         conn.commit()
         ok = cur.rowcount > 0
-    finally:
-        conn.close()
 
     if ok:
         _delete_vec(db_path, memory_id)
@@ -515,11 +654,7 @@ def delete(project_path: str, agent_id: str, memory_id: int) -> bool:
 
 def count(project_path: str, agent_id: str) -> int:
     """메모리 총 개수"""
-    conn = get_db(project_path, agent_id)
-    try:
-        return conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
-    finally:
-        conn.close()
+    return count_at(_get_db_path(project_path, agent_id))
 
 
 # =============================================================================
@@ -531,48 +666,32 @@ def rebuild_index(project_path: str, agent_id: str) -> Dict:
     db_path = _get_db_path(project_path, agent_id)
 
     # 메모리 항목 전수 조회
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
+    with _pooled(db_path) as conn:
         rows = conn.execute(
             "SELECT id, content, keywords, category FROM memories ORDER BY id"
         ).fetchall()
-    finally:
-        conn.close()
 
     if not rows:
         return {"success": True, "indexed": 0, "message": "메모리 없음"}
-
-    # vec 테이블 초기화
-    vec_conn = _get_vec_conn(db_path)
-    if vec_conn is None:
+    if not _vec_available():
         return {"success": False, "error": "sqlite-vec 사용 불가"}
-    try:
-        _ensure_vec_table(vec_conn)
-        vec_conn.execute("DELETE FROM memories_vec")
-        vec_conn.commit()
-    finally:
-        vec_conn.close()
 
-    # 배치 임베딩
+    # 배치 임베딩 (연결을 쥐기 전에)
     texts = [_prepare_text(r["content"], r["keywords"], r["category"]) for r in rows]
     embs = _embed_batch(texts)
     if not embs:
         return {"success": False, "error": "임베딩 생성 실패 (모델 없음)"}
 
-    # 일괄 INSERT
-    vec_conn = _get_vec_conn(db_path)
-    if vec_conn is None:
-        return {"success": False, "error": "vec 연결 실패"}
-    try:
-        for row, emb in zip(rows, embs):
-            vec_conn.execute(
-                "INSERT INTO memories_vec(rowid, embedding) VALUES (?, ?)",
-                (row["id"], emb)
-            )
+    # vec 테이블 비우고 일괄 INSERT — 한 트랜잭션
+    with _vec_conn(db_path) as vec_conn:
+        if vec_conn is None:
+            return {"success": False, "error": "vec 연결 실패"}
+        vec_conn.execute("DELETE FROM memories_vec")
+        vec_conn.executemany(
+            "INSERT INTO memories_vec(rowid, embedding) VALUES (?, ?)",
+            [(row["id"], emb) for row, emb in zip(rows, embs)]
+        )
         vec_conn.commit()
-    finally:
-        vec_conn.close()
 
     return {"success": True, "indexed": len(rows), "db_path": db_path}
 
@@ -583,61 +702,41 @@ def rebuild_index(project_path: str, agent_id: str) -> Dict:
 # 기계적(무LLM) 부분만 담당하고, 의미 병합 판단은 backend 오케스트레이터가 한다.
 # =============================================================================
 
-def _ensure_meta(conn):
-    """_meta(key,value) 테이블 보장 — 마지막 정리 시각 등 추적용."""
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS _meta (key TEXT PRIMARY KEY, value TEXT)"
-    )
-
-
 def get_meta(db_path: str, key: str) -> Optional[str]:
-    conn = sqlite3.connect(db_path)
-    try:
-        _ensure_meta(conn)
+    with _pooled(db_path) as conn:
         row = conn.execute("SELECT value FROM _meta WHERE key = ?", (key,)).fetchone()
         return row[0] if row else None
-    finally:
-        conn.close()
 
 
 def set_meta(db_path: str, key: str, value: str):
-    conn = sqlite3.connect(db_path)
-    try:
-        _ensure_meta(conn)
+    with _pooled(db_path) as conn:
         conn.execute(
             "INSERT INTO _meta(key,value) VALUES(?,?) "
             "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
             (key, value)
         )
         conn.commit()
-    finally:
-        conn.close()
 
 
 def list_all(db_path: str) -> List[Dict]:
     """전체 메모리 전문 조회 (정리 패스용)."""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
     try:
-        rows = conn.execute(
-            "SELECT id, category, keywords, content, created_at, used_at "
-            "FROM memories ORDER BY id"
-        ).fetchall()
-        return [dict(r) for r in rows]
+        with _pooled(db_path) as conn:
+            rows = conn.execute(
+                "SELECT id, category, keywords, content, created_at, used_at "
+                "FROM memories ORDER BY id"
+            ).fetchall()
+            return [dict(r) for r in rows]
     except sqlite3.OperationalError:
         return []
-    finally:
-        conn.close()
 
 
 def count_at(db_path: str) -> int:
-    conn = sqlite3.connect(db_path)
     try:
-        return conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+        with _pooled(db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
     except sqlite3.OperationalError:
         return 0
-    finally:
-        conn.close()
 
 
 def prune_lru(db_path: str, cap: int = DEFAULT_MEMORY_CAP,
@@ -651,9 +750,7 @@ def prune_lru(db_path: str, cap: int = DEFAULT_MEMORY_CAP,
     if total <= cap:
         return 0
 
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
+    with _pooled(db_path) as conn:
         # 가지치기 후보: 비보호 카테고리, 오래 안 쓰인 순(used_at/created_at 오름차순)
         ph = ",".join("?" * len(protected)) if protected else "''"
         rows = conn.execute(
@@ -662,33 +759,28 @@ def prune_lru(db_path: str, cap: int = DEFAULT_MEMORY_CAP,
             f"ORDER BY COALESCE(used_at, created_at) ASC",
             tuple(protected) if protected else ()
         ).fetchall()
-    finally:
-        conn.close()
 
-    need = total - cap
-    victims = [r["id"] for r in rows[:need]]
-    if not victims:
-        return 0
+        need = total - cap
+        victims = [r["id"] for r in rows[:need]]
+        if not victims:
+            return 0
 
-    conn = sqlite3.connect(db_path)
-    try:
         ph = ",".join("?" * len(victims))
         conn.execute(f"DELETE FROM memories WHERE id IN ({ph})", victims)
         conn.commit()
-    finally:
-        conn.close()
-    for vid in victims:
-        _delete_vec(db_path, vid)
+    _delete_vec(db_path, victims)
     return len(victims)
 
 
 def _load_vectors(db_path: str) -> List[Tuple[int, list]]:
     """memories_vec에서 (id, 정규화 벡터 리스트) 전수 로드."""
-    conn = _get_vec_conn(db_path)
-    if conn is None:
+    if not _vec_available():
         return []
     try:
-        rows = conn.execute("SELECT rowid, embedding FROM memories_vec").fetchall()
+        with _vec_conn(db_path) as conn:
+            if conn is None:
+                return []
+            rows = conn.execute("SELECT rowid, embedding FROM memories_vec").fetchall()
         out = []
         for r in rows:
             blob = r["embedding"]
@@ -697,8 +789,6 @@ def _load_vectors(db_path: str) -> List[Tuple[int, list]]:
         return out
     except Exception:
         return []
-    finally:
-        conn.close()
 
 
 def find_duplicate_clusters(db_path: str,
@@ -752,16 +842,12 @@ def find_duplicate_clusters(db_path: str,
 
 def get_by_id(db_path: str, memory_id: int) -> Optional[Dict]:
     """id로 메모리 전문 조회 (used_at 갱신 없음 — 정리 패스용)."""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
+    with _pooled(db_path) as conn:
         row = conn.execute(
             "SELECT id, category, keywords, content, created_at, used_at "
             "FROM memories WHERE id = ?", (memory_id,)
         ).fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
 
 
 def apply_merge(db_path: str, keep_id: int, content: str,
@@ -771,8 +857,7 @@ def apply_merge(db_path: str, keep_id: int, content: str,
     content/keywords/category를 keep_id에 갱신하고 재인덱싱, drop_ids는
     행+vec 동시 삭제. 카테고리는 정규화된다."""
     category = normalize_category(category)
-    conn = sqlite3.connect(db_path)
-    try:
+    with _pooled(db_path) as conn:
         conn.execute(
             "UPDATE memories SET content=?, keywords=?, category=? WHERE id=?",
             (content, keywords, category, keep_id)
@@ -781,12 +866,9 @@ def apply_merge(db_path: str, keep_id: int, content: str,
             ph = ",".join("?" * len(drop_ids))
             conn.execute(f"DELETE FROM memories WHERE id IN ({ph})", drop_ids)
         conn.commit()
-    finally:
-        conn.close()
 
     _index_one(db_path, keep_id, content, keywords, category)
-    for did in drop_ids:
-        _delete_vec(db_path, did)
+    _delete_vec(db_path, drop_ids)
     return True
 
 
@@ -797,8 +879,7 @@ def normalize_all_categories(db_path: str) -> int:
     무조건 '기타'로 강등하면 보호를 잃기 때문. 빈칸 분류는 LLM 병합 단계에 맡긴다."""
     rows = list_all(db_path)
     changed = 0
-    conn = sqlite3.connect(db_path)
-    try:
+    with _pooled(db_path) as conn:
         for r in rows:
             cur = (r.get("category") or "").strip()
             if not cur:
@@ -810,6 +891,4 @@ def normalize_all_categories(db_path: str) -> int:
                 changed += 1
         if changed:
             conn.commit()
-    finally:
-        conn.close()
     return changed
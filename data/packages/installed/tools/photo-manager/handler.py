@@ -294,7 +294,7 @@ def scan_photos(params: Dict[str, Any]) -> Dict[str, Any]:
     scan_id = photo_db.get_or_create_scan(scan_name, path)
 
     # 스캔 실행
-    result = scanner.scan_media(path, scan_id)
+    result = scanner.scan_media(path, scan_id, full=bool(params.get("full")))
 
     if result.get("success"):
         return {
@@ -305,6 +305,9 @@ def scan_photos(params: Dict[str, Any]) -> Dict[str, Any]:
                 "사진": result.get("photo_count", 0),
                 "동영상": result.get("video_count", 0),
                 "총 용량": f"{result.get('total_size_mb', 0)} MB",
+                "새로 추가": result.get("added", 0),
+                "변경": result.get("updated", 0),
+                "삭제": result.get("removed", 0),
                 "오류": result.get("errors_count", 0)
             }
         }
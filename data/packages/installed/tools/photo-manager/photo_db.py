@@ -18,6 +18,9 @@ import unicodedata
 from datetime import datetime
 from typing import Dict, List, Optional
 import hashlib
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import lane_scheduler
 
 
 def _normalize_path(path: str) -> str:
@@ -101,7 +104,9 @@ def _init_scan_db(scan_id: int):
             gps_lon REAL,
             duration REAL,
             fps REAL,
-            codec TEXT
+            codec TEXT,
+            sample_hash TEXT,
+            hash_stamp TEXT
         )
     """)
 
@@ -166,19 +171,29 @@ def get_or_create_scan(name: str, root_path: str) -> int:
 
 
 def save_media_batch(scan_id: int, media_list: List[Dict]):
-    """미디어 파일 배치 저장"""
+    """미디어 파일 배치 저장 (경로 기준 upsert — 바뀐 파일도 id 는 그대로)"""
     if not media_list:
         return
 
     conn = _get_connection(scan_id)
     cursor = conn.cursor()
 
+    # ★INSERT OR REPLACE 는 행을 지우고 새로 넣어 id 가 바뀐다. 증분 재스캔(2026-10-16)은
+    #   바뀐 파일만 다시 쓰므로, 갤러리·상세가 쥔 id 가 유지되도록 경로 충돌 시 UPDATE.
     cursor.executemany("""
-        INSERT OR REPLACE INTO media_files
+        INSERT INTO media_files
         (path, filename, extension, size, mtime, md5_hash, media_type,
          width, height, taken_date, camera_make, camera_model, gps_lat, gps_lon,
          duration, fps, codec)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(path) DO UPDATE SET
+            filename=excluded.filename, extension=excluded.extension,
+            size=excluded.size, mtime=excluded.mtime, md5_hash=excluded.md5_hash,
+            media_type=excluded.media_type, width=excluded.width, height=excluded.height,
+            taken_date=excluded.taken_date, camera_make=excluded.camera_make,
+            camera_model=excluded.camera_model, gps_lat=excluded.gps_lat,
+            gps_lon=excluded.gps_lon, duration=excluded.duration, fps=excluded.fps,
+            codec=excluded.codec
     """, [(
         m.get('path'),
         m.get('filename'),
@@ -203,6 +218,34 @@ def save_media_batch(scan_id: int, media_list: List[Dict]):
     conn.close()
 
 
+def get_file_index(scan_id: int) -> Dict[str, tuple]:
+    """증분 재스캔용 기존 색인 — {path: (size, mtime)} (DB 가 없으면 만들고 빈 dict)"""
+    if not os.path.exists(_get_db_path(scan_id)):
+        _init_scan_db(scan_id)
+        return {}
+
+    conn = _get_connection(scan_id)
+    try:
+        return {r[0]: (r[1], r[2])
+                for r in conn.execute("SELECT path, size, mtime FROM media_files")}
+    finally:
+        conn.close()
+
+
+def delete_media_paths(scan_id: int, paths: List[str]) -> int:
+    """사라진 파일의 행 삭제 (증분 재스캔용) — 지운 행 수"""
+    if not paths:
+        return 0
+
+    conn = _get_connection(scan_id)
+    try:
+        cur = conn.executemany("DELETE FROM media_files WHERE path = ?", [(p,) for p in paths])
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
 def update_scan_stats(scan_id: int, photo_count: int, video_count: int, total_size: int):
     """스캔 통계 업데이트"""
     with _scans_lock:
@@ -519,130 +562,266 @@ def get_gps_photos(root_path: str) -> Dict:
     }
 
 
-def _calculate_md5(filepath: str, chunk_size: int = 65536) -> Optional[str]:
-    """파일 MD5 해시 계산 (첫 64KB만 - 성능 최적화)"""
+# ============ 중복 탐지 (2026-10-16 단계식) ============
+# 예전엔 같은 크기 묶음마다 질의 한 번, 후보마다 첫 64KB MD5 를 차례로 계산했다 — 앞부분만 같은
+# 파일(같은 카메라 헤더의 동영상 등)을 중복으로 잘못 묶었고, 해시는 mtime 없이 저장돼 파일이 바뀌어도
+# 그대로였다. 이제: 크기 → 앞·뒤 표본 해시 → 표본까지 같은 것만 전체 해시. 해시는 엔진 스케줄러의
+# cpu 레인에서 병렬로 돌고(스캐너 EXIF·썸네일과 같은 상한), (크기, mtime_ns) 도장과 함께 저장돼
+# 바뀌지 않은 파일은 다시 읽지 않는다.
+# md5_hash 는 이제 **전체 내용** MD5 다 (도장 없는 옛 값은 첫 64KB 값이라 이관 때 비운다).
+
+SAMPLE_BYTES = 64 * 1024        # 표본: 앞·뒤 각 64KB
+HASH_CHUNK = 1024 * 1024        # 전체 해시 읽기 단위
+HASH_WINDOW = 512               # 한 번에 질의·해시하는 후보 파일 수 (크기 묶음 단위로 끊음)
+HASH_INFLIGHT = 4               # 그중 cpu 레인에 동시에 올라가 있는 해시 일 — 썸네일이 줄 뒤에 갇히지 않게
+
+_hash_cols_ready = set()
+
+
+def _ensure_hash_columns(conn: sqlite3.Connection, scan_id: int):
+    """sample_hash / hash_stamp 컬럼 보장 — 스캔 DB 당 한 번"""
+    if scan_id in _hash_cols_ready:
+        return
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(media_files)")}
+    if "hash_stamp" not in cols:
+        conn.execute("ALTER TABLE media_files ADD COLUMN sample_hash TEXT")
+        conn.execute("ALTER TABLE media_files ADD COLUMN hash_stamp TEXT")
+        conn.execute("UPDATE media_files SET md5_hash = NULL")   # 옛 값은 첫 64KB 해시
+        conn.commit()
+    _hash_cols_ready.add(scan_id)
+
+
+def _file_stamp(path: str) -> Optional[str]:
+    """해시 캐시 도장 — 크기:mtime_ns (파일이 없으면 None)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _full_md5(path: str) -> Optional[str]:
+    """파일 전체 MD5 (HASH_CHUNK 단위 스트리밍)"""
     try:
         md5 = hashlib.md5()
-        with open(filepath, 'rb') as f:
-            chunk = f.read(chunk_size)
-            if chunk:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
                 md5.update(chunk)
         return md5.hexdigest()
     except (IOError, OSError):
         return None
 
 
-def _update_file_hash(cursor, file_id: int, md5_hash: str):
-    """파일 해시 업데이트"""
-    cursor.execute("UPDATE media_files SET md5_hash = ? WHERE id = ?", (md5_hash, file_id))
+def _sample_md5(path: str, size: int) -> Optional[str]:
+    """앞·뒤 SAMPLE_BYTES 표본 MD5 (+크기)"""
+    try:
+        md5 = hashlib.md5(str(size).encode())
+        with open(path, 'rb') as f:
+            md5.update(f.read(SAMPLE_BYTES))
+            f.seek(max(0, size - SAMPLE_BYTES))
+            md5.update(f.read(SAMPLE_BYTES))
+        return md5.hexdigest()
+    except (IOError, OSError):
+        return None
 
 
-def get_duplicates(root_path: str) -> Dict:
-    """중복 파일 조회 (크기 기반 필터링 + MD5 해시 확인)"""
-    # macOS NFD -> NFC 정규화
+def _sample_stage(row: Dict) -> Dict:
+    """표본 단계 (워커) — 도장이 같으면 저장된 해시를 쓰고, 작은 파일은 곧바로 전체 해시"""
+    stamp = _file_stamp(row['path'])
+    out = {"row": row, "stamp": stamp, "sample": None, "full": None, "read": 0}
+    if stamp is None:
+        return out
+    if row['hash_stamp'] == stamp and row['sample_hash']:
+        out["sample"], out["full"] = row['sample_hash'], row['md5_hash']
+        return out
+    if row['size'] <= 2 * SAMPLE_BYTES:          # 표본이 곧 전체 — 한 번만 읽는다
+        out["full"] = _full_md5(row['path'])
+        out["sample"] = out["full"]
+    else:
+        out["sample"] = _sample_md5(row['path'], row['size'])
+    out["read"] = 1 if out["sample"] else 0
+    return out
+
+
+def _full_stage(item: Dict) -> Dict:
+    """전체 해시 단계 (워커) — 표본까지 겹친 파일만 온다"""
+    if not item["full"]:
+        item["full"] = _full_md5(item["row"]['path'])
+        item["read"] += 1 if item["full"] else 0
+    return item
+
+
+def _find_scan(root_path: str) -> Optional[Dict]:
+    """root_path(정규화 비교)에 해당하는 스캔 메타"""
     root_path = _normalize_path(root_path)
+    for s in _load_scans_json():
+        if _normalize_path(s.get('root_path', '')) == root_path:
+            return s
+    return None
 
-    # 스캔 찾기
-    scans = _load_scans_json()
-    scan = None
-    for s in scans:
-        stored_path = _normalize_path(s.get('root_path', ''))
-        if stored_path == root_path:
-            scan = s
-            break
 
-    if not scan:
-        return {"success": False, "error": "스캔 데이터가 없습니다."}
-
-    scan_id = scan['id']
-    db_path = _get_db_path(scan_id)
+def _lane_map(fn, items: List[Dict]) -> list:
+    """fn 을 cpu 레인에서 — pool.map 처럼 입력 순서대로 결과. (hashlib·파일 읽기는 GIL 을 놓는다)
 
-    if not os.path.exists(db_path):
-        return {"success": False, "error": "스캔 DB가 없습니다."}
+    레인은 FIFO 라 창 하나(HASH_WINDOW)를 통째로 올리면 큰 동영상 전체 해시 수백 개 뒤에 대화형
+    썸네일 렌더가 줄 선다. 그래서 한 번에 HASH_INFLIGHT 개만 올리고 하나 끝날 때마다 다음을 낸다
+    (thumbnail_service 의 PREWARM_WINDOW 와 같은 수).
+    """
+    futures, pending = [], set()
+    for it in items:
+        fut = lane_scheduler.submit("cpu", fn, it, name="photo-hash")
+        futures.append(fut)
+        if not fut.done():
+            pending.add(fut)
+        if len(pending) >= HASH_INFLIGHT:
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+    return [f.result() for f in futures]
+
+
+def iter_duplicate_groups(scan_id: int, stats: Optional[Dict] = None):
+    """중복 그룹을 찾는 대로 하나씩 낸다 (큰 크기부터) — 페이지·스트리밍용.
+
+    stats 를 넘기면 hash_calculated(실제로 읽은 해시 수)·candidates 를 채운다.
+    DB 연결은 창(HASH_WINDOW) 단위로 열고 닫아 yield 사이에 쥐고 있지 않는다(다른 스레드가
+    이어서 돌려도 된다 — StreamingResponse).
+    """
+    stats = stats if stats is not None else {}
+    stats.setdefault("hash_calculated", 0)
+    stats.setdefault("candidates", 0)
 
     conn = _get_connection(scan_id)
-    cursor = conn.cursor()
+    try:
+        _ensure_hash_columns(conn, scan_id)
+        # 1단계: 같은 크기를 가진 파일 그룹 찾기 (잠재적 중복)
+        size_groups = conn.execute("""
+            SELECT size, COUNT(*) as cnt
+            FROM media_files
+            WHERE size > 0
+            GROUP BY size
+            HAVING cnt > 1
+            ORDER BY size DESC
+        """).fetchall()
+    finally:
+        conn.close()
 
-    # 1단계: 같은 크기를 가진 파일 그룹 찾기 (잠재적 중복)
-    cursor.execute("""
-        SELECT size, COUNT(*) as cnt
-        FROM media_files
-        WHERE size > 0
-        GROUP BY size
-        HAVING cnt > 1
-        ORDER BY size DESC
-    """)
+    # 크기 묶음을 HASH_WINDOW 파일 언저리씩 창으로
+    windows, cur, n = [], [], 0
+    for r in size_groups:
+        cur.append(r['size'])
+        n += r['cnt']
+        if n >= HASH_WINDOW:
+            windows.append(cur)
+            cur, n = [], 0
+    if cur:
+        windows.append(cur)
+
+    for sizes in windows:
+        conn = _get_connection(scan_id)
+        try:
+            ph = ",".join("?" * len(sizes))
+            rows = [dict(r) for r in conn.execute(f"""
+                SELECT id, path, filename, size, mtime, media_type,
+                       md5_hash, sample_hash, hash_stamp
+                FROM media_files
+                WHERE size IN ({ph})
+            """, sizes)]
+        finally:
+            conn.close()
+        stats["candidates"] += len(rows)
+
+        # 2단계: 앞·뒤 표본 해시
+        sampled = [it for it in _lane_map(_sample_stage, rows) if it["sample"]]
+        by_sample: Dict[tuple, List[Dict]] = {}
+        for it in sampled:
+            by_sample.setdefault((it["row"]['size'], it["sample"]), []).append(it)
+
+        # 3단계: 표본까지 겹친 것만 전체 해시
+        survivors = [it for grp in by_sample.values() if len(grp) > 1 for it in grp]
+        _lane_map(_full_stage, survivors)
+
+        # 해시 캐시 저장 (도장과 함께)
+        fresh = [it for it in sampled if it["read"]]
+        stats["hash_calculated"] += sum(it["read"] for it in fresh)
+        if fresh:
+            conn = _get_connection(scan_id)
+            try:
+                conn.executemany(
+                    "UPDATE media_files SET sample_hash = ?, md5_hash = ?, hash_stamp = ? "
+                    "WHERE id = ?",
+                    [(it["sample"], it["full"], it["stamp"], it["row"]['id']) for it in fresh])
+                conn.commit()
+            finally:
+                conn.close()
+
+        by_full: Dict[tuple, List[Dict]] = {}
+        for it in survivors:
+            if it["full"]:
+                by_full.setdefault((it["row"]['size'], it["full"]), []).append(it["row"])
+
+        for (_size, md5_hash), members in sorted(by_full.items(), key=lambda kv: -kv[0][0]):
+            if len(members) < 2:
+                continue
+            files = [{
+                "id": f['id'],
+                "path": f['path'],
+                "filename": f['filename'],
+                "size_mb": round(f['size'] / (1024 * 1024), 2) if f['size'] else 0,
+                "mtime": f['mtime'],
+                "media_type": f['media_type']
+            } for f in members]
+            # 수정일 기준 정렬
+            files.sort(key=lambda x: x['mtime'] or '', reverse=True)
+            yield {
+                "hash": md5_hash[:8] + "...",
+                "count": len(files),
+                "wasted_mb": round(sum(f['size_mb'] for f in files[1:]), 2),
+                "files": files
+            }
+
+
+def get_duplicates(root_path: str, offset: int = 0, limit: Optional[int] = None) -> Dict:
+    """중복 파일 조회 (크기 → 표본 해시 → 전체 해시)
 
-    size_groups = cursor.fetchall()
+    limit 을 주면 offset+limit 개 그룹을 찾는 즉시 멈춘다 — 합계는 그 페이지까지의 값이고
+    complete=False, 다음 그룹이 있으면 has_more=True.
+    """
+    scan = _find_scan(root_path)
+    if not scan:
+        return {"success": False, "error": "스캔 데이터가 없습니다."}
 
-    # 2단계: 같은 크기의 파일들에 대해서만 해시 계산/확인
+    scan_id = scan['id']
+    if not os.path.exists(_get_db_path(scan_id)):
+        return {"success": False, "error": "스캔 DB가 없습니다."}
+
+    stats: Dict = {}
     groups = []
     total_duplicates = 0
     total_wasted_size = 0
-    hash_calculated = 0
-
-    for size_row in size_groups:
-        file_size = size_row['size']
-
-        # 해당 크기의 모든 파일 조회
-        cursor.execute("""
-            SELECT id, path, filename, size, mtime, media_type, md5_hash
-            FROM media_files
-            WHERE size = ?
-        """, (file_size,))
-
-        files_with_same_size = cursor.fetchall()
-
-        # 해시별로 그룹화
-        hash_groups = {}
-        for f in files_with_same_size:
-            file_hash = f['md5_hash']
-
-            # 해시가 없으면 계산
-            if file_hash is None:
-                file_hash = _calculate_md5(f['path'])
-                if file_hash:
-                    _update_file_hash(cursor, f['id'], file_hash)
-                    hash_calculated += 1
-
-            if file_hash:
-                if file_hash not in hash_groups:
-                    hash_groups[file_hash] = []
-                hash_groups[file_hash].append({
-                    "id": f['id'],
-                    "path": f['path'],
-                    "filename": f['filename'],
-                    "size_mb": round(f['size'] / (1024 * 1024), 2) if f['size'] else 0,
-                    "mtime": f['mtime'],
-                    "media_type": f['media_type']
-                })
-
-        # 2개 이상인 해시 그룹만 중복으로 처리
-        for md5_hash, files in hash_groups.items():
-            if len(files) > 1:
-                # 수정일 기준 정렬
-                files.sort(key=lambda x: x['mtime'] or '', reverse=True)
-                wasted = sum(f['size_mb'] for f in files[1:])
-                total_wasted_size += wasted
-                total_duplicates += len(files) - 1
-
-                groups.append({
-                    "hash": md5_hash[:8] + "...",
-                    "count": len(files),
-                    "wasted_mb": round(wasted, 2),
-                    "files": files
-                })
-
-    # 변경사항 저장
-    conn.commit()
-    conn.close()
+    has_more = False
+    seen = 0
+    offset = max(0, int(offset or 0))
+    gen = iter_duplicate_groups(scan_id, stats)
+    try:
+        for group in gen:
+            if limit is not None and seen >= offset + limit:
+                has_more = True
+                break
+            seen += 1
+            total_duplicates += group["count"] - 1
+            total_wasted_size += group["wasted_mb"]
+            if seen > offset:
+                groups.append(group)
+    finally:
+        gen.close()
 
     return {
         "success": True,
-        "total_groups": len(groups),
+        "total_groups": seen,
         "total_duplicates": total_duplicates,
         "total_wasted_mb": round(total_wasted_size, 2),
-        "hash_calculated": hash_calculated,
+        "hash_calculated": stats.get("hash_calculated", 0),
+        "complete": not has_more,
+        "has_more": has_more,
         "groups": groups
     }
 
@@ -6,10 +6,13 @@ EXIF 추출, MD5 해시 계산, 메타데이터 수집
 import os
 import hashlib
 import subprocess
+from concurrent.futures import wait, FIRST_COMPLETED
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+import lane_scheduler
+
 # 지원 확장자
 PHOTO_EXTENSIONS = {
     'jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp',
@@ -20,6 +23,15 @@ VIDEO_EXTENSIONS = {
     'webm', 'mpg', 'mpeg', 'm4v', 'mts', '3gp'
 }
 
+# 메타데이터 추출 병렬도 (2026-10-16) — 동시 수는 엔진 스케줄러 레인 상한(lane_scheduler.LANE_CAPS)이
+# 정한다. 사진(EXIF·PIL 디코드)은 cpu, 동영상(ffprobe 프로세스)은 subprocess — thumbnail_service 와
+# 같은 배치라 스캔과 썸네일 예열이 같은 상한을 나눠 쓴다(각자 풀을 만들면 합이 상한을 넘는다).
+_LANES = {"photo": "cpu", "video": "subprocess"}
+# 레인은 FIFO 라 추출을 수백 개 올려 두면 대화형 썸네일 렌더가 그 뒤에 줄 선다 — 레인에 올라가
+# 있는 추출은 레인 상한의 SCAN_LANE_FACTOR 배까지만(상한만큼 돌고, 그만큼이 다음 차례로 대기).
+SCAN_LANE_FACTOR = 2
+SCAN_QUEUE_SIZE = 256                         # 뽑았지만 아직 안 쓴 행 상한 = 쓰기 배치 크기
+
 # 제외 폴더
 EXCLUDE_DIRS = {
     'node_modules', '.git', '__pycache__', '.venv', 'venv',
@@ -200,17 +212,149 @@ def extract_video_metadata(filepath: str) -> Dict:
     return metadata
 
 
-def scan_media(path: str, scan_id: int, progress_callback=None) -> Dict:
+def _walk_media(path: str, unreadable: List[str]):
+    """미디어 파일 경로를 차례로 낸다 (제외 폴더·숨김 파일 건너뜀). 못 연 폴더는 unreadable 에."""
+    def _onerror(err):
+        if getattr(err, 'filename', None):
+            unreadable.append(err.filename)
+
+    for root, dirs, files in os.walk(path, onerror=_onerror):
+        # 제외 폴더 필터링
+        dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS and not d.startswith('.')]
+
+        for filename in files:
+            if filename.startswith('.'):
+                continue
+
+            ext = os.path.splitext(filename)[1].lower().lstrip('.')
+            if ext in PHOTO_EXTENSIONS or ext in VIDEO_EXTENSIONS:
+                yield os.path.join(root, filename)
+
+
+def build_media_record(filepath: str, stat: os.stat_result) -> Dict:
+    """파일 하나의 media_files 행 — 사진은 EXIF, 동영상은 ffprobe 메타데이터 포함"""
+    filename = os.path.basename(filepath)
+    ext = os.path.splitext(filename)[1].lower().lstrip('.')
+    media_type = 'photo' if ext in PHOTO_EXTENSIONS else 'video'
+
+    media_data = {
+        'path': filepath,
+        'filename': filename,
+        'extension': ext,
+        'size': stat.st_size,
+        'mtime': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        'md5_hash': None,  # 중복 탐지 시 계산
+        'media_type': media_type,
+        'width': None,
+        'height': None,
+        'taken_date': None,
+        'camera_make': None,
+        'camera_model': None,
+        'gps_lat': None,
+        'gps_lon': None,
+        'duration': None,
+        'fps': None,
+        'codec': None
+    }
+
+    # 사진이면 EXIF 메타데이터 추출 (GPS, 촬영일 등)
+    if media_type == 'photo':
+        photo_meta = extract_photo_metadata(filepath)
+        media_data.update({
+            'width': photo_meta.get('width'),
+            'height': photo_meta.get('height'),
+            'taken_date': photo_meta.get('taken_date'),
+            'camera_make': photo_meta.get('camera_make'),
+            'camera_model': photo_meta.get('camera_model'),
+            'gps_lat': photo_meta.get('gps_lat'),
+            'gps_lon': photo_meta.get('gps_lon'),
+        })
+    # 동영상이면 동영상 메타데이터 추출
+    else:
+        video_meta = extract_video_metadata(filepath)
+        media_data.update({
+            'width': video_meta.get('width'),
+            'height': video_meta.get('height'),
+            'duration': video_meta.get('duration'),
+            'fps': video_meta.get('fps'),
+            'codec': video_meta.get('codec'),
+        })
+
+    return media_data
+
+
+def _lane_window() -> int:
+    """레인에 동시에 올려 둘 추출 수 — 두 레인 중 큰 상한의 SCAN_LANE_FACTOR 배"""
+    return SCAN_LANE_FACTOR * max(lane_scheduler.LANE_CAPS.get(l, 1) for l in _LANES.values())
+
+
+def _extract_records(todo: List[Tuple[str, os.stat_result]], parallel: bool,
+                     window: Optional[int] = None):
+    """메타데이터 추출 단계 — (filepath, 행 또는 None) 을 끝난 순서대로 낸다 (None = 읽기 실패).
+
+    걸음 결과(todo)를 파일마다 레인에 낸다 — 사진은 cpu, 동영상은 subprocess(_LANES). 레인에
+    올라가 있는 것은 window 개까지만(기본 _lane_window()): 공유 레인을 스캔이 독차지하지 않고,
+    소비자(쓰기 단계)가 밀리면 내기도 멈춘다(배압). parallel=False 면 레인 없이 이 스레드에서
+    차례로 돈다.
+    """
+    def _one(filepath, stat):
+        try:
+            return filepath, build_media_record(filepath, stat)
+        except (OSError, PermissionError):
+            return filepath, None
+
+    if not parallel:
+        for filepath, stat in todo:
+            yield _one(filepath, stat)
+        return
+
+    window = max(1, _lane_window() if window is None else window)
+    pending = set()
+    try:
+        for filepath, stat in todo:
+            ext = os.path.splitext(filepath)[1].lower().lstrip('.')
+            lane = _LANES["video" if ext in VIDEO_EXTENSIONS else "photo"]
+            pending.add(lane_scheduler.submit(lane, _one, filepath, stat,
+                                              name=f"scan:{os.path.basename(filepath)}"))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+    finally:
+        for fut in pending:                     # 소비자가 중간에 그만두면 대기분은 버린다
+            fut.cancel()
+
+
+def scan_media(path: str, scan_id: int, progress_callback=None, full: bool = False,
+               parallel: bool = True, queue_size: Optional[int] = None) -> Dict:
     """
     폴더 스캔 - 사진/동영상 메타데이터 수집
 
+    ★증분 재스캔 (2026-10-16): 예전엔 매번 clear_scan_data 후 전 파일의 EXIF/ffprobe 를 다시
+    뽑아 30만 장 NAS 재스캔이 몇 시간 걸렸다. 이제 걸음(walk)의 stat 을 기존 media_files 의
+    path+size+mtime 과 견줘 새 파일은 넣고, 바뀐 파일만 다시 뽑고, 사라진 파일은 지운다.
+    열지 못한 폴더 아래의 기존 행은 지우지 않는다(NAS 끊김 ≠ 삭제).
+
     Args:
         path: 스캔할 폴더 경로
         scan_id: DB scan ID
-        progress_callback: 진행 상황 콜백 함수 (current, total)
+        progress_callback: 진행 상황 콜백 함수 (current, total) — total 은 실제로
+            메타데이터를 뽑는 파일 수(새 + 바뀐 것)
+        full: True 면 예전처럼 비우고 전부 다시 뽑는다
+        parallel: False 면 추출을 레인 없이 차례로 (비교·디버그용)
+        queue_size: 뽑았지만 아직 안 쓴 행 상한 = 쓰기 배치 크기 (기본 SCAN_QUEUE_SIZE).
+            레인에 올리는 추출 수는 따로 _lane_window() 로 작게 묶인다
+
+    ★병렬 추출 (2026-10-16): 걸음 → 엔진 스케줄러 레인(_extract_records — EXIF 는 cpu, ffprobe 는
+    subprocess 레인 상한) → 이 스레드의 배치 쓰기(save_media_batch). progress_callback 은
+    예전처럼 호출 스레드에서 (끝낸 수, 할 일 수) 로 불린다.
 
     Returns:
-        스캔 결과 딕셔너리
+        스캔 결과 딕셔너리 (added/updated/removed/unchanged 포함)
     """
     import photo_db
 
@@ -220,110 +364,80 @@ def scan_media(path: str, scan_id: int, progress_callback=None) -> Dict:
     if not os.path.exists(path):
         return {"success": False, "error": f"경로가 존재하지 않습니다: {path}"}
 
-    # 기존 데이터 삭제 (재스캔)
-    photo_db.clear_scan_data(scan_id)
-
-    # 먼저 파일 목록 수집 (진행률 표시용)
-    media_files = []
-    for root, dirs, files in os.walk(path):
-        # 제외 폴더 필터링
-        dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS and not d.startswith('.')]
-
-        for filename in files:
-            if filename.startswith('.'):
-                continue
-
-            ext = os.path.splitext(filename)[1].lower().lstrip('.')
-            if ext in PHOTO_EXTENSIONS or ext in VIDEO_EXTENSIONS:
-                media_files.append(os.path.join(root, filename))
-
-    total_files = len(media_files)
+    if full:
+        # 기존 데이터 삭제 (전체 재스캔)
+        photo_db.clear_scan_data(scan_id)
+        known = {}
+    else:
+        known = photo_db.get_file_index(scan_id)
+
+    # 걸음 + stat 으로 기존 색인과 비교 (메타데이터 추출 없음)
+    unreadable: List[str] = []
+    seen = set()
+    todo: List[Tuple[str, os.stat_result]] = []
     photo_count = 0
     video_count = 0
     total_size = 0
     error_count = 0
-    batch = []
-    BATCH_SIZE = 1000
+    added = 0
 
-    for i, filepath in enumerate(media_files):
+    for filepath in _walk_media(path, unreadable):
+        seen.add(filepath)
         try:
             stat = os.stat(filepath)
-            filename = os.path.basename(filepath)
-            ext = os.path.splitext(filename)[1].lower().lstrip('.')
+        except OSError:
+            error_count += 1
+            continue
+
+        ext = os.path.splitext(filepath)[1].lower().lstrip('.')
+        if ext in PHOTO_EXTENSIONS:
+            photo_count += 1
+        else:
+            video_count += 1
+        total_size += stat.st_size
+
+        prev = known.get(filepath)
+        if prev is None:
+            added += 1
+            todo.append((filepath, stat))
+        elif prev != (stat.st_size, datetime.fromtimestamp(stat.st_mtime).isoformat()):
+            todo.append((filepath, stat))
+
+    total_files = photo_count + video_count + error_count
+    updated = len(todo) - added
+    unchanged = photo_count + video_count - len(todo)
+
+    # 새 파일·바뀐 파일만 메타데이터 추출 (병렬) → 배치 저장 (이 스레드 하나가 쓴다)
+    batch = []
+    batch_size = max(1, SCAN_QUEUE_SIZE if queue_size is None else queue_size)
+    work_total = len(todo)
+    records = _extract_records(todo, parallel=parallel)
 
-            # 미디어 타입 결정
-            if ext in PHOTO_EXTENSIONS:
-                media_type = 'photo'
-                photo_count += 1
-            else:
-                media_type = 'video'
-                video_count += 1
+    for i, (filepath, record) in enumerate(records):
+        if record is None:
+            error_count += 1
+        else:
+            batch.append(record)
 
-            # mtime
-            mtime = datetime.fromtimestamp(stat.st_mtime).isoformat()
-
-            # 메타데이터 구성
-            media_data = {
-                'path': filepath,
-                'filename': filename,
-                'extension': ext,
-                'size': stat.st_size,
-                'mtime': mtime,
-                'md5_hash': None,  # 중복 탐지 시 계산
-                'media_type': media_type,
-                'width': None,
-                'height': None,
-                'taken_date': None,
-                'camera_make': None,
-                'camera_model': None,
-                'gps_lat': None,
-                'gps_lon': None,
-                'duration': None,
-                'fps': None,
-                'codec': None
-            }
-
-            # 사진이면 EXIF 메타데이터 추출 (GPS, 촬영일 등)
-            if media_type == 'photo':
-                photo_meta = extract_photo_metadata(filepath)
-                media_data.update({
-                    'width': photo_meta.get('width'),
-                    'height': photo_meta.get('height'),
-                    'taken_date': photo_meta.get('taken_date'),
-                    'camera_make': photo_meta.get('camera_make'),
-                    'camera_model': photo_meta.get('camera_model'),
-                    'gps_lat': photo_meta.get('gps_lat'),
-                    'gps_lon': photo_meta.get('gps_lon'),
-                })
-            # 동영상이면 동영상 메타데이터 추출
-            elif media_type == 'video':
-                video_meta = extract_video_metadata(filepath)
-                media_data.update({
-                    'width': video_meta.get('width'),
-                    'height': video_meta.get('height'),
-                    'duration': video_meta.get('duration'),
-                    'fps': video_meta.get('fps'),
-                    'codec': video_meta.get('codec'),
-                })
-
-            batch.append(media_data)
-            total_size += stat.st_size
-
-            # 배치 저장
-            if len(batch) >= BATCH_SIZE:
-                photo_db.save_media_batch(scan_id, batch)
-                batch = []
-
-            # 진행 콜백
-            if progress_callback and (i + 1) % 100 == 0:
-                progress_callback(i + 1, total_files)
+        # 배치 저장
+        if len(batch) >= batch_size:
+            photo_db.save_media_batch(scan_id, batch)
+            batch = []
 
-        except (OSError, PermissionError):
-            error_count += 1
+        # 진행 콜백
+        if progress_callback and (i + 1) % 100 == 0:
+            progress_callback(i + 1, work_total)
 
     # 남은 배치 저장
     if batch:
         photo_db.save_media_batch(scan_id, batch)
+    if progress_callback and work_total % 100:
+        progress_callback(work_total, work_total)
+
+    # 사라진 파일 정리 — 못 연 폴더 아래는 남겨 둔다
+    skip = tuple(os.path.join(d, '') for d in unreadable)
+    vanished = [p for p in known if p not in seen and not (skip and p.startswith(skip))]
+    removed = photo_db.delete_media_paths(scan_id, vanished)
 
     # 스캔 통계 업데이트
     photo_db.update_scan_stats(scan_id, photo_count, video_count, total_size)
@@ -331,10 +445,15 @@ def scan_media(path: str, scan_id: int, progress_callback=None) -> Dict:
     return {
         "success": True,
         "scan_id": scan_id,
+        "mode": "full" if full else "incremental",
         "total_files": total_files,
         "photo_count": photo_count,
         "video_count": video_count,
         "total_size_mb": round(total_size / (1024 * 1024), 2),
+        "added": added,
+        "updated": updated,
+        "removed": removed,
+        "unchanged": unchanged,
         "errors_count": error_count
     }
 
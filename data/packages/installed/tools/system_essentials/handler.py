@@ -746,14 +746,20 @@ def execute(tool_input: dict, context) -> str:
             path = _red_stage(path, for_write=True)
             content = tool_input.get("content")  # 파이프 싱크(구 output op:file 흡수 2026-08-05): 생략 시 _prev_result, ""는 유효
             piped = False
+            _spilled_rows = None
             if content is None:
                 content = tool_input.get("_prev_result")
                 piped = content is not None
                 if piped:
-                    # 스필 참조 봉투(M5)면 본문을 저장 — 참조 JSON 이 파일이 되면 침묵 오답
+                    # 스필 참조 봉투(M5)면 본문을 저장 — 참조 JSON 이 파일이 되면 침묵 오답.
+                    # 행 형식 스필은 행을 흘려 쓴다(아래 write_json_stream — 전량 적재 없음, 2026-10-16)
                     try:
-                        from common.spill import resolve_ref_str
-                        _resolved, _ref_err = resolve_ref_str(content)
+                        from common.spill import open_rows, resolve_ref_str
+                        _spilled_rows = open_rows(content)
+                        if _spilled_rows is not None:
+                            _resolved, _ref_err = _spilled_rows.load_lazy(), None
+                        else:
+                            _resolved, _ref_err = resolve_ref_str(content)
                         if _ref_err:
                             return json.dumps({"success": False, "error": _ref_err}, ensure_ascii=False)
                         content = _resolved
@@ -811,23 +817,32 @@ def execute(tool_input: dict, context) -> str:
                     content = {k: v for k, v in probe.items() if k not in _untouched}
                     excluded_untransformed = sorted(_untouched)
                     content["_untransformed_excluded"] = excluded_untransformed
-            if not isinstance(content, str):
+            _stream = None
+            if (_spilled_rows is not None and isinstance(content, (dict, list))
+                    and not _red_is_live_path(os.path.realpath(path))):
+                _stream = content   # 스필 행 — 아래에서 조각조각 직렬화(RED 대상은 구문검증을 위해 전량 문자열)
+            elif not isinstance(content, str):
                 content = json.dumps(content, ensure_ascii=False, indent=2) if isinstance(content, (dict, list)) else str(content)
-            _red_err = _red_write_prepare(path, content)  # 그랜트된 RED 쓰기 안전판(구문검증+백업)
-            if _red_err:
-                return _red_err
+            if _stream is None:
+                _red_err = _red_write_prepare(path, content)  # 그랜트된 RED 쓰기 안전판(구문검증+백업)
+                if _red_err:
+                    return _red_err
             os.makedirs(os.path.dirname(path), exist_ok=True)
             with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+                if _stream is not None:
+                    from common.spill import write_json_stream
+                    _size = write_json_stream(f, _stream)
+                else:
+                    _size = f.write(content)
             _red_write_finalize(path)  # backend .py 면 워치독(헬스체크·자동 롤백) 보장
             # 쓰기 관문 원장 — 행위자 동반 사건 기록(관측일 뿐, 실패해도 본 쓰기 무영향)
             try:
                 from write_ledger import log_write
-                log_write(path, event="write", gate="self_write", size=len(content))
+                log_write(path, event="write", gate="self_write", size=_size)
             except Exception:
                 pass
             abs_path = os.path.abspath(path)
-            result = {"success": True, "path": abs_path, "size": len(content)}
+            result = {"success": True, "path": abs_path, "size": _size}
             if path != _live_target:   # 격리 사본에 쌓였다 — 라이브는 아직 무변경
                 result.update({
                     "staged": True, "live_path": os.path.abspath(_live_target),
@@ -858,7 +873,7 @@ def execute(tool_input: dict, context) -> str:
                 elif extracted == "message":
                     _kind = "message"
                 result["items"] = []
-                result["ref"] = {"path": abs_path, "kind": _kind, "count": _count, "bytes": len(content)}
+                result["ref"] = {"path": abs_path, "kind": _kind, "count": _count, "bytes": _size}
                 result["spilled"] = True
             return json.dumps(result, ensure_ascii=False)
 
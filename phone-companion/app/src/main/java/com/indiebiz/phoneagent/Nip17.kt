@@ -19,6 +19,22 @@ object Nip17 {
 
     private fun pTag(recipient: String) = JSONArray().put(JSONArray().put("p").put(recipient))
 
+    // seal 층 대화키 LRU (2026-10-16) — 같은 상대와는 늘 같은 ECDH 라, 오프라인 뒤 밀린 DM 을
+    // 풀 때 상대마다 한 번만 계산한다. gift wrap 층(임시키)은 일회용이라 넣지 않는다. backend/nip17.py 와 같다.
+    private const val CONV_KEY_CACHE_MAX = 256
+    private val convKeys = object : LinkedHashMap<String, ByteArray>(64, 0.75f, true) {
+        override fun removeEldestEntry(eldest: MutableMap.MutableEntry<String, ByteArray>?): Boolean =
+            size > CONV_KEY_CACHE_MAX
+    }
+
+    private fun sealKey(privHex: String, pubHex: String): ByteArray {
+        val k = privHex + ":" + pubHex.lowercase()
+        synchronized(convKeys) { convKeys[k]?.let { return it } }
+        val ck = Nip44.conversationKey(privHex, pubHex)
+        synchronized(convKeys) { convKeys[k] = ck }
+        return ck
+    }
+
     fun wrapDm(senderPrivHex: String, recipientPubHex: String, message: String): String {
         val now = System.currentTimeMillis() / 1000
         val senderPub = NostrCrypto.toHex(NostrCrypto.xonlyPub(NostrCrypto.fromHex(senderPrivHex)))
@@ -36,7 +52,7 @@ object Nip17 {
             .put("content", message)
 
         // 2) seal (kind 13): rumor 를 발신자→수신자 NIP-44 암호화, 발신자 서명
-        val sealCk = Nip44.conversationKey(senderPrivHex, recipientPubHex)
+        val sealCk = sealKey(senderPrivHex, recipientPubHex)
         val sealContent = Nip44.encrypt(rumor.toString(), sealCk)
         val sealCreated = randomPast(now)
         val sealId = NostrCrypto.eventId(senderPub, sealCreated, KIND_SEAL, emptyList(), sealContent)
@@ -83,7 +99,7 @@ object Nip17 {
         val seal = JSONObject(Nip44.decrypt(wrap.getString("content"), wrapCk))
         // 2) seal 복호(발신자→나) → rumor
         val senderPub = seal.getString("pubkey")
-        val sealCk = Nip44.conversationKey(recipientPrivHex, senderPub)
+        val sealCk = sealKey(recipientPrivHex, senderPub)
         val rumor = JSONObject(Nip44.decrypt(seal.getString("content"), sealCk))
         // 3) rumor.pubkey 가 진짜 발신자(seal.pubkey 와 같아야 정상)
         return JSONObject()
@@ -7,7 +7,9 @@
 3) `data/ibl_nodes.yaml`이 갱신됨 (런타임이 읽는 단일 파일)
 
 런타임 코드는 단일 ibl_nodes.yaml만 읽는다 (ibl_access / tool_loader /
-tool_selector / system_tools).
+tool_selector / system_tools). (2026-10-16) 빌드는 옆에 미리-컴파일 스냅샷
+ibl_nodes.yaml.snapshot(파생 색인 포함)도 굽고, 런타임은 backend/datastore/vocab_snapshot
+레지스트리 하나를 거쳐 그것을 읽는다.
 
 병합 방식: 바이트-단위 연결. 소스 파일들의 내용은 원본 yaml의 해당 span에서
 잘라낸 바이트 그대로이므로, 정상 워크플로에서는 byte-identical 라운드트립이
@@ -790,6 +792,13 @@ def build(check: bool = False, validate_only: bool = False) -> int:
     if fixtures_text is not None:
         atomic_write_text(fixtures_path, fixtures_text)
         print(f"[build_ibl_nodes] 작성: {fixtures_path}")
+    # 미리-컴파일 어휘 스냅샷 (2026-10-16) — yaml·phone_manifest.json 을 다 쓴 뒤에 굽는다.
+    # 런타임 레지스트리(vocab_snapshot)는 이것을 파싱 없이 풀고, 없거나 낡았으면 스스로 다시 굽는다.
+    try:
+        import vocab_snapshot
+        print(f"[build_ibl_nodes] 작성: {vocab_snapshot.write_snapshot(target)} (어휘 스냅샷)")
+    except Exception as _e:
+        print(f"[build_ibl_nodes] 어휘 스냅샷 건너뜀 ({_e}) — 런타임이 첫 조회 때 굽는다")
     tj_written = 0
     for tj_path, tj_text in sorted(tool_json_docs.items()):
         current = tj_path.read_text(encoding="utf-8") if tj_path.is_file() else None
@@ -40,20 +40,21 @@ ORDER = ["base", "data", "ibl", "cognition", "services", "surface"]
 LAYERS = {
     "base": {
         "desktop_notify", "device_registry", "doc_ir", "document_converter",
-        "episode_logger", "hls_ladder", "korean_utils", "limb_keys",
-        "logging_utils", "mime_compat", "model_resolver", "nip17", "nip44",
+        "episode_logger", "hls_ladder", "http_pool", "korean_utils", "lane_scheduler", "limb_keys",
+        "logging_utils", "mime_compat", "model_resolver", "nip17", "nip44", "nostr_relay_pool",
         "phone_jobs", "r2_client", "repeat_guard", "runtime_utils", "safe_store",
-        "steer_inbox", "thread_context", "thumbnails", "window_requests", "write_ledger",
+        "steer_inbox", "telemetry_sink", "thread_context", "thumbnail_service", "thumbnails", "window_requests",
+        "write_ledger",
     },
     "data": {
         "agent_registry", "body_trust", "boot_status", "business_manager",
         "calendar_manager", "conversation_db", "face_config", "file_index", "focus_map",
-        "forage_memory", "guide_registry", "health_sync", "ibl_registry", "ibl_usage_db",
+        "forage_memory", "guide_registry", "health_sync", "hippo_ann", "ibl_registry", "ibl_usage_db",
         "install_approvals",
         "multi_chat_db", "node_registry", "notification_manager",
         "notify_dispatch", "peer_cards", "project_manager", "pulse_db", "red_apply",
         "red_grant", "red_report", "red_watchdog", "service_status", "switch_manager", "system_ai_memory",
-        "system_docs",
+        "system_docs", "vocab_snapshot",
         "warehouse_catalog", "warehouse_directory", "warehouse_items",
         "websocket_manager", "xray_stream",
     },
@@ -63,10 +64,10 @@ LAYERS = {
         # 명시 배정이 우선한다. 디렉토리화 때 개명 후보.
         "api_engine", "api_pipeline", "api_transforms",
         "capability_card", "channel_engine", "event_engine", "ibl_access", "ibl_control_blocks",
-        "ibl_engine", "ibl_envelope", "ibl_executors", "ibl_exec_output", "ibl_exec_goal",
+        "ibl_async", "ibl_engine", "ibl_envelope", "ibl_executors", "ibl_exec_output", "ibl_exec_goal",
         "ibl_exec_each", "ibl_exec_sense", "ibl_ops", "ibl_param_vocab",
         "ibl_predicates",
-        "ibl_parser", "ibl_parser_blocks", "ibl_parser_values", "ibl_routing",
+        "ibl_parser", "ibl_parser_blocks", "ibl_parser_values", "ibl_plan", "ibl_routing",
         "ibl_safety", "ibl_translate", "package_manager", "tool_context",
         "tool_loader", "tool_selector", "trigger_engine", "workflow_engine",
         "workflow_parallel", "workflow_fallback", "workflow_contract",
@@ -101,7 +102,7 @@ LAYERS = {
     },
     # warehouse_likes: /like 라우트 보유 = 창고 공개면의 일부(⑨가 방향을 명시한
     # portal_warehouse 와의 상호 순환도 같은 층 안이 맞다)
-    "surface": {"public_face", "face_provision", "warehouse_likes"},
+    "surface": {"public_face", "face_provision", "lazy_router", "warehouse_likes"},
 }
 SURFACE_PREFIX = ("api_", "launcher_", "portal_")
 ASSEMBLY = {"api", "boot_common"}
@@ -208,11 +208,30 @@ def self_test() -> int:
     return 0
 
 
+def _load_app():
+    """api.app 을 지연 라우터까지 전부 올린 채로 돌려준다.
+
+    ★(2026-10-16) api.py 는 매니저 주입이 없는 라우터를 lazy_router 자리표로 앉히고 첫 요청 때
+    올린다. 자리표는 path·methods 가 없어 이 가드 눈에 안 보인다 — 그대로 세면 520 → 312 로
+    줄고 공개 라우트 대부분이 검사 밖으로 빠진다. 그래서 감사 전에 warmup() 으로 전부 올린다.
+    (INDIEBIZ_EAGER_ROUTERS="*" 로 띄운 앱과 같은 라우트 수여야 한다 — test_lazy_router L6.)
+    """
+    import api
+    import lazy_router
+    lazy_router.warmup()
+    return api.app
+
+
+def _count_routes(app) -> int:
+    return sum(1 for r in _iter_effective_routes(app) if getattr(r, "path", None))
+
+
 def main() -> int:
     if "--self-test" in sys.argv:
         return self_test()
     try:
         import api
+        app = _load_app()
         from api_launcher_web import is_public_remote_path
     except Exception as e:
         print(f"[FAIL] 앱 임포트 실패 — 검사할 수 없습니다: {e.__class__.__name__}: {e}")
@@ -221,7 +240,7 @@ def main() -> int:
     mod_cache: dict = {}
     unguarded, guarded, exempted = [], 0, 0
 
-    for route in _iter_effective_routes(api.app):
+    for route in _iter_effective_routes(app):
         path = getattr(route, "path", None)
         endpoint = getattr(route, "endpoint", None)
         if not path or endpoint is None:
@@ -250,7 +269,7 @@ def main() -> int:
             else:
                 unguarded.append((method, path, endpoint.__name__, mod_name))
 
-    total_routes = sum(1 for r in _iter_effective_routes(api.app) if getattr(r, "path", None))
+    total_routes = _count_routes(app)
     inspected = guarded + exempted + len(unguarded)
     print(f"[공개 라우트] 전체 라우트 {total_routes} · 공개 {inspected} "
           f"(자체인증 {guarded} · 익명 선언 {exempted} · 무검사 {len(unguarded)})")
@@ -267,7 +286,7 @@ def main() -> int:
         print("  이 상태의 '통과'는 아무것도 검사하지 않은 통과입니다.")
         print("  라우터 등록이 조용히 빠졌는지, 의존성이 모자라 일부 모듈이 안 실렸는지 확인하세요.")
         by_prefix: dict = {}
-        for r in _iter_effective_routes(api.app):
+        for r in _iter_effective_routes(app):
             p = getattr(r, "path", "") or ""
             if p.startswith("/"):
                 by_prefix[p.split("/")[1]] = by_prefix.get(p.split("/")[1], 0) + 1
@@ -14,6 +14,11 @@ import 스모크(ci_import_smoke.py)의 다음 층: import 성공 ≠ 부팅 성
 ★자식 stdout 은 PIPE 가 아니라 파일로 받는다 — 부팅 로그가 파이프 버퍼(윈도우
 ~4KB)를 채우는 순간 자식이 쓰기에서 통째로 블록되는 부류(2026-07-20 cloudflared
 실증, pitfall: subprocess PIPE 교착). 실패 시 그 파일 꼬리를 출력한다.
+
+콜드스타트 예산 (2026-10-16): 첫 부팅이 통과하면 한 번 더 띄워 /health 까지의 시간을
+BOOT_SMOKE_COLD_BUDGET(초, 기본 30)과 견준다. 두 번째는 .pyc 가 데워진 상태 = 자가수리
+(red_apply) 뒤 재시작과 같은 조건이고, 첫 부팅(바이트코드 컴파일·윈도우 러너 편차)은
+DEADLINE_S 로만 본다. 라우터를 첫 요청 때 올리는(lazy_router) 이유가 이 숫자다.
 """
 import json
 import os
@@ -36,6 +41,8 @@ def _python() -> str:
 PORT = int(os.environ.get("INDIEBIZ_API_PORT", "8799"))  # 기본 8765 를 피해 로컬 실행과 충돌 없음
 HEALTH = f"http://127.0.0.1:{PORT}/health"
 DEADLINE_S = int(os.environ.get("BOOT_SMOKE_DEADLINE", "240"))  # 첫 부팅은 임포트가 무거움(윈도우 러너 여유)
+COLD_BUDGET_S = float(os.environ.get("BOOT_SMOKE_COLD_BUDGET", "30"))  # 재시작 → /health 상한 (0 = 검사 안 함)
+POLL_S = 0.5
 
 
 def tail(path, lines=120):
@@ -46,7 +53,8 @@ def tail(path, lines=120):
         return f"(로그 읽기 실패: {e})"
 
 
-def main() -> int:
+def boot_once(label: str, deadline_s: float):
+    """api.py 를 한 번 띄워 /health 200·healthy 까지 → 걸린 초 (실패면 None). 끝나면 죽인다."""
     env = dict(os.environ)
     env["INDIEBIZ_PRODUCTION"] = "1"   # reload/파일감시 없음 = 자식 1프로세스, terminate 로 깨끗이 죽음
     env["INDIEBIZ_API_PORT"] = str(PORT)
@@ -54,7 +62,7 @@ def main() -> int:
 
     py = _python()
     log_fd, log_path = tempfile.mkstemp(prefix="boot_smoke_", suffix=".log")
-    print(f"[boot-smoke] spawn: {py} api.py (port {PORT}, log={log_path})", flush=True)
+    print(f"[boot-smoke] {label} spawn: {py} api.py (port {PORT}, log={log_path})", flush=True)
     with os.fdopen(log_fd, "wb") as log_f:
         proc = subprocess.Popen(
             [py, API_PY],
@@ -66,29 +74,33 @@ def main() -> int:
         try:
             t0 = time.monotonic()
             payload = None
-            while time.monotonic() - t0 < DEADLINE_S:
+            while time.monotonic() - t0 < deadline_s:
                 if proc.poll() is not None:
                     print(f"[boot-smoke] FAILED — 서버 프로세스가 부팅 중 죽음 (exit {proc.returncode})", flush=True)
                     print(tail(log_path), flush=True)
-                    return 1
+                    return None
                 try:
                     with urllib.request.urlopen(HEALTH, timeout=3) as r:
                         payload = json.loads(r.read().decode("utf-8"))
                         break
                 except Exception:
-                    time.sleep(2)
+                    time.sleep(POLL_S)
 
             if payload is None:
-                print(f"[boot-smoke] FAILED — {DEADLINE_S}s 안에 /health 응답 없음", flush=True)
+                print(f"[boot-smoke] FAILED — {deadline_s:.0f}s 안에 /health 응답 없음", flush=True)
                 print(tail(log_path), flush=True)
-                return 1
+                return None
             if payload.get("status") != "healthy":
                 print(f"[boot-smoke] FAILED — /health 페이로드 비정상: {payload}", flush=True)
-                return 1
+                return None
 
             took = time.monotonic() - t0
-            print(f"[boot-smoke] OK — /health 200 in {took:.1f}s: {payload}", flush=True)
-            return 0
+            print(f"[boot-smoke] {label} OK — /health 200 in {took:.1f}s: {payload}", flush=True)
+            for line in tail(log_path, 400).splitlines():
+                if line.startswith("[boot] import "):          # boot_status.import_summary
+                    print(f"[boot-smoke] {line}", flush=True)   # 첫 줄 = __main__ 조립(차가운 쪽)
+                    break
+            return took
         finally:
             proc.terminate()
             try:
@@ -97,5 +109,21 @@ def main() -> int:
                 proc.kill()
 
 
+def main() -> int:
+    if boot_once("첫 부팅", DEADLINE_S) is None:
+        return 1
+    if COLD_BUDGET_S <= 0:
+        return 0
+    took = boot_once("재시작", max(COLD_BUDGET_S * 2, 30))
+    if took is None:
+        return 1
+    if took > COLD_BUDGET_S:
+        print(f"[boot-smoke] FAILED — 재시작 콜드스타트 {took:.1f}s > 예산 {COLD_BUDGET_S:.0f}s "
+              f"(BOOT_SMOKE_COLD_BUDGET)", flush=True)
+        return 1
+    print(f"[boot-smoke] 콜드스타트 {took:.1f}s ≤ 예산 {COLD_BUDGET_S:.0f}s", flush=True)
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -10,7 +10,9 @@
 - ibl_hippo_index.json : {dim, count, examples:[{id,intent,ibl_code,nodes,category,difficulty,
   source,success_count,fail_count}]}  (벡터 행 순서와 1:1)
 - ibl_hippo_vecs.f32   : raw float32, (count, dim) — examples[i] 의 L2정규화 임베딩.
-  폰은 np.frombuffer(...).reshape(count, dim) 로 즉시 행렬화 → query_vec 와 dot = 코사인.
+  폰은 np.memmap 으로 열어 재채점할 행만 읽는다.
+- ibl_hippo_ivf/       : 위 f32 의 ANN 색인(hippo_ann, 기본 int8 양자화). 미리 지어 두면 폰이 첫
+  부팅에 색인을 짓지 않는다 — 지문이 f32 내용 기반이라 번들 전개 뒤에도 그대로 열린다.
 
 맥에서 1회 실행(어휘/코퍼스 갱신 시 재실행). build_ibl_nodes 처럼 정본→파생.
 """
@@ -118,6 +120,16 @@ def main() -> int:
         for pr in packed_rows:
             f.write(pr)
 
+    # 5) ANN 색인 미리 짓기 (폰 콜드스타트 — 2026-10-16)
+    try:
+        import numpy as np
+        vecs = np.memmap(vec_path, dtype=np.float32, mode="r", shape=(len(examples), dim))
+        ann = IBLUsageDB._open_rented_ann(vec_path, vecs)
+        print(f"[export_hippo] {vec_path.with_name('ibl_hippo_ivf')} "
+              f"(목록 {ann.nlist}, {ann.quantize})")
+    except ImportError as e:
+        print(f"[export_hippo] ANN 색인 건너뜀(numpy 없음): {e} — 폰이 첫 부팅에 짓는다")
+
     print(f"[export_hippo] {len(examples)}개 추출 "
           f"(vec0 {len(examples)-reencoded}, 재인코딩 {reencoded}, 누락 {missing})")
     print(f"[export_hippo] {idx_path} ({idx_path.stat().st_size//1024}KB)")